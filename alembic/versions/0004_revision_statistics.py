@@ -0,0 +1,74 @@
+"""Store per-revision content statistics computed at write time."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.contexts.studio.domain.utils import _revision_statistics
+
+revision = "0004_revision_statistics"
+down_revision = "0003_add_csrf_token_to_sessions"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+STATISTIC_COLUMNS = ("word_count", "char_count", "paragraph_count", "content_sha256")
+
+
+def _statistic_column(name: str) -> sa.Column[object]:
+    if name == "content_sha256":
+        return sa.Column(name, sa.String(length=64), nullable=False, server_default="")
+    return sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    columns = {
+        column["name"] for column in sa.inspect(bind).get_columns("document_revisions")
+    }
+    for name in STATISTIC_COLUMNS:
+        if name not in columns:
+            op.add_column("document_revisions", _statistic_column(name))
+
+    # Walk the table in primary-key order so each batch is a short write and
+    # large libraries never hold every revision body in memory at once.
+    select_batch = sa.text(
+        "SELECT id, content_markdown FROM document_revisions "
+        "WHERE id > :after AND content_sha256 = '' "
+        "ORDER BY id LIMIT :limit"
+    )
+    update = sa.text(
+        "UPDATE document_revisions SET word_count = :word_count, "
+        "char_count = :char_count, paragraph_count = :paragraph_count, "
+        "content_sha256 = :content_sha256 WHERE id = :id"
+    )
+    after = ""
+    while True:
+        rows = bind.execute(
+            select_batch,
+            {"after": after, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            update,
+            [
+                {"id": row.id, **_revision_statistics(row.content_markdown or "")}
+                for row in rows
+            ],
+        )
+        after = rows[-1].id
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    columns = {
+        column["name"] for column in sa.inspect(bind).get_columns("document_revisions")
+    }
+    present = [name for name in STATISTIC_COLUMNS if name in columns]
+    if not present:
+        return
+    with op.batch_alter_table("document_revisions") as batch_op:
+        for name in present:
+            batch_op.drop_column(name)
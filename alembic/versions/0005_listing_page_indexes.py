@@ -0,0 +1,36 @@
+"""Add composite indexes backing keyset-paginated listings."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0005_listing_page_indexes"
+down_revision = "0004_revision_statistics"
+branch_labels = None
+depends_on = None
+
+PAGE_INDEXES = {
+    "ix_jobs_project_page": "jobs",
+    "ix_reviews_project_page": "reviews",
+    "ix_exports_project_page": "exports",
+    "ix_project_snapshots_project_page": "project_snapshots",
+}
+
+
+def _existing_indexes(bind: sa.Connection, table: str) -> set[str]:
+    return {index["name"] for index in sa.inspect(bind).get_indexes(table)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for name, table in PAGE_INDEXES.items():
+        if name not in _existing_indexes(bind, table):
+            op.create_index(name, table, ["project_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for name, table in PAGE_INDEXES.items():
+        if name in _existing_indexes(bind, table):
+            op.drop_index(name, table_name=table)
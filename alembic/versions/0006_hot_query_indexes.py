@@ -0,0 +1,38 @@
+"""Add indexes for hot lookups that previously scanned whole tables."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006_hot_query_indexes"
+down_revision = "0005_listing_page_indexes"
+branch_labels = None
+depends_on = None
+
+HOT_QUERY_INDEXES = {
+    "ix_project_snapshots_project_reason": (
+        "project_snapshots",
+        ["project_id", "reason", "created_at"],
+    ),
+    "ix_snapshot_documents_document": ("snapshot_documents", ["document_id"]),
+    "ix_sessions_kind_expires": ("sessions", ["kind", "expires_at"]),
+}
+
+
+def _existing_indexes(bind: sa.Connection, table: str) -> set[str]:
+    return {index["name"] for index in sa.inspect(bind).get_indexes(table)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for name, (table, columns) in HOT_QUERY_INDEXES.items():
+        if name not in _existing_indexes(bind, table):
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for name, (table, _columns) in HOT_QUERY_INDEXES.items():
+        if name in _existing_indexes(bind, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,65 @@
+"""Allow revision bodies to be stored as deltas against their parent."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.contexts.studio.infrastructure.revision_delta import apply_delta
+
+revision = "0007_revision_deltas"
+down_revision = "0006_hot_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+def _revision_columns(bind: sa.Connection) -> set[str]:
+    return {
+        column["name"] for column in sa.inspect(bind).get_columns("document_revisions")
+    }
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "content_delta" not in _revision_columns(bind):
+        op.add_column(
+            "document_revisions",
+            sa.Column("content_delta", sa.Text(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if "content_delta" not in _revision_columns(bind):
+        return
+    # Older schemas only understand full bodies, so expand every delta first,
+    # one document at a time and in revision order so parents come first.
+    document_ids = bind.execute(
+        sa.text(
+            "SELECT DISTINCT document_id FROM document_revisions "
+            "WHERE content_delta IS NOT NULL"
+        )
+    ).scalars()
+    select_history = sa.text(
+        "SELECT id, parent_revision_id, content_markdown, content_delta "
+        "FROM document_revisions WHERE document_id = :document_id "
+        "ORDER BY revision_number"
+    )
+    expand = sa.text(
+        "UPDATE document_revisions SET content_markdown = :content_markdown, "
+        "content_delta = NULL WHERE id = :id"
+    )
+    for document_id in list(document_ids):
+        contents: dict[str, str] = {}
+        updates = []
+        for row in bind.execute(select_history, {"document_id": document_id}):
+            if row.content_delta is None:
+                contents[row.id] = row.content_markdown
+                continue
+            content = apply_delta(contents[row.parent_revision_id], row.content_delta)
+            contents[row.id] = content
+            updates.append({"id": row.id, "content_markdown": content})
+        if updates:
+            bind.execute(expand, updates)
+    with op.batch_alter_table("document_revisions") as batch_op:
+        batch_op.drop_column("content_delta")
@@ -0,0 +1,113 @@
+"""Move full revision bodies into a deduplicated, content-addressed blob table."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.contexts.studio.domain.utils import _revision_statistics
+from src.contexts.studio.infrastructure.models import REVISION_BLOB_TRIGGERS
+
+revision = "0008_revision_blobs"
+down_revision = "0007_revision_deltas"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+TRIGGER_NAMES = ("revision_blob_ref", "revision_blob_unref", "revision_blob_reref")
+
+
+def _revision_columns(bind: sa.Connection) -> set[str]:
+    return {
+        column["name"] for column in sa.inspect(bind).get_columns("document_revisions")
+    }
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "revision_blobs" not in sa.inspect(bind).get_table_names():
+        op.create_table(
+            "revision_blobs",
+            sa.Column("sha256", sa.String(length=64), primary_key=True),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("size_bytes", sa.Integer(), nullable=False),
+            sa.Column("refcount", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        )
+    if "blob_sha256" not in _revision_columns(bind):
+        with op.batch_alter_table("document_revisions") as batch_op:
+            batch_op.add_column(
+                sa.Column("blob_sha256", sa.String(length=64), nullable=True)
+            )
+            batch_op.create_foreign_key(
+                "fk_document_revisions_blob_sha256",
+                "revision_blobs",
+                ["blob_sha256"],
+                ["sha256"],
+            )
+            batch_op.create_index(
+                "ix_document_revisions_blob_sha256", ["blob_sha256"]
+            )
+    # Triggers go in before the backfill so it is counted like any other write.
+    for trigger in REVISION_BLOB_TRIGGERS:
+        bind.execute(sa.text(trigger))
+
+    # Same primary-key walk as the statistics backfill: short write batches,
+    # never every body in memory at once. Delta rows keep their inline delta.
+    select_batch = sa.text(
+        "SELECT id, content_markdown, content_sha256, created_at "
+        "FROM document_revisions WHERE id > :after "
+        "AND content_delta IS NULL AND blob_sha256 IS NULL "
+        "ORDER BY id LIMIT :limit"
+    )
+    insert_blob = sa.text(
+        "INSERT OR IGNORE INTO revision_blobs "
+        "(sha256, content, size_bytes, refcount, created_at) "
+        "VALUES (:sha256, :content, :size_bytes, 0, :created_at)"
+    )
+    point_at_blob = sa.text(
+        "UPDATE document_revisions SET blob_sha256 = :sha256, "
+        "content_markdown = '' WHERE id = :id"
+    )
+    after = ""
+    while True:
+        rows = bind.execute(
+            select_batch,
+            {"after": after, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        blobs = [
+            {
+                "id": row.id,
+                "sha256": row.content_sha256
+                or _revision_statistics(row.content_markdown)["content_sha256"],
+                "content": row.content_markdown,
+                "size_bytes": len(row.content_markdown.encode()),
+                "created_at": row.created_at,
+            }
+            for row in rows
+        ]
+        bind.execute(insert_blob, blobs)
+        bind.execute(point_at_blob, blobs)
+        after = rows[-1].id
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if "blob_sha256" not in _revision_columns(bind):
+        return
+    bind.execute(
+        sa.text(
+            "UPDATE document_revisions SET content_markdown = ("
+            "SELECT content FROM revision_blobs "
+            "WHERE sha256 = document_revisions.blob_sha256) "
+            "WHERE blob_sha256 IS NOT NULL"
+        )
+    )
+    for name in TRIGGER_NAMES:
+        bind.execute(sa.text(f"DROP TRIGGER IF EXISTS {name}"))
+    with op.batch_alter_table("document_revisions") as batch_op:
+        batch_op.drop_index("ix_document_revisions_blob_sha256")
+        batch_op.drop_column("blob_sha256")
+    op.drop_table("revision_blobs")
@@ -0,0 +1,64 @@
+"""Allow cold revision blobs to be stored zlib-compressed."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.contexts.studio.infrastructure.models import REVISION_BLOB_TRIGGERS
+from src.contexts.studio.infrastructure.revision_compression import blob_text
+
+revision = "0009_revision_blob_compression"
+down_revision = "0008_revision_blobs"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+TRIGGER_NAMES = ("revision_blob_ref", "revision_blob_unref", "revision_blob_reref")
+
+
+def _blob_columns(bind: sa.Connection) -> set[str]:
+    return {column["name"] for column in sa.inspect(bind).get_columns("revision_blobs")}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "content_zlib" not in _blob_columns(bind):
+        op.add_column(
+            "revision_blobs",
+            sa.Column("content_zlib", sa.LargeBinary(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if "content_zlib" not in _blob_columns(bind):
+        return
+    # Older schemas read ``content`` directly, so inflate every compressed blob.
+    select_batch = sa.text(
+        "SELECT sha256, content, content_zlib FROM revision_blobs "
+        "WHERE content_zlib IS NOT NULL LIMIT :limit"
+    )
+    inflate = sa.text(
+        "UPDATE revision_blobs SET content = :content, content_zlib = NULL "
+        "WHERE sha256 = :sha256"
+    )
+    while rows := bind.execute(select_batch, {"limit": BATCH_SIZE}).all():
+        bind.execute(
+            inflate,
+            [
+                {
+                    "sha256": row.sha256,
+                    "content": blob_text(row.content, row.content_zlib),
+                }
+                for row in rows
+            ],
+        )
+    # The batch rebuild renames the table, which SQLite refuses while the
+    # refcount triggers still name it, so they are recreated afterwards.
+    for name in TRIGGER_NAMES:
+        bind.execute(sa.text(f"DROP TRIGGER IF EXISTS {name}"))
+    with op.batch_alter_table("revision_blobs") as batch_op:
+        batch_op.drop_column("content_zlib")
+    for trigger in REVISION_BLOB_TRIGGERS:
+        bind.execute(sa.text(trigger))
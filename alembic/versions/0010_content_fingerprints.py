@@ -0,0 +1,89 @@
+"""Track content fingerprints on projects and snapshots."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.contexts.studio.infrastructure.content_fingerprint import (
+    EMPTY_FINGERPRINT,
+    Member,
+    fingerprint,
+)
+
+revision = "0010_content_fingerprints"
+down_revision = "0009_revision_blob_compression"
+branch_labels = None
+depends_on = None
+
+FINGERPRINT_TABLES = ("projects", "project_snapshots")
+INDEX_NAME = "ix_project_snapshots_fingerprint"
+
+
+def _columns(bind: sa.Connection, table: str) -> set[str]:
+    return {column["name"] for column in sa.inspect(bind).get_columns(table)}
+
+
+def _index_names(bind: sa.Connection) -> set[str]:
+    indexes = sa.inspect(bind).get_indexes("project_snapshots")
+    return {index["name"] for index in indexes}
+
+
+def _backfill(bind: sa.Connection, members_sql: str, update_sql: str) -> None:
+    members: defaultdict[str, list[Member]] = defaultdict(list)
+    for owner_id, document_id, content_sha256, position in bind.execute(
+        sa.text(members_sql)
+    ):
+        members[owner_id].append((document_id, content_sha256, position))
+    if members:
+        bind.execute(
+            sa.text(update_sql),
+            [
+                {"id": owner_id, "value": fingerprint(items)}
+                for owner_id, items in members.items()
+            ],
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table in FINGERPRINT_TABLES:
+        if "content_fingerprint" not in _columns(bind, table):
+            op.add_column(
+                table,
+                sa.Column(
+                    "content_fingerprint",
+                    sa.String(32),
+                    server_default=EMPTY_FINGERPRINT,
+                    nullable=False,
+                ),
+            )
+    _backfill(
+        bind,
+        "SELECT d.project_id, d.id, r.content_sha256, d.position FROM documents d "
+        "JOIN document_revisions r ON r.id = d.current_revision_id",
+        "UPDATE projects SET content_fingerprint = :value WHERE id = :id",
+    )
+    _backfill(
+        bind,
+        "SELECT s.snapshot_id, s.document_id, r.content_sha256, s.position "
+        "FROM snapshot_documents s "
+        "JOIN document_revisions r ON r.id = s.revision_id",
+        "UPDATE project_snapshots SET content_fingerprint = :value WHERE id = :id",
+    )
+    if INDEX_NAME not in _index_names(bind):
+        op.create_index(
+            INDEX_NAME, "project_snapshots", ["project_id", "content_fingerprint"]
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if INDEX_NAME in _index_names(bind):
+        op.drop_index(INDEX_NAME, table_name="project_snapshots")
+    for table in FINGERPRINT_TABLES:
+        if "content_fingerprint" in _columns(bind, table):
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.drop_column("content_fingerprint")
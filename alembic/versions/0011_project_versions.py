@@ -0,0 +1,31 @@
+"""Add a monotonically increasing version counter to projects."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0011_project_versions"
+down_revision = "0010_content_fingerprints"
+branch_labels = None
+depends_on = None
+
+
+def _columns(bind: sa.Connection) -> set[str]:
+    return {column["name"] for column in sa.inspect(bind).get_columns("projects")}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "version" not in _columns(bind):
+        op.add_column(
+            "projects",
+            sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if "version" in _columns(bind):
+        with op.batch_alter_table("projects") as batch_op:
+            batch_op.drop_column("version")
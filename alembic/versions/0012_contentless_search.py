@@ -0,0 +1,82 @@
+"""Rebuild document_search as a contentless FTS5 index."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    _revision_text,
+)
+from src.contexts.studio.infrastructure.search_index import rebuild
+
+revision = "0012_contentless_search"
+down_revision = "0011_project_versions"
+branch_labels = None
+depends_on = None
+
+CONTENTLESS_DDL = (
+    "CREATE VIRTUAL TABLE document_search USING fts5(title, content, content='')"
+)
+LEGACY_DDL = (
+    "CREATE VIRTUAL TABLE document_search USING fts5("
+    "document_id UNINDEXED, project_id UNINDEXED, title, content)"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "document_search_entries" not in sa.inspect(bind).get_table_names():
+        op.create_table(
+            "document_search_entries",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "document_id",
+                sa.String(36),
+                sa.ForeignKey("documents.id", ondelete="CASCADE"),
+                nullable=False,
+                unique=True,
+            ),
+            sa.Column(
+                "project_id",
+                sa.String(36),
+                sa.ForeignKey("projects.id", ondelete="CASCADE"),
+                nullable=False,
+                index=True,
+            ),
+            sa.Column("title", sa.String(240), nullable=False),
+            sa.Column("revision_id", sa.String(36), nullable=False),
+            sqlite_autoincrement=True,
+        )
+    bind.exec_driver_sql("DROP TABLE IF EXISTS document_search")
+    bind.exec_driver_sql(CONTENTLESS_DDL)
+    rebuild(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    bind.exec_driver_sql("DROP TABLE IF EXISTS document_search")
+    bind.exec_driver_sql(LEGACY_DDL)
+    documents = bind.execute(
+        sa.text(
+            "SELECT id, project_id, title, current_revision_id FROM documents "
+            "WHERE current_revision_id IS NOT NULL"
+        )
+    ).all()
+    if documents:
+        bind.execute(
+            sa.text(
+                "INSERT INTO document_search(document_id, project_id, title, content) "
+                "VALUES (:document_id, :project_id, :title, :content)"
+            ),
+            [
+                {
+                    "document_id": document_id,
+                    "project_id": project_id,
+                    "title": title,
+                    "content": _revision_text(bind, revision_id) or "",
+                }
+                for document_id, project_id, title, revision_id in documents
+            ],
+        )
+    op.drop_table("document_search_entries")
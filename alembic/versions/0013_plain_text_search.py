@@ -0,0 +1,57 @@
+"""Index plain text with an explicit tokenizer in document_search."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    _revision_text,
+)
+from src.contexts.studio.infrastructure.search_index import rebuild
+
+revision = "0013_plain_text_search"
+down_revision = "0012_contentless_search"
+branch_labels = None
+depends_on = None
+
+PLAIN_TEXT_DDL = (
+    "CREATE VIRTUAL TABLE document_search USING fts5(title, content, content='', "
+    "tokenize='unicode61 remove_diacritics 2')"
+)
+MARKDOWN_DDL = (
+    "CREATE VIRTUAL TABLE document_search USING fts5(title, content, content='')"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    bind.exec_driver_sql("DROP TABLE IF EXISTS document_search_next")
+    bind.exec_driver_sql("DROP TABLE IF EXISTS document_search")
+    bind.exec_driver_sql(PLAIN_TEXT_DDL)
+    rebuild(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    bind.exec_driver_sql("DROP TABLE IF EXISTS document_search_next")
+    bind.exec_driver_sql("DROP TABLE IF EXISTS document_search")
+    bind.exec_driver_sql(MARKDOWN_DDL)
+    entries = bind.execute(
+        sa.text("SELECT id, title, revision_id FROM document_search_entries")
+    ).all()
+    if entries:
+        bind.execute(
+            sa.text(
+                "INSERT INTO document_search(rowid, title, content) "
+                "VALUES (:rowid, :title, :content)"
+            ),
+            [
+                {
+                    "rowid": rowid,
+                    "title": title,
+                    "content": _revision_text(bind, revision_id) or "",
+                }
+                for rowid, title, revision_id in entries
+            ],
+        )
@@ -0,0 +1,37 @@
+"""Add FTS5 prefix indexes to document_search."""
+
+from __future__ import annotations
+
+from alembic import op
+
+from src.contexts.studio.infrastructure.search_index import rebuild
+
+revision = "0014_search_prefix_indexes"
+down_revision = "0013_plain_text_search"
+branch_labels = None
+depends_on = None
+
+PREFIX_DDL = (
+    "CREATE VIRTUAL TABLE document_search USING fts5(title, content, content='', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+)
+PLAIN_TEXT_DDL = (
+    "CREATE VIRTUAL TABLE document_search USING fts5(title, content, content='', "
+    "tokenize='unicode61 remove_diacritics 2')"
+)
+
+
+def _recreate(ddl: str) -> None:
+    bind = op.get_bind()
+    bind.exec_driver_sql("DROP TABLE IF EXISTS document_search_next")
+    bind.exec_driver_sql("DROP TABLE IF EXISTS document_search")
+    bind.exec_driver_sql(ddl)
+    rebuild(bind)
+
+
+def upgrade() -> None:
+    _recreate(PREFIX_DDL)
+
+
+def downgrade() -> None:
+    _recreate(PLAIN_TEXT_DDL)
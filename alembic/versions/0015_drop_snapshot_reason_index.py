@@ -0,0 +1,33 @@
+"""Drop the snapshot reason index that no query uses any more.
+
+It only backed the latest-export-snapshot lookup. Snapshot reuse reads the
+project's latest snapshot of any reason, which
+``ix_project_snapshots_project_page`` already serves.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0015_drop_snapshot_reason_index"
+down_revision = "0014_search_prefix_indexes"
+branch_labels = None
+depends_on = None
+
+INDEX = "ix_project_snapshots_project_reason"
+TABLE = "project_snapshots"
+
+
+def _existing_indexes(bind: sa.Connection) -> set[str]:
+    return {index["name"] for index in sa.inspect(bind).get_indexes(TABLE)}
+
+
+def upgrade() -> None:
+    if INDEX in _existing_indexes(op.get_bind()):
+        op.drop_index(INDEX, table_name=TABLE)
+
+
+def downgrade() -> None:
+    if INDEX not in _existing_indexes(op.get_bind()):
+        op.create_index(INDEX, TABLE, ["project_id", "reason", "created_at"])
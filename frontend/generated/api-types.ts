@@ -99,7 +99,8 @@ export interface paths {
             path?: never;
             cookie?: never;
         };
-        get?: never;
+        /** List Documents */
+        get: operations["list_documents_api_projects__project_id__documents_get"];
         put?: never;
         /** Create Document */
         post: operations["create_document_api_projects__project_id__documents_post"];
@@ -109,6 +110,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/projects/{project_id}/documents/batch": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /** Create Documents */
+        post: operations["create_documents_api_projects__project_id__documents_batch_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/projects/{project_id}/documents/reorder": {
         parameters: {
             query?: never;
@@ -162,6 +180,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/projects/{project_id}/documents/{document_id}/move": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /** Move Document */
+        post: operations["move_document_api_projects__project_id__documents__document_id__move_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/projects/{project_id}/documents/{document_id}/revisions": {
         parameters: {
             query?: never;
@@ -179,6 +214,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/projects/{project_id}/documents/{document_id}/revisions/{revision_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Get Revision */
+        get: operations["get_revision_api_projects__project_id__documents__document_id__revisions__revision_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/projects/{project_id}/documents/{document_id}/revisions/{revision_id}/restore": {
         parameters: {
             query?: never;
@@ -318,6 +370,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/projects/{project_id}/suggest": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Suggest Titles */
+        get: operations["suggest_titles_api_projects__project_id__suggest_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/providers": {
         parameters: {
             query?: never;
@@ -335,6 +404,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/search": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Search All Projects */
+        get: operations["search_all_projects_api_search_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/session": {
         parameters: {
             query?: never;
@@ -546,6 +632,11 @@ export interface components {
             /** Timestamp */
             timestamp: string;
         };
+        /** DocumentBatchCreateRequest */
+        DocumentBatchCreateRequest: {
+            /** Documents */
+            documents: components["schemas"]["DocumentCreateRequest"][];
+        };
         /** DocumentCreateRequest */
         DocumentCreateRequest: {
             /**
@@ -567,6 +658,13 @@ export interface components {
             /** Title */
             title: string;
         };
+        /** DocumentMoveRequest */
+        DocumentMoveRequest: {
+            /** After Id */
+            after_id?: string | null;
+            /** Before Id */
+            before_id?: string | null;
+        };
         /** DocumentRestoreRequest */
         DocumentRestoreRequest: {
             /** Base Revision Id */
@@ -762,7 +860,9 @@ export interface operations {
     };
     list_projects_api_projects_get: {
         parameters: {
-            query?: never;
+            query?: {
+                view?: "list" | "summary";
+            };
             header?: never;
             path?: never;
             cookie?: {
@@ -849,9 +949,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": {
-                        [key: string]: unknown;
-                    };
+                    "application/json": unknown;
                 };
             };
             /** @description Validation Error */
@@ -971,6 +1069,39 @@ export interface operations {
             };
         };
     };
+    list_documents_api_projects__project_id__documents_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                project_id: string;
+            };
+            cookie?: {
+                novel_studio_session?: string | null;
+            };
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     create_document_api_projects__project_id__documents_post: {
         parameters: {
             query?: never;
@@ -1010,6 +1141,45 @@ export interface operations {
             };
         };
     };
+    create_documents_api_projects__project_id__documents_batch_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                project_id: string;
+            };
+            cookie?: {
+                novel_studio_session?: string | null;
+            };
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["DocumentBatchCreateRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: unknown;
+                    };
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     reorder_documents_api_projects__project_id__documents_reorder_put: {
         parameters: {
             query?: never;
@@ -1069,9 +1239,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": {
-                        [key: string]: unknown;
-                    };
+                    "application/json": unknown;
                 };
             };
             /** @description Validation Error */
@@ -1197,7 +1365,7 @@ export interface operations {
             };
         };
     };
-    list_revisions_api_projects__project_id__documents__document_id__revisions_get: {
+    move_document_api_projects__project_id__documents__document_id__move_post: {
         parameters: {
             query?: never;
             header?: never;
@@ -1209,6 +1377,49 @@ export interface operations {
                 novel_studio_session?: string | null;
             };
         };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["DocumentMoveRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: unknown;
+                    };
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    list_revisions_api_projects__project_id__documents__document_id__revisions_get: {
+        parameters: {
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+            };
+            header?: never;
+            path: {
+                project_id: string;
+                document_id: string;
+            };
+            cookie?: {
+                novel_studio_session?: string | null;
+            };
+        };
         requestBody?: never;
         responses: {
             /** @description Successful Response */
@@ -1233,6 +1444,41 @@ export interface operations {
             };
         };
     };
+    get_revision_api_projects__project_id__documents__document_id__revisions__revision_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                project_id: string;
+                document_id: string;
+                revision_id: string;
+            };
+            cookie?: {
+                novel_studio_session?: string | null;
+            };
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     restore_revision_api_projects__project_id__documents__document_id__revisions__revision_id__restore_post: {
         parameters: {
             query?: never;
@@ -1276,7 +1522,10 @@ export interface operations {
     };
     list_exports_api_projects__project_id__exports_get: {
         parameters: {
-            query?: never;
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+            };
             header?: never;
             path: {
                 project_id: string;
@@ -1384,7 +1633,10 @@ export interface operations {
     };
     list_jobs_api_projects__project_id__jobs_get: {
         parameters: {
-            query?: never;
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+            };
             header?: never;
             path: {
                 project_id: string;
@@ -1455,7 +1707,10 @@ export interface operations {
     };
     list_reviews_api_projects__project_id__reviews_get: {
         parameters: {
-            query?: never;
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+            };
             header?: never;
             path: {
                 project_id: string;
@@ -1527,6 +1782,7 @@ export interface operations {
         parameters: {
             query: {
                 q: string;
+                prefix?: boolean;
             };
             header?: never;
             path: {
@@ -1562,7 +1818,10 @@ export interface operations {
     };
     list_snapshots_api_projects__project_id__snapshots_get: {
         parameters: {
-            query?: never;
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+            };
             header?: never;
             path: {
                 project_id: string;
@@ -1634,6 +1893,44 @@ export interface operations {
             };
         };
     };
+    suggest_titles_api_projects__project_id__suggest_get: {
+        parameters: {
+            query: {
+                q: string;
+                limit?: number;
+            };
+            header?: never;
+            path: {
+                project_id: string;
+            };
+            cookie?: {
+                novel_studio_session?: string | null;
+            };
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: unknown;
+                    };
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     providers_api_providers_get: {
         parameters: {
             query?: never;
@@ -1667,6 +1964,44 @@ export interface operations {
             };
         };
     };
+    search_all_projects_api_search_get: {
+        parameters: {
+            query: {
+                q: string;
+                prefix?: boolean;
+                limit?: number;
+                cursor?: string | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: {
+                novel_studio_session?: string | null;
+            };
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: unknown;
+                    };
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     current_session_api_session_get: {
         parameters: {
             query?: never;
@@ -5,6 +5,7 @@ import {
   parseProject,
   parseProjects,
   parseProviders,
+  parseRevisionContent,
   parseRevisions,
   parseSearch,
   parseSession,
@@ -186,6 +187,12 @@ export const api = {
       undefined,
       parseRevisions,
     ),
+  revision: (projectId: string, documentId: string, revisionId: string) =>
+    request(
+      `/api/projects/${projectId}/documents/${documentId}/revisions/${revisionId}`,
+      undefined,
+      parseRevisionContent,
+    ),
   restoreRevision: (
     projectId: string,
     documentId: string,
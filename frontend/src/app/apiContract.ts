@@ -3,6 +3,7 @@ import type {
   Project,
   ProviderInfo,
   Revision,
+  RevisionContent,
   Session,
   SessionKind,
   SetupStatus,
@@ -215,14 +216,24 @@ function parseRevision(value: unknown, label: string): Revision {
     document_id: stringField(item, 'document_id', label),
     parent_revision_id: nullableStringField(item, 'parent_revision_id', label),
     revision_number: numberField(item, 'revision_number', label),
-    content_markdown: stringField(item, 'content_markdown', label),
-    metadata: recordField(item, 'metadata', label),
     source: stringField(item, 'source', label),
     word_count: numberField(item, 'word_count', label),
+    char_count: numberField(item, 'char_count', label),
+    paragraph_count: numberField(item, 'paragraph_count', label),
+    content_sha256: stringField(item, 'content_sha256', label),
     created_at: stringField(item, 'created_at', label),
   };
 }
 
+export function parseRevisionContent(value: unknown): RevisionContent {
+  const item = objectValue(value, 'revision');
+  return {
+    ...parseRevision(item, 'revision'),
+    content_markdown: stringField(item, 'content_markdown', 'revision'),
+    metadata: recordField(item, 'metadata', 'revision'),
+  };
+}
+
 export function parseRevisions(value: unknown): { revisions: Revision[] } {
   const item = objectValue(value, 'revisions response');
   return {
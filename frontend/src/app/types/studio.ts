@@ -71,13 +71,19 @@ export interface Revision {
   document_id: string;
   parent_revision_id: string | null;
   revision_number: number;
-  content_markdown: string;
-  metadata: Record<string, unknown>;
   source: string;
   word_count: number;
+  char_count: number;
+  paragraph_count: number;
+  content_sha256: string;
   created_at: string;
 }
 
+export interface RevisionContent extends Revision {
+  content_markdown: string;
+  metadata: Record<string, unknown>;
+}
+
 export interface ReviewIssue {
   id: string;
   document_id: string | null;
@@ -22,10 +22,11 @@ const revisions: Revision[] = [
     document_id: 'document-1',
     parent_revision_id: null,
     revision_number: 1,
-    content_markdown: 'Old draft',
-    metadata: {},
     source: 'manual',
     word_count: 2,
+    char_count: 10,
+    paragraph_count: 1,
+    content_sha256: '0000000000000000000000000000000000000000000000000000000000000000',
     created_at: '2026-06-16T00:00:00Z',
   },
   {
@@ -33,10 +34,11 @@ const revisions: Revision[] = [
     document_id: 'document-1',
     parent_revision_id: 'revision-old',
     revision_number: 2,
-    content_markdown: 'Other draft',
-    metadata: {},
     source: 'manual',
     word_count: 2,
+    char_count: 10,
+    paragraph_count: 1,
+    content_sha256: '0000000000000000000000000000000000000000000000000000000000000000',
     created_at: '2026-06-16T00:01:00Z',
   },
   {
@@ -44,10 +46,11 @@ const revisions: Revision[] = [
     document_id: 'document-1',
     parent_revision_id: 'revision-other',
     revision_number: 3,
-    content_markdown: 'Current draft',
-    metadata: {},
     source: 'manual',
     word_count: 2,
+    char_count: 10,
+    paragraph_count: 1,
+    content_sha256: '0000000000000000000000000000000000000000000000000000000000000000',
     created_at: '2026-06-16T00:02:00Z',
   },
 ];
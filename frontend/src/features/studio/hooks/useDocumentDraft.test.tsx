@@ -63,10 +63,11 @@ const initialRevision: Revision = {
   document_id: activeDocument.id,
   parent_revision_id: null,
   revision_number: 1,
-  content_markdown: activeDocument.content_markdown,
-  metadata: {},
   source: 'manual',
   word_count: 2,
+  char_count: 10,
+  paragraph_count: 1,
+  content_sha256: '0000000000000000000000000000000000000000000000000000000000000000',
   created_at: '2026-06-18T00:00:00Z',
 };
 
@@ -83,10 +84,11 @@ const savedRevision: Revision = {
   document_id: activeDocument.id,
   parent_revision_id: initialRevision.id,
   revision_number: 2,
-  content_markdown: savedDocument.content_markdown,
-  metadata: {},
   source: 'manual',
   word_count: 2,
+  char_count: 10,
+  paragraph_count: 1,
+  content_sha256: '0000000000000000000000000000000000000000000000000000000000000000',
   created_at: '2026-06-18T00:01:00Z',
 };
 
@@ -39,17 +39,18 @@ const revision: Revision = {
   document_id: 'document-1',
   parent_revision_id: null,
   revision_number: 1,
-  content_markdown: 'Draft',
-  metadata: {},
   source: 'manual',
   word_count: 1,
+  char_count: 5,
+  paragraph_count: 1,
+  content_sha256: '0000000000000000000000000000000000000000000000000000000000000000',
   created_at: '2026-07-20T00:00:00Z',
 };
 
 const staleRevision: Revision = {
   ...revision,
   id: 'revision-stale',
-  content_markdown: 'Stale draft',
+  content_sha256: '1111111111111111111111111111111111111111111111111111111111111111',
 };
 
 const activeDocument: StudioDocument = {
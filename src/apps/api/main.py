@@ -15,6 +15,7 @@ from fastapi.staticfiles import StaticFiles
 
 from src.apps.api.middleware.cors import get_cors_config
 from src.apps.api.middleware.error_handler import setup_exception_handlers
+from src.apps.api.middleware.ownership_scope import OwnershipScopeMiddleware
 from src.apps.api.runtime import StudioRuntime, attach_runtime, create_runtime, lifespan
 from src.apps.api.swagger_ui import add_docs_route
 from src.contexts.studio.interface.http.dependencies import attach_studio_store
@@ -123,6 +124,7 @@ def _add_http_middleware(
     resolved_settings: NovelEngineSettings,
 ) -> None:
     app.state.settings = resolved_settings
+    app.add_middleware(OwnershipScopeMiddleware)
     app.add_middleware(GZipMiddleware, minimum_size=1000)
     cors_config = get_cors_config(resolved_settings)
     app.add_middleware(
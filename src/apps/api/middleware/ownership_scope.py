@@ -0,0 +1,26 @@
+"""Scope Studio project ownership checks to a single HTTP request."""
+
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.contexts.studio.infrastructure.repository.ownership import ownership_scope
+
+
+class OwnershipScopeMiddleware:
+    """Let repeated project scope checks within one request share a result.
+
+    A plain ASGI middleware rather than ``BaseHTTPMiddleware`` so the context
+    variable is set in the same task that runs the endpoint; worker threads
+    started from the endpoint inherit it through ``contextvars``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with ownership_scope():
+            await self.app(scope, receive, send)
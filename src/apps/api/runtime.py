@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from datetime import timedelta
 from functools import partial
 
 import anyio
@@ -21,7 +22,20 @@ from src.contexts.studio.infrastructure.database import (
     create_studio_database,
 )
 from src.contexts.studio.infrastructure.exporters import DEFAULT_EXPORT_WRITERS
-from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
+from src.contexts.studio.infrastructure.group_commit import GroupCommitWriter
+from src.contexts.studio.infrastructure.repository import (
+    RevisionStorage,
+    SqlAlchemyStudioRepository,
+)
+from src.contexts.studio.infrastructure.revision_compression import (
+    compress_cold_revisions,
+)
+from src.contexts.studio.infrastructure.search_maintenance import maintain_search
+from src.contexts.studio.infrastructure.search_reindex import (
+    reindex_search,
+    search_index_stale,
+)
+from src.contexts.studio.infrastructure.wal import maintain_wal
 from src.shared.infrastructure.config.settings import NovelEngineSettings
 from src.shared.infrastructure.logging.config import configure_logging, get_logger
 from src.shared.infrastructure.middleware import start_prometheus_server
@@ -31,6 +45,7 @@ from src.shared.infrastructure.middleware import start_prometheus_server
 class StudioRuntime:
     store: StudioStore
     database: StudioDatabase
+    group_commit: GroupCommitWriter | None = None
 
 
 class StudioRuntimeNotConfiguredError(RuntimeError):
@@ -39,6 +54,23 @@ class StudioRuntimeNotConfiguredError(RuntimeError):
 
 def create_runtime(settings: NovelEngineSettings) -> StudioRuntime:
     database = create_studio_database(settings)
+    group_commit = (
+        GroupCommitWriter(
+            database,
+            window_seconds=settings.database.group_commit_window_ms / 1000,
+            max_batch=settings.database.group_commit_max_batch,
+        )
+        if settings.database.group_commit
+        else None
+    )
+    repository = SqlAlchemyStudioRepository(
+        database,
+        group_commit=group_commit,
+        revision_storage=RevisionStorage(
+            mode=settings.database.revision_storage,
+            keyframe_interval=settings.database.revision_keyframe_interval,
+        ),
+    )
 
     def ai_provider_factory(
         provider_name: TextGenerationProviderName,
@@ -48,13 +80,14 @@ def create_runtime(settings: NovelEngineSettings) -> StudioRuntime:
 
     return StudioRuntime(
         store=StudioStore(
-            repository=SqlAlchemyStudioRepository(database),
+            repository=repository,
             data_dir=settings.data_dir,
             ai_provider_factory=ai_provider_factory,
             session_secret=settings.security.secret_key,
             export_writers=DEFAULT_EXPORT_WRITERS,
         ),
         database=database,
+        group_commit=group_commit,
     )
 
 
@@ -77,6 +110,70 @@ async def _cleanup_expired_guests(store: StudioStore) -> None:
         await anyio.to_thread.run_sync(store.cleanup_expired_guests)
 
 
+async def _checkpoint_wal(
+    database: StudioDatabase,
+    *,
+    interval_seconds: float,
+    threshold_bytes: int,
+) -> None:
+    logger = get_logger(__name__)
+    while True:
+        await anyio.sleep(interval_seconds)
+        checkpoints = await anyio.to_thread.run_sync(
+            maintain_wal, database, threshold_bytes
+        )
+        for checkpoint in checkpoints:
+            logger.info(
+                "wal_checkpoint",
+                mode=checkpoint.mode,
+                busy=checkpoint.busy,
+                log_frames=checkpoint.log_frames,
+                checkpointed_frames=checkpoint.checkpointed_frames,
+                duration_ms=checkpoint.duration_ms,
+            )
+
+
+async def _compress_cold_revisions(
+    database: StudioDatabase,
+    *,
+    interval_seconds: float,
+    older_than: timedelta,
+) -> None:
+    logger = get_logger(__name__)
+    compress = partial(compress_cold_revisions, database, older_than=older_than)
+    while True:
+        await anyio.sleep(interval_seconds)
+        report = await anyio.to_thread.run_sync(compress)
+        if report.compressed:
+            logger.info("revision_compression", **asdict(report))
+
+
+async def _reindex_search(database: StudioDatabase) -> None:
+    """Rebuild a stale search index in the background instead of at startup."""
+    logger = get_logger(__name__)
+    if not await anyio.to_thread.run_sync(search_index_stale, database):
+        return
+    reindex = partial(reindex_search, database, database.search_tokenizer)
+    report = await anyio.to_thread.run_sync(reindex)
+    logger.info("search_reindex", **asdict(report))
+
+
+async def _maintain_search(
+    database: StudioDatabase, *, interval_seconds: float
+) -> None:
+    logger = get_logger(__name__)
+    while True:
+        await anyio.sleep(interval_seconds)
+        report = await anyio.to_thread.run_sync(maintain_search, database)
+        logger.info(
+            "search_maintenance",
+            reindex=None if report.reindex is None else asdict(report.reindex),
+            optimize_ms=report.optimize_ms,
+            healthy=report.after.healthy,
+            integrity=report.after.integrity,
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings: NovelEngineSettings = app.state.settings
@@ -117,10 +214,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         async with anyio.create_task_group() as tasks:
             tasks.start_soon(_cleanup_expired_guests, store)
+            tasks.start_soon(_reindex_search, runtime.database)
+            database_settings = settings.database
+            if database_settings.wal_checkpoint_interval_seconds and (
+                runtime.database.path is not None
+            ):
+                checkpoint = partial(
+                    _checkpoint_wal,
+                    runtime.database,
+                    interval_seconds=database_settings.wal_checkpoint_interval_seconds,
+                    threshold_bytes=database_settings.wal_checkpoint_threshold_mb << 20,
+                )
+                tasks.start_soon(checkpoint)
+            if database_settings.revision_compression_interval_seconds:
+                compression = partial(
+                    _compress_cold_revisions,
+                    runtime.database,
+                    interval_seconds=database_settings.revision_compression_interval_seconds,
+                    older_than=timedelta(
+                        days=database_settings.revision_compression_age_days
+                    ),
+                )
+                tasks.start_soon(compression)
+            if database_settings.search_maintenance_interval_seconds:
+                maintenance = partial(
+                    _maintain_search,
+                    runtime.database,
+                    interval_seconds=database_settings.search_maintenance_interval_seconds,
+                )
+                tasks.start_soon(maintenance)
             try:
                 yield
             finally:
                 tasks.cancel_scope.cancel()
     finally:
+        if runtime.group_commit is not None:
+            await anyio.to_thread.run_sync(runtime.group_commit.close)
         await anyio.to_thread.run_sync(runtime.database.dispose)
         logger.info("api_shutdown", message="Shutting down Novel Engine API")
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from datetime import timedelta
 from pathlib import Path
 
 from alembic.config import Config
@@ -23,8 +25,37 @@ from src.contexts.studio.infrastructure.database import (
     create_studio_database,
 )
 from src.contexts.studio.infrastructure.exporters import DEFAULT_EXPORT_WRITERS
-from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
-from src.shared.infrastructure.config.settings import get_settings
+from src.contexts.studio.infrastructure.fingerprint_repair import (
+    verify_fingerprints,
+)
+from src.contexts.studio.infrastructure.repository import (
+    RevisionStorage,
+    SqlAlchemyStudioRepository,
+)
+from src.contexts.studio.infrastructure.repository.query_plans import (
+    explain_hot_queries,
+)
+from src.contexts.studio.infrastructure.revision_compaction import (
+    blob_report,
+    compact_revisions,
+)
+from src.contexts.studio.infrastructure.revision_compression import (
+    compress_cold_revisions,
+    vacuum_database,
+)
+from src.contexts.studio.infrastructure.revision_pruning import (
+    RetentionPolicy,
+    prune_revisions,
+)
+from src.contexts.studio.infrastructure.search_maintenance import (
+    maintain_search,
+    verify_search,
+)
+from src.contexts.studio.infrastructure.wal import checkpoint_wal, wal_size
+from src.shared.infrastructure.config.settings import (
+    NovelEngineSettings,
+    get_settings,
+)
 
 
 class FileBackedDatabaseRequiredError(RuntimeError):
@@ -37,12 +68,21 @@ class CliRuntime:
     database: StudioDatabase
 
 
+def _revision_storage(settings: NovelEngineSettings) -> RevisionStorage:
+    return RevisionStorage(
+        mode=settings.database.revision_storage,
+        keyframe_interval=settings.database.revision_keyframe_interval,
+    )
+
+
 def _create_runtime() -> CliRuntime:
     settings = get_settings()
     database = create_studio_database(settings)
     return CliRuntime(
         store=StudioStore(
-            repository=SqlAlchemyStudioRepository(database),
+            repository=SqlAlchemyStudioRepository(
+                database, revision_storage=_revision_storage(settings)
+            ),
             data_dir=settings.data_dir,
             ai_provider_factory=create_studio_text_generation_provider,
             session_secret=settings.security.secret_key,
@@ -111,23 +151,108 @@ def _backup(_args: argparse.Namespace) -> int:
     return 0
 
 
-def _doctor(_args: argparse.Namespace) -> int:
+def _compact_revisions(args: argparse.Namespace) -> int:
+    configured = _revision_storage(get_settings())
+    storage = RevisionStorage(
+        mode=args.mode or configured.mode,
+        keyframe_interval=args.keyframe_interval or configured.keyframe_interval,
+    )
+    with _configured_runtime() as runtime:
+        _prepare_database(runtime.database)
+        report = compact_revisions(runtime.database, storage)
+    print(json.dumps(asdict(report), indent=2))  # noqa: T201
+    return 0
+
+
+def _compress_revisions(args: argparse.Namespace) -> int:
+    age_days = (
+        args.older_than_days or get_settings().database.revision_compression_age_days
+    )
+    with _configured_runtime() as runtime:
+        _prepare_database(runtime.database)
+        report = compress_cold_revisions(
+            runtime.database, older_than=timedelta(days=age_days)
+        )
+        if args.vacuum:
+            vacuum_database(runtime.database)
+    print(json.dumps(asdict(report), indent=2))  # noqa: T201
+    return 0
+
+
+def _prune_revisions(args: argparse.Namespace) -> int:
+    database_settings = get_settings().database
+    policy = RetentionPolicy(
+        keep_all=timedelta(hours=database_settings.revision_keep_all_hours),
+        hourly_until=timedelta(days=database_settings.revision_keep_hourly_days),
+    )
+    with _configured_runtime() as runtime:
+        _prepare_database(runtime.database)
+        report = prune_revisions(runtime.database, policy, dry_run=args.dry_run)
+    print(json.dumps(asdict(report), indent=2))  # noqa: T201
+    return 0
+
+
+def _print_progress(copied: int, total: int) -> None:
+    print(f"reindex: {copied}/{total} documents", file=sys.stderr)  # noqa: T201
+
+
+def _reindex(args: argparse.Namespace) -> int:
+    with _configured_runtime() as runtime:
+        _prepare_database(runtime.database)
+        if args.verify_only:
+            verified = verify_search(runtime.database)
+            print(json.dumps(asdict(verified), indent=2))  # noqa: T201
+            return 0 if verified.healthy else 1
+        report = maintain_search(
+            runtime.database,
+            rebuild=True,
+            chunk_size=args.chunk_size,
+            progress=_print_progress,
+        )
+    print(json.dumps(asdict(report), indent=2))  # noqa: T201
+    return 0 if report.after.healthy else 1
+
+
+def _doctor(args: argparse.Namespace) -> int:
     with _configured_runtime() as runtime:
         _prepare_database(runtime.database)
         with runtime.database.engine.connect() as connection:
             quick_check = connection.execute(text("PRAGMA quick_check")).scalar_one()
             journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar_one()
             foreign_keys = connection.execute(text("PRAGMA foreign_keys")).scalar_one()
+        wal_bytes = wal_size(runtime.database)
+        checkpoint = checkpoint_wal(runtime.database)
+        blobs = blob_report(runtime.database)
+        fingerprints = verify_fingerprints(
+            runtime.database, repair=args.repair_fingerprints
+        )
         payload = {
             "version": get_settings().project_version,
             "database": str(runtime.database.path),
             "quick_check": quick_check,
             "journal_mode": journal_mode,
             "foreign_keys": bool(foreign_keys),
+            "sqlite_pragmas": runtime.database.pragmas,
+            "wal_bytes": wal_bytes,
+            "wal_checkpoint": asdict(checkpoint),
+            "revision_blobs": {**asdict(blobs), "saved_bytes": blobs.saved_bytes},
+            "content_fingerprints": asdict(fingerprints),
             "owner_configured": runtime.store.owner_exists(),
         }
+        plans = explain_hot_queries(runtime.database.engine) if args.plans else []
+    if args.plans:
+        payload["query_plans"] = [
+            {
+                "name": plan.name,
+                "steps": list(plan.steps),
+                "full_scans": list(plan.full_scans),
+                "temp_sorts": list(plan.temp_sorts),
+            }
+            for plan in plans
+        ]
     print(json.dumps(payload, ensure_ascii=False, indent=2))  # noqa: T201
-    return 0 if quick_check == "ok" and foreign_keys else 1
+    healthy = quick_check == "ok" and foreign_keys and fingerprints.healthy
+    return 0 if healthy and not any(plan.flagged for plan in plans) else 1
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -151,7 +276,60 @@ def build_parser() -> argparse.ArgumentParser:
     backup = subparsers.add_parser("backup", help="Back up the SQLite database.")
     backup.set_defaults(handler=_backup)
 
+    compact = subparsers.add_parser(
+        "compact-revisions",
+        help="Re-encode stored revisions as deltas or full bodies.",
+    )
+    compact.add_argument("--mode", choices=("full", "delta"))
+    compact.add_argument("--keyframe-interval", type=int)
+    compact.set_defaults(handler=_compact_revisions)
+
+    compress = subparsers.add_parser(
+        "compress-revisions",
+        help="zlib-compress old revisions that are not current or snapshotted.",
+    )
+    compress.add_argument("--older-than-days", type=int)
+    compress.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="Rebuild the database file afterwards to return the freed pages.",
+    )
+    compress.set_defaults(handler=_compress_revisions)
+
+    prune = subparsers.add_parser(
+        "prune-revisions",
+        help="Thin old revision history down to the configured retention policy.",
+    )
+    prune.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the revisions that would be pruned without deleting them.",
+    )
+    prune.set_defaults(handler=_prune_revisions)
+
+    reindex = subparsers.add_parser(
+        "reindex",
+        help="Rebuild, verify and optimize the document search index.",
+    )
+    reindex.add_argument("--chunk-size", type=int, default=200)
+    reindex.add_argument(
+        "--verify-only",
+        action="store_true",
+        help="Compare the index with current revisions without changing it.",
+    )
+    reindex.set_defaults(handler=_reindex)
+
     doctor = subparsers.add_parser("doctor", help="Validate the local installation.")
+    doctor.add_argument(
+        "--plans",
+        action="store_true",
+        help="Explain the hot repository queries and flag full-table scans.",
+    )
+    doctor.add_argument(
+        "--repair-fingerprints",
+        action="store_true",
+        help="Rewrite project content fingerprints that no longer match.",
+    )
     doctor.set_defaults(handler=_doctor)
     return parser
 
@@ -9,16 +9,25 @@ from src.contexts.studio.application.ports.export_writer import (
     ExportChapter,
     ExportFormatWriter,
 )
+from src.contexts.studio.application.ports.pagination import (
+    decode_cursor,
+    encode_cursor,
+)
 from src.contexts.studio.application.ports.studio_repository import (
     DocumentDto,
     ExportDto,
     JobDto,
     JobEventDto,
+    NewDocumentDto,
     OwnerDto,
+    PageDto,
     ProjectDto,
+    ProjectSummaryDto,
     ReviewDto,
     ReviewIssueDto,
     RevisionDto,
+    RevisionSummaryDto,
+    SearchHitDto,
     SessionDto,
     SnapshotDocumentDto,
     SnapshotDto,
@@ -32,14 +41,21 @@ __all__ = [
     "ExportFormatWriter",
     "JobDto",
     "JobEventDto",
+    "NewDocumentDto",
     "OwnerDto",
+    "PageDto",
     "ProjectDto",
+    "ProjectSummaryDto",
     "ReviewDto",
     "ReviewIssueDto",
     "RevisionDto",
+    "RevisionSummaryDto",
+    "SearchHitDto",
     "SessionDto",
     "SnapshotDocumentDto",
     "SnapshotDto",
     "StudioRepository",
     "TextGenerationProviderFactory",
+    "decode_cursor",
+    "encode_cursor",
 ]
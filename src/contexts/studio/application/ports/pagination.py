@@ -0,0 +1,41 @@
+"""Opaque keyset cursors shared by paginated Studio listings."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from src.contexts.studio.domain.exceptions import InvalidOperation
+
+__all__ = ["decode_cursor", "encode_cursor"]
+
+
+def encode_cursor(values: Sequence[object]) -> str:
+    """Encode the sort key of the last row on a page as an opaque token."""
+    payload = json.dumps(
+        [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a token from :func:`encode_cursor` into ``size`` key values.
+
+    Raises ``InvalidOperation`` for tokens that were not issued by this API.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (UnicodeError, binascii.Error, ValueError) as exc:
+        raise InvalidOperation("Invalid pagination cursor.") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidOperation("Invalid pagination cursor.")
+    return values
@@ -7,6 +7,7 @@ from src.contexts.studio.application.ports.studio_repository_sections import (
     DocumentDto,
     ExportDto,
     JobDto,
+    PageDto,
     ReviewDto,
     RevisionDto,
     SnapshotDto,
@@ -15,15 +16,27 @@ from src.contexts.studio.application.ports.studio_repository_sections import (
 from src.contexts.studio.application.ports.studio_repository_sections import (
     JobEventDto as JobEventDto,
 )
+from src.contexts.studio.application.ports.studio_repository_sections import (
+    NewDocumentDto as NewDocumentDto,
+)
 from src.contexts.studio.application.ports.studio_repository_sections import (
     OwnerDto as OwnerDto,
 )
 from src.contexts.studio.application.ports.studio_repository_sections import (
     ProjectDto as ProjectDto,
 )
+from src.contexts.studio.application.ports.studio_repository_sections import (
+    ProjectSummaryDto as ProjectSummaryDto,
+)
 from src.contexts.studio.application.ports.studio_repository_sections import (
     ReviewIssueDto as ReviewIssueDto,
 )
+from src.contexts.studio.application.ports.studio_repository_sections import (
+    RevisionSummaryDto as RevisionSummaryDto,
+)
+from src.contexts.studio.application.ports.studio_repository_sections import (
+    SearchHitDto as SearchHitDto,
+)
 from src.contexts.studio.application.ports.studio_repository_sections import (
     SessionDto as SessionDto,
 )
@@ -52,18 +65,10 @@ class StudioRepository(StudioRepositoryCorePort, Protocol):
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[SnapshotDto]:
-        """List snapshots for a project."""
-        ...
-
-    def get_latest_export_snapshot(
-        self,
-        project_id: str,
-        *,
-        owner_id: str | None,
-        guest_session_id: str | None,
-    ) -> SnapshotDto | None:
-        """Return the most recent export snapshot for a project, if any."""
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[SnapshotDto]:
+        """List snapshots for a project, newest first, one keyset page at a time."""
         ...
 
     def snapshot_content(
@@ -76,16 +81,6 @@ class StudioRepository(StudioRepositoryCorePort, Protocol):
         """Return the document/revision pairs captured by a visible snapshot."""
         ...
 
-    def snapshot_revision_map(
-        self,
-        snapshot_id: str,
-        *,
-        owner_id: str | None,
-        guest_session_id: str | None,
-    ) -> dict[str, str]:
-        """Return ``{document_id: revision_id}`` for a visible snapshot."""
-        ...
-
     # ------------------------------------------------------------------
     # Reviews
     # ------------------------------------------------------------------
@@ -108,8 +103,10 @@ class StudioRepository(StudioRepositoryCorePort, Protocol):
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[ReviewDto]:
-        """List reviews for a project."""
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[ReviewDto]:
+        """List reviews for a project, newest first, one keyset page at a time."""
         ...
 
     # ------------------------------------------------------------------
@@ -136,8 +133,10 @@ class StudioRepository(StudioRepositoryCorePort, Protocol):
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[ExportDto]:
-        """List exports for a project."""
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[ExportDto]:
+        """List exports for a project, newest first, one keyset page at a time."""
         ...
 
     def get_export(
@@ -190,8 +189,10 @@ class StudioRepository(StudioRepositoryCorePort, Protocol):
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[JobDto]:
-        """List jobs for a project."""
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[JobDto]:
+        """List jobs for a project, newest first, one keyset page at a time."""
         ...
 
     def update_job(
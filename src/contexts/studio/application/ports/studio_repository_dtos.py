@@ -2,23 +2,39 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
 
 __all__ = [
     "DocumentDto",
     "ExportDto",
     "JobDto",
     "JobEventDto",
+    "NewDocumentDto",
     "OwnerDto",
+    "PageDto",
     "ProjectDto",
+    "ProjectSummaryDto",
     "ReviewDto",
     "ReviewIssueDto",
     "RevisionDto",
+    "RevisionSummaryDto",
+    "SearchHitDto",
     "SessionDto",
     "SnapshotDocumentDto",
     "SnapshotDto",
 ]
 
 
+@dataclass
+class PageDto(Generic[T]):
+    """One newest-first slice of a listing plus the cursor for the next one."""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
 @dataclass
 class OwnerDto:
     id: str
@@ -49,6 +65,24 @@ class RevisionDto:
     metadata_json: str
     source: str
     created_at: datetime
+    word_count: int
+    char_count: int
+    paragraph_count: int
+    content_sha256: str
+
+
+@dataclass
+class RevisionSummaryDto:
+    id: str
+    document_id: str
+    parent_revision_id: str | None
+    revision_number: int
+    source: str
+    created_at: datetime
+    word_count: int
+    char_count: int
+    paragraph_count: int
+    content_sha256: str
 
 
 @dataclass
@@ -64,6 +98,18 @@ class DocumentDto:
     current_revision: RevisionDto | None = None
 
 
+@dataclass
+class NewDocumentDto:
+    """One document of a bulk create; ``position=None`` appends to its kind."""
+
+    kind: str
+    title: str
+    content_markdown: str
+    metadata_json: str
+    position: int | None = None
+    source: str = "author"
+
+
 @dataclass
 class SnapshotDocumentDto:
     document_id: str
@@ -156,4 +202,34 @@ class ProjectDto:
     import_hash: str | None
     created_at: datetime
     updated_at: datetime
+    version: int = 1
     documents: list[DocumentDto] | None = None
+
+
+@dataclass
+class ProjectSummaryDto:
+    id: str
+    title: str
+    description: str
+    created_at: datetime
+    updated_at: datetime
+    document_counts: dict[str, int]
+    word_count: int
+    last_edited_document_id: str | None
+    last_edited_document_title: str | None
+    last_edited_at: datetime | None
+    latest_snapshot_at: datetime | None
+    latest_export_at: datetime | None
+
+
+@dataclass
+class SearchHitDto:
+    """One ranked full-text match; ``score`` is bm25, lower is better."""
+
+    id: int
+    score: float
+    project_id: str
+    project_title: str
+    document_id: str
+    title: str
+    excerpt: str
@@ -8,11 +8,16 @@ from src.contexts.studio.application.ports.studio_repository_dtos import (
     ExportDto,
     JobDto,
     JobEventDto,
+    NewDocumentDto,
     OwnerDto,
+    PageDto,
     ProjectDto,
+    ProjectSummaryDto,
     ReviewDto,
     ReviewIssueDto,
     RevisionDto,
+    RevisionSummaryDto,
+    SearchHitDto,
     SessionDto,
     SnapshotDocumentDto,
     SnapshotDto,
@@ -23,11 +28,16 @@ __all__ = [
     "ExportDto",
     "JobDto",
     "JobEventDto",
+    "NewDocumentDto",
     "OwnerDto",
+    "PageDto",
     "ProjectDto",
+    "ProjectSummaryDto",
     "ReviewDto",
     "ReviewIssueDto",
     "RevisionDto",
+    "RevisionSummaryDto",
+    "SearchHitDto",
     "SessionDto",
     "SnapshotDocumentDto",
     "SnapshotDto",
@@ -87,6 +97,13 @@ class StudioRepositoryCorePort(Protocol):
         guest_session_id: str | None,
     ) -> list[ProjectDto]: ...
 
+    def list_project_summaries(
+        self,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+    ) -> list[ProjectSummaryDto]: ...
+
     def get_project(
         self,
         project_id: str,
@@ -95,6 +112,16 @@ class StudioRepositoryCorePort(Protocol):
         guest_session_id: str | None,
     ) -> ProjectDto: ...
 
+    def project_version(
+        self,
+        project_id: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+    ) -> int:
+        """Return the counter every project or document write increments."""
+        ...
+
     def update_project(
         self,
         project_id: str,
@@ -147,6 +174,18 @@ class StudioRepositoryCorePort(Protocol):
         now: datetime,
     ) -> DocumentDto: ...
 
+    def create_documents(
+        self,
+        *,
+        project_id: str,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        documents: list[NewDocumentDto],
+        now: datetime,
+    ) -> list[DocumentDto]:
+        """Create many documents and their first revisions in one transaction."""
+        ...
+
     def list_documents(
         self,
         project_id: str,
@@ -207,7 +246,9 @@ class StudioRepositoryCorePort(Protocol):
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[RevisionDto]: ...
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[RevisionSummaryDto]: ...
 
     def reorder_documents(
         self,
@@ -219,6 +260,20 @@ class StudioRepositoryCorePort(Protocol):
         now: datetime,
     ) -> list[DocumentDto]: ...
 
+    def move_document(
+        self,
+        project_id: str,
+        document_id: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        anchor_id: str,
+        before: bool,
+        now: datetime,
+    ) -> DocumentDto:
+        """Place a document directly before or after ``anchor_id``."""
+        ...
+
     def search_documents(
         self,
         project_id: str,
@@ -227,3 +282,27 @@ class StudioRepositoryCorePort(Protocol):
         owner_id: str | None,
         guest_session_id: str | None,
     ) -> list[dict[str, Any]]: ...
+
+    def search_all_documents(
+        self,
+        query: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> PageDto[SearchHitDto]:
+        """Rank matches across every project the principal can see."""
+        ...
+
+    def suggest_titles(
+        self,
+        project_id: str,
+        prefix: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Documents whose title has a word starting with ``prefix``."""
+        ...
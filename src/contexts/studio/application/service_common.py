@@ -12,7 +12,7 @@ import json
 import logging
 import re
 import secrets
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, TypeVar, cast
@@ -28,9 +28,14 @@ from src.contexts.studio.application.ports import (
     DocumentDto,
     ExportDto,
     JobDto,
+    NewDocumentDto,
+    PageDto,
     ProjectDto,
+    ProjectSummaryDto,
     ReviewDto,
     RevisionDto,
+    RevisionSummaryDto,
+    SearchHitDto,
     SnapshotDto,
     StudioRepository,
     TextGenerationProviderFactory,
@@ -39,10 +44,14 @@ from src.contexts.studio.application.service_payloads import (
     _document_payload,
     _export_payload,
     _job_payload,
+    _page_payload,
     _project_payload,
+    _project_summary_payload,
     _review_payload,
     _revision_payload,
+    _revision_summary_payload,
     _safe_load_json,
+    _search_page_payload,
     _snapshot_payload,
     iso,
 )
@@ -102,18 +111,27 @@ _FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
 _MAX_SEARCH_TOKENS = 8
 
 
-def _build_fts5_match_query(query: str) -> str | None:
+def _build_fts5_match_query(query: str, *, prefix: bool = False) -> str | None:
     """Build a safe SQLite FTS5 MATCH expression from user text.
 
     User input is reduced to tokenizer-like word tokens, then each token is
     quoted before joining with AND semantics. FTS5 operators, column filters,
     NEAR groups, wildcards, and punctuation never cross this boundary.
+
+    With ``prefix`` the token still being typed (the last one, unless the
+    query ends in a separator) becomes a prefix query, ``"tok"*``.
     """
-    tokens = _FTS_TOKEN_RE.findall(query.casefold())
+    folded = query.casefold()
+    tokens = _FTS_TOKEN_RE.findall(folded)
     if not tokens:
         return None
     unique_tokens = list(dict.fromkeys(tokens))[:_MAX_SEARCH_TOKENS]
-    return " ".join(f'"{token}"' for token in unique_tokens)
+    terms = [f'"{token}"' for token in unique_tokens]
+    partial = tokens[-1]
+    if prefix and folded.endswith(partial) and partial in unique_tokens:
+        index = unique_tokens.index(partial)
+        terms[index] = f"{terms[index]}*"
+    return " ".join(terms)
 
 
 def _stream_sha256(path: Path) -> str:
@@ -243,6 +261,8 @@ def _owner_scopes(principal: Principal) -> tuple[str | None, str | None]:
 __all__ = [
     "Any",
     "Iterable",
+    "Mapping",
+    "Sequence",
     "Path",
     "T",
     "cast",
@@ -256,9 +276,14 @@ __all__ = [
     "DocumentDto",
     "ExportDto",
     "JobDto",
+    "NewDocumentDto",
+    "PageDto",
     "ProjectDto",
+    "ProjectSummaryDto",
     "ReviewDto",
     "RevisionDto",
+    "RevisionSummaryDto",
+    "SearchHitDto",
     "SnapshotDto",
     "StudioRepository",
     "TextGenerationProviderFactory",
@@ -293,10 +318,14 @@ __all__ = [
     "Principal",
     "_owner_scopes",
     "_project_payload",
+    "_project_summary_payload",
     "_document_payload",
     "_revision_payload",
+    "_revision_summary_payload",
     "_snapshot_payload",
     "_review_payload",
     "_job_payload",
+    "_page_payload",
+    "_search_page_payload",
     "_export_payload",
 ]
@@ -1,23 +1,30 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from src.contexts.studio.application.ports import (
     DocumentDto,
     ExportDto,
     JobDto,
+    PageDto,
     ProjectDto,
+    ProjectSummaryDto,
     ReviewDto,
     RevisionDto,
+    RevisionSummaryDto,
+    SearchHitDto,
     SnapshotDto,
 )
 from src.contexts.studio.domain.exceptions import InvalidOperation
-from src.contexts.studio.domain.utils import _word_count, load_json
+from src.contexts.studio.domain.utils import load_json
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def iso(value: datetime | None) -> str | None:
     return value.astimezone(UTC).isoformat().replace("+00:00", "Z") if value else None
@@ -31,6 +38,31 @@ def _safe_load_json(value: str | None) -> Any:
         return {}
 
 
+def _page_payload(
+    key: str,
+    page: PageDto[T],
+    payload: Callable[[T], dict[str, Any]],
+) -> dict[str, Any]:
+    return {
+        key: [payload(item) for item in page.items],
+        "next_cursor": page.next_cursor,
+    }
+
+
+def _search_page_payload(page: PageDto[SearchHitDto]) -> dict[str, Any]:
+    """Group ranked hits by project, projects in order of their best hit."""
+    projects: dict[str, dict[str, Any]] = {}
+    for hit in page.items:
+        group = projects.setdefault(
+            hit.project_id,
+            {"project_id": hit.project_id, "title": hit.project_title, "results": []},
+        )
+        group["results"].append(
+            {"document_id": hit.document_id, "title": hit.title, "excerpt": hit.excerpt}
+        )
+    return {"projects": list(projects.values()), "next_cursor": page.next_cursor}
+
+
 def _project_payload(
     project: ProjectDto,
     *,
@@ -44,6 +76,7 @@ def _project_payload(
         "import_hash": project.import_hash,
         "created_at": iso(project.created_at),
         "updated_at": iso(project.updated_at),
+        "version": project.version,
     }
     if include_documents:
         documents = project.documents or []
@@ -51,6 +84,28 @@ def _project_payload(
     return payload
 
 
+def _project_summary_payload(summary: ProjectSummaryDto) -> dict[str, Any]:
+    last_edited = None
+    if summary.last_edited_document_id is not None:
+        last_edited = {
+            "id": summary.last_edited_document_id,
+            "title": summary.last_edited_document_title,
+            "updated_at": iso(summary.last_edited_at),
+        }
+    return {
+        "id": summary.id,
+        "title": summary.title,
+        "description": summary.description,
+        "created_at": iso(summary.created_at),
+        "updated_at": iso(summary.updated_at),
+        "document_counts": summary.document_counts,
+        "word_count": summary.word_count,
+        "last_edited_document": last_edited,
+        "latest_snapshot_at": iso(summary.latest_snapshot_at),
+        "latest_export_at": iso(summary.latest_export_at),
+    }
+
+
 def _document_payload(document: DocumentDto) -> dict[str, Any]:
     revision = document.current_revision
     if revision is None:
@@ -65,7 +120,7 @@ def _document_payload(document: DocumentDto) -> dict[str, Any]:
         "content_markdown": revision.content_markdown,
         "metadata": _safe_load_json(revision.metadata_json),
         "revision_source": revision.source,
-        "word_count": _word_count(revision.content_markdown),
+        "word_count": revision.word_count,
         "created_at": iso(document.created_at),
         "updated_at": iso(document.updated_at),
     }
@@ -80,7 +135,25 @@ def _revision_payload(revision: RevisionDto) -> dict[str, Any]:
         "content_markdown": revision.content_markdown,
         "metadata": _safe_load_json(revision.metadata_json),
         "source": revision.source,
-        "word_count": _word_count(revision.content_markdown),
+        "word_count": revision.word_count,
+        "char_count": revision.char_count,
+        "paragraph_count": revision.paragraph_count,
+        "content_sha256": revision.content_sha256,
+        "created_at": iso(revision.created_at),
+    }
+
+
+def _revision_summary_payload(revision: RevisionSummaryDto) -> dict[str, Any]:
+    return {
+        "id": revision.id,
+        "document_id": revision.document_id,
+        "parent_revision_id": revision.parent_revision_id,
+        "revision_number": revision.revision_number,
+        "source": revision.source,
+        "word_count": revision.word_count,
+        "char_count": revision.char_count,
+        "paragraph_count": revision.paragraph_count,
+        "content_sha256": revision.content_sha256,
         "created_at": iso(revision.created_at),
     }
 
@@ -5,12 +5,16 @@ from src.contexts.studio.application.service_common import (
     Any,
     DocumentKind,
     InvalidOperation,
+    Mapping,
+    NewDocumentDto,
     Principal,
     RevisionConflict,
+    Sequence,
     StudioRepository,
     _build_fts5_match_query,
     _document_payload,
     _owner_scopes,
+    _search_page_payload,
     dump_json,
     utcnow,
 )
@@ -57,6 +61,53 @@ class DocumentService:
         )
         return _document_payload(document)
 
+    def create_documents(
+        self,
+        principal: Principal,
+        project_id: str,
+        documents: Sequence[Mapping[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Create every document in ``documents`` with a single commit.
+
+        Each item takes the keyword arguments of :meth:`create_document`.
+        """
+        new_documents = []
+        for item in documents:
+            kind = item["kind"]
+            if kind not in DOCUMENT_KINDS:
+                raise InvalidOperation(f"Unsupported document kind: {kind}")
+            new_documents.append(
+                NewDocumentDto(
+                    kind=kind,
+                    title=item["title"],
+                    content_markdown=item.get("content_markdown", ""),
+                    metadata_json=dump_json(item.get("metadata") or {}),
+                    position=item.get("position"),
+                )
+            )
+        owner_id, guest_session_id = _owner_scopes(principal)
+        created = self._repository.create_documents(
+            project_id=project_id,
+            owner_id=owner_id,
+            guest_session_id=guest_session_id,
+            documents=new_documents,
+            now=utcnow(),
+        )
+        return [_document_payload(document) for document in created]
+
+    def list_documents(
+        self,
+        principal: Principal,
+        project_id: str,
+    ) -> list[dict[str, Any]]:
+        owner_id, guest_session_id = _owner_scopes(principal)
+        documents = self._repository.list_documents(
+            project_id,
+            owner_id=owner_id,
+            guest_session_id=guest_session_id,
+        )
+        return [_document_payload(document) for document in documents]
+
     def get_document(
         self,
         principal: Principal,
@@ -140,13 +191,39 @@ class DocumentService:
         )
         return [_document_payload(document) for document in documents]
 
+    def move_document(
+        self,
+        principal: Principal,
+        project_id: str,
+        document_id: str,
+        *,
+        before_id: str | None = None,
+        after_id: str | None = None,
+    ) -> dict[str, Any]:
+        anchor_id = before_id or after_id
+        if anchor_id is None or (before_id and after_id):
+            raise InvalidOperation("Move needs exactly one of before_id or after_id.")
+        owner_id, guest_session_id = _owner_scopes(principal)
+        document = self._repository.move_document(
+            project_id,
+            document_id,
+            owner_id=owner_id,
+            guest_session_id=guest_session_id,
+            anchor_id=anchor_id,
+            before=before_id is not None,
+            now=utcnow(),
+        )
+        return _document_payload(document)
+
     def search(
         self,
         principal: Principal,
         project_id: str,
         query: str,
+        *,
+        prefix: bool = False,
     ) -> list[dict[str, Any]]:
-        match_query = _build_fts5_match_query(query)
+        match_query = _build_fts5_match_query(query, prefix=prefix)
         if match_query is None:
             return []
         owner_id, guest_session_id = _owner_scopes(principal)
@@ -156,3 +233,44 @@ class DocumentService:
             owner_id=owner_id,
             guest_session_id=guest_session_id,
         )
+
+    def search_all(
+        self,
+        principal: Principal,
+        query: str,
+        *,
+        prefix: bool = False,
+        limit: int = 30,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        match_query = _build_fts5_match_query(query, prefix=prefix)
+        if match_query is None:
+            return {"projects": [], "next_cursor": None}
+        owner_id, guest_session_id = _owner_scopes(principal)
+        page = self._repository.search_all_documents(
+            match_query,
+            owner_id=owner_id,
+            guest_session_id=guest_session_id,
+            limit=limit,
+            cursor=cursor,
+        )
+        return _search_page_payload(page)
+
+    def suggest(
+        self,
+        principal: Principal,
+        project_id: str,
+        prefix: str,
+        *,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        if not prefix.strip():
+            return []
+        owner_id, guest_session_id = _owner_scopes(principal)
+        return self._repository.suggest_titles(
+            project_id,
+            prefix,
+            owner_id=owner_id,
+            guest_session_id=guest_session_id,
+            limit=limit,
+        )
@@ -17,6 +17,7 @@ from src.contexts.studio.application.service_common import (
     StudioRepository,
     _export_payload,
     _owner_scopes,
+    _page_payload,
     _plain_text,
     _stream_sha256,
     new_id,
@@ -57,36 +58,15 @@ class ExportService:
             owner_id=owner_id,
             guest_session_id=guest_session_id,
         )
-        snapshot = self._repository.get_latest_export_snapshot(
+        # The repository hands back the latest snapshot when nothing was
+        # edited or moved since, so repeated exports share one snapshot.
+        snapshot = self._repository.create_snapshot(
             project_id,
             owner_id=owner_id,
             guest_session_id=guest_session_id,
+            reason="export",
+            now=utcnow(),
         )
-        current_revisions = {
-            document.id: document.current_revision_id
-            for document in self._repository.list_documents(
-                project_id,
-                owner_id=owner_id,
-                guest_session_id=guest_session_id,
-            )
-        }
-        snapshot_revisions = (
-            self._repository.snapshot_revision_map(
-                snapshot.id,
-                owner_id=owner_id,
-                guest_session_id=guest_session_id,
-            )
-            if snapshot is not None
-            else {}
-        )
-        if snapshot is None or snapshot_revisions != current_revisions:
-            snapshot = self._repository.create_snapshot(
-                project_id,
-                owner_id=owner_id,
-                guest_session_id=guest_session_id,
-                reason="export",
-                now=utcnow(),
-            )
         content = [
             (document, revision)
             for document, revision in self._repository.snapshot_content(
@@ -126,14 +106,19 @@ class ExportService:
         self,
         principal: Principal,
         project_id: str,
-    ) -> list[dict[str, Any]]:
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
         owner_id, guest_session_id = _owner_scopes(principal)
-        exports = self._repository.list_exports(
+        page = self._repository.list_exports(
             project_id,
             owner_id=owner_id,
             guest_session_id=guest_session_id,
+            limit=limit,
+            cursor=cursor,
         )
-        return [_export_payload(item) for item in exports]
+        return _page_payload("exports", page, _export_payload)
 
     def export_path(
         self,
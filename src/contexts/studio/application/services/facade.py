@@ -26,7 +26,11 @@ from src.contexts.studio.application.services.facade_workflow import WorkflowFac
 __all__ = ["StudioStore"]
 
 
-class StudioStore(AuthProjectFacade, DocumentRevisionFacade, WorkflowFacade):
+class StudioStore(
+    AuthProjectFacade,
+    DocumentRevisionFacade,
+    WorkflowFacade,
+):
     def _project_payload(
         self,
         project: ProjectDto,
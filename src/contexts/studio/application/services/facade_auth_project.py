@@ -54,9 +54,15 @@ class AuthProjectFacade(StudioServiceRegistry):
     def list_projects(self, principal: Principal) -> list[dict[str, Any]]:
         return self.project_service.list_projects(principal)
 
+    def list_project_summaries(self, principal: Principal) -> list[dict[str, Any]]:
+        return self.project_service.list_project_summaries(principal)
+
     def get_project(self, principal: Principal, project_id: str) -> dict[str, Any]:
         return self.project_service.get_project(principal, project_id)
 
+    def project_version(self, principal: Principal, project_id: str) -> int:
+        return self.project_service.project_version(principal, project_id)
+
     def update_project(
         self,
         principal: Principal,
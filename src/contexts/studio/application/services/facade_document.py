@@ -3,7 +3,9 @@ from __future__ import annotations
 from src.contexts.studio.application.service_common import (
     Any,
     DocumentKind,
+    Mapping,
     Principal,
+    Sequence,
 )
 from src.contexts.studio.application.services.facade_base import StudioServiceRegistry
 
@@ -30,6 +32,21 @@ class DocumentRevisionFacade(StudioServiceRegistry):
             metadata=metadata,
         )
 
+    def create_documents(
+        self,
+        principal: Principal,
+        project_id: str,
+        documents: Sequence[Mapping[str, Any]],
+    ) -> list[dict[str, Any]]:
+        return self.document_service.create_documents(principal, project_id, documents)
+
+    def list_documents(
+        self,
+        principal: Principal,
+        project_id: str,
+    ) -> list[dict[str, Any]]:
+        return self.document_service.list_documents(principal, project_id)
+
     def get_document(
         self,
         principal: Principal,
@@ -79,21 +96,79 @@ class DocumentRevisionFacade(StudioServiceRegistry):
             principal, project_id, document_ids
         )
 
+    def move_document(
+        self,
+        principal: Principal,
+        project_id: str,
+        document_id: str,
+        *,
+        before_id: str | None = None,
+        after_id: str | None = None,
+    ) -> dict[str, Any]:
+        return self.document_service.move_document(
+            principal,
+            project_id,
+            document_id,
+            before_id=before_id,
+            after_id=after_id,
+        )
+
     def search(
         self,
         principal: Principal,
         project_id: str,
         query: str,
+        *,
+        prefix: bool = False,
     ) -> list[dict[str, Any]]:
-        return self.document_service.search(principal, project_id, query)
+        return self.document_service.search(principal, project_id, query, prefix=prefix)
+
+    def search_all(
+        self,
+        principal: Principal,
+        query: str,
+        *,
+        prefix: bool = False,
+        limit: int = 30,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        return self.document_service.search_all(
+            principal, query, prefix=prefix, limit=limit, cursor=cursor
+        )
+
+    def suggest(
+        self,
+        principal: Principal,
+        project_id: str,
+        prefix: str,
+        *,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        return self.document_service.suggest(principal, project_id, prefix, limit=limit)
 
     def list_revisions(
         self,
         principal: Principal,
         project_id: str,
         document_id: str,
-    ) -> list[dict[str, Any]]:
-        return self.revision_service.list_revisions(principal, project_id, document_id)
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        return self.revision_service.list_revisions(
+            principal, project_id, document_id, limit=limit, cursor=cursor
+        )
+
+    def get_revision(
+        self,
+        principal: Principal,
+        project_id: str,
+        document_id: str,
+        revision_id: str,
+    ) -> dict[str, Any]:
+        return self.revision_service.get_revision(
+            principal, project_id, document_id, revision_id
+        )
 
     def restore_revision(
         self,
@@ -127,5 +202,10 @@ class DocumentRevisionFacade(StudioServiceRegistry):
         self,
         principal: Principal,
         project_id: str,
-    ) -> list[dict[str, Any]]:
-        return self.snapshot_service.list_snapshots(principal, project_id)
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        return self.snapshot_service.list_snapshots(
+            principal, project_id, limit=limit, cursor=cursor
+        )
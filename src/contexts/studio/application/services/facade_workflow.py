@@ -26,8 +26,13 @@ class WorkflowFacade(StudioServiceRegistry):
         self,
         principal: Principal,
         project_id: str,
-    ) -> list[dict[str, Any]]:
-        return self.review_service.list_reviews(principal, project_id)
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        return self.review_service.list_reviews(
+            principal, project_id, limit=limit, cursor=cursor
+        )
 
     def export_project(
         self,
@@ -44,8 +49,13 @@ class WorkflowFacade(StudioServiceRegistry):
         self,
         principal: Principal,
         project_id: str,
-    ) -> list[dict[str, Any]]:
-        return self.export_service.list_exports(principal, project_id)
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        return self.export_service.list_exports(
+            principal, project_id, limit=limit, cursor=cursor
+        )
 
     def export_path(
         self,
@@ -84,8 +94,17 @@ class WorkflowFacade(StudioServiceRegistry):
     ) -> dict[str, Any]:
         return self.ai_service.accept_ai_proposal(principal, project_id, job_id)
 
-    def list_jobs(self, principal: Principal, project_id: str) -> list[dict[str, Any]]:
-        return self.job_service.list_jobs(principal, project_id)
+    def list_jobs(
+        self,
+        principal: Principal,
+        project_id: str,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        return self.job_service.list_jobs(
+            principal, project_id, limit=limit, cursor=cursor
+        )
 
     async def retry_job(
         self,
@@ -12,6 +12,7 @@ from src.contexts.studio.application.service_common import (
     hashlib,
     yaml,
 )
+from src.contexts.studio.domain.utils import POSITION_GAP
 
 from .document_service import DocumentService
 from .project_service import ProjectService
@@ -81,19 +82,24 @@ class ImportService:
             create_seed=False,
         )
         source_root = Path(str(preview["source"]))
-        for position, chapter_path in enumerate(
-            sorted((source_root / "manuscript" / "chapters").glob("chapter-*.md")),
-            start=1,
-        ):
-            self._document_service.create_document(
-                principal,
-                new_project["id"],
-                kind="chapter",
-                title=f"Chapter {position}",
-                content_markdown=chapter_path.read_text(encoding="utf-8"),
-                position=position,
-                metadata={"legacy_filename": chapter_path.name},
-            )
+        chapters = sorted(
+            (source_root / "manuscript" / "chapters").glob("chapter-*.md")
+        )
+        # One bulk write keeps a large workspace import to a single commit.
+        self._document_service.create_documents(
+            principal,
+            new_project["id"],
+            [
+                {
+                    "kind": "chapter",
+                    "title": f"Chapter {slot}",
+                    "content_markdown": chapter_path.read_text(encoding="utf-8"),
+                    "position": slot * POSITION_GAP,
+                    "metadata": {"legacy_filename": chapter_path.name},
+                }
+                for slot, chapter_path in enumerate(chapters, start=1)
+            ],
+        )
         self._repository.set_project_import_hash(
             new_project["id"],
             str(preview["source_hash"]),
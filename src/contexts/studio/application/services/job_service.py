@@ -11,6 +11,7 @@ from src.contexts.studio.application.service_common import (
     TextGenerationProviderError,
     _job_payload,
     _owner_scopes,
+    _page_payload,
     _safe_load_json,
     cast,
     dump_json,
@@ -40,14 +41,23 @@ class JobService:
         self._review_service = review_service
         self._export_service = export_service
 
-    def list_jobs(self, principal: Principal, project_id: str) -> list[dict[str, Any]]:
+    def list_jobs(
+        self,
+        principal: Principal,
+        project_id: str,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
         owner_id, guest_session_id = _owner_scopes(principal)
-        jobs = self._repository.list_jobs(
+        page = self._repository.list_jobs(
             project_id,
             owner_id=owner_id,
             guest_session_id=guest_session_id,
+            limit=limit,
+            cursor=cursor,
         )
-        return [_job_payload(job) for job in jobs]
+        return _page_payload("jobs", page, _job_payload)
 
     async def retry_job(
         self,
@@ -7,6 +7,7 @@ from src.contexts.studio.application.service_common import (
     StudioRepository,
     _owner_scopes,
     _project_payload,
+    _project_summary_payload,
     dump_json,
     utcnow,
 )
@@ -53,6 +54,14 @@ class ProjectService:
             _project_payload(project, include_documents=False) for project in projects
         ]
 
+    def list_project_summaries(self, principal: Principal) -> list[dict[str, Any]]:
+        owner_id, guest_session_id = _owner_scopes(principal)
+        summaries = self._repository.list_project_summaries(
+            owner_id=owner_id,
+            guest_session_id=guest_session_id,
+        )
+        return [_project_summary_payload(summary) for summary in summaries]
+
     def get_project(self, principal: Principal, project_id: str) -> dict[str, Any]:
         owner_id, guest_session_id = _owner_scopes(principal)
         project = self._repository.get_project(
@@ -62,6 +71,14 @@ class ProjectService:
         )
         return _project_payload(project)
 
+    def project_version(self, principal: Principal, project_id: str) -> int:
+        owner_id, guest_session_id = _owner_scopes(principal)
+        return self._repository.project_version(
+            project_id,
+            owner_id=owner_id,
+            guest_session_id=guest_session_id,
+        )
+
     def update_project(
         self,
         principal: Principal,
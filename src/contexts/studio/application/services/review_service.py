@@ -5,6 +5,7 @@ from src.contexts.studio.application.service_common import (
     Principal,
     StudioRepository,
     _owner_scopes,
+    _page_payload,
     _review_payload,
     utcnow,
 )
@@ -41,11 +42,16 @@ class ReviewService:
         self,
         principal: Principal,
         project_id: str,
-    ) -> list[dict[str, Any]]:
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
         owner_id, guest_session_id = _owner_scopes(principal)
-        reviews = self._repository.list_reviews(
+        page = self._repository.list_reviews(
             project_id,
             owner_id=owner_id,
             guest_session_id=guest_session_id,
+            limit=limit,
+            cursor=cursor,
         )
-        return [_review_payload(review) for review in reviews]
+        return _page_payload("reviews", page, _review_payload)
@@ -5,7 +5,9 @@ from src.contexts.studio.application.service_common import (
     Principal,
     StudioRepository,
     _owner_scopes,
+    _page_payload,
     _revision_payload,
+    _revision_summary_payload,
     _safe_load_json,
     cast,
 )
@@ -31,15 +33,37 @@ class RevisionService:
         principal: Principal,
         project_id: str,
         document_id: str,
-    ) -> list[dict[str, Any]]:
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
         owner_id, guest_session_id = _owner_scopes(principal)
-        revisions = self._repository.list_revisions(
+        page = self._repository.list_revisions(
             project_id,
             document_id,
             owner_id=owner_id,
             guest_session_id=guest_session_id,
+            limit=limit,
+            cursor=cursor,
+        )
+        return _page_payload("revisions", page, _revision_summary_payload)
+
+    def get_revision(
+        self,
+        principal: Principal,
+        project_id: str,
+        document_id: str,
+        revision_id: str,
+    ) -> dict[str, Any]:
+        owner_id, guest_session_id = _owner_scopes(principal)
+        revision = self._repository.get_revision(
+            project_id,
+            document_id,
+            revision_id,
+            owner_id=owner_id,
+            guest_session_id=guest_session_id,
         )
-        return [_revision_payload(revision) for revision in revisions]
+        return _revision_payload(revision)
 
     def restore_revision(
         self,
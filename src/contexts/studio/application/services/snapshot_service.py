@@ -5,6 +5,7 @@ from src.contexts.studio.application.service_common import (
     Principal,
     StudioRepository,
     _owner_scopes,
+    _page_payload,
     _snapshot_payload,
     utcnow,
 )
@@ -39,11 +40,16 @@ class SnapshotService:
         self,
         principal: Principal,
         project_id: str,
-    ) -> list[dict[str, Any]]:
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
         owner_id, guest_session_id = _owner_scopes(principal)
-        snapshots = self._repository.list_snapshots(
+        page = self._repository.list_snapshots(
             project_id,
             owner_id=owner_id,
             guest_session_id=guest_session_id,
+            limit=limit,
+            cursor=cursor,
         )
-        return [_snapshot_payload(snapshot) for snapshot in snapshots]
+        return _page_payload("snapshots", page, _snapshot_payload)
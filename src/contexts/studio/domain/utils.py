@@ -13,6 +13,10 @@ from uuid import uuid4
 
 logger = logging.getLogger(__name__)
 
+# Documents are ordered by sparse integer positions so a move can land
+# between two neighbours without renumbering the rest of the project.
+POSITION_GAP = 1024
+
 
 def utcnow() -> datetime:
     """Return the current UTC datetime."""
@@ -60,3 +64,33 @@ def _token_hash(token: str, secret_key: str) -> str:
 
 def _word_count(markdown: str) -> int:
     return len(re.findall(r"\b[\w'-]+\b", markdown, flags=re.UNICODE))
+
+
+def _paragraph_count(markdown: str) -> int:
+    return sum(1 for block in re.split(r"\n\s*\n", markdown) if block.strip())
+
+
+def _content_sha256(markdown: str) -> str:
+    return hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+
+
+def _revision_statistics(markdown: str) -> dict[str, Any]:
+    """Return the statistics stored alongside every document revision."""
+    return {
+        "word_count": _word_count(markdown),
+        "char_count": len(markdown),
+        "paragraph_count": _paragraph_count(markdown),
+        "content_sha256": _content_sha256(markdown),
+    }
+
+
+def _position_between(lower: int, upper: int | None) -> int | None:
+    """Return a position strictly between two neighbours, or ``None`` if full.
+
+    ``upper=None`` means the slot after the last document.
+    """
+    if upper is None:
+        return lower + POSITION_GAP
+    if upper - lower < 2:
+        return None
+    return (lower + upper) // 2
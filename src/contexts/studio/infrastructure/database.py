@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
@@ -13,6 +13,10 @@ from sqlalchemy import Engine, create_engine, event, select, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.contexts.studio.infrastructure.models import Base, Job, JobEvent
+from src.contexts.studio.infrastructure.search_models import (
+    SearchTokenizer,
+    search_table_ddl,
+)
 from src.shared.infrastructure.config.settings import NovelEngineSettings, get_settings
 
 
@@ -29,6 +33,7 @@ class UnitOfWork:
 
     def __enter__(self) -> Session:
         self._session = self._database._session_factory()
+        self._database._lock_writer(self._session)
         return self._session
 
     def __exit__(
@@ -71,31 +76,103 @@ def backup_database(path: Path) -> Path | None:
 
 
 class StudioDatabase:
-    """Own the SQLite engine and transactional sessions."""
+    """Own the SQLite writer and reader engines and transactional sessions.
 
-    def __init__(self, url: str | None = None) -> None:
+    ``engine`` is the process's only writer and holds a single connection, so
+    every mutation (request handlers on worker threads, group commit, background
+    maintenance) is serialized in-process instead of racing other connections
+    for the SQLite write lock.
+    ``read_engine`` is a pool of ``query_only`` WAL connections sized from
+    ``DatabaseSettings`` so reads run concurrently with the writer. Both apply
+    ``pragmas`` (cache, mmap, temp store, autocheckpoint) to every connection.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        *,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: int = 30,
+        echo: bool = False,
+        pragmas: Mapping[str, int | str] | None = None,
+        search_tokenizer: SearchTokenizer = "unicode61",
+    ) -> None:
         self.url = url or get_settings().database.url
+        self.pragmas = dict(pragmas or {})
+        self.search_tokenizer = search_tokenizer
         path = _database_path_from_url(self.url)
         if path is not None:
             path.parent.mkdir(parents=True, exist_ok=True)
         self.path = path
-        self.engine = create_engine(
-            self.url,
-            connect_args={"check_same_thread": False}
-            if self.url.startswith("sqlite")
-            else {},
-            future=True,
+        self.engine = self._create_engine(
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=pool_timeout,
+            echo=echo,
         )
+        self._configure_sqlite(self.engine, pragmas=self.pragmas)
+        if path is None:
+            # In-memory databases are private to one connection pool, so the
+            # reader has to share the writer engine to observe its data.
+            self.read_engine = self.engine
+        else:
+            self.read_engine = self._create_engine(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                echo=echo,
+            )
+            self._configure_sqlite(
+                self.read_engine, query_only=True, pragmas=self.pragmas
+            )
         self._session_factory = sessionmaker(
             bind=self.engine,
             expire_on_commit=False,
             autoflush=False,
             future=True,
         )
-        self._configure_sqlite(self.engine)
+        self._read_session_factory = sessionmaker(
+            bind=self.read_engine,
+            expire_on_commit=False,
+            autoflush=False,
+            future=True,
+        )
+
+    def _create_engine(
+        self,
+        *,
+        pool_size: int,
+        max_overflow: int,
+        pool_timeout: int,
+        echo: bool,
+    ) -> Engine:
+        if self.path is None:
+            return create_engine(
+                self.url,
+                connect_args={"check_same_thread": False}
+                if self.url.startswith("sqlite")
+                else {},
+                echo=echo,
+                future=True,
+            )
+        return create_engine(
+            self.url,
+            connect_args={"check_same_thread": False},
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            echo=echo,
+            future=True,
+        )
 
     @staticmethod
-    def _configure_sqlite(engine: Engine) -> None:
+    def _configure_sqlite(
+        engine: Engine,
+        *,
+        query_only: bool = False,
+        pragmas: Mapping[str, int | str] | None = None,
+    ) -> None:
         if not str(engine.url).startswith("sqlite"):
             return
 
@@ -105,6 +182,11 @@ class StudioDatabase:
             cursor.execute("PRAGMA foreign_keys=ON")
             cursor.execute("PRAGMA journal_mode=WAL")
             cursor.execute("PRAGMA synchronous=NORMAL")
+            # Values come from validated settings, never from request input.
+            for name, value in (pragmas or {}).items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            if query_only:
+                cursor.execute("PRAGMA query_only=ON")
             cursor.close()
 
     def initialize(
@@ -118,12 +200,7 @@ class StudioDatabase:
         if create_schema:
             Base.metadata.create_all(self.engine)
             with self.engine.begin() as connection:
-                connection.execute(
-                    text(
-                        "CREATE VIRTUAL TABLE IF NOT EXISTS document_search USING fts5("
-                        "document_id UNINDEXED, project_id UNINDEXED, title, content)"
-                    )
-                )
+                connection.execute(text(search_table_ddl(self.search_tokenizer)))
         self.recover_jobs()
 
     def recover_jobs(self) -> int:
@@ -151,11 +228,29 @@ class StudioDatabase:
 
     def dispose(self) -> None:
         """Release pooled database connections during application shutdown."""
+        if self.read_engine is not self.engine:
+            self.read_engine.dispose()
         self.engine.dispose()
 
+    def _lock_writer(self, session: Session) -> None:
+        # pysqlite defers BEGIN to the first DML statement, so the reads of a
+        # read-modify-write (project version, content fingerprint) would run
+        # outside the transaction and could act on rows another writer has
+        # since replaced. Taking the write lock up front keeps them current.
+        if self.engine.dialect.name == "sqlite":
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+
     @contextmanager
     def session(self) -> Iterator[Session]:
+        """Yield a writer session that holds SQLite's write lock throughout."""
         with self._session_factory() as session, session.begin():
+            self._lock_writer(session)
+            yield session
+
+    @contextmanager
+    def read_session(self) -> Iterator[Session]:
+        """Yield a session on a ``query_only`` reader connection."""
+        with self._read_session_factory() as session, session.begin():
             yield session
 
     def unit_of_work(self) -> UnitOfWork:
@@ -169,8 +264,16 @@ def create_studio_database(
     url: str | None = None,
 ) -> StudioDatabase:
     """Create a Studio database after runtime configuration has been resolved."""
-    resolved_settings = settings or get_settings()
-    return StudioDatabase(url or resolved_settings.database.url)
+    database_settings = (settings or get_settings()).database
+    return StudioDatabase(
+        url or database_settings.url,
+        pool_size=database_settings.pool_size,
+        max_overflow=database_settings.max_overflow,
+        pool_timeout=database_settings.pool_timeout,
+        echo=database_settings.echo,
+        pragmas=database_settings.sqlite_pragmas(),
+        search_tokenizer=database_settings.search_tokenizer,
+    )
 
 
 def initialize_studio_database(
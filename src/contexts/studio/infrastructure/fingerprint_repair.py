@@ -0,0 +1,86 @@
+"""Recompute project content fingerprints and repair any that drifted.
+
+Writers maintain ``projects.content_fingerprint`` incrementally, so a write
+that toggled the wrong member (or a row edited by hand) leaves it wrong for
+good: snapshots would then be reused for text they never froze. This module
+rebuilds every fingerprint from the live document set, the same way the
+0010 migration backfilled them, and optionally writes back the ones that
+differ.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+from sqlalchemy import text
+
+from src.contexts.studio.infrastructure.content_fingerprint import (
+    Member,
+    fingerprint,
+)
+from src.contexts.studio.infrastructure.database import StudioDatabase
+
+__all__ = ["FingerprintReport", "verify_fingerprints"]
+
+_PROJECTS = text("SELECT id, content_fingerprint FROM projects")
+_MEMBERS = text(
+    "SELECT d.project_id, d.id, r.content_sha256, d.position FROM documents d "
+    "JOIN document_revisions r ON r.id = d.current_revision_id"
+)
+_REPAIR = text("UPDATE projects SET content_fingerprint = :value WHERE id = :id")
+
+
+@dataclass(frozen=True, slots=True)
+class FingerprintReport:
+    projects: int
+    drifted: tuple[str, ...]
+    repaired: bool
+
+    @property
+    def healthy(self) -> bool:
+        """Whether every stored fingerprint now matches the live documents."""
+        return not self.drifted or self.repaired
+
+
+def verify_fingerprints(
+    database: StudioDatabase, *, repair: bool = False
+) -> FingerprintReport:
+    """Compare each stored fingerprint with one recomputed from its documents.
+
+    With ``repair`` the drifted rows are rewritten in the same writer
+    transaction that read them, so no save can slip in between.
+    """
+    with database.session() as session:
+        stored: dict[str, str] = {
+            project_id: value for project_id, value in session.execute(_PROJECTS)
+        }
+        members: defaultdict[str, list[Member]] = defaultdict(list)
+        for project_id, document_id, content_sha256, position in session.execute(
+            _MEMBERS
+        ):
+            members[project_id].append((document_id, content_sha256, position))
+        expected = {
+            project_id: fingerprint(members.get(project_id, ()))
+            for project_id in stored
+        }
+        drifted = tuple(
+            sorted(
+                project_id
+                for project_id, value in stored.items()
+                if value != expected[project_id]
+            )
+        )
+        if repair and drifted:
+            session.execute(
+                _REPAIR,
+                [
+                    {"id": project_id, "value": expected[project_id]}
+                    for project_id in drifted
+                ],
+            )
+    return FingerprintReport(
+        projects=len(stored),
+        drifted=drifted,
+        repaired=repair and bool(drifted),
+    )
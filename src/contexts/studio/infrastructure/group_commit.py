@@ -0,0 +1,135 @@
+"""Group commit for concurrent Studio writer transactions."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, TypeVar
+
+from sqlalchemy.orm import Session
+
+from src.contexts.studio.infrastructure.database import StudioDatabase
+
+T = TypeVar("T")
+
+__all__ = ["GroupCommitWriter"]
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingWrite:
+    operation: Callable[[Session], Any]
+    future: Future[Any]
+
+
+class GroupCommitWriter:
+    """Coalesce writes that arrive within a short window into one commit.
+
+    Callers hand over an operation that receives the shared writer session.
+    A background thread collects operations for up to ``window_seconds`` (or
+    ``max_batch`` items), runs each one inside its own SAVEPOINT, and commits
+    the whole batch once. A failing operation rolls back only its savepoint
+    and its exception is re-raised to that caller alone, so conflicts surface
+    exactly as they do for ungrouped writes.
+    """
+
+    def __init__(
+        self,
+        database: StudioDatabase,
+        *,
+        window_seconds: float = 0.002,
+        max_batch: int = 64,
+    ) -> None:
+        self._database = database
+        self._window_seconds = window_seconds
+        self._max_batch = max_batch
+        self._queue: queue.SimpleQueue[_PendingWrite | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def submit(self, operation: Callable[[Session], T]) -> Future[T]:
+        """Queue ``operation`` for the next batch and return its future."""
+        future: Future[T] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("GroupCommitWriter has been closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._drain,
+                    name="studio-group-commit",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._queue.put(_PendingWrite(operation, future))
+        return future
+
+    def run(self, operation: Callable[[Session], T]) -> T:
+        """Submit ``operation`` and block until its batch has committed."""
+        return self.submit(operation).result()
+
+    def close(self) -> None:
+        """Flush queued writes and stop the background thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+
+    def _drain(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = monotonic() + self._window_seconds
+            stop = False
+            while len(batch) < self._max_batch:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batch.append(pending)
+            self._commit(batch)
+            if stop:
+                return
+
+    def _commit(self, batch: list[_PendingWrite]) -> None:
+        outcomes: list[tuple[_PendingWrite, Any, BaseException | None]] = []
+        try:
+            # The writer session opens with BEGIN IMMEDIATE, so the first
+            # SAVEPOINT nests inside it instead of autocommitting on release.
+            with self._database.session() as session:
+                for pending in batch:
+                    if not pending.future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with session.begin_nested():
+                            result = pending.operation(session)
+                    except Exception as exc:  # noqa: BLE001 - returned to caller
+                        outcomes.append((pending, None, exc))
+                    else:
+                        outcomes.append((pending, result, None))
+        except Exception as exc:  # noqa: BLE001 - the whole batch failed
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+            return
+        for pending, result, error in outcomes:
+            if error is not None:
+                pending.future.set_exception(error)
+            else:
+                pending.future.set_result(result)
@@ -3,16 +3,22 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import (
+    DDL,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.contexts.studio.infrastructure.content_fingerprint import EMPTY_FINGERPRINT
 from src.contexts.studio.infrastructure.model_base import Base
+from src.contexts.studio.infrastructure.search_models import DocumentSearchEntry
 from src.contexts.studio.infrastructure.workflow_models import (
     Export,
     Job,
@@ -26,6 +32,7 @@ __all__ = [
     "Base",
     "Document",
     "DocumentRevision",
+    "DocumentSearchEntry",
     "Export",
     "Job",
     "JobEvent",
@@ -33,7 +40,9 @@ __all__ = [
     "Project",
     "ProjectSnapshot",
     "Review",
+    "REVISION_BLOB_TRIGGERS",
     "ReviewIssue",
+    "RevisionBlob",
     "SessionRecord",
     "SnapshotDocument",
     "UsageEvent",
@@ -53,6 +62,7 @@ class Owner(Base):
 
 class SessionRecord(Base):
     __tablename__ = "sessions"
+    __table_args__ = (Index("ix_sessions_kind_expires", "kind", "expires_at"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     kind: Mapped[str] = mapped_column(String(16), nullable=False)
@@ -92,6 +102,17 @@ class Project(Base):
     import_hash: Mapped[str | None] = mapped_column(
         String(64), unique=True, nullable=True
     )
+    # Fingerprint of the live document set; see ``content_fingerprint``.
+    content_fingerprint: Mapped[str] = mapped_column(
+        String(32),
+        default=EMPTY_FINGERPRINT,
+        server_default=EMPTY_FINGERPRINT,
+        nullable=False,
+    )
+    # Bumped by every write that changes the project or its documents.
+    version: Mapped[int] = mapped_column(
+        Integer, default=1, server_default="1", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -134,6 +155,11 @@ class Document(Base):
         cascade="all, delete-orphan",
         foreign_keys="DocumentRevision.document_id",
     )
+    # Listings load this single row instead of the full revision history.
+    current_revision: Mapped[DocumentRevision | None] = relationship(
+        primaryjoin="foreign(Document.current_revision_id) == DocumentRevision.id",
+        viewonly=True,
+    )
 
 
 class DocumentRevision(Base):
@@ -157,9 +183,22 @@ class DocumentRevision(Base):
         nullable=True,
     )
     revision_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Legacy inline body; new revisions point at a blob or carry a delta.
     content_markdown: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    # When set, the body is stored as a delta against the parent revision;
+    # see ``repository.revision_content``.
+    content_delta: Mapped[str | None] = mapped_column(Text, nullable=True)
+    blob_sha256: Mapped[str | None] = mapped_column(
+        ForeignKey("revision_blobs.sha256"),
+        nullable=True,
+        index=True,
+    )
     metadata_json: Mapped[str] = mapped_column(Text, default="{}", nullable=False)
     source: Mapped[str] = mapped_column(String(32), default="author", nullable=False)
+    word_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    char_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    paragraph_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    content_sha256: Mapped[str] = mapped_column(String(64), default="", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -168,10 +207,83 @@ class DocumentRevision(Base):
         back_populates="revisions",
         foreign_keys=[document_id],
     )
+    blob: Mapped[RevisionBlob | None] = relationship()
+
+
+class RevisionBlob(Base):
+    """Revision body stored once per distinct content, keyed by its SHA-256.
+
+    ``refcount`` counts the revisions pointing at the blob and is maintained
+    by the ``REVISION_BLOB_TRIGGERS`` on ``document_revisions``, so cascading
+    deletes issued by SQLite itself keep it exact. A blob is removed when its
+    last reference goes. Cold blobs are zlib-compressed into ``content_zlib``
+    with ``content`` emptied; see ``revision_compression``.
+    """
+
+    __tablename__ = "revision_blobs"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_zlib: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    refcount: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+
+REVISION_BLOB_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS revision_blob_ref
+    AFTER INSERT ON document_revisions WHEN NEW.blob_sha256 IS NOT NULL
+    BEGIN
+        UPDATE revision_blobs SET refcount = refcount + 1
+        WHERE sha256 = NEW.blob_sha256;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS revision_blob_unref
+    AFTER DELETE ON document_revisions WHEN OLD.blob_sha256 IS NOT NULL
+    BEGIN
+        UPDATE revision_blobs SET refcount = refcount - 1
+        WHERE sha256 = OLD.blob_sha256;
+        DELETE FROM revision_blobs
+        WHERE sha256 = OLD.blob_sha256 AND refcount <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS revision_blob_reref
+    AFTER UPDATE OF blob_sha256 ON document_revisions
+    WHEN OLD.blob_sha256 IS NOT NEW.blob_sha256
+    BEGIN
+        UPDATE revision_blobs SET refcount = refcount + 1
+        WHERE sha256 = NEW.blob_sha256;
+        UPDATE revision_blobs SET refcount = refcount - 1
+        WHERE sha256 = OLD.blob_sha256;
+        DELETE FROM revision_blobs
+        WHERE sha256 = OLD.blob_sha256 AND refcount <= 0;
+    END
+    """,
+)
+
+for _trigger in REVISION_BLOB_TRIGGERS:
+    event.listen(
+        DocumentRevision.__table__,
+        "after_create",
+        DDL(_trigger).execute_if(dialect="sqlite"),
+    )
 
 
 class ProjectSnapshot(Base):
     __tablename__ = "project_snapshots"
+    __table_args__ = (
+        Index("ix_project_snapshots_project_page", "project_id", "created_at", "id"),
+        Index(
+            "ix_project_snapshots_fingerprint",
+            "project_id",
+            "content_fingerprint",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     project_id: Mapped[str] = mapped_column(
@@ -180,6 +292,12 @@ class ProjectSnapshot(Base):
         index=True,
     )
     reason: Mapped[str] = mapped_column(String(48), nullable=False)
+    content_fingerprint: Mapped[str] = mapped_column(
+        String(32),
+        default=EMPTY_FINGERPRINT,
+        server_default=EMPTY_FINGERPRINT,
+        nullable=False,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -195,6 +313,7 @@ class SnapshotDocument(Base):
     __tablename__ = "snapshot_documents"
     __table_args__ = (
         UniqueConstraint("snapshot_id", "document_id", name="uq_snapshot_document"),
+        Index("ix_snapshot_documents_document", "document_id"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
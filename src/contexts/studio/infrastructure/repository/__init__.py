@@ -8,7 +8,13 @@ from src.contexts.studio.infrastructure.repository.document import (
 from src.contexts.studio.infrastructure.repository.export import ExportRepositoryMixin
 from src.contexts.studio.infrastructure.repository.job import JobRepositoryMixin
 from src.contexts.studio.infrastructure.repository.project import ProjectRepositoryMixin
+from src.contexts.studio.infrastructure.repository.project_summary import (
+    ProjectSummaryRepositoryMixin,
+)
 from src.contexts.studio.infrastructure.repository.review import ReviewRepositoryMixin
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    RevisionStorage,
+)
 from src.contexts.studio.infrastructure.repository.snapshot import (
     SnapshotRepositoryMixin,
 )
@@ -17,6 +23,7 @@ from src.contexts.studio.infrastructure.repository.snapshot import (
 class SqlAlchemyStudioRepository(
     AuthRepositoryMixin,
     ProjectRepositoryMixin,
+    ProjectSummaryRepositoryMixin,
     DocumentRepositoryMixin,
     SnapshotRepositoryMixin,
     ReviewRepositoryMixin,
@@ -27,4 +34,7 @@ class SqlAlchemyStudioRepository(
     """SQLAlchemy-backed implementation of ``StudioRepository``."""
 
 
-__all__ = ["SqlAlchemyStudioRepository"]
+__all__ = [
+    "RevisionStorage",
+    "SqlAlchemyStudioRepository",
+]
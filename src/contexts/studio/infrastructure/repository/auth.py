@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from sqlalchemy import Select
+
 from src.contexts.studio.infrastructure.repository.common import (
     InvalidOperation,
     Owner,
@@ -18,7 +20,15 @@ from src.contexts.studio.infrastructure.repository.common import (
     utcnow,
 )
 
-__all__ = ["AuthRepositoryMixin"]
+__all__ = ["AuthRepositoryMixin", "_expired_guest_sessions_statement"]
+
+
+def _expired_guest_sessions_statement(now: datetime) -> Select[SessionRecord]:
+    return select(SessionRecord).where(
+        SessionRecord.kind == "guest",
+        SessionRecord.expires_at.is_not(None),
+        SessionRecord.expires_at <= now,
+    )
 
 
 class AuthRepositoryMixin:
@@ -55,8 +65,6 @@ class AuthRepositoryMixin:
         session: Session | None = None,
     ) -> OwnerDto:
         with _session(self.database, session) as db_session:
-            if session is None and self.database.engine.dialect.name == "sqlite":
-                db_session.connection().exec_driver_sql("BEGIN IMMEDIATE")
             if db_session.scalar(select(func.count()).select_from(Owner)):
                 raise InvalidOperation("The local owner has already been configured.")
             owner = Owner(
@@ -123,13 +131,7 @@ class AuthRepositoryMixin:
         session: Session | None = None,
     ) -> int:
         with _session(self.database, session) as db_session:
-            expired = db_session.scalars(
-                select(SessionRecord).where(
-                    SessionRecord.kind == "guest",
-                    SessionRecord.expires_at.is_not(None),
-                    SessionRecord.expires_at <= now,
-                )
-            ).all()
+            expired = db_session.scalars(_expired_guest_sessions_statement(now)).all()
             for record in expired:
                 db_session.delete(record)
             return len(expired)
@@ -5,15 +5,27 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from src.contexts.studio.infrastructure.database import UnitOfWork
 from src.contexts.studio.infrastructure.repository.common import (
+    GroupCommitWriter,
     StudioDatabase,
 )
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    RevisionStorage,
+)
 
 __all__ = ["RepositoryBase"]
 
 
 class RepositoryBase:
-    def __init__(self, database: StudioDatabase) -> None:
+    def __init__(
+        self,
+        database: StudioDatabase,
+        *,
+        group_commit: GroupCommitWriter | None = None,
+        revision_storage: RevisionStorage | None = None,
+    ) -> None:
         self.database = database
+        self.group_commit = group_commit
+        self.revision_storage = revision_storage or RevisionStorage()
 
     def health_check(self) -> bool:
         """Verify the persistence backend is reachable."""
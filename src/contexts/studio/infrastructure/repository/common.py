@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, cast
+from functools import wraps
+from typing import Any, Concatenate, ParamSpec, TypeVar, cast
 
 from sqlalchemy import func, select, text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, object_session
 
 from src.contexts.studio.application.ports.studio_repository import (
     DocumentDto,
     ExportDto,
     JobDto,
     JobEventDto,
+    NewDocumentDto,
     OwnerDto,
+    PageDto,
     ProjectDto,
+    ProjectSummaryDto,
     ReviewDto,
     ReviewIssueDto,
     RevisionDto,
+    RevisionSummaryDto,
+    SearchHitDto,
     SessionDto,
     SnapshotDocumentDto,
     SnapshotDto,
@@ -30,8 +36,9 @@ from src.contexts.studio.domain.exceptions import (
     SnapshotConflict,
 )
 from src.contexts.studio.domain.types import JOB_KINDS
-from src.contexts.studio.domain.utils import _word_count, dump_json, new_id, utcnow
+from src.contexts.studio.domain.utils import dump_json, new_id, utcnow
 from src.contexts.studio.infrastructure.database import StudioDatabase, UnitOfWork
+from src.contexts.studio.infrastructure.group_commit import GroupCommitWriter
 from src.contexts.studio.infrastructure.models import (
     Document,
     DocumentRevision,
@@ -46,6 +53,12 @@ from src.contexts.studio.infrastructure.models import (
     SnapshotDocument,
     UsageEvent,
 )
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    RevisionStorage,
+    _new_revision,
+    _revision_content,
+    _store_blobs,
+)
 
 
 @contextmanager
@@ -61,6 +74,51 @@ def _session(
         yield new_session
 
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class _GroupCommitCapable:
+    group_commit: GroupCommitWriter | None
+
+
+def _group_committed(
+    method: Callable[Concatenate[Any, P], R],
+) -> Callable[Concatenate[Any, P], R]:
+    """Route a writer method through the group-commit queue when enabled.
+
+    Calls that already carry a ``session`` keep running inside it; otherwise
+    the method runs on the shared batch session of ``GroupCommitWriter``.
+    """
+
+    @wraps(method)
+    def wrapper(self: Any, *args: P.args, **kwargs: P.kwargs) -> R:
+        writer = cast(_GroupCommitCapable, self).group_commit
+        if writer is None or kwargs.get("session") is not None:
+            return method(self, *args, **kwargs)
+
+        def operation(session: Session) -> R:
+            kwargs["session"] = session
+            return method(self, *args, **kwargs)
+
+        return writer.run(operation)
+
+    return wrapper
+
+
+@contextmanager
+def _read_session(
+    database: StudioDatabase,
+    session: Session | None = None,
+) -> Iterator[Session]:
+    """Yield a shared session or a fresh session on a reader connection."""
+    if session is not None:
+        yield session
+        return
+    with database.read_session() as new_session:
+        yield new_session
+
+
 def _owner_dto(owner: Owner) -> OwnerDto:
     return OwnerDto(
         id=owner.id,
@@ -89,20 +147,33 @@ def _revision_dto(revision: DocumentRevision) -> RevisionDto:
         document_id=revision.document_id,
         parent_revision_id=revision.parent_revision_id,
         revision_number=revision.revision_number,
-        content_markdown=revision.content_markdown,
+        content_markdown=_revision_content(revision),
         metadata_json=revision.metadata_json,
         source=revision.source,
         created_at=revision.created_at,
+        word_count=revision.word_count,
+        char_count=revision.char_count,
+        paragraph_count=revision.paragraph_count,
+        content_sha256=revision.content_sha256,
     )
 
 
+def _current_revision_row(document: Document) -> DocumentRevision | None:
+    revision_id = document.current_revision_id
+    if revision_id is None:
+        return None
+    revision = document.current_revision
+    if revision is not None and revision.id == revision_id:
+        return revision
+    # The view-only relationship is not refreshed when a write in this session
+    # moves ``current_revision_id``; the new row is already in the identity map.
+    session = object_session(document)
+    return session.get(DocumentRevision, revision_id) if session is not None else None
+
+
 def _document_dto(document: Document) -> DocumentDto:
-    current_revision = None
-    if document.current_revision_id is not None:
-        for revision in document.revisions:
-            if revision.id == document.current_revision_id:
-                current_revision = _revision_dto(revision)
-                break
+    revision = _current_revision_row(document)
+    current_revision = _revision_dto(revision) if revision is not None else None
     return DocumentDto(
         id=document.id,
         project_id=document.project_id,
@@ -214,16 +285,23 @@ __all__ = [
     "text",
     "Session",
     "UnitOfWork",
+    "_group_committed",
+    "_read_session",
     "_session",
     "DocumentDto",
     "ExportDto",
     "JobDto",
     "JobEventDto",
+    "NewDocumentDto",
     "OwnerDto",
+    "PageDto",
     "ProjectDto",
+    "ProjectSummaryDto",
     "ReviewDto",
     "ReviewIssueDto",
     "RevisionDto",
+    "RevisionSummaryDto",
+    "SearchHitDto",
     "SessionDto",
     "SnapshotDocumentDto",
     "SnapshotDto",
@@ -231,10 +309,10 @@ __all__ = [
     "NotFound",
     "SnapshotConflict",
     "JOB_KINDS",
-    "_word_count",
     "dump_json",
     "new_id",
     "utcnow",
+    "GroupCommitWriter",
     "StudioDatabase",
     "Document",
     "DocumentRevision",
@@ -247,6 +325,10 @@ __all__ = [
     "SessionRecord",
     "SnapshotDocument",
     "UsageEvent",
+    "RevisionStorage",
+    "_new_revision",
+    "_revision_content",
+    "_store_blobs",
     "_owner_dto",
     "_session_dto",
     "_revision_dto",
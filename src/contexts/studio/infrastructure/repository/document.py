@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Select
 from sqlalchemy.orm import selectinload
 
+from src.contexts.studio.infrastructure.content_fingerprint import toggle_members
 from src.contexts.studio.infrastructure.repository.common import (
     Document,
     DocumentDto,
@@ -11,17 +13,25 @@ from src.contexts.studio.infrastructure.repository.common import (
     InvalidOperation,
     NotFound,
     Project,
+    RevisionStorage,
     Session,
     SnapshotConflict,
     SnapshotDocument,
     StudioDatabase,
     _document_dto,
+    _group_committed,
+    _new_revision,
+    _read_session,
     _session,
     datetime,
-    func,
     new_id,
     select,
-    text,
+)
+from src.contexts.studio.infrastructure.repository.document_bulk import (
+    DocumentBulkRepositoryMixin,
+)
+from src.contexts.studio.infrastructure.repository.document_order import (
+    DocumentOrderRepositoryMixin,
 )
 from src.contexts.studio.infrastructure.repository.document_revisions import (
     DocumentRevisionRepositoryMixin,
@@ -29,15 +39,33 @@ from src.contexts.studio.infrastructure.repository.document_revisions import (
 from src.contexts.studio.infrastructure.repository.document_search import (
     DocumentSearchRepositoryMixin,
 )
+from src.contexts.studio.infrastructure.repository.ownership import (
+    _document_statement,
+)
+from src.contexts.studio.infrastructure.repository.project_version import (
+    _bump_version,
+)
+from src.contexts.studio.infrastructure.search_index import unindex_document
 
-__all__ = ["DocumentRepositoryMixin"]
+__all__ = ["DocumentRepositoryMixin", "_snapshot_reference_statement"]
+
+
+def _snapshot_reference_statement(document_id: str) -> Select[str]:
+    return (
+        select(SnapshotDocument.id)
+        .where(SnapshotDocument.document_id == document_id)
+        .limit(1)
+    )
 
 
 class DocumentRepositoryMixin(
+    DocumentBulkRepositoryMixin,
+    DocumentOrderRepositoryMixin,
     DocumentRevisionRepositoryMixin,
     DocumentSearchRepositoryMixin,
 ):
     database: StudioDatabase
+    revision_storage: RevisionStorage
 
     if TYPE_CHECKING:
 
@@ -49,22 +77,28 @@ class DocumentRepositoryMixin(
             guest_session_id: str | None,
         ) -> Project: ...
 
+        def _verify_project(
+            self,
+            session: Session,
+            project_id: str,
+            owner_id: str | None,
+            guest_session_id: str | None,
+        ) -> None: ...
+
     def _document(
         self,
         session: Session,
-        project: Project,
+        project_id: str,
         document_id: str,
     ) -> Document:
-        document = session.scalar(
-            select(Document).where(
-                Document.id == document_id,
-                Document.project_id == project.id,
-            )
+        document: Document | None = session.scalar(
+            _document_statement(project_id, document_id)
         )
         if document is None:
             raise NotFound("Document not found.")
         return document
 
+    @_group_committed
     def create_document(
         self,
         *,
@@ -93,12 +127,14 @@ class DocumentRepositoryMixin(
             )
             db_session.add(document)
             db_session.flush()
-            revision = DocumentRevision(
+            revision = _new_revision(
+                db_session,
+                content_markdown=content_markdown,
+                parent=None,
+                storage=self.revision_storage,
                 id=new_id(),
                 document_id=document.id,
-                parent_revision_id=None,
                 revision_number=1,
-                content_markdown=content_markdown,
                 metadata_json=metadata_json,
                 source=source,
                 created_at=now,
@@ -106,8 +142,13 @@ class DocumentRepositoryMixin(
             db_session.add(revision)
             db_session.flush()
             document.current_revision_id = revision.id
+            project.content_fingerprint = toggle_members(
+                project.content_fingerprint,
+                (document.id, revision.content_sha256, document.position),
+            )
             self._refresh_search(db_session, document, revision)
             project.updated_at = now
+            _bump_version(db_session, project)
             db_session.flush()
             return _document_dto(document)
 
@@ -119,13 +160,17 @@ class DocumentRepositoryMixin(
         guest_session_id: str | None,
         session: Session | None = None,
     ) -> list[DocumentDto]:
-        with _session(self.database, session) as db_session:
-            self._project(db_session, project_id, owner_id, guest_session_id)
+        with _read_session(self.database, session) as db_session:
+            self._verify_project(db_session, project_id, owner_id, guest_session_id)
             documents = db_session.scalars(
                 select(Document)
                 .where(Document.project_id == project_id)
                 .order_by(Document.kind, Document.position, Document.created_at)
-                .options(selectinload(Document.revisions))
+                .options(
+                    selectinload(Document.current_revision).selectinload(
+                        DocumentRevision.blob
+                    )
+                )
             ).all()
             return [_document_dto(document) for document in documents]
 
@@ -138,9 +183,9 @@ class DocumentRepositoryMixin(
         guest_session_id: str | None,
         session: Session | None = None,
     ) -> DocumentDto:
-        with _session(self.database, session) as db_session:
-            project = self._project(db_session, project_id, owner_id, guest_session_id)
-            document = self._document(db_session, project, document_id)
+        with _read_session(self.database, session) as db_session:
+            self._verify_project(db_session, project_id, owner_id, guest_session_id)
+            document = self._document(db_session, project_id, document_id)
             return _document_dto(document)
 
     def delete_document(
@@ -154,35 +199,23 @@ class DocumentRepositoryMixin(
     ) -> None:
         with _session(self.database, session) as db_session:
             project = self._project(db_session, project_id, owner_id, guest_session_id)
-            document = self._document(db_session, project, document_id)
+            document = self._document(db_session, project.id, document_id)
             snapshot_reference = db_session.scalar(
-                select(SnapshotDocument.id).where(
-                    SnapshotDocument.document_id == document.id
-                )
+                _snapshot_reference_statement(document.id)
             )
             if snapshot_reference is not None:
                 raise SnapshotConflict()
-            db_session.execute(
-                text("DELETE FROM document_search WHERE document_id = :document_id"),
-                {"document_id": document.id},
-            )
-            db_session.delete(document)
-
-    def next_document_position(
-        self,
-        project_id: str,
-        kind: str,
-        session: Session | None = None,
-    ) -> int:
-        with _session(self.database, session) as db_session:
-            max_position = db_session.scalar(
-                select(func.max(Document.position)).where(
-                    Document.project_id == project_id,
-                    Document.kind == kind,
+            if document.current_revision_id is not None:
+                current_revision = self._current_revision(db_session, document)
+                project.content_fingerprint = toggle_members(
+                    project.content_fingerprint,
+                    (document.id, current_revision.content_sha256, document.position),
                 )
-            )
-            return (max_position or 0) + 1
+            unindex_document(db_session, document.id)
+            db_session.delete(document)
+            _bump_version(db_session, project)
 
+    @_group_committed
     def save_document(
         self,
         project_id: str,
@@ -196,60 +229,41 @@ class DocumentRepositoryMixin(
         metadata_json: str,
         source: str,
         now: datetime,
+        session: Session | None = None,
     ) -> DocumentDto:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            document = self._document(session, project, document_id)
+        with _session(self.database, session) as db_session:
+            project = self._project(db_session, project_id, owner_id, guest_session_id)
+            document = self._document(db_session, project.id, document_id)
             if document.current_revision_id != base_revision_id:
                 raise InvalidOperation(
                     "Document changed since the requested base revision."
                 )
-            current_revision = self._current_revision(session, document)
+            current_revision = self._current_revision(db_session, document)
             if title is not None:
                 document.title = title
-            revision = DocumentRevision(
+            revision = _new_revision(
+                db_session,
+                content_markdown=content_markdown,
+                parent=current_revision,
+                storage=self.revision_storage,
                 id=new_id(),
                 document_id=document.id,
-                parent_revision_id=document.current_revision_id,
                 revision_number=current_revision.revision_number + 1,
-                content_markdown=content_markdown,
                 metadata_json=metadata_json,
                 source=source,
                 created_at=now,
             )
-            session.add(revision)
-            session.flush()
+            db_session.add(revision)
+            db_session.flush()
             document.current_revision_id = revision.id
+            project.content_fingerprint = toggle_members(
+                project.content_fingerprint,
+                (document.id, current_revision.content_sha256, document.position),
+                (document.id, revision.content_sha256, document.position),
+            )
             document.updated_at = now
             project.updated_at = now
-            self._refresh_search(session, document, revision)
-            session.flush()
+            _bump_version(db_session, project)
+            self._refresh_search(db_session, document, revision)
+            db_session.flush()
             return _document_dto(document)
-
-    def reorder_documents(
-        self,
-        project_id: str,
-        *,
-        owner_id: str | None,
-        guest_session_id: str | None,
-        document_ids: list[str],
-        now: datetime,
-    ) -> list[DocumentDto]:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            documents = {
-                document.id: document
-                for document in session.scalars(
-                    select(Document).where(Document.project_id == project.id)
-                ).all()
-            }
-            if set(document_ids) != set(documents):
-                raise InvalidOperation(
-                    "Reorder must include every project document once."
-                )
-            for position, doc_id in enumerate(document_ids, start=1):
-                documents[doc_id].position = position
-                documents[doc_id].updated_at = now
-            project.updated_at = now
-            session.flush()
-            return [_document_dto(documents[doc_id]) for doc_id in document_ids]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.contexts.studio.domain.utils import POSITION_GAP
+from src.contexts.studio.infrastructure.content_fingerprint import toggle_members
+from src.contexts.studio.infrastructure.repository.common import (
+    Document,
+    DocumentDto,
+    DocumentRevision,
+    NewDocumentDto,
+    Project,
+    RevisionStorage,
+    Session,
+    StudioDatabase,
+    _document_dto,
+    _group_committed,
+    _new_revision,
+    _session,
+    _store_blobs,
+    datetime,
+    func,
+    new_id,
+    select,
+)
+from src.contexts.studio.infrastructure.repository.project_version import (
+    _bump_version,
+)
+from src.contexts.studio.infrastructure.search_index import index_new_documents
+
+__all__ = ["DocumentBulkRepositoryMixin"]
+
+
+class DocumentBulkRepositoryMixin:
+    database: StudioDatabase
+    revision_storage: RevisionStorage
+
+    if TYPE_CHECKING:
+
+        def _project(
+            self,
+            session: Session,
+            project_id: str,
+            owner_id: str | None,
+            guest_session_id: str | None,
+        ) -> Project: ...
+
+    def _next_positions(
+        self,
+        session: Session,
+        project_id: str,
+        documents: list[NewDocumentDto],
+    ) -> dict[str, int]:
+        kinds = {item.kind for item in documents if item.position is None}
+        if not kinds:
+            return {}
+        rows = session.execute(
+            select(Document.kind, func.max(Document.position))
+            .where(Document.project_id == project_id, Document.kind.in_(kinds))
+            .group_by(Document.kind)
+        )
+        positions = dict.fromkeys(kinds, POSITION_GAP)
+        positions.update(
+            {kind: (position or 0) + POSITION_GAP for kind, position in rows}
+        )
+        return positions
+
+    @_group_committed
+    def create_documents(
+        self,
+        *,
+        project_id: str,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        documents: list[NewDocumentDto],
+        now: datetime,
+        session: Session | None = None,
+    ) -> list[DocumentDto]:
+        with _session(self.database, session) as db_session:
+            project = self._project(db_session, project_id, owner_id, guest_session_id)
+            next_positions = self._next_positions(db_session, project.id, documents)
+            rows: list[Document] = []
+            revisions: list[DocumentRevision] = []
+            pending_blobs: dict[str, str] = {}
+            for item in documents:
+                position = item.position
+                if position is None:
+                    position = next_positions[item.kind]
+                    next_positions[item.kind] += POSITION_GAP
+                document = Document(
+                    id=new_id(),
+                    project_id=project.id,
+                    kind=item.kind,
+                    title=item.title,
+                    position=position,
+                    created_at=now,
+                    updated_at=now,
+                )
+                revision = _new_revision(
+                    db_session,
+                    content_markdown=item.content_markdown,
+                    parent=None,
+                    storage=self.revision_storage,
+                    created_at=now,
+                    pending_blobs=pending_blobs,
+                    id=new_id(),
+                    document_id=document.id,
+                    revision_number=1,
+                    metadata_json=item.metadata_json,
+                    source=item.source,
+                )
+                # ``current_revision_id`` carries no foreign key, so it can be
+                # set up front instead of with a second UPDATE per document.
+                document.current_revision_id = revision.id
+                set_committed_value(document, "current_revision", revision)
+                rows.append(document)
+                revisions.append(revision)
+            if not rows:
+                return []
+            # Blobs first: revisions reference them and bump their refcounts.
+            _store_blobs(db_session, pending_blobs, now)
+            db_session.add_all(rows)
+            db_session.add_all(revisions)
+            db_session.flush()
+            index_new_documents(
+                db_session,
+                [
+                    {
+                        "document_id": document.id,
+                        "project_id": document.project_id,
+                        "title": document.title,
+                        "revision_id": revision.id,
+                        "content": item.content_markdown,
+                    }
+                    for document, revision, item in zip(
+                        rows, revisions, documents, strict=True
+                    )
+                ],
+            )
+            project.content_fingerprint = toggle_members(
+                project.content_fingerprint,
+                *(
+                    (document.id, revision.content_sha256, document.position)
+                    for document, revision in zip(rows, revisions, strict=True)
+                ),
+            )
+            project.updated_at = now
+            _bump_version(db_session, project)
+            db_session.flush()
+            return [_document_dto(document) for document in rows]
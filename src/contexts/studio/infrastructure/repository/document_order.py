@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.contexts.studio.domain.utils import POSITION_GAP, _position_between
+from src.contexts.studio.infrastructure.content_fingerprint import (
+    Member,
+    toggle_members,
+)
+from src.contexts.studio.infrastructure.repository.common import (
+    Document,
+    DocumentDto,
+    DocumentRevision,
+    InvalidOperation,
+    Project,
+    Session,
+    StudioDatabase,
+    _document_dto,
+    _group_committed,
+    _session,
+    datetime,
+    func,
+    select,
+)
+from src.contexts.studio.infrastructure.repository.project_version import (
+    _bump_version,
+)
+
+__all__ = ["DocumentOrderRepositoryMixin"]
+
+
+class DocumentOrderRepositoryMixin:
+    database: StudioDatabase
+
+    if TYPE_CHECKING:
+
+        def _project(
+            self,
+            session: Session,
+            project_id: str,
+            owner_id: str | None,
+            guest_session_id: str | None,
+        ) -> Project: ...
+
+        def _document(
+            self,
+            session: Session,
+            project_id: str,
+            document_id: str,
+        ) -> Document: ...
+
+    def next_document_position(
+        self,
+        project_id: str,
+        kind: str,
+        session: Session | None = None,
+    ) -> int:
+        with _session(self.database, session) as db_session:
+            max_position = db_session.scalar(
+                select(func.max(Document.position)).where(
+                    Document.project_id == project_id,
+                    Document.kind == kind,
+                )
+            )
+            return (max_position or 0) + POSITION_GAP
+
+    def _neighbour_position(
+        self,
+        session: Session,
+        document: Document,
+        anchor: Document,
+        *,
+        before: bool,
+    ) -> int | None:
+        # ``<=``/``>=`` let a sibling sharing the anchor's position close the
+        # gap, which forces a rebalance instead of an ambiguous placement.
+        scope = (
+            Document.project_id == anchor.project_id,
+            Document.kind == anchor.kind,
+            Document.id.not_in((document.id, anchor.id)),
+        )
+        if before:
+            return session.scalar(
+                select(func.max(Document.position)).where(
+                    *scope, Document.position <= anchor.position
+                )
+            )
+        return session.scalar(
+            select(func.min(Document.position)).where(
+                *scope, Document.position >= anchor.position
+            )
+        )
+
+    def _reposition(
+        self,
+        session: Session,
+        project: Project,
+        moves: list[tuple[Document, int]],
+    ) -> None:
+        """Apply position changes and keep the project fingerprint current."""
+        if not moves:
+            return
+        rows = session.execute(
+            select(Document.id, DocumentRevision.content_sha256)
+            .join(
+                DocumentRevision,
+                DocumentRevision.id == Document.current_revision_id,
+            )
+            .where(Document.id.in_([document.id for document, _ in moves]))
+        )
+        digests = {document_id: digest for document_id, digest in rows}
+        members: list[Member] = []
+        for document, position in moves:
+            digest = digests.get(document.id)
+            if digest is not None:
+                members.append((document.id, digest, document.position))
+                members.append((document.id, digest, position))
+            document.position = position
+        project.content_fingerprint = toggle_members(
+            project.content_fingerprint, *members
+        )
+
+    def _rebalance(
+        self,
+        session: Session,
+        document: Document,
+        anchor: Document,
+        *,
+        before: bool,
+    ) -> list[tuple[Document, int]]:
+        siblings = [
+            sibling
+            for sibling in session.scalars(
+                select(Document)
+                .where(
+                    Document.project_id == anchor.project_id,
+                    Document.kind == anchor.kind,
+                )
+                .order_by(Document.position, Document.created_at)
+            )
+            if sibling.id != document.id
+        ]
+        index = siblings.index(anchor) + (0 if before else 1)
+        siblings.insert(index, document)
+        return [
+            (sibling, slot * POSITION_GAP)
+            for slot, sibling in enumerate(siblings, start=1)
+            if sibling.position != slot * POSITION_GAP
+        ]
+
+    @_group_committed
+    def move_document(
+        self,
+        project_id: str,
+        document_id: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        anchor_id: str,
+        before: bool,
+        now: datetime,
+        session: Session | None = None,
+    ) -> DocumentDto:
+        with _session(self.database, session) as db_session:
+            project = self._project(db_session, project_id, owner_id, guest_session_id)
+            document = self._document(db_session, project.id, document_id)
+            anchor = self._document(db_session, project.id, anchor_id)
+            if anchor.id == document.id or anchor.kind != document.kind:
+                raise InvalidOperation(
+                    "Documents can only move next to another document of their kind."
+                )
+            neighbour = self._neighbour_position(
+                db_session, document, anchor, before=before
+            )
+            if before:
+                position = _position_between(neighbour or 0, anchor.position)
+            else:
+                position = _position_between(anchor.position, neighbour)
+            if position is None:
+                moves = self._rebalance(db_session, document, anchor, before=before)
+            else:
+                moves = [(document, position)]
+            self._reposition(db_session, project, moves)
+            document.updated_at = now
+            project.updated_at = now
+            _bump_version(db_session, project)
+            db_session.flush()
+            return _document_dto(document)
+
+    def reorder_documents(
+        self,
+        project_id: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        document_ids: list[str],
+        now: datetime,
+    ) -> list[DocumentDto]:
+        with self.database.session() as session:
+            project = self._project(session, project_id, owner_id, guest_session_id)
+            documents = {
+                document.id: document
+                for document in session.scalars(
+                    select(Document).where(Document.project_id == project.id)
+                ).all()
+            }
+            if set(document_ids) != set(documents):
+                raise InvalidOperation(
+                    "Reorder must include every project document once."
+                )
+            # Only documents whose slot changed are written.
+            moves = [
+                (documents[doc_id], slot * POSITION_GAP)
+                for slot, doc_id in enumerate(document_ids, start=1)
+                if documents[doc_id].position != slot * POSITION_GAP
+            ]
+            self._reposition(session, project, moves)
+            for document, _position in moves:
+                document.updated_at = now
+            project.updated_at = now
+            _bump_version(session, project)
+            session.flush()
+            return [_document_dto(documents[doc_id]) for doc_id in document_ids]
@@ -7,34 +7,52 @@ from src.contexts.studio.infrastructure.repository.common import (
     DocumentRevision,
     InvalidOperation,
     NotFound,
-    Project,
+    PageDto,
     RevisionDto,
+    RevisionSummaryDto,
     Session,
     StudioDatabase,
+    _read_session,
     _revision_dto,
     select,
 )
+from src.contexts.studio.infrastructure.repository.pagination import _keyset_page
 
 __all__ = ["DocumentRevisionRepositoryMixin"]
 
+# History listings never need revision bodies or metadata, so they select
+# only these columns and skip hydrating (and identity-mapping) full rows.
+_REVISION_SUMMARY_COLUMNS = (
+    DocumentRevision.id,
+    DocumentRevision.document_id,
+    DocumentRevision.parent_revision_id,
+    DocumentRevision.revision_number,
+    DocumentRevision.source,
+    DocumentRevision.created_at,
+    DocumentRevision.word_count,
+    DocumentRevision.char_count,
+    DocumentRevision.paragraph_count,
+    DocumentRevision.content_sha256,
+)
+
 
 class DocumentRevisionRepositoryMixin:
     database: StudioDatabase
 
     if TYPE_CHECKING:
 
-        def _project(
+        def _verify_project(
             self,
             session: Session,
             project_id: str,
             owner_id: str | None,
             guest_session_id: str | None,
-        ) -> Project: ...
+        ) -> None: ...
 
         def _document(
             self,
             session: Session,
-            project: Project,
+            project_id: str,
             document_id: str,
         ) -> Document: ...
 
@@ -58,11 +76,12 @@ class DocumentRevisionRepositoryMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
+        session: Session | None = None,
     ) -> RevisionDto:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            document = self._document(session, project, document_id)
-            revision = session.scalar(
+        with _read_session(self.database, session) as db_session:
+            self._verify_project(db_session, project_id, owner_id, guest_session_id)
+            document = self._document(db_session, project_id, document_id)
+            revision = db_session.scalar(
                 select(DocumentRevision).where(
                     DocumentRevision.id == revision_id,
                     DocumentRevision.document_id == document.id,
@@ -79,13 +98,24 @@ class DocumentRevisionRepositoryMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[RevisionDto]:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            document = self._document(session, project, document_id)
-            revisions = session.scalars(
-                select(DocumentRevision)
-                .where(DocumentRevision.document_id == document.id)
-                .order_by(DocumentRevision.revision_number.desc())
-            ).all()
-            return [_revision_dto(revision) for revision in revisions]
+        limit: int | None = None,
+        cursor: str | None = None,
+        session: Session | None = None,
+    ) -> PageDto[RevisionSummaryDto]:
+        with _read_session(self.database, session) as db_session:
+            self._verify_project(db_session, project_id, owner_id, guest_session_id)
+            document = self._document(db_session, project_id, document_id)
+            rows, next_cursor = _keyset_page(
+                db_session,
+                select(*_REVISION_SUMMARY_COLUMNS).where(
+                    DocumentRevision.document_id == document.id
+                ),
+                (DocumentRevision.revision_number,),
+                limit=limit,
+                cursor=cursor,
+                scalars=False,
+            )
+            return PageDto(
+                items=[RevisionSummaryDto(**row._mapping) for row in rows],
+                next_cursor=next_cursor,
+            )
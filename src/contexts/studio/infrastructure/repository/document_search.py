@@ -2,31 +2,84 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from src.contexts.studio.application.ports import decode_cursor, encode_cursor
 from src.contexts.studio.infrastructure.repository.common import (
     Any,
     Document,
     DocumentRevision,
-    Project,
+    InvalidOperation,
+    PageDto,
+    SearchHitDto,
     Session,
     StudioDatabase,
+    _read_session,
+    _revision_content,
     text,
 )
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    _revision_text,
+)
+from src.contexts.studio.infrastructure.search_index import (
+    excerpt,
+    index_document,
+    plain_text,
+)
+from src.contexts.studio.infrastructure.title_suggest import (
+    TitleSuggestion,
+    TitleTrie,
+    title_suggest_cache,
+)
 
 __all__ = ["DocumentSearchRepositoryMixin"]
 
+# The rowid constraint is handed to FTS5 with the MATCH, so only this
+# project's rows are ranked instead of every match in the index.
+_SEARCH = text(
+    "SELECT e.document_id, e.title, e.revision_id FROM document_search "
+    "JOIN document_search_entries e ON e.id = document_search.rowid "
+    "WHERE document_search MATCH :query AND document_search.rowid IN "
+    "(SELECT id FROM document_search_entries WHERE project_id = :project_id) "
+    "ORDER BY rank LIMIT 30"
+)
+# One FTS5 pass over every project the principal can see. bm25 weighs a
+# title hit ten times a body hit; the outer query pages on (score, rowid).
+_SEARCH_ALL = text(
+    "SELECT * FROM ("
+    "SELECT e.id, bm25(document_search, 10.0, 1.0) AS score, e.project_id, "
+    "p.title AS project_title, e.document_id, e.title, e.revision_id "
+    "FROM document_search "
+    "JOIN document_search_entries e ON e.id = document_search.rowid "
+    "JOIN projects p ON p.id = e.project_id "
+    "WHERE document_search MATCH :query "
+    "AND (p.owner_id = :owner_id OR p.guest_session_id = :guest_session_id)"
+    ") WHERE :after_score IS NULL OR (score, id) > (:after_score, :after_id) "
+    "ORDER BY score, id LIMIT :limit"
+)
+_TITLES = text(
+    "SELECT id, kind, title FROM documents WHERE project_id = :project_id "
+    "ORDER BY kind, position, created_at"
+)
+
+
+def _search_cursor(cursor: str) -> tuple[float, int]:
+    score, rowid = decode_cursor(cursor, 2)
+    if not isinstance(score, int | float) or type(rowid) is not int:
+        raise InvalidOperation("Invalid pagination cursor.")
+    return float(score), rowid
+
 
 class DocumentSearchRepositoryMixin:
     database: StudioDatabase
 
     if TYPE_CHECKING:
 
-        def _project(
+        def _verify_project(
             self,
             session: Session,
             project_id: str,
             owner_id: str | None,
             guest_session_id: str | None,
-        ) -> Project: ...
+        ) -> None: ...
 
     def _refresh_search(
         self,
@@ -34,21 +87,13 @@ class DocumentSearchRepositoryMixin:
         document: Document,
         revision: DocumentRevision,
     ) -> None:
-        session.execute(
-            text("DELETE FROM document_search WHERE document_id = :document_id"),
-            {"document_id": document.id},
-        )
-        session.execute(
-            text(
-                "INSERT INTO document_search(document_id, project_id, title, content) "
-                "VALUES (:document_id, :project_id, :title, :content)"
-            ),
-            {
-                "document_id": document.id,
-                "project_id": document.project_id,
-                "title": document.title,
-                "content": revision.content_markdown,
-            },
+        index_document(
+            session,
+            document_id=document.id,
+            project_id=document.project_id,
+            title=document.title,
+            revision_id=revision.id,
+            content=_revision_content(revision),
         )
 
     def search_documents(
@@ -58,16 +103,96 @@ class DocumentSearchRepositoryMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
+        session: Session | None = None,
     ) -> list[dict[str, Any]]:
-        with self.database.session() as session:
-            self._project(session, project_id, owner_id, guest_session_id)
-            rows = session.execute(
-                text(
-                    "SELECT document_id, title, snippet(document_search, 3, '', "
-                    "'', ' … ', 16) AS excerpt "
-                    "FROM document_search WHERE project_id = :project_id "
-                    "AND document_search MATCH :query ORDER BY rank LIMIT 30"
-                ),
-                {"project_id": project_id, "query": query},
-            ).mappings()
-            return [dict(row) for row in rows]
+        with _read_session(self.database, session) as db_session:
+            self._verify_project(db_session, project_id, owner_id, guest_session_id)
+            rows = db_session.execute(
+                _SEARCH, {"project_id": project_id, "query": query}
+            ).all()
+            return [
+                {
+                    "document_id": row.document_id,
+                    "title": row.title,
+                    "excerpt": excerpt(
+                        plain_text(_revision_text(db_session, row.revision_id) or ""),
+                        query,
+                    ),
+                }
+                for row in rows
+            ]
+
+    def search_all_documents(
+        self,
+        query: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        limit: int,
+        cursor: str | None = None,
+        session: Session | None = None,
+    ) -> PageDto[SearchHitDto]:
+        after_score, after_id = (
+            _search_cursor(cursor) if cursor is not None else (None, None)
+        )
+        with _read_session(self.database, session) as db_session:
+            rows = db_session.execute(
+                _SEARCH_ALL,
+                {
+                    "query": query,
+                    "owner_id": owner_id,
+                    "guest_session_id": guest_session_id,
+                    "after_score": after_score,
+                    "after_id": after_id,
+                    "limit": limit + 1,
+                },
+            ).all()
+            hits = [
+                SearchHitDto(
+                    id=row.id,
+                    score=row.score,
+                    project_id=row.project_id,
+                    project_title=row.project_title,
+                    document_id=row.document_id,
+                    title=row.title,
+                    excerpt=excerpt(
+                        plain_text(_revision_text(db_session, row.revision_id) or ""),
+                        query,
+                    ),
+                )
+                for row in rows[:limit]
+            ]
+        next_cursor = (
+            encode_cursor([hits[-1].score, hits[-1].id]) if len(rows) > limit else None
+        )
+        return PageDto(items=hits, next_cursor=next_cursor)
+
+    def suggest_titles(
+        self,
+        project_id: str,
+        prefix: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        limit: int = 10,
+        session: Session | None = None,
+    ) -> list[dict[str, Any]]:
+        # Read before any query, so a rename committing mid-build fails the put.
+        generation = title_suggest_cache.generation(project_id)
+        with _read_session(self.database, session) as db_session:
+            self._verify_project(db_session, project_id, owner_id, guest_session_id)
+            trie = title_suggest_cache.get(project_id)
+            if trie is None:
+                trie = TitleTrie(
+                    TitleSuggestion(document_id=row.id, kind=row.kind, title=row.title)
+                    for row in db_session.execute(_TITLES, {"project_id": project_id})
+                )
+                title_suggest_cache.put(project_id, generation, trie)
+        return [
+            {
+                "document_id": suggestion.document_id,
+                "kind": suggestion.kind,
+                "title": suggestion.title,
+            }
+            for suggestion in trie.suggest(prefix, limit)
+        ]
@@ -6,13 +6,14 @@ from src.contexts.studio.infrastructure.repository.common import (
     Export,
     ExportDto,
     NotFound,
-    Project,
+    PageDto,
     Session,
     StudioDatabase,
     _export_dto,
     datetime,
     select,
 )
+from src.contexts.studio.infrastructure.repository.pagination import _keyset_page
 
 __all__ = ["ExportRepositoryMixin"]
 
@@ -22,13 +23,13 @@ class ExportRepositoryMixin:
 
     if TYPE_CHECKING:
 
-        def _project(
+        def _verify_project(
             self,
             session: Session,
             project_id: str,
             owner_id: str | None,
             guest_session_id: str | None,
-        ) -> Project: ...
+        ) -> None: ...
 
     def create_export(
         self,
@@ -63,15 +64,22 @@ class ExportRepositoryMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[ExportDto]:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            exports = session.scalars(
-                select(Export)
-                .where(Export.project_id == project.id)
-                .order_by(Export.created_at.desc())
-            ).all()
-            return [_export_dto(item) for item in exports]
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[ExportDto]:
+        with self.database.read_session() as session:
+            self._verify_project(session, project_id, owner_id, guest_session_id)
+            exports, next_cursor = _keyset_page(
+                session,
+                select(Export).where(Export.project_id == project_id),
+                (Export.created_at, Export.id),
+                limit=limit,
+                cursor=cursor,
+            )
+            return PageDto(
+                items=[_export_dto(item) for item in exports],
+                next_cursor=next_cursor,
+            )
 
     def get_export(
         self,
@@ -81,12 +89,12 @@ class ExportRepositoryMixin:
         owner_id: str | None,
         guest_session_id: str | None,
     ) -> ExportDto:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
+        with self.database.read_session() as session:
+            self._verify_project(session, project_id, owner_id, guest_session_id)
             item = session.scalar(
                 select(Export).where(
                     Export.id == export_id,
-                    Export.project_id == project.id,
+                    Export.project_id == project_id,
                 )
             )
             if item is None:
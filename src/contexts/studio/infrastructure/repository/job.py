@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Select
 from sqlalchemy.orm import selectinload
 
 from src.contexts.studio.infrastructure.models import JobEvent
@@ -11,17 +12,26 @@ from src.contexts.studio.infrastructure.repository.common import (
     Job,
     JobDto,
     NotFound,
-    Project,
+    PageDto,
     Session,
     StudioDatabase,
     UsageEvent,
+    _group_committed,
     _job_dto,
+    _session,
     datetime,
     new_id,
     select,
 )
+from src.contexts.studio.infrastructure.repository.pagination import _keyset_page
 
-__all__ = ["JobRepositoryMixin"]
+__all__ = ["JOB_PAGE_KEYS", "JobRepositoryMixin", "_job_page_statement"]
+
+JOB_PAGE_KEYS = (Job.created_at, Job.id)
+
+
+def _job_page_statement(project_id: str) -> Select[Job]:
+    return select(Job).where(Job.project_id == project_id)
 
 
 class JobRepositoryMixin:
@@ -29,13 +39,13 @@ class JobRepositoryMixin:
 
     if TYPE_CHECKING:
 
-        def _project(
+        def _verify_project(
             self,
             session: Session,
             project_id: str,
             owner_id: str | None,
             guest_session_id: str | None,
-        ) -> Project: ...
+        ) -> None: ...
 
     def create_job(
         self,
@@ -86,12 +96,12 @@ class JobRepositoryMixin:
         owner_id: str | None,
         guest_session_id: str | None,
     ) -> JobDto:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
+        with self.database.read_session() as session:
+            self._verify_project(session, project_id, owner_id, guest_session_id)
             job = session.scalar(
                 select(Job).where(
                     Job.id == job_id,
-                    Job.project_id == project.id,
+                    Job.project_id == project_id,
                 )
             )
             if job is None:
@@ -104,16 +114,22 @@ class JobRepositoryMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[JobDto]:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            jobs = session.scalars(
-                select(Job)
-                .where(Job.project_id == project.id)
-                .order_by(Job.created_at.desc())
-                .options(selectinload(Job.events))
-            ).all()
-            return [_job_dto(session, job) for job in jobs]
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[JobDto]:
+        with self.database.read_session() as session:
+            self._verify_project(session, project_id, owner_id, guest_session_id)
+            jobs, next_cursor = _keyset_page(
+                session,
+                _job_page_statement(project_id).options(selectinload(Job.events)),
+                JOB_PAGE_KEYS,
+                limit=limit,
+                cursor=cursor,
+            )
+            return PageDto(
+                items=[_job_dto(session, job) for job in jobs],
+                next_cursor=next_cursor,
+            )
 
     def update_job(
         self,
@@ -141,6 +157,7 @@ class JobRepositoryMixin:
             session.flush()
             return _job_dto(session, job)
 
+    @_group_committed
     def add_job_event(
         self,
         job_id: str,
@@ -148,9 +165,10 @@ class JobRepositoryMixin:
         status: str,
         details_json: str,
         now: datetime,
+        session: Session | None = None,
     ) -> None:
-        with self.database.session() as session:
-            session.add(
+        with _session(self.database, session) as db_session:
+            db_session.add(
                 JobEvent(
                     id=new_id(),
                     job_id=job_id,
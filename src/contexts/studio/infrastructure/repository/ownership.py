@@ -0,0 +1,144 @@
+"""Request-scoped memo of verified project ownership plus cached lookups.
+
+A single service call reaches the repository several times, each in its own
+session, and every entry point re-checks that the principal may see the
+project. Inside :func:`ownership_scope` a successful check is remembered for
+the rest of the scope, so repeat checks for the same principal and project
+cost no query. Outside a scope (CLI commands, background jobs) every check
+still goes to the database.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from src.contexts.studio.infrastructure.models import (
+    Document,
+    Project,
+    ProjectSnapshot,
+)
+
+__all__ = [
+    "_document_statement",
+    "_forget_project",
+    "_is_verified",
+    "_project_statement",
+    "_project_version_statement",
+    "_remember_project",
+    "_snapshot_project_statement",
+    "_visible_project_statement",
+    "ownership_scope",
+]
+
+OwnershipKey = tuple[str | None, str | None, str]
+
+_verified_projects: ContextVar[set[OwnershipKey] | None] = ContextVar(
+    "studio_verified_projects", default=None
+)
+
+
+@contextmanager
+def ownership_scope() -> Iterator[None]:
+    """Remember successful project scope checks until the block exits."""
+    token = _verified_projects.set(set())
+    try:
+        yield
+    finally:
+        _verified_projects.reset(token)
+
+
+def _is_verified(key: OwnershipKey) -> bool:
+    verified = _verified_projects.get()
+    return verified is not None and key in verified
+
+
+def _remember_project(key: OwnershipKey) -> None:
+    verified = _verified_projects.get()
+    if verified is not None:
+        verified.add(key)
+
+
+def _forget_project(project_id: str) -> None:
+    verified = _verified_projects.get()
+    if verified is not None:
+        verified.difference_update({key for key in verified if key[2] == project_id})
+
+
+# Lambda statements are analysed once per call site and then served from the
+# compiled cache, so the hot scope checks skip statement construction and
+# compilation entirely; only the bound values change between calls.
+
+
+def _visible_project_statement(
+    project_id: str,
+    owner_id: str | None,
+    guest_session_id: str | None,
+) -> StatementLambdaElement:
+    if owner_id:
+        return lambda_stmt(
+            lambda: select(Project.id).where(
+                Project.id == project_id, Project.owner_id == owner_id
+            )
+        )
+    return lambda_stmt(
+        lambda: select(Project.id).where(
+            Project.id == project_id, Project.guest_session_id == guest_session_id
+        )
+    )
+
+
+def _project_statement(
+    project_id: str,
+    owner_id: str | None,
+    guest_session_id: str | None,
+) -> StatementLambdaElement:
+    if owner_id:
+        return lambda_stmt(
+            lambda: select(Project).where(
+                Project.id == project_id, Project.owner_id == owner_id
+            )
+        )
+    return lambda_stmt(
+        lambda: select(Project).where(
+            Project.id == project_id, Project.guest_session_id == guest_session_id
+        )
+    )
+
+
+def _project_version_statement(
+    project_id: str,
+    owner_id: str | None,
+    guest_session_id: str | None,
+) -> StatementLambdaElement:
+    if owner_id:
+        return lambda_stmt(
+            lambda: select(Project.version).where(
+                Project.id == project_id, Project.owner_id == owner_id
+            )
+        )
+    return lambda_stmt(
+        lambda: select(Project.version).where(
+            Project.id == project_id, Project.guest_session_id == guest_session_id
+        )
+    )
+
+
+def _document_statement(project_id: str, document_id: str) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(Document).where(
+            Document.id == document_id, Document.project_id == project_id
+        )
+    )
+
+
+def _snapshot_project_statement(snapshot_id: str) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(ProjectSnapshot.project_id).where(
+            ProjectSnapshot.id == snapshot_id
+        )
+    )
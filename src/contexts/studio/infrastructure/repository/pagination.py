@@ -0,0 +1,88 @@
+"""Keyset pagination for newest-first Studio listings."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Select, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from src.contexts.studio.application.ports import decode_cursor, encode_cursor
+from src.contexts.studio.domain.exceptions import InvalidOperation
+
+__all__ = ["_keyset_page", "_keyset_statement"]
+
+
+def _cursor_values(
+    keys: Sequence[InstrumentedAttribute[Any]],
+    cursor: str,
+) -> list[Any]:
+    values: list[Any] = []
+    for key, raw in zip(keys, decode_cursor(cursor, len(keys)), strict=True):
+        try:
+            value = (
+                datetime.fromisoformat(raw) if isinstance(key.type, DateTime) else raw
+            )
+        except (TypeError, ValueError) as exc:
+            raise InvalidOperation("Invalid pagination cursor.") from exc
+        if not isinstance(value, key.type.python_type):
+            raise InvalidOperation("Invalid pagination cursor.")
+        values.append(value)
+    return values
+
+
+def _fetch(
+    session: Session, statement: Select[*tuple[Any, ...]], scalars: bool
+) -> list[Any]:
+    if scalars:
+        return list(session.scalars(statement).all())
+    return list(session.execute(statement).all())
+
+
+def _keyset_statement(
+    statement: Select[*tuple[Any, ...]],
+    keys: Sequence[InstrumentedAttribute[Any]],
+    values: Sequence[Any] | None,
+) -> Select[*tuple[Any, ...]]:
+    """Order ``statement`` by ``keys`` descending, starting after ``values``."""
+    if values is not None:
+        statement = statement.where(
+            tuple_(*keys)
+            < tuple_(
+                *(
+                    literal(value, key.type)
+                    for key, value in zip(keys, values, strict=True)
+                )
+            )
+        )
+    return statement.order_by(*(key.desc() for key in keys))
+
+
+def _keyset_page(
+    session: Session,
+    statement: Select[*tuple[Any, ...]],
+    keys: Sequence[InstrumentedAttribute[Any]],
+    *,
+    limit: int | None,
+    cursor: str | None,
+    scalars: bool = True,
+) -> tuple[list[Any], str | None]:
+    """Return one page of ``statement`` ordered by ``keys`` descending.
+
+    ``keys`` must be unique together (e.g. ``created_at, id``) and backed by a
+    composite index, so every page is a single index range scan regardless of
+    how many rows precede it. Without ``limit`` every remaining row is returned.
+    Pass ``scalars=False`` for column-only statements to get named rows back;
+    ``keys`` must then be among the selected columns.
+    """
+    values = _cursor_values(keys, cursor) if cursor is not None else None
+    statement = _keyset_statement(statement, keys, values)
+    if limit is None:
+        return _fetch(session, statement, scalars), None
+    rows = _fetch(session, statement.limit(limit + 1), scalars)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor([getattr(rows[-1], key.key) for key in keys])
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 from sqlalchemy import delete
 from sqlalchemy.orm import selectinload
 
+from src.contexts.studio.domain.utils import POSITION_GAP
+from src.contexts.studio.infrastructure.content_fingerprint import toggle_members
 from src.contexts.studio.infrastructure.models import ProjectSnapshot, SnapshotDocument
 from src.contexts.studio.infrastructure.repository.common import (
     Any,
@@ -14,24 +16,38 @@ from src.contexts.studio.infrastructure.repository.common import (
     NotFound,
     Project,
     ProjectDto,
+    RevisionStorage,
     Session,
     StudioDatabase,
     _document_dto,
+    _new_revision,
+    _read_session,
     _session,
-    cast,
     datetime,
     dump_json,
     new_id,
     select,
-    text,
+)
+from src.contexts.studio.infrastructure.repository.ownership import (
+    _forget_project,
+    _is_verified,
+    _project_statement,
+    _project_version_statement,
+    _remember_project,
+    _visible_project_statement,
 )
 from src.contexts.studio.infrastructure.repository.project_payloads import project_dto
+from src.contexts.studio.infrastructure.repository.project_version import (
+    _bump_version,
+)
+from src.contexts.studio.infrastructure.search_index import unindex_project
 
 __all__ = ["ProjectRepositoryMixin"]
 
 
 class ProjectRepositoryMixin:
     database: StudioDatabase
+    revision_storage: RevisionStorage
 
     if TYPE_CHECKING:
 
@@ -49,12 +65,38 @@ class ProjectRepositoryMixin:
         owner_id: str | None,
         guest_session_id: str | None,
     ) -> Project:
-        statement = select(Project).where(Project.id == project_id)
-        statement = self._scope_projects(statement, owner_id, guest_session_id)
-        project = session.scalar(statement)
+        key = (owner_id, guest_session_id, project_id)
+        if _is_verified(key):
+            project = session.get(Project, project_id)
+        else:
+            project = session.scalar(
+                _project_statement(project_id, owner_id, guest_session_id)
+            )
         if project is None:
             raise NotFound("Project not found.")
-        return cast(Project, project)
+        _remember_project(key)
+        return project
+
+    def _verify_project(
+        self,
+        session: Session,
+        project_id: str,
+        owner_id: str | None,
+        guest_session_id: str | None,
+    ) -> None:
+        """Raise NotFound unless the principal may see ``project_id``.
+
+        Cheaper than :meth:`_project` for callers that only need the id: the
+        check selects no row data and is skipped entirely once verified in
+        the current ownership scope.
+        """
+        key = (owner_id, guest_session_id, project_id)
+        if _is_verified(key):
+            return
+        statement = _visible_project_statement(project_id, owner_id, guest_session_id)
+        if session.scalar(statement) is None:
+            raise NotFound("Project not found.")
+        _remember_project(key)
 
     @staticmethod
     def _scope_projects(
@@ -98,18 +140,20 @@ class ProjectRepositoryMixin:
                     project_id=project.id,
                     kind="chapter",
                     title="Chapter 1",
-                    position=1,
+                    position=POSITION_GAP,
                     created_at=now,
                     updated_at=now,
                 )
                 db_session.add(document)
                 db_session.flush()
-                revision = DocumentRevision(
+                revision = _new_revision(
+                    db_session,
+                    content_markdown="# Chapter 1\n\n",
+                    parent=None,
+                    storage=self.revision_storage,
                     id=new_id(),
                     document_id=document.id,
-                    parent_revision_id=None,
                     revision_number=1,
-                    content_markdown="# Chapter 1\n\n",
                     metadata_json=dump_json({}),
                     source="author",
                     created_at=now,
@@ -117,6 +161,10 @@ class ProjectRepositoryMixin:
                 db_session.add(revision)
                 db_session.flush()
                 document.current_revision_id = revision.id
+                project.content_fingerprint = toggle_members(
+                    project.content_fingerprint,
+                    (document.id, revision.content_sha256, document.position),
+                )
                 self._refresh_search(db_session, document, revision)
                 documents.append(_document_dto(document))
             return project_dto(project, documents=documents)
@@ -128,14 +176,9 @@ class ProjectRepositoryMixin:
         guest_session_id: str | None,
         session: Session | None = None,
     ) -> list[ProjectDto]:
-        with _session(self.database, session) as db_session:
-            statement = (
-                select(Project)
-                .order_by(Project.updated_at.desc())
-                .options(
-                    selectinload(Project.documents).selectinload(Document.revisions)
-                )
-            )
+        with _read_session(self.database, session) as db_session:
+            # Summary listing: project rows only, no documents or revisions.
+            statement = select(Project).order_by(Project.updated_at.desc())
             statement = self._scope_projects(statement, owner_id, guest_session_id)
             projects = db_session.scalars(statement).all()
             return [project_dto(project, documents=None) for project in projects]
@@ -148,16 +191,37 @@ class ProjectRepositoryMixin:
         guest_session_id: str | None,
         session: Session | None = None,
     ) -> ProjectDto:
-        with _session(self.database, session) as db_session:
+        with _read_session(self.database, session) as db_session:
             project = self._project(db_session, project_id, owner_id, guest_session_id)
             documents = db_session.scalars(
                 select(Document)
                 .where(Document.project_id == project.id)
                 .order_by(Document.kind, Document.position, Document.created_at)
-                .options(selectinload(Document.revisions))
+                .options(
+                    selectinload(Document.current_revision).selectinload(
+                        DocumentRevision.blob
+                    )
+                )
             ).all()
             return project_dto(project, documents=documents)
 
+    def project_version(
+        self,
+        project_id: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        session: Session | None = None,
+    ) -> int:
+        """Return the project's write counter with a single primary-key lookup."""
+        with _read_session(self.database, session) as db_session:
+            version: int | None = db_session.scalar(
+                _project_version_statement(project_id, owner_id, guest_session_id)
+            )
+            if version is None:
+                raise NotFound("Project not found.")
+            return version
+
     def update_project(
         self,
         project_id: str,
@@ -179,6 +243,7 @@ class ProjectRepositoryMixin:
             if settings_json is not None:
                 project.settings_json = settings_json
             project.updated_at = now
+            _bump_version(db_session, project)
             documents = db_session.scalars(
                 select(Document)
                 .where(Document.project_id == project.id)
@@ -196,10 +261,7 @@ class ProjectRepositoryMixin:
     ) -> None:
         with _session(self.database, session) as db_session:
             project = self._project(db_session, project_id, owner_id, guest_session_id)
-            db_session.execute(
-                text("DELETE FROM document_search WHERE project_id = :project_id"),
-                {"project_id": project.id},
-            )
+            unindex_project(db_session, project.id)
             snapshot_ids = db_session.scalars(
                 select(ProjectSnapshot.id).where(
                     ProjectSnapshot.project_id == project.id
@@ -215,6 +277,7 @@ class ProjectRepositoryMixin:
                     delete(ProjectSnapshot).where(ProjectSnapshot.id.in_(snapshot_ids))
                 )
             db_session.delete(project)
+            _forget_project(project.id)
 
     def find_project_by_import_hash(
         self,
@@ -244,3 +307,5 @@ class ProjectRepositoryMixin:
         with _session(self.database, session) as db_session:
             project = self._project(db_session, project_id, owner_id, guest_session_id)
             project.import_hash = import_hash
+            # ``import_hash`` is part of the project payload the ETag covers.
+            _bump_version(db_session, project)
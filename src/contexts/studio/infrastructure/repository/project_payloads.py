@@ -26,6 +26,7 @@ def project_dto(
         import_hash=project.import_hash,
         created_at=project.created_at,
         updated_at=project.updated_at,
+        version=project.version,
         documents=_document_payloads(documents),
     )
 
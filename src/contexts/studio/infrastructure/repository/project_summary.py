@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import case
+from sqlalchemy.orm import aliased
+
+from src.contexts.studio.domain.types import DOCUMENT_KINDS
+from src.contexts.studio.infrastructure.models import Export, ProjectSnapshot
+from src.contexts.studio.infrastructure.repository.common import (
+    Any,
+    Document,
+    DocumentRevision,
+    Project,
+    ProjectSummaryDto,
+    Session,
+    StudioDatabase,
+    _read_session,
+    func,
+    select,
+)
+
+__all__ = ["ProjectSummaryRepositoryMixin"]
+
+
+def _project_summary_statement(project_ids: Any) -> Any:
+    """Build the single grouped query behind the project dashboard.
+
+    ``project_ids`` selects the caller's projects. Only their documents are
+    ranked for the last-edited columns; ranking before the caller's scope
+    applies would number every document in the database.
+    """
+    last_edited = (
+        select(
+            Document.project_id,
+            Document.id,
+            Document.title,
+            Document.updated_at,
+            func.row_number()
+            .over(
+                partition_by=Document.project_id,
+                order_by=(Document.updated_at.desc(), Document.id),
+            )
+            .label("recency"),
+        )
+        .where(Document.project_id.in_(project_ids))
+        .subquery()
+    )
+    latest = aliased(last_edited)
+    latest_snapshot_at = (
+        select(func.max(ProjectSnapshot.created_at))
+        .where(ProjectSnapshot.project_id == Project.id)
+        .scalar_subquery()
+    )
+    latest_export_at = (
+        select(func.max(Export.created_at))
+        .where(Export.project_id == Project.id)
+        .scalar_subquery()
+    )
+    kind_counts = [
+        func.count(case((Document.kind == kind, Document.id))).label(kind)
+        for kind in DOCUMENT_KINDS
+    ]
+    return (
+        select(
+            Project.id,
+            Project.title,
+            Project.description,
+            Project.created_at,
+            Project.updated_at,
+            *kind_counts,
+            func.coalesce(func.sum(DocumentRevision.word_count), 0).label("word_count"),
+            func.max(latest.c.id).label("last_edited_document_id"),
+            func.max(latest.c.title).label("last_edited_document_title"),
+            func.max(latest.c.updated_at).label("last_edited_at"),
+            latest_snapshot_at.label("latest_snapshot_at"),
+            latest_export_at.label("latest_export_at"),
+        )
+        .outerjoin(Document, Document.project_id == Project.id)
+        .outerjoin(
+            DocumentRevision,
+            DocumentRevision.id == Document.current_revision_id,
+        )
+        .outerjoin(
+            latest,
+            (latest.c.project_id == Project.id) & (latest.c.recency == 1),
+        )
+        .group_by(Project.id)
+        .order_by(Project.updated_at.desc())
+    )
+
+
+class ProjectSummaryRepositoryMixin:
+    database: StudioDatabase
+
+    if TYPE_CHECKING:
+
+        @staticmethod
+        def _scope_projects(
+            statement: Any,
+            owner_id: str | None,
+            guest_session_id: str | None,
+        ) -> Any: ...
+
+    def list_project_summaries(
+        self,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        session: Session | None = None,
+    ) -> list[ProjectSummaryDto]:
+        project_ids = self._scope_projects(
+            select(Project.id), owner_id, guest_session_id
+        )
+        statement = self._scope_projects(
+            _project_summary_statement(project_ids), owner_id, guest_session_id
+        )
+        with _read_session(self.database, session) as db_session:
+            rows = db_session.execute(statement).all()
+        return [
+            ProjectSummaryDto(
+                id=row.id,
+                title=row.title,
+                description=row.description,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                document_counts={kind: row._mapping[kind] for kind in DOCUMENT_KINDS},
+                word_count=int(row.word_count),
+                last_edited_document_id=row.last_edited_document_id,
+                last_edited_document_title=row.last_edited_document_title,
+                last_edited_at=row.last_edited_at,
+                latest_snapshot_at=row.latest_snapshot_at,
+                latest_export_at=row.latest_export_at,
+            )
+            for row in rows
+        ]
@@ -0,0 +1,29 @@
+"""Atomic increments of the project version counter."""
+
+from __future__ import annotations
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.contexts.studio.infrastructure.models import Project
+
+__all__ = ["_bump_version"]
+
+
+def _bump_version(session: Session, project: Project) -> int:
+    """Increment ``project.version`` in SQL and return the new value.
+
+    A Python ``+= 1`` would write back whatever this session read, losing
+    increments made by other writers in between; the counter backs ETags, so
+    two project states must never share a value.
+    """
+    version: int = session.execute(
+        update(Project)
+        .where(Project.id == project.id)
+        .values(version=Project.version + 1)
+        .returning(Project.version)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+    set_committed_value(project, "version", version)
+    return version
@@ -0,0 +1,126 @@
+"""``EXPLAIN QUERY PLAN`` over the repository's hot statements.
+
+Each entry builds the exact statement the repository issues, with
+placeholder values, so ``novel-engine doctor --plans`` reports on the SQL
+that actually runs rather than a hand-maintained copy of it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import Engine, select
+from sqlalchemy.sql import ClauseElement
+
+from src.contexts.studio.infrastructure.models import DocumentRevision
+from src.contexts.studio.infrastructure.repository.auth import (
+    _expired_guest_sessions_statement,
+)
+from src.contexts.studio.infrastructure.repository.document import (
+    _snapshot_reference_statement,
+)
+from src.contexts.studio.infrastructure.repository.document_revisions import (
+    _REVISION_SUMMARY_COLUMNS,
+)
+from src.contexts.studio.infrastructure.repository.job import (
+    JOB_PAGE_KEYS,
+    _job_page_statement,
+)
+from src.contexts.studio.infrastructure.repository.ownership import (
+    _document_statement,
+    _visible_project_statement,
+)
+from src.contexts.studio.infrastructure.repository.pagination import (
+    _keyset_statement,
+)
+from src.contexts.studio.infrastructure.repository.review import (
+    REVIEW_PAGE_KEYS,
+    _review_page_statement,
+)
+from src.contexts.studio.infrastructure.repository.snapshot_builder import (
+    _latest_snapshot_statement,
+)
+
+__all__ = ["HOT_QUERIES", "QueryPlan", "explain_hot_queries"]
+
+_SAMPLE_ID = "00000000-0000-0000-0000-000000000000"
+_SAMPLE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _revision_history() -> ClauseElement:
+    return _keyset_statement(
+        select(*_REVISION_SUMMARY_COLUMNS).where(
+            DocumentRevision.document_id == _SAMPLE_ID
+        ),
+        (DocumentRevision.revision_number,),
+        None,
+    ).limit(51)
+
+
+HOT_QUERIES: dict[str, Callable[[], ClauseElement]] = {
+    "project_scope_owner": lambda: _visible_project_statement(
+        _SAMPLE_ID, _SAMPLE_ID, None
+    ),
+    "project_scope_guest": lambda: _visible_project_statement(
+        _SAMPLE_ID, None, _SAMPLE_ID
+    ),
+    "document_lookup": lambda: _document_statement(_SAMPLE_ID, _SAMPLE_ID),
+    "revision_history": _revision_history,
+    "latest_snapshot": lambda: _latest_snapshot_statement(_SAMPLE_ID),
+    "snapshot_reference": lambda: _snapshot_reference_statement(_SAMPLE_ID),
+    "expired_guest_sessions": lambda: _expired_guest_sessions_statement(_SAMPLE_TIME),
+    "job_page": lambda: _keyset_statement(
+        _job_page_statement(_SAMPLE_ID), JOB_PAGE_KEYS, (_SAMPLE_TIME, _SAMPLE_ID)
+    ).limit(51),
+    "review_page": lambda: _keyset_statement(
+        _review_page_statement(_SAMPLE_ID),
+        REVIEW_PAGE_KEYS,
+        (_SAMPLE_TIME, _SAMPLE_ID),
+    ).limit(51),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class QueryPlan:
+    name: str
+    steps: tuple[str, ...]
+
+    @property
+    def full_scans(self) -> tuple[str, ...]:
+        """Steps that read a whole table rather than an index range."""
+        return tuple(
+            step
+            for step in self.steps
+            if step.startswith("SCAN ") and " USING " not in step
+        )
+
+    @property
+    def temp_sorts(self) -> tuple[str, ...]:
+        """Steps that sort into a temporary b-tree instead of using an index."""
+        return tuple(step for step in self.steps if "TEMP B-TREE" in step)
+
+    @property
+    def flagged(self) -> bool:
+        return bool(self.full_scans or self.temp_sorts)
+
+
+def _explain(engine: Engine, statement: ClauseElement) -> tuple[str, ...]:
+    # Placeholder values are inlined; the planner only cares about the shape.
+    sql = str(
+        statement.compile(
+            dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+    return tuple(str(row[-1]) for row in rows)
+
+
+def explain_hot_queries(engine: Engine) -> list[QueryPlan]:
+    """Return the SQLite query plan of every statement in ``HOT_QUERIES``."""
+    return [
+        QueryPlan(name=name, steps=_explain(engine, build()))
+        for name, build in HOT_QUERIES.items()
+    ]
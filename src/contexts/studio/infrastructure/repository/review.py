@@ -2,28 +2,37 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Select
 from sqlalchemy.orm import selectinload
 
 from src.contexts.studio.infrastructure.models import ReviewIssue, SnapshotDocument
 from src.contexts.studio.infrastructure.repository.common import (
     Document,
     DocumentRevision,
-    Project,
-    ProjectSnapshot,
+    PageDto,
     Review,
     ReviewDto,
     Session,
     StudioDatabase,
     _review_dto,
-    _word_count,
-    cast,
+    _revision_content,
     datetime,
     dump_json,
     new_id,
     select,
 )
+from src.contexts.studio.infrastructure.repository.pagination import _keyset_page
+from src.contexts.studio.infrastructure.repository.snapshot_builder import (
+    _materialize_snapshot,
+)
+
+__all__ = ["REVIEW_PAGE_KEYS", "ReviewRepositoryMixin", "_review_page_statement"]
+
+REVIEW_PAGE_KEYS = (Review.created_at, Review.id)
 
-__all__ = ["ReviewRepositoryMixin"]
+
+def _review_page_statement(project_id: str) -> Select[Review]:
+    return select(Review).where(Review.project_id == project_id)
 
 
 class ReviewRepositoryMixin:
@@ -31,13 +40,13 @@ class ReviewRepositoryMixin:
 
     if TYPE_CHECKING:
 
-        def _project(
+        def _verify_project(
             self,
             session: Session,
             project_id: str,
             owner_id: str | None,
             guest_session_id: str | None,
-        ) -> Project: ...
+        ) -> None: ...
 
     def create_review(
         self,
@@ -50,36 +59,13 @@ class ReviewRepositoryMixin:
         now: datetime,
     ) -> ReviewDto:
         with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            snapshot = ProjectSnapshot(
-                id=new_id(),
-                project_id=project.id,
-                reason="review",
-                created_at=now,
+            self._verify_project(session, project_id, owner_id, guest_session_id)
+            snapshot = _materialize_snapshot(
+                session, project_id, reason="review", now=now
             )
-            session.add(snapshot)
-            session.flush()
-            documents = session.scalars(
-                select(Document)
-                .where(
-                    Document.project_id == project.id,
-                    Document.current_revision_id.is_not(None),
-                )
-                .order_by(Document.position, Document.created_at)
-            ).all()
-            for document in documents:
-                session.add(
-                    SnapshotDocument(
-                        id=new_id(),
-                        snapshot_id=snapshot.id,
-                        document_id=document.id,
-                        revision_id=cast(str, document.current_revision_id),
-                        position=document.position,
-                    )
-                )
             review = Review(
                 id=new_id(),
-                project_id=project.id,
+                project_id=project_id,
                 snapshot_id=snapshot.id,
                 provider=provider,
                 model=model,
@@ -92,7 +78,7 @@ class ReviewRepositoryMixin:
             for document, revision in content_pairs:
                 if document.kind != "chapter":
                     continue
-                words = _word_count(revision.content_markdown)
+                words = revision.word_count
                 if words < 250:
                     session.add(
                         ReviewIssue(
@@ -106,7 +92,7 @@ class ReviewRepositoryMixin:
                             evidence_json=dump_json({"word_count": words}),
                         )
                     )
-                if not revision.content_markdown.strip():
+                if not _revision_content(revision).strip():
                     session.add(
                         ReviewIssue(
                             id=new_id(),
@@ -136,6 +122,7 @@ class ReviewRepositoryMixin:
             )
             .where(SnapshotDocument.snapshot_id == snapshot_id)
             .order_by(SnapshotDocument.position, Document.created_at)
+            .options(selectinload(DocumentRevision.blob))
         ).all()
         return [(row[0], row[1]) for row in rows]
 
@@ -145,13 +132,19 @@ class ReviewRepositoryMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[ReviewDto]:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            reviews = session.scalars(
-                select(Review)
-                .where(Review.project_id == project.id)
-                .order_by(Review.created_at.desc())
-                .options(selectinload(Review.issues))
-            ).all()
-            return [_review_dto(session, review) for review in reviews]
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[ReviewDto]:
+        with self.database.read_session() as session:
+            self._verify_project(session, project_id, owner_id, guest_session_id)
+            reviews, next_cursor = _keyset_page(
+                session,
+                _review_page_statement(project_id).options(selectinload(Review.issues)),
+                REVIEW_PAGE_KEYS,
+                limit=limit,
+                cursor=cursor,
+            )
+            return PageDto(
+                items=[_review_dto(session, review) for review in reviews],
+                next_cursor=next_cursor,
+            )
@@ -0,0 +1,231 @@
+"""Stored encoding of revision bodies and their transparent reconstruction.
+
+Full bodies live in ``revision_blobs``, keyed by SHA-256, so a revision
+whose text already exists (a restore, an accepted proposal, a no-op
+autosave) only points at the existing blob. In ``delta`` mode a new body is
+otherwise written as a line delta against its parent unless its number falls
+on a keyframe (every ``keyframe_interval`` revisions) or the delta would not
+be smaller than the text. Readers go through :func:`_revision_content`,
+which walks the parent chain back to the nearest full body in one recursive
+query and keeps recently rebuilt bodies in a process-wide LRU cache.
+Revision bodies are immutable, so cached entries never go stale. Cold blobs
+may be zlib-compressed; both paths decompress them transparently.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal
+
+from sqlalchemy import Connection, func, literal, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session, object_session
+
+from src.contexts.studio.domain.utils import _revision_statistics
+from src.contexts.studio.infrastructure.models import DocumentRevision, RevisionBlob
+from src.contexts.studio.infrastructure.revision_compression import blob_text
+from src.contexts.studio.infrastructure.revision_delta import apply_delta, encode_delta
+
+__all__ = [
+    "RevisionContentCache",
+    "RevisionStorage",
+    "_new_revision",
+    "_revision_content",
+    "_revision_text",
+    "_store_blob",
+    "_store_blobs",
+    "revision_content_cache",
+]
+
+RevisionStorageMode = Literal["full", "delta"]
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionStorage:
+    mode: RevisionStorageMode = "full"
+    keyframe_interval: int = 20
+
+    def is_keyframe(self, revision_number: int) -> bool:
+        return (revision_number - 1) % self.keyframe_interval == 0
+
+
+class RevisionContentCache:
+    """Thread-safe LRU of reconstructed revision bodies keyed by revision id."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, revision_id: str) -> str | None:
+        with self._lock:
+            content = self._entries.get(revision_id)
+            if content is not None:
+                self._entries.move_to_end(revision_id)
+            return content
+
+    def put(self, revision_id: str, content: str) -> None:
+        with self._lock:
+            self._entries[revision_id] = content
+            self._entries.move_to_end(revision_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+revision_content_cache = RevisionContentCache()
+
+
+def _chain_columns() -> tuple[Any, ...]:
+    return (
+        DocumentRevision.id,
+        DocumentRevision.parent_revision_id,
+        func.coalesce(RevisionBlob.content, DocumentRevision.content_markdown).label(
+            "body"
+        ),
+        RevisionBlob.content_zlib,
+        DocumentRevision.content_delta,
+    )
+
+
+def _delta_chain(session: Session | Connection, revision_id: str) -> list[Any]:
+    """Return ``revision_id`` and its ancestors up to the nearest full body."""
+    anchor = (
+        select(*_chain_columns(), literal(0).label("depth"))
+        .outerjoin(RevisionBlob, RevisionBlob.sha256 == DocumentRevision.blob_sha256)
+        .where(DocumentRevision.id == revision_id)
+    )
+    chain = anchor.cte("revision_chain", recursive=True)
+    parent = (
+        select(*_chain_columns(), (chain.c.depth + 1).label("depth"))
+        .outerjoin(RevisionBlob, RevisionBlob.sha256 == DocumentRevision.blob_sha256)
+        .where(
+            DocumentRevision.id == chain.c.parent_revision_id,
+            chain.c.content_delta.is_not(None),
+        )
+    )
+    chain = chain.union_all(parent)
+    return list(session.execute(select(chain).order_by(chain.c.depth.desc())))
+
+
+def _revision_content(revision: DocumentRevision) -> str:
+    """Return the full markdown body of ``revision`` whatever its encoding."""
+    if revision.content_delta is None and revision.blob_sha256 is None:
+        return revision.content_markdown
+    cached = revision_content_cache.get(revision.id)
+    if cached is not None:
+        return cached
+    if revision.blob_sha256 is not None:
+        blob = revision.blob
+        if blob is None:
+            raise RuntimeError(f"Revision {revision.id} points at a missing blob.")
+        if blob.content_zlib is None:
+            return blob.content
+        content = blob_text(blob.content, blob.content_zlib)
+        revision_content_cache.put(revision.id, content)
+        return content
+    session = object_session(revision)
+    if session is None:
+        raise RuntimeError("Delta-encoded revisions need a session to rebuild.")
+    rebuilt = _revision_text(session, revision.id)
+    if rebuilt is None:
+        raise RuntimeError(f"Revision {revision.id} is missing.")
+    return rebuilt
+
+
+def _revision_text(session: Session | Connection, revision_id: str) -> str | None:
+    """Return the body of ``revision_id`` by id, or ``None`` if it is gone."""
+    cached = revision_content_cache.get(revision_id)
+    if cached is not None:
+        return cached
+    chain = _delta_chain(session, revision_id)
+    if not chain:
+        return None
+    content = ""
+    for row in chain:
+        if row.content_delta is None:
+            content = blob_text(row.body, row.content_zlib)
+            continue
+        content = revision_content_cache.get(row.id) or apply_delta(
+            content, row.content_delta
+        )
+        revision_content_cache.put(row.id, content)
+    return content
+
+
+def _store_blobs(
+    session: Session | Connection, bodies: Mapping[str, str], now: datetime
+) -> None:
+    """Insert a blob per ``sha256: content`` pair, skipping ones that exist."""
+    session.execute(
+        insert(RevisionBlob).on_conflict_do_nothing(
+            index_elements=[RevisionBlob.sha256]
+        ),
+        [
+            {
+                "sha256": sha256,
+                "content": content,
+                "size_bytes": len(content.encode()),
+                "refcount": 0,
+                "created_at": now,
+            }
+            for sha256, content in bodies.items()
+        ],
+    )
+
+
+def _store_blob(
+    session: Session | Connection, content: str, sha256: str, now: datetime
+) -> None:
+    """Insert the blob for ``content`` unless an identical one already exists."""
+    _store_blobs(session, {sha256: content}, now)
+
+
+def _new_revision(
+    session: Session,
+    *,
+    content_markdown: str,
+    parent: DocumentRevision | None,
+    storage: RevisionStorage,
+    created_at: datetime,
+    pending_blobs: dict[str, str] | None = None,
+    **columns: Any,
+) -> DocumentRevision:
+    """Build a revision whose body is a shared blob or a delta on ``parent``.
+
+    Bulk writers pass ``pending_blobs`` to collect blob bodies and insert
+    them with one :func:`_store_blobs` call before flushing the revisions.
+    """
+    statistics = _revision_statistics(content_markdown)
+    revision = DocumentRevision(
+        parent_revision_id=parent.id if parent is not None else None,
+        created_at=created_at,
+        **statistics,
+        **columns,
+    )
+    sha256 = str(statistics["content_sha256"])
+    # The response and the next save's delta both read this body right away.
+    revision_content_cache.put(revision.id, content_markdown)
+    if (
+        storage.mode == "delta"
+        and parent is not None
+        and not storage.is_keyframe(revision.revision_number)
+        and session.get(RevisionBlob, sha256) is None
+    ):
+        delta = encode_delta(_revision_content(parent), content_markdown)
+        if len(delta) < len(content_markdown):
+            revision.content_delta = delta
+            return revision
+    if pending_blobs is None:
+        _store_blob(session, content_markdown, sha256, created_at)
+    else:
+        pending_blobs[sha256] = content_markdown
+    revision.blob_sha256 = sha256
+    return revision
@@ -10,7 +10,7 @@ from src.contexts.studio.infrastructure.repository.common import (
     DocumentDto,
     DocumentRevision,
     NotFound,
-    Project,
+    PageDto,
     ProjectSnapshot,
     RevisionDto,
     Session,
@@ -19,11 +19,16 @@ from src.contexts.studio.infrastructure.repository.common import (
     _document_dto,
     _revision_dto,
     _snapshot_dto,
-    cast,
     datetime,
-    new_id,
     select,
 )
+from src.contexts.studio.infrastructure.repository.ownership import (
+    _snapshot_project_statement,
+)
+from src.contexts.studio.infrastructure.repository.pagination import _keyset_page
+from src.contexts.studio.infrastructure.repository.snapshot_builder import (
+    _materialize_snapshot,
+)
 
 __all__ = ["SnapshotRepositoryMixin"]
 
@@ -33,13 +38,13 @@ class SnapshotRepositoryMixin:
 
     if TYPE_CHECKING:
 
-        def _project(
+        def _verify_project(
             self,
             session: Session,
             project_id: str,
             owner_id: str | None,
             guest_session_id: str | None,
-        ) -> Project: ...
+        ) -> None: ...
 
     def _verify_snapshot_access(
         self,
@@ -49,12 +54,10 @@ class SnapshotRepositoryMixin:
         guest_session_id: str | None,
     ) -> None:
         """Raise NotFound if the snapshot belongs to an inaccessible project."""
-        snapshot_project_id = session.scalar(
-            select(ProjectSnapshot.project_id).where(ProjectSnapshot.id == snapshot_id)
-        )
+        snapshot_project_id = session.scalar(_snapshot_project_statement(snapshot_id))
         if snapshot_project_id is None:
             raise NotFound("Snapshot not found.")
-        self._project(session, snapshot_project_id, owner_id, guest_session_id)
+        self._verify_project(session, snapshot_project_id, owner_id, guest_session_id)
 
     def create_snapshot(
         self,
@@ -66,34 +69,10 @@ class SnapshotRepositoryMixin:
         now: datetime,
     ) -> SnapshotDto:
         with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            snapshot = ProjectSnapshot(
-                id=new_id(),
-                project_id=project.id,
-                reason=reason,
-                created_at=now,
+            self._verify_project(session, project_id, owner_id, guest_session_id)
+            snapshot = _materialize_snapshot(
+                session, project_id, reason=reason, now=now
             )
-            session.add(snapshot)
-            session.flush()
-            documents = session.scalars(
-                select(Document)
-                .where(
-                    Document.project_id == project.id,
-                    Document.current_revision_id.is_not(None),
-                )
-                .order_by(Document.position, Document.created_at)
-            ).all()
-            for document in documents:
-                session.add(
-                    SnapshotDocument(
-                        id=new_id(),
-                        snapshot_id=snapshot.id,
-                        document_id=document.id,
-                        revision_id=cast(str, document.current_revision_id),
-                        position=document.position,
-                    )
-                )
-            session.flush()
             return _snapshot_dto(session, snapshot)
 
     def list_snapshots(
@@ -102,35 +81,24 @@ class SnapshotRepositoryMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[SnapshotDto]:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            snapshots = session.scalars(
-                select(ProjectSnapshot)
-                .where(ProjectSnapshot.project_id == project.id)
-                .order_by(ProjectSnapshot.created_at.desc())
-                .options(selectinload(ProjectSnapshot.snapshot_documents))
-            ).all()
-            return [_snapshot_dto(session, snapshot) for snapshot in snapshots]
-
-    def get_latest_export_snapshot(
-        self,
-        project_id: str,
-        *,
-        owner_id: str | None,
-        guest_session_id: str | None,
-    ) -> SnapshotDto | None:
-        with self.database.session() as session:
-            project = self._project(session, project_id, owner_id, guest_session_id)
-            snapshot = session.scalar(
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[SnapshotDto]:
+        with self.database.read_session() as session:
+            self._verify_project(session, project_id, owner_id, guest_session_id)
+            snapshots, next_cursor = _keyset_page(
+                session,
                 select(ProjectSnapshot)
-                .where(
-                    ProjectSnapshot.project_id == project.id,
-                    ProjectSnapshot.reason == "export",
-                )
-                .order_by(ProjectSnapshot.created_at.desc())
+                .where(ProjectSnapshot.project_id == project_id)
+                .options(selectinload(ProjectSnapshot.snapshot_documents)),
+                (ProjectSnapshot.created_at, ProjectSnapshot.id),
+                limit=limit,
+                cursor=cursor,
+            )
+            return PageDto(
+                items=[_snapshot_dto(session, snapshot) for snapshot in snapshots],
+                next_cursor=next_cursor,
             )
-            return _snapshot_dto(session, snapshot) if snapshot is not None else None
 
     def snapshot_content(
         self,
@@ -139,7 +107,7 @@ class SnapshotRepositoryMixin:
         owner_id: str | None,
         guest_session_id: str | None,
     ) -> list[tuple[DocumentDto, RevisionDto]]:
-        with self.database.session() as session:
+        with self.database.read_session() as session:
             self._verify_snapshot_access(
                 session, snapshot_id, owner_id, guest_session_id
             )
@@ -152,23 +120,6 @@ class SnapshotRepositoryMixin:
                 )
                 .where(SnapshotDocument.snapshot_id == snapshot_id)
                 .order_by(SnapshotDocument.position, Document.created_at)
+                .options(selectinload(DocumentRevision.blob))
             ).all()
             return [(_document_dto(row[0]), _revision_dto(row[1])) for row in rows]
-
-    def snapshot_revision_map(
-        self,
-        snapshot_id: str,
-        *,
-        owner_id: str | None,
-        guest_session_id: str | None,
-    ) -> dict[str, str]:
-        with self.database.session() as session:
-            self._verify_snapshot_access(
-                session, snapshot_id, owner_id, guest_session_id
-            )
-            items = session.scalars(
-                select(SnapshotDocument).where(
-                    SnapshotDocument.snapshot_id == snapshot_id
-                )
-            ).all()
-            return {item.document_id: item.revision_id for item in items}
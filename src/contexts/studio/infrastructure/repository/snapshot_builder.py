@@ -0,0 +1,113 @@
+"""Set-based materialization of project snapshots.
+
+Snapshots, reviews and exports all freeze a project the same way: one
+``project_snapshots`` row plus one ``snapshot_documents`` row per document
+pointing at its current revision. The member rows are copied with a single
+``INSERT ... SELECT`` so the cost no longer includes an ORM object and a
+Python-generated id per document. A review or export of a project whose
+content fingerprint still matches its latest snapshot reuses that snapshot
+instead of writing a duplicate; snapshots the author asks for always get
+their own row.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select, String, insert, literal, literal_column, select
+
+from src.contexts.studio.infrastructure.models import SnapshotDocument
+from src.contexts.studio.infrastructure.repository.common import (
+    Document,
+    Project,
+    ProjectSnapshot,
+    Session,
+    datetime,
+    new_id,
+)
+
+__all__ = [
+    "REUSABLE_SNAPSHOT_REASONS",
+    "_latest_snapshot_statement",
+    "_materialize_snapshot",
+]
+
+# Snapshots taken on the author's behalf. Any other reason is an explicit
+# request and must leave a row of its own in the history.
+REUSABLE_SNAPSHOT_REASONS = frozenset({"review", "export"})
+
+
+# A random UUID4 built in SQL, so ids keep the shape of :func:`new_id` ones
+# and nothing reading ``snapshot_documents`` can tell which path wrote a row.
+_SQL_UUID4 = literal_column(
+    "lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+    "substr(lower(hex(randomblob(2))), 2) || '-' || "
+    "substr('89ab', 1 + (abs(random()) % 4), 1) || "
+    "substr(lower(hex(randomblob(2))), 2) || '-' || lower(hex(randomblob(6)))",
+    String,
+)
+
+
+def _latest_snapshot_statement(project_id: str) -> Select[ProjectSnapshot]:
+    return (
+        select(ProjectSnapshot)
+        .where(ProjectSnapshot.project_id == project_id)
+        .order_by(ProjectSnapshot.created_at.desc(), ProjectSnapshot.id.desc())
+        .limit(1)
+    )
+
+
+def _materialize_snapshot(
+    session: Session,
+    project_id: str,
+    *,
+    reason: str,
+    now: datetime,
+) -> ProjectSnapshot:
+    """Freeze every document's current revision, or reuse the latest snapshot.
+
+    Only the project's most recent snapshot is a candidate: an older one with
+    the same fingerprint froze the same text, but handing it out would make
+    a review or export look older than the history in between.
+    """
+    project = session.get_one(Project, project_id)
+    if reason in REUSABLE_SNAPSHOT_REASONS:
+        latest = session.scalar(_latest_snapshot_statement(project_id))
+        if (
+            latest is not None
+            and latest.content_fingerprint == project.content_fingerprint
+        ):
+            return latest
+    snapshot = ProjectSnapshot(
+        id=new_id(),
+        project_id=project_id,
+        reason=reason,
+        content_fingerprint=project.content_fingerprint,
+        created_at=now,
+    )
+    session.add(snapshot)
+    session.flush()
+    members = select(
+        _SQL_UUID4,
+        literal(snapshot.id),
+        Document.id,
+        Document.current_revision_id,
+        Document.position,
+    ).where(
+        Document.project_id == project_id,
+        Document.current_revision_id.is_not(None),
+    )
+    session.execute(
+        insert(SnapshotDocument).from_select(
+            [
+                SnapshotDocument.id,
+                SnapshotDocument.snapshot_id,
+                SnapshotDocument.document_id,
+                SnapshotDocument.revision_id,
+                SnapshotDocument.position,
+            ],
+            members,
+        )
+    )
+    # The ORM never saw these rows; expiring the collection makes the next
+    # access load them.
+    session.expire(snapshot, ["snapshot_documents"])
+    return snapshot
@@ -0,0 +1,206 @@
+"""Re-encode stored revision bodies to match a ``RevisionStorage`` policy.
+
+Used by ``novel-engine compact-revisions`` to move an existing library to
+delta storage (or back to full bodies). Each document is rewritten in its
+own short transaction, walking revisions in ``revision_number`` order so a
+parent is always rebuilt before the revisions that diff against it. Full
+bodies are written to the shared ``revision_blobs`` table; the refcount
+triggers drop a blob once no revision points at it any more.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Connection, DateTime, text
+
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    RevisionStorage,
+    _store_blob,
+)
+from src.contexts.studio.infrastructure.revision_compression import blob_text
+from src.contexts.studio.infrastructure.revision_delta import apply_delta, encode_delta
+
+__all__ = [
+    "BlobReport",
+    "CompactionReport",
+    "blob_report",
+    "compact_revisions",
+    "recode_document",
+]
+
+_DOCUMENT_IDS = text(
+    "SELECT DISTINCT document_id FROM document_revisions ORDER BY document_id"
+)
+_DOCUMENT_REVISIONS = text(
+    "SELECT r.id, r.parent_revision_id, r.revision_number, r.content_sha256, "
+    "r.content_markdown, r.content_delta, r.blob_sha256, r.created_at, "
+    "b.content_zlib, COALESCE(b.content, r.content_markdown) AS body "
+    "FROM document_revisions r "
+    "LEFT JOIN revision_blobs b ON b.sha256 = r.blob_sha256 "
+    "WHERE r.document_id = :document_id ORDER BY r.revision_number"
+).columns(created_at=DateTime(timezone=True))
+_UPDATE_BODY = text(
+    "UPDATE document_revisions SET content_markdown = '', "
+    "content_delta = :content_delta, blob_sha256 = :blob_sha256 WHERE id = :id"
+)
+_BLOB_TOTALS = text(
+    "SELECT "
+    "(SELECT COUNT(*) FROM document_revisions WHERE blob_sha256 IS NOT NULL), "
+    "(SELECT COALESCE(SUM(b.size_bytes), 0) FROM document_revisions r "
+    "JOIN revision_blobs b ON b.sha256 = r.blob_sha256), "
+    "COUNT(*), COALESCE(SUM(COALESCE(length(content_zlib), size_bytes)), 0) "
+    "FROM revision_blobs"
+)
+
+
+@dataclass(slots=True)
+class CompactionReport:
+    documents: int = 0
+    revisions: int = 0
+    delta_revisions: int = 0
+    rewritten: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    def add(self, other: CompactionReport) -> None:
+        self.documents += other.documents
+        self.revisions += other.revisions
+        self.delta_revisions += other.delta_revisions
+        self.rewritten += other.rewritten
+        self.bytes_before += other.bytes_before
+        self.bytes_after += other.bytes_after
+
+
+@dataclass(frozen=True, slots=True)
+class BlobReport:
+    """How much the content-addressed blob table saves over one body per row."""
+
+    revisions: int
+    blobs: int
+    logical_bytes: int
+    stored_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.logical_bytes - self.stored_bytes
+
+
+def _stored_bytes(
+    content_markdown: str,
+    content_delta: str | None,
+    blobs: dict[str, int],
+    blob_sha256: str | None,
+    body: str,
+) -> int:
+    # A blob is counted once per document however many revisions share it.
+    if blob_sha256 is not None and blob_sha256 not in blobs:
+        blobs[blob_sha256] = len(body.encode())
+        return len(content_markdown.encode()) + blobs[blob_sha256]
+    return len(content_markdown.encode()) + len((content_delta or "").encode())
+
+
+def _document_history(
+    connection: Connection, document_id: str
+) -> Iterator[tuple[Any, str]]:
+    """Yield each revision row of a document with its full body, parents first."""
+    contents: dict[str, str] = {}
+    for row in connection.execute(_DOCUMENT_REVISIONS, {"document_id": document_id}):
+        if row.content_delta is None:
+            content = blob_text(row.body, row.content_zlib)
+        elif row.parent_revision_id not in contents:
+            raise RuntimeError(f"Revision {row.id} is a delta without its parent.")
+        else:
+            content = apply_delta(contents[row.parent_revision_id], row.content_delta)
+        contents[row.id] = content
+        yield row, content
+
+
+def recode_document(
+    connection: Connection,
+    document_id: str,
+    storage: RevisionStorage,
+) -> CompactionReport:
+    """Rewrite one document's revision bodies in the encoding ``storage`` asks for.
+
+    ``bytes_before`` and ``bytes_after`` count inline text, deltas and each
+    distinct blob the document references once.
+    """
+    report = CompactionReport(documents=1)
+    contents: dict[str, str] = {}
+    blobs_before: dict[str, int] = {}
+    blobs_after: dict[str, int] = {}
+    updates: list[dict[str, str | None]] = []
+    now = datetime.now(UTC)
+    for row, content in _document_history(connection, document_id):
+        parent_content = contents.get(row.parent_revision_id or "")
+        contents[row.id] = content
+
+        content_delta: str | None = None
+        blob_sha256: str | None = row.content_sha256
+        if (
+            storage.mode == "delta"
+            and parent_content is not None
+            and not storage.is_keyframe(row.revision_number)
+        ):
+            delta = encode_delta(parent_content, content)
+            if len(delta) < len(content):
+                content_delta, blob_sha256 = delta, None
+
+        report.revisions += 1
+        report.delta_revisions += content_delta is not None
+        report.bytes_before += _stored_bytes(
+            row.content_markdown,
+            row.content_delta,
+            blobs_before,
+            row.blob_sha256,
+            content,
+        )
+        report.bytes_after += _stored_bytes(
+            "", content_delta, blobs_after, blob_sha256, content
+        )
+        if (content_delta, blob_sha256, "") == (
+            row.content_delta,
+            row.blob_sha256,
+            row.content_markdown,
+        ):
+            continue
+        if blob_sha256 is not None:
+            _store_blob(connection, content, blob_sha256, now)
+        updates.append(
+            {"id": row.id, "content_delta": content_delta, "blob_sha256": blob_sha256}
+        )
+    if updates:
+        connection.execute(_UPDATE_BODY, updates)
+    report.rewritten = len(updates)
+    return report
+
+
+def compact_revisions(
+    database: StudioDatabase,
+    storage: RevisionStorage,
+) -> CompactionReport:
+    """Re-encode every document's history, one writer transaction per document."""
+    with database.engine.connect() as connection:
+        document_ids = list(connection.execute(_DOCUMENT_IDS).scalars())
+    report = CompactionReport()
+    for document_id in document_ids:
+        with database.engine.begin() as connection:
+            report.add(recode_document(connection, document_id, storage))
+    return report
+
+
+def blob_report(database: StudioDatabase) -> BlobReport:
+    """Compare the bytes blob-backed revisions reference with what is stored."""
+    with database.read_engine.connect() as connection:
+        revisions, logical, blobs, stored = connection.execute(_BLOB_TOTALS).one()
+    return BlobReport(
+        revisions=int(revisions),
+        blobs=int(blobs),
+        logical_bytes=int(logical),
+        stored_bytes=int(stored),
+    )
@@ -0,0 +1,154 @@
+"""zlib compression of cold revision blobs.
+
+A blob is cold once it is older than the cutoff and neither a document's
+current revision nor a revision in its project's latest snapshot points at
+it; such bodies are rarely read again. Compression moves the text into
+``content_zlib`` and empties ``content``; bodies too short to benefit are
+left alone. Readers go through :func:`blob_text`, so the change is
+invisible above the repository, and a later restore of a cold body simply
+reuses the compressed blob.
+"""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Connection, Select, and_, func, select, text
+
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.models import (
+    Document,
+    DocumentRevision,
+    ProjectSnapshot,
+    RevisionBlob,
+    SnapshotDocument,
+)
+
+__all__ = [
+    "MIN_COMPRESSED_BYTES",
+    "CompressionReport",
+    "blob_text",
+    "compress_cold_revisions",
+    "vacuum_database",
+]
+
+# Below this zlib's header and dictionary overhead rarely pay off.
+MIN_COMPRESSED_BYTES = 256
+
+_COMPRESS_BLOB = text(
+    "UPDATE revision_blobs SET content = '', content_zlib = :content_zlib "
+    "WHERE sha256 = :sha256 AND content_zlib IS NULL"
+)
+
+
+@dataclass(slots=True)
+class CompressionReport:
+    candidates: int = 0
+    compressed: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+def blob_text(content: str, content_zlib: bytes | None) -> str:
+    """Return a blob's body whether or not it has been compressed."""
+    if content_zlib is None:
+        return content
+    return zlib.decompress(content_zlib).decode()
+
+
+def _cold_blob_statement(cutoff: datetime, after: str, limit: int) -> Select[str, str]:
+    # NULLs are filtered out of both sets: ``NOT IN`` a set holding NULL
+    # matches nothing, and delta revisions carry no blob.
+    current = (
+        select(DocumentRevision.blob_sha256)
+        .join(Document, Document.current_revision_id == DocumentRevision.id)
+        .where(DocumentRevision.blob_sha256.is_not(None))
+    )
+    latest = (
+        select(
+            ProjectSnapshot.project_id,
+            func.max(ProjectSnapshot.created_at).label("created_at"),
+        )
+        .group_by(ProjectSnapshot.project_id)
+        .subquery()
+    )
+    snapshotted = (
+        select(DocumentRevision.blob_sha256)
+        .join(SnapshotDocument, SnapshotDocument.revision_id == DocumentRevision.id)
+        .join(ProjectSnapshot, ProjectSnapshot.id == SnapshotDocument.snapshot_id)
+        .join(
+            latest,
+            and_(
+                latest.c.project_id == ProjectSnapshot.project_id,
+                latest.c.created_at == ProjectSnapshot.created_at,
+            ),
+        )
+        .where(DocumentRevision.blob_sha256.is_not(None))
+    )
+    return (
+        select(RevisionBlob.sha256, RevisionBlob.content)
+        .where(
+            RevisionBlob.content_zlib.is_(None),
+            RevisionBlob.created_at < cutoff,
+            RevisionBlob.size_bytes >= MIN_COMPRESSED_BYTES,
+            RevisionBlob.sha256 > after,
+            RevisionBlob.sha256.not_in(current),
+            RevisionBlob.sha256.not_in(snapshotted),
+        )
+        .order_by(RevisionBlob.sha256)
+        .limit(limit)
+    )
+
+
+def _compress_batch(
+    connection: Connection,
+    rows: list[Any],
+    level: int,
+    report: CompressionReport,
+) -> None:
+    updates = []
+    for sha256, content in rows:
+        raw = content.encode()
+        compressed = zlib.compress(raw, level)
+        report.candidates += 1
+        report.bytes_before += len(raw)
+        if len(compressed) >= len(raw):
+            report.bytes_after += len(raw)
+            continue
+        report.compressed += 1
+        report.bytes_after += len(compressed)
+        updates.append({"sha256": sha256, "content_zlib": compressed})
+    if updates:
+        connection.execute(_COMPRESS_BLOB, updates)
+
+
+def compress_cold_revisions(
+    database: StudioDatabase,
+    *,
+    older_than: timedelta,
+    level: int = 9,
+    batch_size: int = 200,
+    now: datetime | None = None,
+) -> CompressionReport:
+    """Compress every cold blob, one short writer transaction per batch."""
+    cutoff = (now or datetime.now(UTC)) - older_than
+    report = CompressionReport()
+    after = ""
+    while True:
+        with database.engine.begin() as connection:
+            rows = list(
+                connection.execute(_cold_blob_statement(cutoff, after, batch_size))
+            )
+            if not rows:
+                return report
+            _compress_batch(connection, rows, level, report)
+        after = rows[-1].sha256
+
+
+def vacuum_database(database: StudioDatabase) -> None:
+    """Rebuild the database file so pages freed by compression are returned."""
+    with database.engine.connect() as connection:
+        connection.exec_driver_sql("VACUUM")
@@ -0,0 +1,49 @@
+"""Line-based deltas between consecutive revision bodies.
+
+A delta is a compact JSON list applied to the base text's lines in order:
+a positive integer copies that many base lines, a negative integer skips
+that many, and a string is inserted verbatim. Markdown keeps a paragraph on
+one line, so an edit costs roughly the paragraphs it touches.
+"""
+
+from __future__ import annotations
+
+import json
+from difflib import SequenceMatcher
+
+__all__ = ["apply_delta", "encode_delta"]
+
+DeltaOp = int | str
+
+
+def encode_delta(base: str, content: str) -> str:
+    """Return the delta that turns ``base`` into ``content``."""
+    base_lines = base.splitlines(keepends=True)
+    lines = content.splitlines(keepends=True)
+    matcher = SequenceMatcher(None, base_lines, lines, autojunk=False)
+    ops: list[DeltaOp] = []
+    for tag, base_start, base_end, start, end in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(base_end - base_start)
+            continue
+        if base_end > base_start:
+            ops.append(base_start - base_end)
+        if end > start:
+            ops.append("".join(lines[start:end]))
+    return json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+
+
+def apply_delta(base: str, delta: str) -> str:
+    """Rebuild the text ``delta`` was encoded from, given its ``base``."""
+    lines = base.splitlines(keepends=True)
+    position = 0
+    parts: list[str] = []
+    for op in json.loads(delta):
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            parts.extend(lines[position : position + op])
+            position += op
+        else:
+            position -= op
+    return "".join(parts)
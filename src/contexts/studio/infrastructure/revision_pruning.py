@@ -0,0 +1,174 @@
+"""Thin autosave history down to a retention policy.
+
+Every revision from the last ``keep_all`` window is kept; older ones are
+thinned to the newest revision of each hour until ``hourly_until``, and to
+the newest of each day beyond that. A document's current revision and every
+revision a snapshot references are never removed. Surviving revisions are
+relinked to their nearest surviving ancestor, and a delta whose base went
+away is rewritten as a full blob first. ``revision_number`` is left alone,
+so numbers keep identifying the same text after a prune.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Connection, text
+
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    _store_blob,
+)
+from src.contexts.studio.infrastructure.revision_compaction import (
+    _DOCUMENT_IDS,
+    _document_history,
+)
+
+__all__ = ["PruneReport", "RetentionPolicy", "prune_document", "prune_revisions"]
+
+_PROTECTED_REVISIONS = text(
+    "SELECT current_revision_id FROM documents "
+    "WHERE id = :document_id AND current_revision_id IS NOT NULL "
+    "UNION SELECT revision_id FROM snapshot_documents "
+    "WHERE document_id = :document_id"
+)
+_RELINK = text(
+    "UPDATE document_revisions SET parent_revision_id = :parent_revision_id, "
+    "content_delta = :content_delta, blob_sha256 = :blob_sha256 WHERE id = :id"
+)
+_DELETE = text("DELETE FROM document_revisions WHERE id = :id")
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    keep_all: timedelta = timedelta(days=1)
+    hourly_until: timedelta = timedelta(days=7)
+
+    def bucket(self, created_at: datetime, now: datetime) -> str | None:
+        """Return the bucket whose newest revision survives, or ``None`` to keep."""
+        age = now - created_at
+        if age < self.keep_all:
+            return None
+        if age < self.hourly_until:
+            return created_at.strftime("%Y-%m-%dT%H")
+        return created_at.strftime("%Y-%m-%d")
+
+
+@dataclass(slots=True)
+class PruneReport:
+    dry_run: bool = False
+    documents: int = 0
+    revisions: int = 0
+    pruned: int = 0
+    relinked: int = 0
+    materialized: int = 0
+    # Filled on dry runs only, keyed by document id.
+    pruned_revision_numbers: dict[str, list[int]] = field(default_factory=dict)
+
+    def add(self, other: PruneReport) -> None:
+        self.documents += other.documents
+        self.revisions += other.revisions
+        self.pruned += other.pruned
+        self.relinked += other.relinked
+        self.materialized += other.materialized
+        self.pruned_revision_numbers.update(other.pruned_revision_numbers)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+def _kept_revisions(
+    connection: Connection,
+    document_id: str,
+    history: list[tuple[Any, str]],
+    policy: RetentionPolicy,
+    now: datetime,
+) -> set[str]:
+    keep = set(
+        connection.execute(_PROTECTED_REVISIONS, {"document_id": document_id})
+        .scalars()
+        .all()
+    )
+    newest: dict[str, str] = {}
+    for row, _content in history:
+        bucket = policy.bucket(_as_utc(row.created_at), now)
+        if bucket is None:
+            keep.add(row.id)
+        else:
+            newest[bucket] = row.id
+    return keep | set(newest.values())
+
+
+def prune_document(
+    connection: Connection,
+    document_id: str,
+    policy: RetentionPolicy,
+    now: datetime,
+    *,
+    dry_run: bool = False,
+) -> PruneReport:
+    """Apply ``policy`` to one document's history inside the caller's transaction."""
+    history = list(_document_history(connection, document_id))
+    keep = _kept_revisions(connection, document_id, history, policy, now)
+    report = PruneReport(dry_run=dry_run, documents=1, revisions=len(history))
+
+    # Map every revision to its nearest surviving ancestor-or-self.
+    survivor: dict[str, str | None] = {}
+    updates: list[dict[str, str | None]] = []
+    pruned: list[tuple[str, int]] = []
+    for row, content in history:
+        parent = survivor.get(row.parent_revision_id or "")
+        if row.id not in keep:
+            survivor[row.id] = parent
+            pruned.append((row.id, row.revision_number))
+            continue
+        survivor[row.id] = row.id
+        if parent == row.parent_revision_id:
+            continue
+        update = {
+            "id": row.id,
+            "parent_revision_id": parent,
+            "content_delta": row.content_delta,
+            "blob_sha256": row.blob_sha256,
+        }
+        if row.content_delta is not None:
+            update.update(content_delta=None, blob_sha256=row.content_sha256)
+            report.materialized += 1
+            if not dry_run:
+                _store_blob(connection, content, row.content_sha256, now)
+        updates.append(update)
+
+    report.pruned = len(pruned)
+    report.relinked = len(updates)
+    if dry_run:
+        if pruned:
+            report.pruned_revision_numbers[document_id] = [n for _, n in pruned]
+        return report
+    if updates:
+        connection.execute(_RELINK, updates)
+    if pruned:
+        connection.execute(_DELETE, [{"id": revision_id} for revision_id, _ in pruned])
+    return report
+
+
+def prune_revisions(
+    database: StudioDatabase,
+    policy: RetentionPolicy,
+    *,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> PruneReport:
+    """Prune every document's history, one writer transaction per document."""
+    now = now or datetime.now(UTC)
+    with database.engine.connect() as connection:
+        document_ids = list(connection.execute(_DOCUMENT_IDS).scalars())
+    report = PruneReport(dry_run=dry_run)
+    for document_id in document_ids:
+        with database.engine.begin() as connection:
+            report.add(
+                prune_document(connection, document_id, policy, now, dry_run=dry_run)
+            )
+    return report
@@ -0,0 +1,295 @@
+"""Maintenance of the contentless ``document_search`` FTS5 index.
+
+``document_search`` keeps only the inverted index: a document's title and
+current text are tokenized on the way in but never stored, so the manuscript
+lives once, in the revision tables. FTS5 can only drop a contentless row when
+handed back the exact values it indexed, so ``document_search_entries``
+records which title and revision each document was indexed with, and a
+removal re-reads that revision's text (normally still in the revision
+content cache from the save that replaced it). Every writer goes through
+:func:`index_document`, :func:`index_new_documents` and the ``unindex_``
+helpers, which also tell the title suggester when a project's titles change.
+
+Both columns see :func:`plain_text`, not raw Markdown, so fence markers,
+link targets and emphasis characters never become search terms. Excerpts are
+cut from the same plain text in Python, since FTS5's ``snippet()`` needs
+stored content.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Connection, bindparam, text
+from sqlalchemy.orm import Session
+
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    _revision_text,
+)
+from src.contexts.studio.infrastructure.title_suggest import invalidate_titles
+
+__all__ = [
+    "excerpt",
+    "index_document",
+    "index_new_documents",
+    "plain_text",
+    "rebuild",
+    "unindex_document",
+    "unindex_project",
+]
+
+Executor = Session | Connection
+
+_ENTRY = text(
+    "SELECT id, project_id, title, revision_id FROM document_search_entries "
+    "WHERE document_id = :document_id"
+)
+_PROJECT_ENTRIES = text(
+    "SELECT id, project_id, title, revision_id FROM document_search_entries "
+    "WHERE project_id = :project_id"
+)
+_ADD_ENTRY = text(
+    "INSERT INTO document_search_entries(document_id, project_id, title, "
+    "revision_id) VALUES (:document_id, :project_id, :title, :revision_id)"
+)
+_ENTRY_IDS = text(
+    "SELECT id, document_id FROM document_search_entries "
+    "WHERE document_id IN :document_ids"
+).bindparams(bindparam("document_ids", expanding=True))
+# Stays well under SQLite's bound-parameter limit.
+_ID_BATCH = 500
+_MOVE_ENTRY = text(
+    "UPDATE document_search_entries SET title = :title, "
+    "revision_id = :revision_id WHERE id = :id"
+)
+_DROP_ENTRY = text("DELETE FROM document_search_entries WHERE id = :id")
+_INDEX = text(
+    "INSERT INTO document_search(rowid, title, content) "
+    "VALUES (:rowid, :title, :content)"
+)
+_UNINDEX = text(
+    "INSERT INTO document_search(document_search, rowid, title, content) "
+    "VALUES ('delete', :rowid, :title, :content)"
+)
+_DELETE_ALL = text("INSERT INTO document_search(document_search) VALUES ('delete-all')")
+_DROP_ALL_ENTRIES = text("DELETE FROM document_search_entries")
+_CURRENT_DOCUMENTS = text(
+    "SELECT id AS document_id, project_id, title, current_revision_id AS revision_id "
+    "FROM documents WHERE current_revision_id IS NOT NULL ORDER BY id"
+)
+
+_WORD_RE = re.compile(r"\w+")
+_MATCH_TERM_RE = re.compile(r'"((?:[^"]|"")*)"')
+
+_FENCE_RE = re.compile(r"^[ \t]*(?:`{3,}|~{3,}).*$", re.MULTILINE)
+_LINK_DEFINITION_RE = re.compile(r"^[ \t]{0,3}\[[^\]]+\]:.*$", re.MULTILINE)
+_RULE_RE = re.compile(r"^[ \t]*(?:[-*_][ \t]*){3,}$", re.MULTILINE)
+_BLOCK_PREFIX_RE = re.compile(
+    r"^[ \t]*(?:>[ \t]?|#{1,6}[ \t]+|[-*+][ \t]+|\d{1,9}[.)][ \t]+)+",
+    re.MULTILINE,
+)
+_CLOSING_HASHES_RE = re.compile(r"[ \t]+#+[ \t]*$", re.MULTILINE)
+_AUTOLINK_RE = re.compile(r"<((?:https?|mailto):[^>\s]+)>")
+_HTML_RE = re.compile(r"<!--.*?-->|</?[A-Za-z][^>]*>", re.DOTALL)
+_LINK_RE = re.compile(r"!?\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])")
+_EMPHASIS_RE = re.compile(r"(?<!\\)(?:\*+|~~|`+|(?<!\w)_+|_+(?!\w))")
+_ESCAPE_RE = re.compile(r"\\([!-/:-@\[-`{-~])")
+
+
+def plain_text(markdown: str) -> str:
+    """Reduce Markdown to the words a reader sees.
+
+    Link and image text is kept while their targets are dropped; code keeps
+    its contents but loses its fences and backticks. The result only has to be
+    stable, since removals re-derive it from the same revision.
+    """
+    stripped = _FENCE_RE.sub("", markdown)
+    stripped = _LINK_DEFINITION_RE.sub("", stripped)
+    stripped = _RULE_RE.sub("", stripped)
+    stripped = _BLOCK_PREFIX_RE.sub("", stripped)
+    stripped = _CLOSING_HASHES_RE.sub("", stripped)
+    stripped = _AUTOLINK_RE.sub(r"\1", stripped)
+    stripped = _HTML_RE.sub(" ", stripped)
+    stripped = _LINK_RE.sub(r"\1", stripped)
+    stripped = _EMPHASIS_RE.sub("", stripped)
+    return _ESCAPE_RE.sub(r"\1", stripped)
+
+
+def _indexed_text(executor: Executor, revision_id: str) -> str | None:
+    content = _revision_text(executor, revision_id)
+    return None if content is None else plain_text(content)
+
+
+def _unindex_entries(executor: Executor, entries: Sequence[Any]) -> None:
+    removals = []
+    for entry in entries:
+        content = _indexed_text(executor, entry.revision_id)
+        # Without the indexed text the terms cannot be removed; they stay
+        # behind under a rowid that is never reused until the next rebuild.
+        if content is not None:
+            removals.append(
+                {"rowid": entry.id, "title": entry.title, "content": content}
+            )
+    if removals:
+        executor.execute(_UNINDEX, removals)
+    if entries:
+        executor.execute(_DROP_ENTRY, [{"id": entry.id} for entry in entries])
+    for project_id in {entry.project_id for entry in entries}:
+        invalidate_titles(executor, project_id)
+
+
+def unindex_document(executor: Executor, document_id: str) -> None:
+    entries = executor.execute(_ENTRY, {"document_id": document_id}).all()
+    _unindex_entries(executor, entries)
+
+
+def unindex_project(executor: Executor, project_id: str) -> None:
+    entries = executor.execute(_PROJECT_ENTRIES, {"project_id": project_id}).all()
+    _unindex_entries(executor, entries)
+
+
+def index_document(
+    executor: Executor,
+    *,
+    document_id: str,
+    project_id: str,
+    title: str,
+    revision_id: str,
+    content: str,
+) -> None:
+    """Point the index at ``revision_id``, replacing whatever it held before."""
+    entry = executor.execute(_ENTRY, {"document_id": document_id}).first()
+    if entry is not None:
+        if (entry.title, entry.revision_id) == (title, revision_id):
+            return
+        if entry.title != title:
+            invalidate_titles(executor, project_id)
+        previous = _indexed_text(executor, entry.revision_id)
+        if previous is not None:
+            executor.execute(
+                _UNINDEX,
+                {"rowid": entry.id, "title": entry.title, "content": previous},
+            )
+            executor.execute(
+                _MOVE_ENTRY,
+                {"id": entry.id, "title": title, "revision_id": revision_id},
+            )
+            executor.execute(
+                _INDEX,
+                {"rowid": entry.id, "title": title, "content": plain_text(content)},
+            )
+            return
+        _unindex_entries(executor, [entry])
+    index_new_documents(
+        executor,
+        [
+            {
+                "document_id": document_id,
+                "project_id": project_id,
+                "title": title,
+                "revision_id": revision_id,
+                "content": content,
+            }
+        ],
+    )
+
+
+def index_new_documents(
+    executor: Executor,
+    documents: Sequence[Mapping[str, str]],
+) -> None:
+    """Index documents that have no entry yet, in a fixed number of statements.
+
+    Each mapping carries ``document_id``, ``project_id``, ``title``,
+    ``revision_id`` and the revision's Markdown as ``content``.
+    """
+    if not documents:
+        return
+    executor.execute(
+        _ADD_ENTRY,
+        [
+            {
+                "document_id": document["document_id"],
+                "project_id": document["project_id"],
+                "title": document["title"],
+                "revision_id": document["revision_id"],
+            }
+            for document in documents
+        ],
+    )
+    rowids: dict[str, int] = {}
+    for offset in range(0, len(documents), _ID_BATCH):
+        batch = [item["document_id"] for item in documents[offset : offset + _ID_BATCH]]
+        rowids.update(
+            {
+                document_id: rowid
+                for rowid, document_id in executor.execute(
+                    _ENTRY_IDS, {"document_ids": batch}
+                )
+            }
+        )
+    executor.execute(
+        _INDEX,
+        [
+            {
+                "rowid": rowids[document["document_id"]],
+                "title": document["title"],
+                "content": plain_text(document["content"]),
+            }
+            for document in documents
+        ],
+    )
+    for project_id in {document["project_id"] for document in documents}:
+        invalidate_titles(executor, project_id)
+
+
+def excerpt(
+    content: str,
+    match_query: str,
+    *,
+    tokens: int = 16,
+    ellipsis: str = " … ",
+) -> str:
+    """Cut about ``tokens`` words of ``content`` around the first query term.
+
+    A whole-word hit wins; otherwise the first word containing a term, which
+    is how trigram and prefix queries match (a CJK run is a single word).
+    """
+    terms = {
+        term.replace('""', '"').casefold()
+        for term in _MATCH_TERM_RE.findall(match_query)
+    }
+    words = list(_WORD_RE.finditer(content))
+    if not words:
+        return ""
+    folded = [word[0].casefold() for word in words]
+    hit = next((index for index, word in enumerate(folded) if word in terms), None)
+    if hit is None:
+        hit = next(
+            (
+                index
+                for index, word in enumerate(folded)
+                if any(term and term in word for term in terms)
+            ),
+            0,
+        )
+    start = max(0, min(hit - tokens // 4, len(words) - tokens))
+    end = min(len(words), start + tokens)
+    fragment = content[words[start].start() : words[end - 1].end()]
+    prefix = ellipsis.lstrip() if start > 0 else ""
+    suffix = ellipsis if end < len(words) else ""
+    return f"{prefix}{fragment}{suffix}"
+
+
+def rebuild(executor: Executor) -> int:
+    """Empty the index and index every document's current revision again."""
+    executor.execute(_DELETE_ALL)
+    executor.execute(_DROP_ALL_ENTRIES)
+    documents = [
+        {**row._asdict(), "content": _revision_text(executor, row.revision_id) or ""}
+        for row in executor.execute(_CURRENT_DOCUMENTS)
+    ]
+    index_new_documents(executor, documents)
+    return len(documents)
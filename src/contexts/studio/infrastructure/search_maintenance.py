@@ -0,0 +1,139 @@
+"""Verify and optimize ``document_search`` in place.
+
+:func:`verify_search` counts how far the entries drifted from ``documents``
+without writing, and :func:`optimize_search` merges the segments FTS5
+accumulates over many small saves back into one. :func:`maintain_search`
+combines both with a rebuild from ``search_reindex`` when drift is found.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import text
+from sqlalchemy.exc import DatabaseError
+
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.search_reindex import (
+    _DOCUMENT_COUNT,
+    SearchReindexReport,
+    _options_stale,
+    reindex_search,
+)
+
+__all__ = [
+    "SearchMaintenanceReport",
+    "SearchVerifyReport",
+    "maintain_search",
+    "optimize_search",
+    "verify_search",
+]
+
+_DRIFT = text(
+    "SELECT "
+    "(SELECT COUNT(*) FROM document_search_entries), "
+    "(SELECT COUNT(*) FROM documents AS d WHERE d.current_revision_id IS NOT NULL "
+    "AND NOT EXISTS (SELECT 1 FROM document_search_entries AS e "
+    "WHERE e.document_id = d.id)), "
+    "(SELECT COUNT(*) FROM document_search_entries AS e "
+    "JOIN documents AS d ON d.id = e.document_id "
+    "WHERE e.revision_id IS NOT d.current_revision_id OR e.title IS NOT d.title), "
+    "(SELECT COUNT(*) FROM document_search_entries WHERE document_id NOT IN "
+    "(SELECT id FROM documents WHERE current_revision_id IS NOT NULL))"
+)
+_INTEGRITY_CHECK = text(
+    "INSERT INTO document_search(document_search) VALUES ('integrity-check')"
+)
+_OPTIMIZE = text("INSERT INTO document_search(document_search) VALUES ('optimize')")
+
+
+@dataclass(frozen=True, slots=True)
+class SearchVerifyReport:
+    documents: int
+    indexed: int
+    missing: int
+    stale: int
+    orphaned: int
+    options_stale: bool
+    integrity: str
+
+    @property
+    def drifted(self) -> bool:
+        """Whether the index needs a rebuild to match the current revisions."""
+        return bool(self.missing or self.stale or self.orphaned or self.options_stale)
+
+    @property
+    def healthy(self) -> bool:
+        return not self.drifted and self.integrity == "ok"
+
+
+@dataclass(frozen=True, slots=True)
+class SearchMaintenanceReport:
+    before: SearchVerifyReport
+    reindex: SearchReindexReport | None
+    optimize_ms: float
+    after: SearchVerifyReport
+
+
+def verify_search(database: StudioDatabase) -> SearchVerifyReport:
+    """Compare the entries with ``documents`` and run FTS5's integrity check.
+
+    A contentless table cannot compare its terms with the revisions, so the
+    integrity check covers the index structure; drift shows up as entries
+    that are missing, stale or orphaned.
+    """
+    with database.engine.begin() as connection:
+        documents = connection.execute(_DOCUMENT_COUNT).scalar_one()
+        indexed, missing, stale, orphaned = connection.execute(_DRIFT).one()
+        options_stale = _options_stale(connection, database.search_tokenizer)
+        try:
+            connection.execute(_INTEGRITY_CHECK)
+        except DatabaseError as exc:
+            integrity = str(exc.orig)
+        else:
+            integrity = "ok"
+    return SearchVerifyReport(
+        documents=documents,
+        indexed=indexed,
+        missing=missing,
+        stale=stale,
+        orphaned=orphaned,
+        options_stale=options_stale,
+        integrity=integrity,
+    )
+
+
+def optimize_search(database: StudioDatabase) -> float:
+    """Merge the index into a single segment; returns the time taken in ms."""
+    started = perf_counter()
+    with database.engine.begin() as connection:
+        connection.execute(_OPTIMIZE)
+    return round((perf_counter() - started) * 1000, 3)
+
+
+def maintain_search(
+    database: StudioDatabase,
+    *,
+    rebuild: bool = False,
+    chunk_size: int = 200,
+    progress: Callable[[int, int], None] | None = None,
+) -> SearchMaintenanceReport:
+    """Verify, rebuild when asked to or when drifted, optimize, verify again."""
+    before = verify_search(database)
+    reindex = None
+    if rebuild or before.drifted or before.integrity != "ok":
+        reindex = reindex_search(
+            database,
+            database.search_tokenizer,
+            chunk_size=chunk_size,
+            progress=progress,
+        )
+    optimize_ms = optimize_search(database)
+    return SearchMaintenanceReport(
+        before=before,
+        reindex=reindex,
+        optimize_ms=optimize_ms,
+        after=verify_search(database),
+    )
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.contexts.studio.infrastructure.model_base import Base
+
+__all__ = [
+    "SEARCH_PREFIX_LENGTHS",
+    "SEARCH_TOKENIZERS",
+    "DocumentSearchEntry",
+    "SearchTokenizer",
+    "search_table_ddl",
+]
+
+SearchTokenizer = Literal["unicode61", "porter", "trigram"]
+
+# Setting name -> FTS5 ``tokenize`` option. ``trigram`` indexes every
+# three-character run, so CJK text without spaces is searchable by substring.
+SEARCH_TOKENIZERS: dict[str, str] = {
+    "unicode61": "unicode61 remove_diacritics 2",
+    "porter": "porter unicode61 remove_diacritics 2",
+    "trigram": "trigram",
+}
+
+# Extra FTS5 prefix indexes, so ``"ab"*`` queries typed into a search box read
+# one index range instead of scanning every term. Trigram queries already match
+# substrings and cannot use them.
+SEARCH_PREFIX_LENGTHS = "2 3"
+
+
+def search_table_ddl(
+    tokenizer: SearchTokenizer = "unicode61",
+    *,
+    table: str = "document_search",
+) -> str:
+    """Contentless: FTS5 keeps the inverted index only, never the text."""
+    prefix = "" if tokenizer == "trigram" else f", prefix='{SEARCH_PREFIX_LENGTHS}'"
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5(title, content, "
+        f"content='', tokenize='{SEARCH_TOKENIZERS[tokenizer]}'{prefix})"
+    )
+
+
+class DocumentSearchEntry(Base):
+    """What the contentless ``document_search`` index holds for one document.
+
+    ``id`` is the FTS5 rowid. It is never reused, so terms a failed removal
+    left behind cannot attach to another document.
+    """
+
+    __tablename__ = "document_search_entries"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    document_id: Mapped[str] = mapped_column(
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    project_id: Mapped[str] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    title: Mapped[str] = mapped_column(String(240), nullable=False)
+    # The revision whose text was indexed; no foreign key, so pruning and
+    # compaction never have to know about the index.
+    revision_id: Mapped[str] = mapped_column(String(36), nullable=False)
@@ -0,0 +1,268 @@
+"""Rebuild ``document_search`` in chunks while the app serves.
+
+FTS5 fixes the tokenizer and prefix indexes when a table is created, so
+changing ``database.search_tokenizer`` (or the prefix lengths this release
+indexes) means building a second table. The new one,
+``document_search_next``, is filled from every document's current revision
+in short chunked transactions, leaving the writer free for saves between
+chunks; those saves keep updating the live table and the entries. A final
+swap transaction reconciles every document that changed since its chunk was
+copied, brings ``document_search_entries`` back in line with ``documents``,
+then drops the live table and renames the new one into place. Documents keep
+their entry's rowid, so the entries table stays valid throughout.
+
+Reading from ``documents`` rather than the entries means the same rebuild
+repairs an index that drifted from the current revisions, as a restored
+backup can leave it; see ``search_maintenance`` for detecting that drift.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import Connection, text
+
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    _revision_text,
+)
+from src.contexts.studio.infrastructure.search_index import plain_text
+from src.contexts.studio.infrastructure.search_models import (
+    SEARCH_TOKENIZERS,
+    SearchTokenizer,
+    search_table_ddl,
+)
+
+__all__ = [
+    "SearchReindexReport",
+    "live_tokenizer",
+    "reindex_search",
+    "search_index_stale",
+]
+
+NEXT_TABLE = "document_search_next"
+
+_TABLE_SQL = text(
+    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'document_search'"
+)
+_TOKENIZE_RE = re.compile(r"tokenize\s*=\s*'([^']*)'", re.IGNORECASE)
+_MODULE_ARGS_RE = re.compile(r"USING\s+fts5\s*\((.*)\)\s*$", re.IGNORECASE | re.DOTALL)
+_DOCUMENT_COUNT = text(
+    "SELECT COUNT(*) FROM documents WHERE current_revision_id IS NOT NULL"
+)
+_DOCUMENT_CHUNK = text(
+    "SELECT d.id, d.title, d.current_revision_id AS revision_id, e.id AS rowid "
+    "FROM documents AS d "
+    "LEFT JOIN document_search_entries AS e ON e.document_id = d.id "
+    "WHERE d.current_revision_id IS NOT NULL AND d.id > :after "
+    "ORDER BY d.id LIMIT :limit"
+)
+_ALL_DOCUMENTS = text(
+    "SELECT d.id, d.project_id, d.title, d.current_revision_id AS revision_id, "
+    "e.id AS rowid, e.title AS entry_title, e.revision_id AS entry_revision_id "
+    "FROM documents AS d "
+    "LEFT JOIN document_search_entries AS e ON e.document_id = d.id "
+    "WHERE d.current_revision_id IS NOT NULL"
+)
+_ADD_ENTRY = text(
+    "INSERT INTO document_search_entries(document_id, project_id, title, "
+    "revision_id) VALUES (:document_id, :project_id, :title, :revision_id) "
+    "RETURNING id"
+)
+_MOVE_ENTRY = text(
+    "UPDATE document_search_entries SET title = :title, "
+    "revision_id = :revision_id WHERE id = :id"
+)
+_DROP_ORPHANED_ENTRIES = text(
+    "DELETE FROM document_search_entries WHERE document_id NOT IN "
+    "(SELECT id FROM documents WHERE current_revision_id IS NOT NULL)"
+)
+_INDEX_NEXT = text(
+    "INSERT INTO document_search_next(rowid, title, content) "
+    "VALUES (:rowid, :title, :content)"
+)
+_UNINDEX_NEXT = text(
+    "INSERT INTO document_search_next(document_search_next, rowid, title, content) "
+    "VALUES ('delete', :rowid, :title, :content)"
+)
+# One rebuild at a time per process: they share ``document_search_next``.
+_REINDEX_LOCK = threading.Lock()
+
+# (rowid, title, revision_id) a document was copied into the new table with.
+Indexed = tuple[int, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class SearchReindexReport:
+    tokenizer: str
+    documents: int
+    reconciled: int
+    repaired: int
+    duration_ms: float
+
+
+def live_tokenizer(connection: Connection) -> str | None:
+    """The setting name ``document_search`` was created with, if it has one."""
+    sql = connection.execute(_TABLE_SQL).scalar_one_or_none()
+    match = _TOKENIZE_RE.search(sql or "")
+    if match is None:
+        return None
+    return next(
+        (name for name, option in SEARCH_TOKENIZERS.items() if option == match[1]),
+        None,
+    )
+
+
+def _module_args(sql: str) -> str | None:
+    match = _MODULE_ARGS_RE.search(sql)
+    return None if match is None else match[1]
+
+
+def _options_stale(connection: Connection, tokenizer: SearchTokenizer) -> bool:
+    sql = connection.execute(_TABLE_SQL).scalar_one_or_none()
+    if sql is None:
+        return False
+    return _module_args(sql) != _module_args(search_table_ddl(tokenizer))
+
+
+def search_index_stale(database: StudioDatabase) -> bool:
+    """Whether an existing index was built with other tokenizer or prefixes."""
+    with database.engine.connect() as connection:
+        return _options_stale(connection, database.search_tokenizer)
+
+
+def _indexed_row(connection: Connection, indexed: Indexed) -> dict[str, object] | None:
+    rowid, title, revision_id = indexed
+    content = _revision_text(connection, revision_id)
+    if content is None:
+        return None
+    return {"rowid": rowid, "title": title, "content": plain_text(content)}
+
+
+def _copy_chunk(
+    connection: Connection,
+    after: str,
+    limit: int,
+    snapshot: dict[str, Indexed | None],
+) -> str | None:
+    rows = connection.execute(_DOCUMENT_CHUNK, {"after": after, "limit": limit}).all()
+    values = []
+    for row in rows:
+        # Documents without an entry get one, and their row, in the swap.
+        if row.rowid is None:
+            snapshot[row.id] = None
+            continue
+        indexed = (row.rowid, row.title, row.revision_id)
+        snapshot[row.id] = indexed
+        value = _indexed_row(connection, indexed)
+        if value is not None:
+            values.append(value)
+    if values:
+        connection.execute(_INDEX_NEXT, values)
+    return rows[-1].id if rows else None
+
+
+def _reconcile(
+    connection: Connection, snapshot: dict[str, Indexed | None]
+) -> tuple[int, int, int]:
+    """Catch the new table and the entries up with ``documents``.
+
+    Returns the number of documents indexed, rows re-copied into the new
+    table and entries repaired.
+    """
+    current: dict[str, Indexed] = {}
+    repaired = 0
+    for row in connection.execute(_ALL_DOCUMENTS).all():
+        rowid = row.rowid
+        if rowid is None:
+            rowid = connection.execute(
+                _ADD_ENTRY,
+                {
+                    "document_id": row.id,
+                    "project_id": row.project_id,
+                    "title": row.title,
+                    "revision_id": row.revision_id,
+                },
+            ).scalar_one()
+            repaired += 1
+        elif (row.entry_title, row.entry_revision_id) != (row.title, row.revision_id):
+            connection.execute(
+                _MOVE_ENTRY,
+                {"id": rowid, "title": row.title, "revision_id": row.revision_id},
+            )
+            repaired += 1
+        current[row.id] = (rowid, row.title, row.revision_id)
+    repaired += connection.execute(_DROP_ORPHANED_ENTRIES).rowcount
+    changed = {
+        document_id
+        for document_id in snapshot.keys() | current.keys()
+        if snapshot.get(document_id) != current.get(document_id)
+    }
+    removals = [
+        _indexed_row(connection, indexed)
+        for document_id in changed
+        if (indexed := snapshot.get(document_id)) is not None
+    ]
+    additions = [
+        _indexed_row(connection, current[document_id])
+        for document_id in changed
+        if document_id in current
+    ]
+    if present := [row for row in removals if row is not None]:
+        connection.execute(_UNINDEX_NEXT, present)
+    if present := [row for row in additions if row is not None]:
+        connection.execute(_INDEX_NEXT, present)
+    return len(current), len(changed), repaired
+
+
+def reindex_search(
+    database: StudioDatabase,
+    tokenizer: SearchTokenizer,
+    *,
+    chunk_size: int = 200,
+    progress: Callable[[int, int], None] | None = None,
+) -> SearchReindexReport:
+    """Rebuild the index with ``tokenizer`` in chunks and swap it in.
+
+    ``progress`` is called with ``(copied, total)`` after each chunk commits.
+    """
+    with _REINDEX_LOCK:
+        return _reindex(database, tokenizer, chunk_size, progress)
+
+
+def _reindex(
+    database: StudioDatabase,
+    tokenizer: SearchTokenizer,
+    chunk_size: int,
+    progress: Callable[[int, int], None] | None,
+) -> SearchReindexReport:
+    started = perf_counter()
+    with database.engine.begin() as connection:
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {NEXT_TABLE}")
+        connection.exec_driver_sql(search_table_ddl(tokenizer, table=NEXT_TABLE))
+        total = connection.execute(_DOCUMENT_COUNT).scalar_one()
+    snapshot: dict[str, Indexed | None] = {}
+    after: str | None = ""
+    while after is not None:
+        with database.engine.begin() as connection:
+            after = _copy_chunk(connection, after, chunk_size, snapshot)
+        if progress is not None and after is not None:
+            progress(len(snapshot), total)
+    with database.engine.begin() as connection:
+        documents, reconciled, repaired = _reconcile(connection, snapshot)
+        connection.exec_driver_sql("DROP TABLE document_search")
+        connection.exec_driver_sql(
+            f"ALTER TABLE {NEXT_TABLE} RENAME TO document_search"
+        )
+    database.search_tokenizer = tokenizer
+    return SearchReindexReport(
+        tokenizer=tokenizer,
+        documents=documents,
+        reconciled=reconciled,
+        repaired=repaired,
+        duration_ms=round((perf_counter() - started) * 1000, 3),
+    )
@@ -0,0 +1,155 @@
+"""In-memory title tries behind the quick-open suggester.
+
+Each project's document titles are loaded once into a :class:`TitleTrie`
+keyed on every word start of the casefolded title, so ``"riv"`` finds
+"The Red River" and ``"red ri"`` does too; a lookup walks one path and reads
+a precomputed id list. Tries live in :data:`title_suggest_cache` until the
+project's titles change. The search-index helpers are the single place
+titles are written, so they mark the project on the writing session and the
+cache drops its trie when that session commits. A trie built from a read
+that raced the commit is discarded rather than cached.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from sqlalchemy import Connection, event
+from sqlalchemy.orm import Session
+
+__all__ = [
+    "TitleSuggestCache",
+    "TitleSuggestion",
+    "TitleTrie",
+    "invalidate_titles",
+    "title_suggest_cache",
+]
+
+_WORD_START_RE = re.compile(r"\b\w")
+# Word starts deeper than this in a title are not worth a trie path.
+_MAX_KEY_LENGTH = 48
+_PENDING_KEY = "title_suggest_invalidations"
+
+
+def _fold(value: str) -> str:
+    return " ".join(value.casefold().split())
+
+
+@dataclass(frozen=True, slots=True)
+class TitleSuggestion:
+    document_id: str
+    kind: str
+    title: str
+
+
+@dataclass(slots=True)
+class _Node:
+    children: dict[str, _Node] = field(default_factory=dict)
+    # Indexes into ``TitleTrie.titles``, ascending and without repeats.
+    matches: list[int] = field(default_factory=list)
+
+
+class TitleTrie:
+    """Prefix tree over the word starts of one project's titles."""
+
+    def __init__(self, titles: Iterable[TitleSuggestion]) -> None:
+        self.titles = tuple(titles)
+        self._root = _Node()
+        for index, suggestion in enumerate(self.titles):
+            folded = _fold(suggestion.title)
+            for start in _WORD_START_RE.finditer(folded):
+                node = self._root
+                for character in folded[start.start() :][:_MAX_KEY_LENGTH]:
+                    node = node.children.setdefault(character, _Node())
+                    if not node.matches or node.matches[-1] != index:
+                        node.matches.append(index)
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[TitleSuggestion]:
+        """Titles with a word starting with ``prefix``; title starts first."""
+        folded = _fold(prefix)[:_MAX_KEY_LENGTH]
+        if not folded:
+            return []
+        node: _Node | None = self._root
+        for character in folded:
+            node = node.children.get(character) if node is not None else None
+        if node is None:
+            return []
+        leading: list[TitleSuggestion] = []
+        inner: list[TitleSuggestion] = []
+        for index in node.matches:
+            suggestion = self.titles[index]
+            if _fold(suggestion.title).startswith(folded):
+                leading.append(suggestion)
+                if len(leading) == limit:
+                    break
+            elif len(inner) < limit:
+                inner.append(suggestion)
+        return (leading + inner)[:limit]
+
+
+class TitleSuggestCache:
+    """Thread-safe LRU of title tries keyed by project id.
+
+    Every invalidation bumps the project's generation; :meth:`put` only keeps
+    a trie built while the generation it started from is still current.
+    """
+
+    def __init__(self, max_projects: int = 64) -> None:
+        self.max_projects = max_projects
+        self._tries: OrderedDict[str, TitleTrie] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, project_id: str) -> TitleTrie | None:
+        with self._lock:
+            trie = self._tries.get(project_id)
+            if trie is not None:
+                self._tries.move_to_end(project_id)
+            return trie
+
+    def generation(self, project_id: str) -> int:
+        with self._lock:
+            return self._generations.get(project_id, 0)
+
+    def put(self, project_id: str, generation: int, trie: TitleTrie) -> None:
+        with self._lock:
+            if self._generations.get(project_id, 0) != generation:
+                return
+            self._tries[project_id] = trie
+            self._tries.move_to_end(project_id)
+            while len(self._tries) > self.max_projects:
+                self._tries.popitem(last=False)
+
+    def invalidate(self, project_ids: Iterable[str]) -> None:
+        with self._lock:
+            for project_id in project_ids:
+                self._tries.pop(project_id, None)
+                self._generations[project_id] = self._generations.get(project_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tries.clear()
+            self._generations.clear()
+
+
+title_suggest_cache = TitleSuggestCache()
+
+
+def invalidate_titles(executor: Session | Connection, project_id: str) -> None:
+    """Drop ``project_id``'s trie once the writing transaction commits.
+
+    Bare connections (migrations, rebuilds) invalidate straight away.
+    """
+    if isinstance(executor, Session):
+        executor.info.setdefault(_PENDING_KEY, set()).add(project_id)
+    else:
+        title_suggest_cache.invalidate([project_id])
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    title_suggest_cache.invalidate(session.info.pop(_PENDING_KEY, ()))
@@ -0,0 +1,72 @@
+"""WAL size inspection and checkpointing for the Studio SQLite store."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Literal
+
+from sqlalchemy import text
+
+from src.contexts.studio.infrastructure.database import StudioDatabase
+
+__all__ = ["WalCheckpoint", "checkpoint_wal", "maintain_wal", "wal_size"]
+
+CheckpointMode = Literal["PASSIVE", "FULL", "RESTART", "TRUNCATE"]
+
+
+@dataclass(frozen=True, slots=True)
+class WalCheckpoint:
+    mode: CheckpointMode
+    busy: bool
+    log_frames: int
+    checkpointed_frames: int
+    duration_ms: float
+
+    @property
+    def complete(self) -> bool:
+        """Whether every frame in the WAL was copied back to the database."""
+        return not self.busy and self.checkpointed_frames == self.log_frames
+
+
+def wal_size(database: StudioDatabase) -> int:
+    """Return the size of the ``-wal`` file in bytes, or 0 when there is none."""
+    if database.path is None:
+        return 0
+    wal_path = database.path.with_name(f"{database.path.name}-wal")
+    return wal_path.stat().st_size if wal_path.exists() else 0
+
+
+def checkpoint_wal(
+    database: StudioDatabase,
+    mode: CheckpointMode = "PASSIVE",
+) -> WalCheckpoint:
+    """Run ``PRAGMA wal_checkpoint`` on the writer connection and time it."""
+    started = perf_counter()
+    with database.engine.connect() as connection:
+        busy, log_frames, checkpointed = connection.execute(
+            text(f"PRAGMA wal_checkpoint({mode})")
+        ).one()
+    return WalCheckpoint(
+        mode=mode,
+        busy=bool(busy),
+        log_frames=int(log_frames),
+        checkpointed_frames=int(checkpointed),
+        duration_ms=round((perf_counter() - started) * 1000, 3),
+    )
+
+
+def maintain_wal(database: StudioDatabase, threshold_bytes: int) -> list[WalCheckpoint]:
+    """Checkpoint the WAL once it grows past ``threshold_bytes``.
+
+    A PASSIVE checkpoint copies what it can without waiting on readers. Only
+    when it drained the whole log is a TRUNCATE issued to shrink the file back
+    to zero; otherwise readers are still pinning old frames and the next poll
+    tries again. Autosaving writers therefore never pay for the checkpoint.
+    """
+    if wal_size(database) < threshold_bytes:
+        return []
+    passive = checkpoint_wal(database, "PASSIVE")
+    if not passive.complete:
+        return [passive]
+    return [passive, checkpoint_wal(database, "TRUNCATE")]
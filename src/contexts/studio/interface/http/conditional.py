@@ -0,0 +1,65 @@
+"""Conditional GET support for the Studio routers.
+
+Project, document-list and document reads are tagged with the project's write
+counter, so a polling client that sends ``If-None-Match`` costs one indexed
+lookup and gets a bodiless 304 until something in the project changes.
+"""
+
+from __future__ import annotations
+
+from fastapi import Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+
+from src.contexts.studio.application.services import Principal, StudioStore
+
+__all__ = [
+    "REVALIDATE_CACHE_CONTROL",
+    "_conditional_response",
+    "_etag_matches",
+    "_project_not_modified",
+]
+
+# Cacheable by the browser only, and always revalidated before reuse.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Apply the weak comparison ``If-None-Match`` calls for."""
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _conditional_response(
+    request: Request,
+    response: Response,
+    *,
+    etag: str,
+    cache_control: str,
+) -> Response | None:
+    """Return a 304 when ``etag`` matches, else stamp the headers on ``response``."""
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+async def _project_not_modified(
+    request: Request,
+    response: Response,
+    store: StudioStore,
+    principal: Principal,
+    project_id: str,
+) -> Response | None:
+    # The version is read before the payload is built, so a concurrent write
+    # can only leave the ETag older than the body, which costs a refetch.
+    version = await run_in_threadpool(store.project_version, principal, project_id)
+    return _conditional_response(
+        request,
+        response,
+        etag=f'"{project_id}.{version}"',
+        cache_control=REVALIDATE_CACHE_CONTROL,
+    )
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Query
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_SEARCH_PAGE_SIZE = 30
+MAX_PAGE_SIZE = 200
+
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+PageCursor = Annotated[str | None, Query(max_length=512)]
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 
+from src.contexts.studio.interface.http.conditional import _project_not_modified
 from src.contexts.studio.interface.http.dependencies import StudioStoreDependency
 from src.contexts.studio.interface.http.errors import _handle_domain_exceptions
+from src.contexts.studio.interface.http.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageCursor,
+    PageLimit,
+)
 from src.contexts.studio.interface.http.schemas import (
+    DocumentBatchCreateRequest,
     DocumentCreateRequest,
-    DocumentRestoreRequest,
+    DocumentMoveRequest,
     DocumentSaveRequest,
     ProjectRequest,
     ProjectUpdateRequest,
@@ -24,8 +32,13 @@ project_router = APIRouter(tags=["studio"])
 async def list_projects(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
+    view: Literal["list", "summary"] = "list",
 ) -> dict[str, Any]:
-    return {"projects": store.list_projects(principal)}
+    if view == "summary":
+        return {
+            "projects": await run_in_threadpool(store.list_project_summaries, principal)
+        }
+    return {"projects": await run_in_threadpool(store.list_projects, principal)}
 
 
 @project_router.post("/projects", status_code=status.HTTP_201_CREATED)
@@ -35,21 +48,29 @@ async def create_project(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.create_project(
+    return await run_in_threadpool(
+        store.create_project,
         principal,
         title=payload.title,
         description=payload.description,
     )
 
 
-@project_router.get("/projects/{project_id}")
+@project_router.get("/projects/{project_id}", response_model=None)
 @_handle_domain_exceptions
 async def get_project(
     project_id: str,
+    request: Request,
+    response: Response,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
-) -> dict[str, Any]:
-    return store.get_project(principal, project_id)
+) -> dict[str, Any] | Response:
+    not_modified = await _project_not_modified(
+        request, response, store, principal, project_id
+    )
+    if not_modified is not None:
+        return not_modified
+    return await run_in_threadpool(store.get_project, principal, project_id)
 
 
 @project_router.patch("/projects/{project_id}")
@@ -60,7 +81,8 @@ async def update_project(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.update_project(
+    return await run_in_threadpool(
+        store.update_project,
         principal,
         project_id,
         title=payload.title,
@@ -81,7 +103,7 @@ async def delete_project(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> Response:
-    store.delete_project(principal, project_id)
+    await run_in_threadpool(store.delete_project, principal, project_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -96,7 +118,8 @@ async def create_document(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.create_document(
+    return await run_in_threadpool(
+        store.create_document,
         principal,
         project_id,
         kind=payload.kind,
@@ -107,118 +130,144 @@ async def create_document(
     )
 
 
-@project_router.put("/projects/{project_id}/documents/reorder")
+@project_router.get("/projects/{project_id}/documents", response_model=None)
 @_handle_domain_exceptions
-async def reorder_documents(
+async def list_documents(
     project_id: str,
-    payload: ReorderRequest,
+    request: Request,
+    response: Response,
+    principal: PrincipalDependency,
+    store: StudioStoreDependency,
+) -> dict[str, Any] | Response:
+    not_modified = await _project_not_modified(
+        request, response, store, principal, project_id
+    )
+    if not_modified is not None:
+        return not_modified
+    return {
+        "documents": await run_in_threadpool(
+            store.list_documents, principal, project_id
+        )
+    }
+
+
+@project_router.post(
+    "/projects/{project_id}/documents/batch",
+    status_code=status.HTTP_201_CREATED,
+)
+@_handle_domain_exceptions
+async def create_documents(
+    project_id: str,
+    payload: DocumentBatchCreateRequest,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
     return {
-        "documents": store.reorder_documents(
+        "documents": await run_in_threadpool(
+            store.create_documents,
             principal,
             project_id,
-            payload.document_ids,
+            [document.model_dump() for document in payload.documents],
         )
     }
 
 
-@project_router.get("/projects/{project_id}/documents/{document_id}")
+@project_router.put("/projects/{project_id}/documents/reorder")
 @_handle_domain_exceptions
-async def get_document(
+async def reorder_documents(
     project_id: str,
-    document_id: str,
+    payload: ReorderRequest,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.get_document(principal, project_id, document_id)
+    return {
+        "documents": await run_in_threadpool(
+            store.reorder_documents,
+            principal,
+            project_id,
+            payload.document_ids,
+        )
+    }
 
 
-@project_router.put("/projects/{project_id}/documents/{document_id}")
+@project_router.post("/projects/{project_id}/documents/{document_id}/move")
 @_handle_domain_exceptions
-async def save_document(
+async def move_document(
     project_id: str,
     document_id: str,
-    payload: DocumentSaveRequest,
+    payload: DocumentMoveRequest,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.save_document(
+    return await run_in_threadpool(
+        store.move_document,
         principal,
         project_id,
         document_id,
-        content_markdown=payload.content_markdown,
-        base_revision_id=payload.base_revision_id,
-        title=payload.title,
-        metadata=payload.metadata,
+        before_id=payload.before_id,
+        after_id=payload.after_id,
     )
 
 
-@project_router.delete(
+@project_router.get(
     "/projects/{project_id}/documents/{document_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
-    response_class=Response,
     response_model=None,
 )
 @_handle_domain_exceptions
-async def delete_document(
-    project_id: str,
-    document_id: str,
-    principal: PrincipalDependency,
-    store: StudioStoreDependency,
-) -> Response:
-    store.delete_document(principal, project_id, document_id)
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
-
-
-@project_router.get("/projects/{project_id}/documents/{document_id}/revisions")
-@_handle_domain_exceptions
-async def list_revisions(
+async def get_document(
     project_id: str,
     document_id: str,
+    request: Request,
+    response: Response,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
-) -> dict[str, Any]:
-    return {
-        "revisions": store.list_revisions(
-            principal,
-            project_id,
-            document_id,
-        )
-    }
+) -> dict[str, Any] | Response:
+    not_modified = await _project_not_modified(
+        request, response, store, principal, project_id
+    )
+    if not_modified is not None:
+        return not_modified
+    return await run_in_threadpool(
+        store.get_document, principal, project_id, document_id
+    )
 
 
-@project_router.post(
-    "/projects/{project_id}/documents/{document_id}/revisions/{revision_id}/restore"
-)
+@project_router.put("/projects/{project_id}/documents/{document_id}")
 @_handle_domain_exceptions
-async def restore_revision(
+async def save_document(
     project_id: str,
     document_id: str,
-    revision_id: str,
-    payload: DocumentRestoreRequest,
+    payload: DocumentSaveRequest,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.restore_revision(
+    return await run_in_threadpool(
+        store.save_document,
         principal,
         project_id,
         document_id,
-        revision_id,
+        content_markdown=payload.content_markdown,
         base_revision_id=payload.base_revision_id,
+        title=payload.title,
+        metadata=payload.metadata,
     )
 
 
-@project_router.get("/projects/{project_id}/search")
+@project_router.delete(
+    "/projects/{project_id}/documents/{document_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    response_model=None,
+)
 @_handle_domain_exceptions
-async def search_project(
+async def delete_document(
     project_id: str,
-    q: str,
+    document_id: str,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
-) -> dict[str, Any]:
-    return {"results": store.search(principal, project_id, q)}
+) -> Response:
+    await run_in_threadpool(store.delete_document, principal, project_id, document_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @project_router.get("/projects/{project_id}/snapshots")
@@ -227,8 +276,16 @@ async def list_snapshots(
     project_id: str,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
 ) -> dict[str, Any]:
-    return {"snapshots": store.list_snapshots(principal, project_id)}
+    return await run_in_threadpool(
+        store.list_snapshots,
+        principal,
+        project_id,
+        limit=limit,
+        cursor=cursor,
+    )
 
 
 @project_router.post(
@@ -242,7 +299,8 @@ async def create_snapshot(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.create_snapshot(
+    return await run_in_threadpool(
+        store.create_snapshot,
         principal,
         project_id,
         reason=payload.reason,
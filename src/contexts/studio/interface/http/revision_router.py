@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from src.contexts.studio.interface.http.conditional import _conditional_response
+from src.contexts.studio.interface.http.dependencies import StudioStoreDependency
+from src.contexts.studio.interface.http.errors import _handle_domain_exceptions
+from src.contexts.studio.interface.http.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageCursor,
+    PageLimit,
+)
+from src.contexts.studio.interface.http.schemas import DocumentRestoreRequest
+from src.contexts.studio.interface.http.session_router import PrincipalDependency
+
+revision_router = APIRouter(tags=["studio"])
+
+# A revision is never rewritten once stored, so its content can be cached for
+# as long as browsers allow. ``private`` keeps shared caches out of it.
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+@revision_router.get("/projects/{project_id}/documents/{document_id}/revisions")
+@_handle_domain_exceptions
+async def list_revisions(
+    project_id: str,
+    document_id: str,
+    principal: PrincipalDependency,
+    store: StudioStoreDependency,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
+) -> dict[str, Any]:
+    return await run_in_threadpool(
+        store.list_revisions,
+        principal,
+        project_id,
+        document_id,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
+@revision_router.get(
+    "/projects/{project_id}/documents/{document_id}/revisions/{revision_id}",
+    response_model=None,
+)
+@_handle_domain_exceptions
+async def get_revision(
+    project_id: str,
+    document_id: str,
+    revision_id: str,
+    request: Request,
+    response: Response,
+    principal: PrincipalDependency,
+    store: StudioStoreDependency,
+) -> dict[str, Any] | Response:
+    revision = await run_in_threadpool(
+        store.get_revision, principal, project_id, document_id, revision_id
+    )
+    not_modified = _conditional_response(
+        request,
+        response,
+        etag=f'"{revision_id}"',
+        cache_control=IMMUTABLE_CACHE_CONTROL,
+    )
+    if not_modified is not None:
+        return not_modified
+    return revision
+
+
+@revision_router.post(
+    "/projects/{project_id}/documents/{document_id}/revisions/{revision_id}/restore"
+)
+@_handle_domain_exceptions
+async def restore_revision(
+    project_id: str,
+    document_id: str,
+    revision_id: str,
+    payload: DocumentRestoreRequest,
+    principal: PrincipalDependency,
+    store: StudioStoreDependency,
+) -> dict[str, Any]:
+    return await run_in_threadpool(
+        store.restore_revision,
+        principal,
+        project_id,
+        document_id,
+        revision_id,
+        base_revision_id=payload.base_revision_id,
+    )
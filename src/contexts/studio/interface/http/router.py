@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
 from src.contexts.studio.interface.http.project_router import project_router
+from src.contexts.studio.interface.http.revision_router import revision_router
+from src.contexts.studio.interface.http.search_router import search_router
 from src.contexts.studio.interface.http.session_router import (
     get_principal,
     session_router,
@@ -10,6 +12,8 @@ from src.contexts.studio.interface.http.workflow_router import workflow_router
 router = APIRouter()
 router.include_router(session_router)
 router.include_router(project_router)
+router.include_router(revision_router)
+router.include_router(search_router)
 router.include_router(workflow_router)
 
 __all__ = ["get_principal", "router"]
@@ -36,6 +36,10 @@ class DocumentCreateRequest(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+class DocumentBatchCreateRequest(BaseModel):
+    documents: list[DocumentCreateRequest] = Field(min_length=1, max_length=500)
+
+
 class DocumentSaveRequest(BaseModel):
     content_markdown: str
     base_revision_id: str | None
@@ -51,6 +55,11 @@ class ReorderRequest(BaseModel):
     document_ids: list[str] = Field(min_length=1)
 
 
+class DocumentMoveRequest(BaseModel):
+    before_id: str | None = None
+    after_id: str | None = None
+
+
 class AIProposalRequest(BaseModel):
     operation: Literal["continue", "rewrite", "generate"]
     instruction: str = Field(default="", max_length=10_000)
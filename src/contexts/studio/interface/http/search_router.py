@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Query
+from fastapi.concurrency import run_in_threadpool
+
+from src.contexts.studio.interface.http.dependencies import StudioStoreDependency
+from src.contexts.studio.interface.http.errors import _handle_domain_exceptions
+from src.contexts.studio.interface.http.pagination import (
+    DEFAULT_SEARCH_PAGE_SIZE,
+    PageCursor,
+    PageLimit,
+)
+from src.contexts.studio.interface.http.session_router import PrincipalDependency
+
+search_router = APIRouter(tags=["studio"])
+
+MAX_SUGGESTIONS = 50
+
+
+@search_router.get("/projects/{project_id}/search")
+@_handle_domain_exceptions
+async def search_project(
+    project_id: str,
+    q: str,
+    principal: PrincipalDependency,
+    store: StudioStoreDependency,
+    prefix: bool = False,
+) -> dict[str, Any]:
+    return {
+        "results": await run_in_threadpool(
+            store.search, principal, project_id, q, prefix=prefix
+        )
+    }
+
+
+@search_router.get("/search")
+@_handle_domain_exceptions
+async def search_all_projects(
+    q: str,
+    principal: PrincipalDependency,
+    store: StudioStoreDependency,
+    prefix: bool = False,
+    limit: PageLimit = DEFAULT_SEARCH_PAGE_SIZE,
+    cursor: PageCursor = None,
+) -> dict[str, Any]:
+    return await run_in_threadpool(
+        store.search_all, principal, q, prefix=prefix, limit=limit, cursor=cursor
+    )
+
+
+@search_router.get("/projects/{project_id}/suggest")
+@_handle_domain_exceptions
+async def suggest_titles(
+    project_id: str,
+    principal: PrincipalDependency,
+    store: StudioStoreDependency,
+    q: Annotated[str, Query(max_length=120)],
+    limit: Annotated[int, Query(ge=1, le=MAX_SUGGESTIONS)] = 10,
+) -> dict[str, Any]:
+    return {
+        "suggestions": await run_in_threadpool(
+            store.suggest, principal, project_id, q, limit=limit
+        )
+    }
@@ -5,6 +5,7 @@ from typing import Annotated, Any
 from urllib.parse import urlsplit
 
 from fastapi import APIRouter, Cookie, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 
 from src.contexts.studio.application.services import (
     CSRF_COOKIE,
@@ -172,7 +173,7 @@ async def setup_status(
     request: Request, store: StudioStoreDependency
 ) -> dict[str, Any]:
     return {
-        "owner_configured": store.owner_exists(),
+        "owner_configured": await run_in_threadpool(store.owner_exists),
         "version": request.app.state.settings.project_version,
     }
 
@@ -189,7 +190,9 @@ async def setup_owner(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Setup requests must be same-origin.",
         )
-    return store.setup_owner(payload.username, payload.password)
+    return await run_in_threadpool(
+        store.setup_owner, payload.username, payload.password
+    )
 
 
 @session_router.post("/session/login")
@@ -200,7 +203,8 @@ async def login(
     response: Response,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    token, csrf_token, principal = store.create_owner_session(
+    token, csrf_token, principal = await run_in_threadpool(
+        store.create_owner_session,
         payload.username,
         payload.password,
     )
@@ -220,7 +224,7 @@ async def guest_session(
     response: Response,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    token, csrf_token, principal = store.create_guest_session()
+    token, csrf_token, principal = await run_in_threadpool(store.create_guest_session)
     max_age = int(GUEST_TTL.total_seconds())
     secure = (
         request.app.state.settings.is_production
@@ -247,7 +251,7 @@ async def logout(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> Response:
-    store.logout(principal.session_id)
+    await run_in_threadpool(store.logout, principal.session_id)
     response.delete_cookie(SESSION_COOKIE, path="/")
     response.delete_cookie(CSRF_COOKIE, path="/")
     response.status_code = status.HTTP_204_NO_CONTENT
@@ -4,12 +4,18 @@ from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 
 from src.contexts.studio.domain.exceptions import InvalidOperation, NotFound
 from src.contexts.studio.domain.principal import Principal
 from src.contexts.studio.interface.http.dependencies import StudioStoreDependency
 from src.contexts.studio.interface.http.errors import _handle_domain_exceptions
+from src.contexts.studio.interface.http.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageCursor,
+    PageLimit,
+)
 from src.contexts.studio.interface.http.schemas import (
     AIProposalRequest,
     ExportRequest,
@@ -75,7 +81,9 @@ async def accept_ai_proposal(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.accept_ai_proposal(principal, project_id, job_id)
+    return await run_in_threadpool(
+        store.accept_ai_proposal, principal, project_id, job_id
+    )
 
 
 @workflow_router.get("/projects/{project_id}/jobs")
@@ -84,8 +92,16 @@ async def list_jobs(
     project_id: str,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
 ) -> dict[str, Any]:
-    return {"jobs": store.list_jobs(principal, project_id)}
+    return await run_in_threadpool(
+        store.list_jobs,
+        principal,
+        project_id,
+        limit=limit,
+        cursor=cursor,
+    )
 
 
 @workflow_router.post("/projects/{project_id}/jobs/{job_id}/retry")
@@ -109,7 +125,7 @@ async def create_review(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.review_project(principal, project_id)
+    return await run_in_threadpool(store.review_project, principal, project_id)
 
 
 @workflow_router.get("/projects/{project_id}/reviews")
@@ -118,8 +134,16 @@ async def list_reviews(
     project_id: str,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
 ) -> dict[str, Any]:
-    return {"reviews": store.list_reviews(principal, project_id)}
+    return await run_in_threadpool(
+        store.list_reviews,
+        principal,
+        project_id,
+        limit=limit,
+        cursor=cursor,
+    )
 
 
 @workflow_router.post(
@@ -133,7 +157,8 @@ async def create_export(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
-    return store.export_project(
+    return await run_in_threadpool(
+        store.export_project,
         principal,
         project_id,
         export_format=payload.format,
@@ -146,8 +171,16 @@ async def list_exports(
     project_id: str,
     principal: PrincipalDependency,
     store: StudioStoreDependency,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
 ) -> dict[str, Any]:
-    return {"exports": store.list_exports(principal, project_id)}
+    return await run_in_threadpool(
+        store.list_exports,
+        principal,
+        project_id,
+        limit=limit,
+        cursor=cursor,
+    )
 
 
 @workflow_router.get("/projects/{project_id}/exports/{export_id}/download")
@@ -158,7 +191,7 @@ async def download_export(
     principal: PrincipalDependency,
     store: StudioStoreDependency,
 ) -> FileResponse:
-    path = store.export_path(principal, project_id, export_id)
+    path = await run_in_threadpool(store.export_path, principal, project_id, export_id)
     return FileResponse(path, filename=path.name)
 
 
@@ -171,8 +204,9 @@ async def preview_import(
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
     _require_owner(principal)
-    return store.preview_legacy_workspace(
-        _web_import_source(payload.source, request.app.state.settings.data_dir)
+    return await run_in_threadpool(
+        store.preview_legacy_workspace,
+        _web_import_source(payload.source, request.app.state.settings.data_dir),
     )
 
 
@@ -185,7 +219,8 @@ async def import_workspace(
     store: StudioStoreDependency,
 ) -> dict[str, Any]:
     _require_owner(principal)
-    return store.import_legacy_workspace(
+    return await run_in_threadpool(
+        store.import_legacy_workspace,
         principal,
         _web_import_source(payload.source, request.app.state.settings.data_dir),
     )
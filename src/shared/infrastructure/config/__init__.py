@@ -14,6 +14,7 @@ from .settings import (
     reload_settings,
     reset_settings,
 )
+from .settings_sections import SqliteProfile
 
 __all__ = [
     # Main classes
@@ -27,6 +28,7 @@ __all__ = [
     "LoggingSettings",
     "MonitoringSettings",
     "SecuritySettings",
+    "SqliteProfile",
     # Functions
     "get_settings",
     "reload_settings",
@@ -5,7 +5,7 @@ from enum import StrEnum
 from importlib.metadata import PackageNotFoundError, version
 from ipaddress import IPv4Address
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings, NoDecode
@@ -24,7 +24,9 @@ __all__ = [
     "LLMSettings",
     "LOCAL_DOTENV_FILE",
     "LogLevel",
+    "SQLITE_PROFILES",
     "SecuritySettings",
+    "SqliteProfile",
 ]
 
 _DEFAULT_SECRET_KEY_PARTS = ("change-me", "in-production", "32-char-long")
@@ -57,6 +59,38 @@ class LogLevel(StrEnum):
     CRITICAL = "CRITICAL"
 
 
+class SqliteProfile(StrEnum):
+    LAPTOP = "laptop"
+    BALANCED = "balanced"
+    LIBRARY = "library"
+
+
+SqlitePragmas = dict[str, int | str]
+
+# cache_size is negative, i.e. KiB rather than pages, so it does not depend on
+# the page size. mmap_size is in bytes; wal_autocheckpoint is in pages.
+SQLITE_PROFILES: dict[SqliteProfile, SqlitePragmas] = {
+    SqliteProfile.LAPTOP: {
+        "cache_size": -4_096,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "wal_autocheckpoint": 1_000,
+    },
+    SqliteProfile.BALANCED: {
+        "cache_size": -16_384,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 1_000,
+    },
+    SqliteProfile.LIBRARY: {
+        "cache_size": -65_536,
+        "mmap_size": 512 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 4_000,
+    },
+}
+
+
 class DatabaseSettings(BaseSettings):
     model_config = _settings_config(env_prefix="DB_")
 
@@ -72,6 +106,77 @@ class DatabaseSettings(BaseSettings):
         default=30, ge=1, le=300, description="Pool timeout in seconds"
     )
     echo: bool = Field(default=False, description="Echo SQL statements")
+    group_commit: bool = Field(
+        default=False,
+        description="Coalesce concurrent document saves into shared commits",
+    )
+    group_commit_window_ms: int = Field(
+        default=2, ge=1, le=100, description="Group-commit collection window"
+    )
+    group_commit_max_batch: int = Field(
+        default=64, ge=1, le=1000, description="Max writes per group commit"
+    )
+    revision_storage: Literal["full", "delta"] = Field(
+        default="full",
+        description="Store revisions whole or as deltas against their parent",
+    )
+    revision_keyframe_interval: int = Field(
+        default=20,
+        ge=1,
+        le=1000,
+        description="Store every Nth revision whole so delta chains stay short",
+    )
+    revision_keep_all_hours: int = Field(
+        default=24, ge=1, description="Prune keeps every revision this recent"
+    )
+    revision_keep_hourly_days: int = Field(
+        default=7, ge=1, description="Prune keeps one revision per hour until then"
+    )
+    revision_compression_age_days: int = Field(
+        default=30, ge=1, description="Age after which cold revisions are compressed"
+    )
+    revision_compression_interval_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="Background cold-revision compression interval; 0 disables it",
+    )
+    search_tokenizer: Literal["unicode61", "porter", "trigram"] = Field(
+        default="unicode61",
+        description="FTS5 tokenizer for document search; trigram suits CJK text",
+    )
+    search_maintenance_interval_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="Background search verify/optimize interval; 0 disables it",
+    )
+    sqlite_profile: SqliteProfile = Field(
+        default=SqliteProfile.BALANCED,
+        description="Named SQLite pragma profile sized for the installation",
+    )
+    cache_size: int | None = Field(
+        default=None, description="PRAGMA cache_size override (negative is KiB)"
+    )
+    mmap_size: int | None = Field(
+        default=None, ge=0, description="PRAGMA mmap_size override in bytes"
+    )
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] | None = Field(
+        default=None, description="PRAGMA temp_store override"
+    )
+    wal_autocheckpoint: int | None = Field(
+        default=None, ge=0, description="PRAGMA wal_autocheckpoint override in pages"
+    )
+    wal_checkpoint_interval_seconds: int = Field(
+        default=30,
+        ge=0,
+        le=3600,
+        description="Background WAL checkpoint poll interval; 0 disables it",
+    )
+    wal_checkpoint_threshold_mb: int = Field(
+        default=64,
+        ge=1,
+        le=4096,
+        description="WAL size that triggers a background checkpoint",
+    )
 
     @field_validator("url")
     @classmethod
@@ -82,6 +187,18 @@ class DatabaseSettings(BaseSettings):
             raise ValueError("DB_URL must use the self-hosted SQLite store")
         return v
 
+    def sqlite_pragmas(self) -> SqlitePragmas:
+        """Return the profile's pragmas with any explicit overrides applied."""
+        pragmas = dict(SQLITE_PROFILES[self.sqlite_profile])
+        overrides = {
+            "cache_size": self.cache_size,
+            "mmap_size": self.mmap_size,
+            "temp_store": self.temp_store,
+            "wal_autocheckpoint": self.wal_autocheckpoint,
+        }
+        pragmas.update({k: v for k, v in overrides.items() if v is not None})
+        return pragmas
+
 
 _DEFAULT_API_HOST = IPv4Address(0).compressed
 
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from src.apps.api.runtime import StudioRuntime
+
+
+def test_export_request_checks_project_scope_once(
+    canonical_app: FastAPI,
+    canonical_client: TestClient,
+) -> None:
+    canonical_client.post("/api/session/guest")
+    project = canonical_client.post("/api/projects", json={"title": "Scoped"}).json()
+    runtime: StudioRuntime = canonical_app.state.studio_runtime
+    engines = {runtime.database.engine, runtime.database.read_engine}
+    executed: list[str] = []
+
+    def _record(*args: Any) -> None:
+        executed.append(args[2])
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _record)
+    try:
+        created = canonical_client.post(
+            f"/api/projects/{project['id']}/exports", json={"format": "markdown"}
+        )
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    assert created.status_code == 201
+    scope_checks = [
+        statement
+        for statement in executed
+        if "FROM projects" in statement and "projects.guest_session_id = " in statement
+    ]
+    assert len(scope_checks) == 1
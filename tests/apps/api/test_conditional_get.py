@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_project_reads_return_304_until_the_project_changes(
+    canonical_client: TestClient,
+) -> None:
+    canonical_client.post("/api/session/guest")
+    project = canonical_client.post("/api/projects", json={"title": "Polled"}).json()
+    document = project["documents"][0]
+    paths = [
+        f"/api/projects/{project['id']}",
+        f"/api/projects/{project['id']}/documents",
+        f"/api/projects/{project['id']}/documents/{document['id']}",
+    ]
+
+    first = canonical_client.get(paths[0])
+    etag = first.headers["etag"]
+    assert first.json()["version"] == project["version"]
+    assert first.headers["cache-control"] == "private, no-cache"
+    listed = canonical_client.get(paths[1])
+    assert [item["id"] for item in listed.json()["documents"]] == [document["id"]]
+    for path in paths:
+        cached = canonical_client.get(path, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+    weak = canonical_client.get(paths[2], headers={"If-None-Match": f'"x", W/{etag}'})
+    assert weak.status_code == 304
+
+    canonical_client.put(
+        paths[2],
+        json={
+            "content_markdown": "# Chapter 1\n\nRevised.",
+            "base_revision_id": document["current_revision_id"],
+        },
+    )
+
+    for path in paths:
+        fresh = canonical_client.get(path, headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+    assert canonical_client.get(paths[0]).json()["version"] == project["version"] + 1
+
+
+def test_every_document_write_bumps_the_project_version(
+    canonical_client: TestClient,
+) -> None:
+    canonical_client.post("/api/session/guest")
+    project = canonical_client.post("/api/projects", json={"title": "Counted"}).json()
+    base = f"/api/projects/{project['id']}"
+
+    def version() -> int:
+        return int(canonical_client.get(base).json()["version"])
+
+    created = canonical_client.post(
+        f"{base}/documents", json={"kind": "chapter", "title": "Two"}
+    ).json()
+    assert version() == project["version"] + 1
+    canonical_client.put(
+        f"{base}/documents/reorder",
+        json={"document_ids": [created["id"], project["documents"][0]["id"]]},
+    )
+    assert version() == project["version"] + 2
+    canonical_client.patch(base, json={"title": "Renamed"})
+    assert version() == project["version"] + 3
+    canonical_client.delete(f"{base}/documents/{created['id']}")
+    assert version() == project["version"] + 4
+    missing = canonical_client.get(
+        "/api/projects/missing", headers={"If-None-Match": "*"}
+    )
+    assert missing.status_code == 404
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_batch_document_endpoint_creates_documents_in_order(
+    canonical_client: TestClient,
+) -> None:
+    canonical_client.post("/api/session/guest")
+    project = canonical_client.post("/api/projects", json={"title": "Batch"}).json()
+
+    created = canonical_client.post(
+        f"/api/projects/{project['id']}/documents/batch",
+        json={
+            "documents": [
+                {"kind": "chapter", "title": "Two", "content_markdown": "Second."},
+                {"kind": "note", "title": "Cast", "metadata": {"pinned": True}},
+            ]
+        },
+    )
+
+    assert created.status_code == 201
+    documents = created.json()["documents"]
+    assert [(item["title"], item["position"]) for item in documents] == [
+        ("Two", 2048),
+        ("Cast", 1024),
+    ]
+    assert documents[1]["metadata"] == {"pinned": True}
+    empty = canonical_client.post(
+        f"/api/projects/{project['id']}/documents/batch", json={"documents": []}
+    )
+    assert empty.status_code == 422
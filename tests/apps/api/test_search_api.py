@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_suggest_and_prefix_search_endpoints(canonical_client: TestClient) -> None:
+    canonical_client.post("/api/session/guest")
+    project = canonical_client.post("/api/projects", json={"title": "Typing"}).json()
+    document = project["documents"][0]
+    canonical_client.put(
+        f"/api/projects/{project['id']}/documents/{document['id']}",
+        json={
+            "content_markdown": "The lantern flickered.",
+            "base_revision_id": document["current_revision_id"],
+            "metadata": {},
+        },
+    )
+
+    suggested = canonical_client.get(f"/api/projects/{project['id']}/suggest?q=cha")
+    assert suggested.status_code == 200
+    assert suggested.json() == {
+        "suggestions": [
+            {"document_id": document["id"], "kind": "chapter", "title": "Chapter 1"}
+        ]
+    }
+    searched = canonical_client.get(
+        f"/api/projects/{project['id']}/search?q=lant&prefix=true"
+    )
+    assert [result["document_id"] for result in searched.json()["results"]] == [
+        document["id"]
+    ]
+    assert (
+        canonical_client.get(
+            f"/api/projects/{project['id']}/suggest?q=cha&limit=0"
+        ).status_code
+        == 422
+    )
+
+
+def test_owner_wide_search_endpoint(canonical_client: TestClient) -> None:
+    canonical_client.post("/api/session/guest")
+    for title in ("Book One", "Book Two"):
+        project = canonical_client.post("/api/projects", json={"title": title}).json()
+        document = project["documents"][0]
+        canonical_client.put(
+            f"/api/projects/{project['id']}/documents/{document['id']}",
+            json={
+                "content_markdown": f"Mara appears in {title}.",
+                "base_revision_id": document["current_revision_id"],
+                "metadata": {},
+            },
+        )
+
+    first = canonical_client.get("/api/search?q=mara&limit=1")
+    assert first.status_code == 200
+    assert len(first.json()["projects"]) == 1
+    cursor = first.json()["next_cursor"]
+    assert cursor is not None
+    second = canonical_client.get(f"/api/search?q=mara&limit=1&cursor={cursor}")
+    titles = {
+        group["title"] for page in (first, second) for group in page.json()["projects"]
+    }
+    assert titles == {"Book One", "Book Two"}
+    assert second.json()["next_cursor"] is None
+    assert canonical_client.get("/api/search?q=mara&cursor=bad").status_code == 422
@@ -146,6 +146,31 @@ def test_project_and_document_delete_endpoints(canonical_client: TestClient) ->
     assert canonical_client.get(f"/api/projects/{project['id']}").status_code == 404
 
 
+def test_project_summary_view(canonical_client: TestClient) -> None:
+    canonical_client.post("/api/session/guest")
+    project = canonical_client.post("/api/projects", json={"title": "Summary"}).json()
+    document = project["documents"][0]
+    canonical_client.put(
+        f"/api/projects/{project['id']}/documents/{document['id']}",
+        json={
+            "content_markdown": "Three small words",
+            "base_revision_id": document["current_revision_id"],
+            "metadata": {},
+        },
+    )
+
+    response = canonical_client.get("/api/projects?view=summary")
+
+    assert response.status_code == 200
+    [summary] = response.json()["projects"]
+    assert summary["id"] == project["id"]
+    assert summary["document_counts"]["chapter"] == 1
+    assert summary["word_count"] == 3
+    assert summary["last_edited_document"]["id"] == document["id"]
+    assert summary["latest_export_at"] is None
+    assert canonical_client.get("/api/projects?view=bogus").status_code == 422
+
+
 def test_delete_project_with_snapshots(canonical_client: TestClient) -> None:
     """Regression test: projects with export snapshots must be deletable."""
     canonical_client.post("/api/session/guest")
@@ -217,6 +242,32 @@ def test_document_delete_with_snapshot_returns_conflict(
     )
     assert revisions.status_code == 200
     assert revisions.json()["revisions"]
+    paged = canonical_client.get(
+        f"/api/projects/{project['id']}/documents/{document['id']}/revisions",
+        params={"limit": 1},
+    ).json()
+    assert len(paged["revisions"]) == 1
+    assert paged["next_cursor"]
+    assert "content_markdown" not in paged["revisions"][0]
+    revision_url = (
+        f"/api/projects/{project['id']}/documents/{document['id']}"
+        f"/revisions/{paged['revisions'][0]['id']}"
+    )
+    content = canonical_client.get(revision_url)
+    assert content.status_code == 200
+    assert content.json()["content_markdown"] == "# Protected\n\nSnapshot content."
+    assert "immutable" in content.headers["cache-control"]
+    cached = canonical_client.get(
+        revision_url, headers={"If-None-Match": content.headers["etag"]}
+    )
+    assert cached.status_code == 304
+    assert canonical_client.get(f"{revision_url}-missing").status_code == 404
+    assert (
+        canonical_client.get(
+            f"/api/projects/{project['id']}/jobs", params={"cursor": "bogus"}
+        ).status_code
+        == 422
+    )
 
 
 def test_swagger_ui_assets_are_version_pinned_and_integrity_checked(
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import cast
+
+import anyio
+import pytest
+
+from src.apps.api import runtime as runtime_module
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.wal import WalCheckpoint
+
+
+def test_checkpoint_task_polls_wal_with_configured_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[tuple[StudioDatabase, int]] = []
+    database = cast(StudioDatabase, object())
+
+    def fake_maintain_wal(
+        target: StudioDatabase, threshold_bytes: int
+    ) -> list[WalCheckpoint]:
+        calls.append((target, threshold_bytes))
+        return [WalCheckpoint("PASSIVE", False, 4, 4, 0.1)]
+
+    monkeypatch.setattr(runtime_module, "maintain_wal", fake_maintain_wal)
+
+    async def run_briefly() -> None:
+        with anyio.move_on_after(0.2):
+            await runtime_module._checkpoint_wal(
+                database,
+                interval_seconds=0.05,
+                threshold_bytes=1024,
+            )
+
+    anyio.run(run_briefly)
+
+    assert len(calls) >= 2
+    assert all(call == (database, 1024) for call in calls)
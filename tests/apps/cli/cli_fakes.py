@@ -11,6 +11,8 @@ import pytest
 from sqlalchemy.sql.elements import TextClause
 
 from src.apps.cli import novel_engine
+from src.contexts.studio.infrastructure.fingerprint_repair import FingerprintReport
+from src.contexts.studio.infrastructure.revision_compaction import _BLOB_TOTALS
 
 
 class ProjectPayload(TypedDict):
@@ -20,10 +22,12 @@ class ProjectPayload(TypedDict):
 
 class FakeConnection:
     def __init__(self) -> None:
-        self.values: dict[str, str | int] = {
+        self.values: dict[str, str | int | tuple[int, ...]] = {
             "PRAGMA quick_check": "ok",
             "PRAGMA journal_mode": "wal",
             "PRAGMA foreign_keys": 1,
+            "PRAGMA wal_checkpoint(PASSIVE)": (0, 3, 3),
+            str(_BLOB_TOTALS): (4, 400, 1, 100),
         }
 
     def __enter__(self) -> FakeConnection:
@@ -46,9 +50,12 @@ class FakeConnection:
 
 @dataclass(frozen=True, slots=True)
 class FakeResult:
-    value: str | int
+    value: str | int | tuple[int, ...]
 
-    def scalar_one(self) -> str | int:
+    def scalar_one(self) -> str | int | tuple[int, ...]:
+        return self.value
+
+    def one(self) -> str | int | tuple[int, ...]:
         return self.value
 
 
@@ -64,6 +71,8 @@ class FakeDatabase:
     def __init__(self, path: Path | None) -> None:
         self.path = path
         self.engine = FakeEngine()
+        self.read_engine = self.engine
+        self.pragmas: dict[str, int | str] = {"cache_size": -16_384}
         self.disposed = False
 
     def dispose(self) -> None:
@@ -115,12 +124,22 @@ class FakeLoggingSettings:
     level: FakeLogLevel = field(default_factory=FakeLogLevel)
 
 
+@dataclass(frozen=True, slots=True)
+class FakeDatabaseSettings:
+    revision_storage: str = "full"
+    revision_keyframe_interval: int = 20
+    revision_compression_age_days: int = 30
+    revision_keep_all_hours: int = 24
+    revision_keep_hourly_days: int = 7
+
+
 @dataclass(frozen=True, slots=True)
 class FakeSettings:
     project_version: str = "0.test"
     base_dir: Path = Path(".")
     api: FakeApiSettings = field(default_factory=FakeApiSettings)
     logging: FakeLoggingSettings = field(default_factory=FakeLoggingSettings)
+    database: FakeDatabaseSettings = field(default_factory=FakeDatabaseSettings)
 
 
 def install_runtime(
@@ -139,3 +158,10 @@ def install_runtime(
 
 def fake_settings() -> FakeSettings:
     return FakeSettings()
+
+
+def fake_verify_fingerprints(
+    database: FakeDatabase, *, repair: bool = False
+) -> FingerprintReport:
+    del database
+    return FingerprintReport(projects=1, drifted=(), repaired=repair)
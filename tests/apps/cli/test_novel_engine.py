@@ -9,12 +9,14 @@ import pytest
 from alembic.config import Config
 
 from src.apps.cli import novel_engine
+from src.contexts.studio.infrastructure.repository.query_plans import QueryPlan
 from tests.apps.cli.cli_fakes import (
     FakeDatabase,
     FakeRuntime,
     FakeSettings,
     FakeStore,
     fake_settings,
+    fake_verify_fingerprints,
     install_runtime,
 )
 
@@ -134,6 +136,7 @@ def test_doctor_reports_database_health(
 
     monkeypatch.setattr(novel_engine, "_prepare_database", fake_prepare_database)
     monkeypatch.setattr(novel_engine, "get_settings", fake_settings)
+    monkeypatch.setattr(novel_engine, "verify_fingerprints", fake_verify_fingerprints)
 
     assert novel_engine.main(["doctor"]) == 0
 
@@ -145,12 +148,73 @@ def test_doctor_reports_database_health(
         "quick_check": "ok",
         "journal_mode": "wal",
         "foreign_keys": True,
+        "sqlite_pragmas": {"cache_size": -16_384},
+        "wal_bytes": 0,
+        "wal_checkpoint": {
+            "mode": "PASSIVE",
+            "busy": False,
+            "log_frames": 3,
+            "checkpointed_frames": 3,
+            "duration_ms": payload["wal_checkpoint"]["duration_ms"],
+        },
+        "revision_blobs": {
+            "revisions": 4,
+            "blobs": 1,
+            "logical_bytes": 400,
+            "stored_bytes": 100,
+            "saved_bytes": 300,
+        },
+        "content_fingerprints": {"projects": 1, "drifted": [], "repaired": False},
         "owner_configured": True,
     }
     assert prepared == [runtime.database]
     assert runtime.database.disposed is True
 
 
+def test_doctor_plans_fails_on_full_table_scan(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    runtime = FakeRuntime(
+        store=FakeStore(owner_configured=True),
+        database=FakeDatabase(path=tmp_path / "studio.sqlite3"),
+    )
+    install_runtime(monkeypatch, runtime)
+    monkeypatch.setattr(novel_engine, "_prepare_database", lambda _database: None)
+    monkeypatch.setattr(novel_engine, "get_settings", fake_settings)
+    monkeypatch.setattr(novel_engine, "verify_fingerprints", fake_verify_fingerprints)
+    explained: list[object] = []
+
+    def fake_explain_hot_queries(engine: object) -> list[QueryPlan]:
+        explained.append(engine)
+        return [
+            QueryPlan("job_page", ("SEARCH jobs USING INDEX ix_jobs_project_page",)),
+            QueryPlan("snapshot_reference", ("SCAN snapshot_documents",)),
+        ]
+
+    monkeypatch.setattr(novel_engine, "explain_hot_queries", fake_explain_hot_queries)
+
+    assert novel_engine.main(["doctor", "--plans"]) == 1
+
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["query_plans"] == [
+        {
+            "name": "job_page",
+            "steps": ["SEARCH jobs USING INDEX ix_jobs_project_page"],
+            "full_scans": [],
+            "temp_sorts": [],
+        },
+        {
+            "name": "snapshot_reference",
+            "steps": ["SCAN snapshot_documents"],
+            "full_scans": ["SCAN snapshot_documents"],
+            "temp_sorts": [],
+        },
+    ]
+    assert explained == [runtime.database.engine]
+
+
 def test_import_workspace_uses_owner_and_source(
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
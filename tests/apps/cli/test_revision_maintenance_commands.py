@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from src.apps.cli import novel_engine
+from src.contexts.studio.infrastructure.repository import RevisionStorage
+from src.contexts.studio.infrastructure.revision_compaction import CompactionReport
+from src.contexts.studio.infrastructure.revision_compression import CompressionReport
+from src.contexts.studio.infrastructure.revision_pruning import (
+    PruneReport,
+    RetentionPolicy,
+)
+from tests.apps.cli.cli_fakes import (
+    FakeDatabase,
+    FakeRuntime,
+    FakeStore,
+    fake_settings,
+    install_runtime,
+)
+
+
+def _install(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> FakeRuntime:
+    runtime = FakeRuntime(
+        store=FakeStore(),
+        database=FakeDatabase(path=tmp_path / "studio.sqlite3"),
+    )
+    install_runtime(monkeypatch, runtime)
+    monkeypatch.setattr(novel_engine, "_prepare_database", lambda _database: None)
+    monkeypatch.setattr(novel_engine, "get_settings", fake_settings)
+    return runtime
+
+
+def test_compact_revisions_overrides_configured_storage(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    runtime = _install(monkeypatch, tmp_path)
+    compacted: list[tuple[object, RevisionStorage]] = []
+
+    def fake_compact_revisions(
+        database: object, storage: RevisionStorage
+    ) -> CompactionReport:
+        compacted.append((database, storage))
+        return CompactionReport(documents=1, revisions=3, bytes_before=9)
+
+    monkeypatch.setattr(novel_engine, "compact_revisions", fake_compact_revisions)
+
+    assert novel_engine.main(["compact-revisions", "--mode", "delta"]) == 0
+
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["documents"] == 1
+    assert payload["bytes_before"] == 9
+    assert compacted == [
+        (runtime.database, RevisionStorage(mode="delta", keyframe_interval=20))
+    ]
+
+
+def test_compress_revisions_uses_configured_age_and_vacuums(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    runtime = _install(monkeypatch, tmp_path)
+    calls: list[tuple[str, object]] = []
+
+    def fake_compress(database: object, *, older_than: timedelta) -> CompressionReport:
+        calls.append(("compress", older_than))
+        assert database is runtime.database
+        return CompressionReport(candidates=2, compressed=2, bytes_before=90)
+
+    def fake_vacuum(database: object) -> None:
+        calls.append(("vacuum", database))
+
+    monkeypatch.setattr(novel_engine, "compress_cold_revisions", fake_compress)
+    monkeypatch.setattr(novel_engine, "vacuum_database", fake_vacuum)
+
+    assert novel_engine.main(["compress-revisions", "--vacuum"]) == 0
+
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["compressed"] == 2
+    assert calls == [
+        ("compress", timedelta(days=30)),
+        ("vacuum", runtime.database),
+    ]
+
+
+def test_prune_revisions_dry_run_uses_configured_policy(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    runtime = _install(monkeypatch, tmp_path)
+    pruned: list[tuple[object, RetentionPolicy, bool]] = []
+
+    def fake_prune(
+        database: object, policy: RetentionPolicy, *, dry_run: bool
+    ) -> PruneReport:
+        pruned.append((database, policy, dry_run))
+        return PruneReport(dry_run=dry_run, pruned_revision_numbers={"doc": [2, 3]})
+
+    monkeypatch.setattr(novel_engine, "prune_revisions", fake_prune)
+
+    assert novel_engine.main(["prune-revisions", "--dry-run"]) == 0
+
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["dry_run"] is True
+    assert payload["pruned_revision_numbers"] == {"doc": [2, 3]}
+    assert pruned == [(runtime.database, RetentionPolicy(), True)]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.apps.cli import novel_engine
+from src.contexts.studio.infrastructure.search_maintenance import (
+    SearchMaintenanceReport,
+    SearchVerifyReport,
+)
+from src.contexts.studio.infrastructure.search_reindex import SearchReindexReport
+from tests.apps.cli.cli_fakes import (
+    FakeDatabase,
+    FakeRuntime,
+    FakeStore,
+    fake_settings,
+    install_runtime,
+)
+
+Progress = Callable[[int, int], None] | None
+
+
+def _install(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> FakeRuntime:
+    runtime = FakeRuntime(
+        store=FakeStore(),
+        database=FakeDatabase(path=tmp_path / "studio.sqlite3"),
+    )
+    install_runtime(monkeypatch, runtime)
+    monkeypatch.setattr(novel_engine, "_prepare_database", lambda _database: None)
+    monkeypatch.setattr(novel_engine, "get_settings", fake_settings)
+    return runtime
+
+
+def _verified(*, missing: int = 0, integrity: str = "ok") -> SearchVerifyReport:
+    return SearchVerifyReport(
+        documents=3,
+        indexed=3 - missing,
+        missing=missing,
+        stale=0,
+        orphaned=0,
+        options_stale=False,
+        integrity=integrity,
+    )
+
+
+def test_reindex_rebuilds_with_progress_and_reports_both_checks(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    runtime = _install(monkeypatch, tmp_path)
+    calls: list[tuple[object, bool, int]] = []
+
+    def fake_maintain(
+        database: object, *, rebuild: bool, chunk_size: int, progress: Progress
+    ) -> SearchMaintenanceReport:
+        calls.append((database, rebuild, chunk_size))
+        assert progress is not None
+        progress(2, 3)
+        return SearchMaintenanceReport(
+            before=_verified(missing=1),
+            reindex=SearchReindexReport(
+                tokenizer="unicode61",
+                documents=3,
+                reconciled=1,
+                repaired=1,
+                duration_ms=5.0,
+            ),
+            optimize_ms=1.5,
+            after=_verified(),
+        )
+
+    monkeypatch.setattr(novel_engine, "maintain_search", fake_maintain)
+
+    assert novel_engine.main(["reindex", "--chunk-size", "50"]) == 0
+
+    captured = capsys.readouterr()
+    payload = json.loads(captured.out)
+    assert payload["before"]["missing"] == 1
+    assert payload["reindex"]["repaired"] == 1
+    assert payload["after"]["integrity"] == "ok"
+    assert "reindex: 2/3 documents" in captured.err
+    assert calls == [(runtime.database, True, 50)]
+
+
+def test_reindex_verify_only_fails_on_drift_without_writing(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+) -> None:
+    _install(monkeypatch, tmp_path)
+
+    def unexpected_maintain(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("--verify-only must not rebuild the index")
+
+    monkeypatch.setattr(novel_engine, "maintain_search", unexpected_maintain)
+    monkeypatch.setattr(
+        novel_engine, "verify_search", lambda _database: _verified(missing=2)
+    )
+
+    assert novel_engine.main(["reindex", "--verify-only"]) == 1
+
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["missing"] == 2
+    assert payload["indexed"] == 1
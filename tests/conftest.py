@@ -30,11 +30,15 @@ def pytest_collection_modifyitems(
 
     enabled_markers = {
         "requires_dashscope": os.getenv("ENABLE_DASHSCOPE_TESTS") == "1",
+        "performance": os.getenv("ENABLE_PERFORMANCE_TESTS") == "1",
     }
     skip_messages = {
         "requires_dashscope": (
             "DashScope integration tests are opt-in; set ENABLE_DASHSCOPE_TESTS=1 to run them."
         ),
+        "performance": (
+            "Benchmarks are opt-in; set ENABLE_PERFORMANCE_TESTS=1 to run them."
+        ),
     }
 
     for item in items:
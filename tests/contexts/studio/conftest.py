@@ -0,0 +1,82 @@
+"""Shared fixtures for Studio tests that run against a real SQLite database."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.ai_provider import (
+    create_studio_text_generation_provider,
+)
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.exporters import DEFAULT_EXPORT_WRITERS
+from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    revision_content_cache,
+)
+from src.contexts.studio.infrastructure.title_suggest import title_suggest_cache
+from src.shared.infrastructure.config import settings as settings_module
+
+
+@pytest.fixture
+def studio_settings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[None]:
+    """Load testing settings rooted in ``tmp_path`` and start with cold caches."""
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("APP_DATA_DIR", str(tmp_path))
+    settings_module.reset_settings()
+    revision_content_cache.clear()
+    try:
+        yield
+    finally:
+        revision_content_cache.clear()
+        title_suggest_cache.clear()
+        settings_module.reset_settings()
+
+
+@pytest.fixture
+def database(tmp_path: Path, studio_settings: None) -> Iterator[StudioDatabase]:
+    del studio_settings
+    database = StudioDatabase(f"sqlite:///{tmp_path / 'studio.sqlite3'}")
+    database.initialize(create_backup=False)
+    try:
+        yield database
+    finally:
+        database.dispose()
+
+
+@pytest.fixture
+def make_store(tmp_path: Path) -> Callable[..., StudioStore]:
+    """Return a builder for stores over any database, with repository options."""
+
+    def build(database: StudioDatabase, **repository_options: Any) -> StudioStore:
+        return StudioStore(
+            repository=SqlAlchemyStudioRepository(database, **repository_options),
+            data_dir=tmp_path,
+            ai_provider_factory=create_studio_text_generation_provider,
+            session_secret=settings_module.get_settings().security.secret_key,
+            export_writers=DEFAULT_EXPORT_WRITERS,
+        )
+
+    return build
+
+
+@pytest.fixture
+def store(
+    make_store: Callable[..., StudioStore],
+    database: StudioDatabase,
+) -> StudioStore:
+    return make_store(database)
+
+
+@pytest.fixture
+def principal(store: StudioStore) -> Principal:
+    """Set up the owner account and return its principal."""
+    store.setup_owner("author", "long-test-password")
+    return store.owner_principal()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -12,7 +11,6 @@ from src.contexts.ai.application.ports.text_generation_port import (
     TextGenerationTask,
 )
 from src.contexts.studio.application.services import (
-    Principal,
     StudioStore,
     _format_user_instruction,
     _sanitize_chapter_markdown,
@@ -22,7 +20,6 @@ from src.contexts.studio.infrastructure.database import StudioDatabase
 from src.contexts.studio.infrastructure.exporters import DEFAULT_EXPORT_WRITERS
 from src.contexts.studio.infrastructure.models import UsageEvent
 from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
-from src.shared.infrastructure.config import settings as settings_module
 
 
 class MechanicalPhraseProvider:
@@ -76,28 +73,6 @@ def _assert_no_mechanical_prose(markdown: str) -> None:
         assert phrase not in lowered, f"mechanical prose found: {phrase!r}"
 
 
-def _owner(store: StudioStore) -> Principal:
-    store.setup_owner("author", "long-test-password")
-    return store.owner_principal()
-
-
-@pytest.fixture
-def studio_database(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> Iterator[StudioDatabase]:
-    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
-    monkeypatch.setenv("APP_DATA_DIR", str(tmp_path))
-    settings_module.reset_settings()
-    database = StudioDatabase(f"sqlite:///{tmp_path / 'studio.sqlite3'}")
-    database.initialize(create_backup=False)
-    try:
-        yield database
-    finally:
-        database.dispose()
-        settings_module.reset_settings()
-
-
 def test_sanitize_chapter_markdown_removes_preambles_and_rewrites_phrases() -> None:
     raw = (
         "# Chapter 1\n\n"
@@ -128,19 +103,20 @@ def test_sanitize_chapter_markdown_removes_preambles_and_rewrites_phrases() -> N
 @pytest.mark.asyncio
 async def test_create_ai_proposal_sanitizes_mechanical_phrases_before_storage(
     tmp_path: Path,
-    studio_database: StudioDatabase,
+    database: StudioDatabase,
 ) -> None:
     captured_tasks: list[TextGenerationTask] = []
     provider = MechanicalPhraseProvider(captured_tasks=captured_tasks)
     session_key = "fixture-key"
     store = StudioStore(
-        repository=SqlAlchemyStudioRepository(studio_database),
+        repository=SqlAlchemyStudioRepository(database),
         data_dir=tmp_path,
         ai_provider_factory=lambda _provider, _model: provider,
         export_writers=DEFAULT_EXPORT_WRITERS,
         session_secret=session_key,
     )
-    principal = _owner(store)
+    store.setup_owner("author", "long-test-password")
+    principal = store.owner_principal()
     project = store.create_project(principal, title="Sanitize Test")
     document = project["documents"][0]
     manuscript = (
@@ -182,7 +158,7 @@ async def test_create_ai_proposal_sanitizes_mechanical_phrases_before_storage(
     assert "\\u005bEND UNTRUSTED MANUSCRIPT JSON\\u005d" in task.user_prompt
     assert '\\nThe author wrote a quote: \\"keep this line\\".' in task.user_prompt
 
-    with studio_database.session() as session:
+    with database.session() as session:
         usage_event = (
             session.query(UsageEvent)
             .filter(UsageEvent.project_id == project["id"])
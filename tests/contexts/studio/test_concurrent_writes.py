@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+
+import anyio
+
+from src.contexts.studio.application.services import Principal, StudioStore
+
+
+async def test_concurrent_worker_thread_writes_keep_the_version_exact(
+    store: StudioStore,
+    principal: Principal,
+) -> None:
+    project_id = store.create_project(principal, title="Busy")["id"]
+    chapters = [
+        store.create_document(
+            principal, project_id, kind="chapter", title=f"Part {number}"
+        )
+        for number in range(1, 5)
+    ]
+    start = store.project_version(principal, project_id)
+    rounds = 12
+
+    async def save_loop(document: dict[str, Any]) -> None:
+        for draft in range(rounds):
+            document = await anyio.to_thread.run_sync(
+                partial(
+                    store.save_document,
+                    principal,
+                    project_id,
+                    document["id"],
+                    content_markdown=f"Draft {draft} of {document['title']}.",
+                    base_revision_id=document["current_revision_id"],
+                )
+            )
+
+    def move_loop() -> None:
+        for step in range(rounds):
+            anchor = {"after_id": chapters[-1]["id"]}
+            if step % 2:
+                anchor = {"before_id": chapters[1]["id"]}
+            store.move_document(principal, project_id, chapters[0]["id"], **anchor)
+
+    async with anyio.create_task_group() as tasks:
+        for chapter in chapters:
+            tasks.start_soon(save_loop, chapter)
+        tasks.start_soon(partial(anyio.to_thread.run_sync, move_loop))
+
+    writes = rounds * len(chapters) + rounds
+    assert store.project_version(principal, project_id) == start + writes
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import text
+
+from alembic import command
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.content_fingerprint import fingerprint
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.fingerprint_repair import (
+    FingerprintReport,
+    verify_fingerprints,
+)
+from src.shared.infrastructure.config import settings as settings_module
+
+
+def _fingerprints(database: StudioDatabase, project_id: str) -> tuple[str, str]:
+    """Return the maintained fingerprint and one recomputed from scratch."""
+    with database.read_session() as session:
+        stored = session.execute(
+            text("SELECT content_fingerprint FROM projects WHERE id = :id"),
+            {"id": project_id},
+        ).scalar_one()
+        members = session.execute(
+            text(
+                "SELECT d.id, r.content_sha256, d.position FROM documents d "
+                "JOIN document_revisions r ON r.id = d.current_revision_id "
+                "WHERE d.project_id = :id"
+            ),
+            {"id": project_id},
+        )
+        return stored, fingerprint(tuple(row) for row in members)
+
+
+def _edit(
+    store: StudioStore, principal: Principal, document: dict[str, Any], body: str
+) -> None:
+    store.save_document(
+        principal,
+        document["project_id"],
+        document["id"],
+        content_markdown=body,
+        base_revision_id=store.get_document(
+            principal, document["project_id"], document["id"]
+        )["current_revision_id"],
+    )
+
+
+def test_fingerprint_tracks_every_document_write(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Tracked")
+    seed = project["documents"][0]
+    created = store.create_documents(
+        principal,
+        project["id"],
+        [{"kind": "chapter", "title": f"Chapter {n}"} for n in range(2, 6)],
+    )
+    note = store.create_document(principal, project["id"], kind="note", title="N")
+    _edit(store, principal, seed, "# Chapter 1\n\nRevised.")
+    store.move_document(
+        principal, project["id"], created[3]["id"], before_id=seed["id"]
+    )
+    store.reorder_documents(
+        principal,
+        project["id"],
+        [note["id"], seed["id"], *(item["id"] for item in created)],
+    )
+    store.delete_document(principal, project["id"], created[1]["id"])
+
+    stored, recomputed = _fingerprints(database, project["id"])
+    assert stored == recomputed
+
+
+def test_verify_fingerprints_repairs_a_drifted_project(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    healthy = store.create_project(principal, title="Healthy")
+    drifted = store.create_project(principal, title="Drifted")
+    with database.session() as session:
+        session.execute(
+            text("UPDATE projects SET content_fingerprint = :value WHERE id = :id"),
+            {"value": "f" * 32, "id": drifted["id"]},
+        )
+
+    report = verify_fingerprints(database)
+    assert report == FingerprintReport(
+        projects=2, drifted=(drifted["id"],), repaired=False
+    )
+    assert not report.healthy
+    assert _fingerprints(database, drifted["id"])[0] == "f" * 32
+
+    repaired = verify_fingerprints(database, repair=True)
+    assert repaired.repaired and repaired.healthy
+    for project in (healthy, drifted):
+        stored, recomputed = _fingerprints(database, project["id"])
+        assert stored == recomputed
+    assert verify_fingerprints(database).drifted == ()
+
+
+def test_identical_states_reuse_one_snapshot(
+    store: StudioStore,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Reused")
+    document = project["documents"][0]
+    _edit(store, principal, document, "# Chapter 1\n\n" + "Words. " * 300)
+
+    manual = store.create_snapshot(principal, project["id"], reason="manual")
+    review = store.review_project(principal, project["id"])
+    first = store.export_project(principal, project["id"], export_format="markdown")
+    # Saving the same text again is not a change.
+    _edit(store, principal, document, "# Chapter 1\n\n" + "Words. " * 300)
+    second = store.export_project(principal, project["id"], export_format="markdown")
+    _edit(store, principal, document, "# Chapter 1\n\nShorter.")
+    third = store.export_project(principal, project["id"], export_format="markdown")
+
+    assert review["snapshot_id"] == manual["id"]
+    assert first["snapshot_id"] == second["snapshot_id"] == manual["id"]
+    assert third["snapshot_id"] != manual["id"]
+
+
+def test_only_the_latest_snapshot_is_reused_and_manual_ones_never_are(
+    store: StudioStore,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="History")
+    document = project["documents"][0]
+    _edit(store, principal, document, "# Chapter 1\n\nFirst draft.")
+
+    first = store.create_snapshot(principal, project["id"], reason="manual")
+    again = store.create_snapshot(principal, project["id"], reason="manual")
+    _edit(store, principal, document, "# Chapter 1\n\nSecond draft.")
+    second = store.export_project(principal, project["id"], export_format="markdown")
+    # Back to the text ``first`` froze, but ``second`` is the latest snapshot.
+    _edit(store, principal, document, "# Chapter 1\n\nFirst draft.")
+    reverted = store.review_project(principal, project["id"])
+    repeated = store.export_project(principal, project["id"], export_format="markdown")
+
+    assert again["id"] != first["id"]
+    assert reverted["snapshot_id"] not in {first["id"], again["id"]}
+    assert reverted["snapshot_id"] != second["snapshot_id"]
+    assert repeated["snapshot_id"] == reverted["snapshot_id"]
+
+
+def test_migration_backfills_fingerprints(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_store: Callable[..., StudioStore],
+) -> None:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'migrated.sqlite3'}")
+    settings_module.reset_settings()
+    config = Config("alembic.ini")
+    try:
+        command.upgrade(config, "head")
+        database = StudioDatabase(settings_module.get_settings().database.url)
+        try:
+            store = make_store(database)
+            store.setup_owner("author", "long-test-password")
+            principal = store.owner_principal()
+            project = store.create_project(principal, title="Backfilled")
+            _edit(store, principal, project["documents"][0], "# Backfilled\n")
+            store.create_snapshot(principal, project["id"], reason="manual")
+            expected = _fingerprints(database, project["id"])[0]
+            database.dispose()
+
+            command.downgrade(config, "0009_revision_blob_compression")
+            command.upgrade(config, "head")
+
+            stored, recomputed = _fingerprints(database, project["id"])
+            with database.read_session() as session:
+                snapshot = session.execute(
+                    text("SELECT content_fingerprint FROM project_snapshots")
+                ).scalar_one()
+            assert stored == recomputed == snapshot == expected
+        finally:
+            database.dispose()
+    finally:
+        settings_module.reset_settings()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import cast
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+from src.contexts.studio.infrastructure.database import (
+    StudioDatabase,
+    create_studio_database,
+)
+from src.shared.infrastructure.config import settings as settings_module
+
+
+@pytest.fixture
+def database(tmp_path: Path, studio_settings: None) -> Iterator[StudioDatabase]:
+    del studio_settings
+    database = StudioDatabase(
+        f"sqlite:///{tmp_path / 'studio.sqlite3'}",
+        pool_size=3,
+        max_overflow=2,
+        pool_timeout=7,
+    )
+    database.initialize(create_backup=False)
+    try:
+        yield database
+    finally:
+        database.dispose()
+
+
+def test_writer_is_single_connection_and_readers_use_pool_settings(
+    database: StudioDatabase,
+) -> None:
+    writer_pool = cast(QueuePool, database.engine.pool)
+    reader_pool = cast(QueuePool, database.read_engine.pool)
+
+    assert writer_pool.size() == 1
+    assert writer_pool._max_overflow == 0
+    assert reader_pool.size() == 3
+    assert reader_pool._max_overflow == 2
+    assert reader_pool.timeout() == 7
+
+
+def test_reader_sessions_are_query_only(database: StudioDatabase) -> None:
+    with database.read_session() as session:
+        assert session.execute(text("PRAGMA query_only")).scalar_one() == 1
+        assert session.execute(text("PRAGMA journal_mode")).scalar_one() == "wal"
+
+    with pytest.raises(OperationalError), database.read_session() as session:
+        session.execute(text("DELETE FROM owners"))
+
+    with database.session() as session:
+        assert session.execute(text("PRAGMA query_only")).scalar_one() == 0
+
+
+def test_reader_observes_committed_writes(database: StudioDatabase) -> None:
+    with database.session() as session:
+        session.execute(
+            text(
+                "INSERT INTO owners (id, username, password_hash, created_at) "
+                "VALUES ('owner-1', 'author', 'hash', CURRENT_TIMESTAMP)"
+            )
+        )
+
+    with database.read_session() as session:
+        count = session.execute(text("SELECT count(*) FROM owners")).scalar_one()
+
+    assert count == 1
+
+
+def test_create_studio_database_applies_pool_settings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'configured.sqlite3'}")
+    monkeypatch.setenv("DB_POOL_SIZE", "4")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "9")
+    settings_module.reset_settings()
+    try:
+        database = create_studio_database()
+        try:
+            reader_pool = cast(QueuePool, database.read_engine.pool)
+            assert reader_pool.size() == 4
+            assert reader_pool.timeout() == 9
+            assert cast(QueuePool, database.engine.pool).size() == 1
+        finally:
+            database.dispose()
+    finally:
+        settings_module.reset_settings()
+
+
+def test_in_memory_database_shares_one_engine() -> None:
+    database = StudioDatabase("sqlite:///:memory:")
+    try:
+        assert database.read_engine is database.engine
+    finally:
+        database.dispose()
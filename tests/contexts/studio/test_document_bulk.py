@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event, text
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    revision_content_cache,
+)
+
+
+def _count_writes(database: StudioDatabase) -> dict[str, int]:
+    counts = {"commits": 0, "statements": 0}
+
+    @event.listens_for(database.engine, "commit")
+    def _commit(_connection: Any) -> None:
+        counts["commits"] += 1
+
+    @event.listens_for(database.engine, "before_cursor_execute")
+    def _statement(*_args: Any) -> None:
+        counts["statements"] += 1
+
+    return counts
+
+
+def test_bulk_create_writes_every_document_in_one_transaction(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Imported")
+    chapters = [
+        {"kind": "chapter", "title": f"Part {index}", "content_markdown": body}
+        for index, body in enumerate(["Shared opening."] * 2 + ["Third."] * 298)
+    ]
+    counts = _count_writes(database)
+
+    created = store.create_documents(principal, project["id"], chapters)
+
+    assert counts["commits"] == 1
+    # Statement count must not grow with the number of documents.
+    assert counts["statements"] < 20
+    # The seed chapter already holds the first slot.
+    assert [document["position"] for document in created] == [
+        slot * 1024 for slot in range(2, 302)
+    ]
+    revision_content_cache.clear()
+    fetched = store.get_document(principal, project["id"], created[-1]["id"])
+    assert fetched["content_markdown"] == "Third."
+    assert store.search(principal, project["id"], "opening")[0]["document_id"] in {
+        created[0]["id"],
+        created[1]["id"],
+    }
+    with database.read_session() as session:
+        refcounts = session.execute(
+            text("SELECT refcount FROM revision_blobs ORDER BY refcount")
+        ).scalars()
+        assert list(refcounts)[-2:] == [2, 298]
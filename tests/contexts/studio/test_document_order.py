@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import event, update
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.domain.exceptions import InvalidOperation
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.models import Document
+
+
+def _chapters(
+    store: StudioStore, principal: Principal, count: int
+) -> tuple[str, list[str]]:
+    project = store.create_project(principal, title="Ordered")
+    created = store.create_documents(
+        principal,
+        project["id"],
+        [{"kind": "chapter", "title": f"Chapter {n}"} for n in range(2, count + 1)],
+    )
+    ids = [project["documents"][0]["id"], *(item["id"] for item in created)]
+    return project["id"], ids
+
+
+def _order(store: StudioStore, principal: Principal, project_id: str) -> list[str]:
+    documents = store.get_project(principal, project_id)["documents"]
+    return [document["title"] for document in documents]
+
+
+def _document_updates(database: StudioDatabase) -> list[int]:
+    rows = [0]
+
+    @event.listens_for(database.engine, "after_cursor_execute")
+    def _count(_conn: Any, cursor: Any, statement: str, *_args: Any) -> None:
+        if statement.startswith("UPDATE documents"):
+            rows[0] += cursor.rowcount
+
+    return rows
+
+
+def test_move_rewrites_only_the_moved_document(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project_id, ids = _chapters(store, principal, 500)
+    updated = _document_updates(database)
+
+    moved = store.move_document(principal, project_id, ids[10], before_id=ids[9])
+    store.move_document(principal, project_id, ids[0], after_id=ids[-1])
+
+    assert updated[0] == 2
+    assert moved["position"] == (9 * 1024 + 10 * 1024) // 2
+    order = _order(store, principal, project_id)
+    assert order[7:10] == ["Chapter 9", "Chapter 11", "Chapter 10"]
+    assert order[-2:] == ["Chapter 500", "Chapter 1"]
+
+
+def test_imported_chapters_are_spaced_so_a_move_rewrites_one_row(
+    tmp_path: Path,
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    legacy = tmp_path / "legacy"
+    chapters = legacy / "manuscript" / "chapters"
+    chapters.mkdir(parents=True)
+    (legacy / "story.yaml").write_text("title: Imported\n", encoding="utf-8")
+    for number in range(1, 4):
+        (chapters / f"chapter-{number:03d}.md").write_text(
+            f"# {number}\n", encoding="utf-8"
+        )
+    project = store.import_legacy_workspace(principal, legacy)
+    ids = [document["id"] for document in project["documents"]]
+    assert [document["position"] for document in project["documents"]] == [
+        1024,
+        2048,
+        3072,
+    ]
+    updated = _document_updates(database)
+
+    moved = store.move_document(principal, project["id"], ids[2], before_id=ids[1])
+
+    assert updated[0] == 1
+    assert moved["position"] == (1024 + 2048) // 2
+    assert _order(store, principal, project["id"]) == [
+        "Chapter 1",
+        "Chapter 3",
+        "Chapter 2",
+    ]
+
+
+def test_move_rebalances_when_the_gap_runs_out(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project_id, ids = _chapters(store, principal, 4)
+    # Legacy rows were numbered densely, leaving no room between neighbours.
+    with database.session() as session:
+        for position, document_id in enumerate(ids, start=1):
+            session.execute(
+                update(Document)
+                .where(Document.id == document_id)
+                .values(position=position)
+            )
+
+    moved = store.move_document(principal, project_id, ids[3], before_id=ids[1])
+
+    assert moved["position"] == 2 * 1024
+    assert _order(store, principal, project_id) == [
+        "Chapter 1",
+        "Chapter 4",
+        "Chapter 2",
+        "Chapter 3",
+    ]
+    with pytest.raises(InvalidOperation):
+        store.move_document(principal, project_id, ids[0], after_id=ids[0])
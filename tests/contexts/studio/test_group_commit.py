@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Any
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.domain.exceptions import RevisionConflict
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.group_commit import GroupCommitWriter
+
+
+@pytest.fixture
+def writer(database: StudioDatabase) -> Iterator[GroupCommitWriter]:
+    writer = GroupCommitWriter(database, window_seconds=0.05)
+    try:
+        yield writer
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+def store(
+    make_store: Callable[..., StudioStore],
+    database: StudioDatabase,
+    writer: GroupCommitWriter,
+) -> StudioStore:
+    return make_store(database, group_commit=writer)
+
+
+def _commit_counter(database: StudioDatabase) -> list[int]:
+    commits = [0]
+
+    @event.listens_for(database.engine, "commit")
+    def _count(_connection: Any) -> None:
+        commits[0] += 1
+
+    return commits
+
+
+def test_concurrent_saves_share_one_commit(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Grouped")
+    documents = [
+        store.create_document(principal, project["id"], kind="chapter", title=f"C{i}")
+        for i in range(6)
+    ]
+    commits = _commit_counter(database)
+    barrier = Barrier(len(documents))
+
+    def save(document: dict[str, Any]) -> dict[str, Any]:
+        barrier.wait()
+        return store.save_document(
+            principal,
+            project["id"],
+            document["id"],
+            content_markdown=f"Grouped text for {document['title']}",
+            base_revision_id=document["current_revision_id"],
+        )
+
+    with ThreadPoolExecutor(max_workers=len(documents)) as pool:
+        saved = list(pool.map(save, documents))
+
+    assert commits[0] < len(documents)
+    for before, after in zip(documents, saved, strict=True):
+        assert after["current_revision_id"] != before["current_revision_id"]
+        assert store.get_document(principal, project["id"], before["id"]) == after
+
+
+def test_conflicting_save_fails_alone_inside_a_batch(
+    store: StudioStore, principal: Principal
+) -> None:
+    project = store.create_project(principal, title="Conflicts")
+    document = project["documents"][0]
+    barrier = Barrier(2)
+
+    def save(content: str) -> dict[str, Any] | RevisionConflict:
+        barrier.wait()
+        try:
+            return store.save_document(
+                principal,
+                project["id"],
+                document["id"],
+                content_markdown=content,
+                base_revision_id=document["current_revision_id"],
+            )
+        except RevisionConflict as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        outcomes = list(pool.map(save, ["first", "second"]))
+
+    conflicts = [item for item in outcomes if isinstance(item, RevisionConflict)]
+    saved = [item for item in outcomes if isinstance(item, dict)]
+    assert len(conflicts) == 1
+    assert len(saved) == 1
+    assert conflicts[0].current_revision_id == saved[0]["current_revision_id"]
+    revisions = store.list_revisions(principal, project["id"], document["id"])[
+        "revisions"
+    ]
+    assert len(revisions) == 2
+
+
+def test_failed_write_rolls_back_only_its_savepoint(
+    database: StudioDatabase,
+    writer: GroupCommitWriter,
+) -> None:
+    insert = text(
+        "INSERT INTO owners (id, username, password_hash, created_at) "
+        "VALUES (:id, :id, 'hash', CURRENT_TIMESTAMP)"
+    )
+
+    def failing(session: Session) -> None:
+        session.execute(insert, {"id": "rolled-back"})
+        raise RuntimeError("boom")
+
+    failed = writer.submit(failing)
+    kept = writer.submit(lambda session: session.execute(insert, {"id": "kept"}))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        failed.result()
+    kept.result()
+    with database.read_session() as session:
+        owners = session.execute(text("SELECT id FROM owners")).scalars().all()
+    assert owners == ["kept"]
+
+
+def test_closed_writer_rejects_new_work(writer: GroupCommitWriter) -> None:
+    writer.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.submit(lambda _session: None)
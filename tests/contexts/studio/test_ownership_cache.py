@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.domain.exceptions import NotFound
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository.ownership import ownership_scope
+
+
+@pytest.fixture
+def statements(database: StudioDatabase) -> Iterator[list[str]]:
+    """Record every SQL statement sent to the writer and reader engines."""
+    executed: list[str] = []
+    engines = {database.engine, database.read_engine}
+
+    def _record(*args: Any) -> None:
+        executed.append(args[2])
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield executed
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", _record)
+
+
+def _scope_checks(statements: list[str]) -> int:
+    return sum(
+        1
+        for statement in statements
+        if "FROM projects" in statement
+        and "projects.owner_id = " in statement
+        and "projects.id = " in statement
+    )
+
+
+def _project_with_chapter(store: StudioStore, principal: Principal) -> dict[str, Any]:
+    project = store.create_project(principal, title="Scoped")
+    document = project["documents"][0]
+    store.save_document(
+        principal,
+        project["id"],
+        document["id"],
+        content_markdown="# One\n\nText.",
+        base_revision_id=document["current_revision_id"],
+    )
+    return project
+
+
+def test_export_checks_project_scope_once_per_request(
+    store: StudioStore,
+    statements: list[str],
+    principal: Principal,
+) -> None:
+    project = _project_with_chapter(store, principal)
+
+    statements.clear()
+    store.export_project(principal, project["id"], export_format="markdown")
+    unscoped = _scope_checks(statements)
+
+    statements.clear()
+    with ownership_scope():
+        store.export_project(principal, project["id"], export_format="markdown")
+    scoped = _scope_checks(statements)
+
+    assert unscoped >= 3
+    assert scoped == 1
+
+
+def test_verified_projects_are_not_shared_across_principals(
+    store: StudioStore,
+    principal: Principal,
+) -> None:
+    project = _project_with_chapter(store, principal)
+    _token, _csrf, guest = store.create_guest_session()
+
+    with ownership_scope():
+        store.get_project(principal, project["id"])
+        with pytest.raises(NotFound):
+            store.get_project(guest, project["id"])
+
+
+def test_deleted_project_is_forgotten_within_the_scope(
+    store: StudioStore, principal: Principal
+) -> None:
+    project = _project_with_chapter(store, principal)
+
+    with ownership_scope():
+        store.list_jobs(principal, project["id"])
+        store.delete_project(principal, project["id"])
+        with pytest.raises(NotFound):
+            store.list_jobs(principal, project["id"])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import text
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.domain.exceptions import InvalidOperation
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
+
+
+def test_revision_pages_walk_history_newest_first(
+    store: StudioStore, principal: Principal
+) -> None:
+    project = store.create_project(principal, title="Paged")
+    document = project["documents"][0]
+    revision_id = document["current_revision_id"]
+    for index in range(4):
+        revision_id = store.save_document(
+            principal,
+            project["id"],
+            document["id"],
+            content_markdown=f"Draft {index}",
+            base_revision_id=revision_id,
+        )["current_revision_id"]
+
+    numbers: list[int] = []
+    cursor: str | None = None
+    while True:
+        page = store.list_revisions(
+            principal, project["id"], document["id"], limit=2, cursor=cursor
+        )
+        assert len(page["revisions"]) <= 2
+        numbers.extend(item["revision_number"] for item in page["revisions"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert numbers == [5, 4, 3, 2, 1]
+
+
+def test_snapshot_pages_break_timestamp_ties_by_id(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Ties")
+    repository = SqlAlchemyStudioRepository(database)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    document = project["documents"][0]
+    revision_id = document["current_revision_id"]
+    created: set[str] = set()
+    for index in range(5):
+        # Identical states share a snapshot, so change the text every time.
+        revision_id = store.save_document(
+            principal,
+            project["id"],
+            document["id"],
+            content_markdown=f"Draft {index}",
+            base_revision_id=revision_id,
+        )["current_revision_id"]
+        snapshot = repository.create_snapshot(
+            project["id"],
+            owner_id=principal.owner_id,
+            guest_session_id=None,
+            reason="manual",
+            now=now,
+        )
+        created.add(snapshot.id)
+
+    first = store.list_snapshots(principal, project["id"], limit=3)
+    second = store.list_snapshots(
+        principal, project["id"], limit=3, cursor=first["next_cursor"]
+    )
+
+    seen = [item["id"] for item in first["snapshots"] + second["snapshots"]]
+    assert sorted(seen) == sorted(created)
+    assert seen == sorted(created, reverse=True)
+    assert second["next_cursor"] is None
+
+
+def test_malformed_cursor_is_rejected(store: StudioStore, principal: Principal) -> None:
+    project = store.create_project(principal, title="Cursor")
+
+    with pytest.raises(InvalidOperation, match="cursor"):
+        store.list_jobs(principal, project["id"], limit=5, cursor="not-a-cursor")
+
+
+def test_job_listing_uses_composite_page_index(database: StudioDatabase) -> None:
+    with database.read_session() as session:
+        plan = session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM jobs WHERE project_id = 'p' "
+                "AND (created_at, id) < ('2026-01-01', 'z') "
+                "ORDER BY created_at DESC, id DESC LIMIT 51"
+            )
+        ).all()
+
+    details = " ".join(str(row[-1]) for row in plan)
+    assert "ix_jobs_project_page" in details
+    assert "TEMP B-TREE" not in details
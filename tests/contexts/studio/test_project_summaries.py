@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.models import DocumentRevision
+
+
+def test_summaries_aggregate_counts_words_and_activity(
+    store: StudioStore,
+    principal: Principal,
+) -> None:
+    empty = store.create_project(principal, title="Empty")
+    project = store.create_project(principal, title="Busy")
+    chapter = project["documents"][0]
+    store.save_document(
+        principal,
+        project["id"],
+        chapter["id"],
+        content_markdown="Draft one two",
+        base_revision_id=chapter["current_revision_id"],
+    )
+    note = store.create_document(principal, project["id"], kind="note", title="Idea")
+    store.save_document(
+        principal,
+        project["id"],
+        note["id"],
+        content_markdown="four more words here",
+        base_revision_id=note["current_revision_id"],
+    )
+    snapshot = store.create_snapshot(principal, project["id"], reason="manual")
+    export = store.export_project(principal, project["id"], export_format="markdown")
+    loaded: list[str] = []
+
+    def _record(target: DocumentRevision, _context: Any) -> None:
+        loaded.append(target.id)
+
+    event.listen(DocumentRevision, "load", _record)
+    try:
+        summaries = store.list_project_summaries(principal)
+    finally:
+        event.remove(DocumentRevision, "load", _record)
+
+    assert loaded == []
+    busy, idle = summaries
+    assert busy["id"] == project["id"]
+    assert busy["document_counts"]["chapter"] == 1
+    assert busy["document_counts"]["note"] == 1
+    assert sum(busy["document_counts"].values()) == 2
+    assert busy["word_count"] == 7
+    assert busy["last_edited_document"]["id"] == note["id"]
+    assert busy["last_edited_document"]["title"] == "Idea"
+    assert busy["latest_snapshot_at"] >= snapshot["created_at"]
+    assert busy["latest_export_at"] == export["created_at"]
+    assert "documents" not in busy
+
+    assert idle["id"] == empty["id"]
+    assert idle["latest_snapshot_at"] is None
+    assert idle["latest_export_at"] is None
+    assert idle["document_counts"]["chapter"] == 1
+    assert idle["last_edited_document"]["id"] == empty["documents"][0]["id"]
+
+
+def test_last_edited_ranking_only_reads_the_callers_documents(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Mine")
+    _token, _csrf, guest = store.create_guest_session()
+    other = store.create_project(guest, title="Theirs")
+    store.create_documents(
+        guest,
+        other["id"],
+        [{"kind": "note", "title": f"Note {n}"} for n in range(20)],
+    )
+    statements: list[tuple[str, Any]] = []
+
+    def record(*args: Any) -> None:
+        statements.append((args[2], args[3]))
+
+    event.listen(database.read_engine, "before_cursor_execute", record)
+    try:
+        [summary] = store.list_project_summaries(principal)
+    finally:
+        event.remove(database.read_engine, "before_cursor_execute", record)
+
+    assert summary["id"] == project["id"]
+    assert summary["last_edited_document"]["id"] == project["documents"][0]["id"]
+    sql, parameters = next(item for item in statements if "row_number" in item[0])
+    with database.read_engine.connect() as connection:
+        plan = [
+            str(row[-1])
+            for row in connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {sql}", parameters
+            )
+        ]
+    assert not [step for step in plan if step.startswith("SCAN documents")]
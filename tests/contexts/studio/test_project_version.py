@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.models import Project
+from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
+from src.contexts.studio.infrastructure.repository.project_version import _bump_version
+
+
+def _project_id(store: StudioStore, principal: Principal) -> str:
+    return str(store.create_project(principal, title="Counted")["id"])
+
+
+def test_version_bump_increments_the_stored_counter_not_the_loaded_one(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project_id = _project_id(store, principal)
+    with database.session() as session:
+        session.execute(
+            update(Project).where(Project.id == project_id).values(version=7)
+        )
+    with database.session() as session:
+        project = session.get_one(Project, project_id)
+        # As if another writer committed after this session read the row.
+        set_committed_value(project, "version", 2)
+        project.title = "Renamed"
+
+        assert _bump_version(session, project) == 8
+        assert project.version == 8
+    with database.read_session() as session:
+        stored = session.get_one(Project, project_id)
+        assert (stored.version, stored.title) == (8, "Renamed")
+
+
+def test_recording_the_import_hash_changes_the_version(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project_id = _project_id(store, principal)
+    repository = SqlAlchemyStudioRepository(database)
+    with database.read_session() as session:
+        project = session.get_one(Project, project_id)
+        owner_id, before = project.owner_id, project.version
+
+    repository.set_project_import_hash(
+        project_id, "a" * 64, owner_id=owner_id, guest_session_id=None
+    )
+
+    assert (
+        repository.project_version(project_id, owner_id=owner_id, guest_session_id=None)
+        == before + 1
+    )
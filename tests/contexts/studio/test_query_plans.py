@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from alembic import command
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository.query_plans import (
+    HOT_QUERIES,
+    explain_hot_queries,
+)
+from src.shared.infrastructure.config import settings as settings_module
+
+HOT_QUERY_INDEXES = {
+    "sessions": "ix_sessions_kind_expires",
+    "snapshot_documents": "ix_snapshot_documents_document",
+}
+
+
+def test_hot_queries_are_served_by_indexes(database: StudioDatabase) -> None:
+    plans = explain_hot_queries(database.engine)
+
+    assert [plan.name for plan in plans] == list(HOT_QUERIES)
+    assert all(plan.steps for plan in plans)
+    assert [plan for plan in plans if plan.flagged] == []
+
+
+def test_migration_adds_hot_query_indexes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'migrated.sqlite3'}")
+    settings_module.reset_settings()
+    config = Config("alembic.ini")
+    try:
+        command.upgrade(config, "head")
+        command.downgrade(config, "0005_listing_page_indexes")
+        database = StudioDatabase(settings_module.get_settings().database.url)
+        try:
+            inspector = inspect(database.engine)
+            for table, index in HOT_QUERY_INDEXES.items():
+                names = {item["name"] for item in inspector.get_indexes(table)}
+                assert index not in names
+
+            command.upgrade(config, "head")
+
+            inspector = inspect(database.engine)
+            for table, index in HOT_QUERY_INDEXES.items():
+                names = {item["name"] for item in inspector.get_indexes(table)}
+                assert index in names
+            snapshot_indexes = {
+                item["name"] for item in inspector.get_indexes("project_snapshots")
+            }
+            assert "ix_project_snapshots_project_reason" not in snapshot_indexes
+        finally:
+            database.dispose()
+    finally:
+        settings_module.reset_settings()
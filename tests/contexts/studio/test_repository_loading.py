@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.models import DocumentRevision
+from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
+
+
+@pytest.fixture
+def loaded_revisions() -> Iterator[list[str]]:
+    loaded: list[str] = []
+
+    def _record(target: DocumentRevision, _context: Any) -> None:
+        loaded.append(target.id)
+
+    event.listen(DocumentRevision, "load", _record)
+    try:
+        yield loaded
+    finally:
+        event.remove(DocumentRevision, "load", _record)
+
+
+def _project_with_history(store: StudioStore, principal: Principal) -> dict[str, Any]:
+    project = store.create_project(principal, title="History")
+    store.create_document(principal, project["id"], kind="chapter", title="Two")
+    for document in store.get_project(principal, project["id"])["documents"]:
+        revision_id = document["current_revision_id"]
+        for index in range(4):
+            revision_id = store.save_document(
+                principal,
+                project["id"],
+                document["id"],
+                content_markdown=f"Draft {index}",
+                base_revision_id=revision_id,
+            )["current_revision_id"]
+    return store.get_project(principal, project["id"])
+
+
+def test_listings_load_only_current_revisions(
+    store: StudioStore,
+    database: StudioDatabase,
+    loaded_revisions: list[str],
+    principal: Principal,
+) -> None:
+    project = _project_with_history(store, principal)
+    current_ids = sorted(item["current_revision_id"] for item in project["documents"])
+
+    loaded_revisions.clear()
+    store.get_project(principal, project["id"])
+    assert sorted(loaded_revisions) == current_ids
+
+    loaded_revisions.clear()
+    documents = SqlAlchemyStudioRepository(database).list_documents(
+        project["id"],
+        owner_id=principal.owner_id,
+        guest_session_id=None,
+    )
+    assert sorted(loaded_revisions) == current_ids
+    assert [
+        item.current_revision.content_markdown
+        for item in documents
+        if item.current_revision is not None
+    ] == ["Draft 3", "Draft 3"]
+
+
+def test_project_listing_loads_no_revisions(
+    store: StudioStore,
+    loaded_revisions: list[str],
+    principal: Principal,
+) -> None:
+    project = _project_with_history(store, principal)
+
+    loaded_revisions.clear()
+    projects = store.list_projects(principal)
+
+    assert [item["id"] for item in projects] == [project["id"]]
+    assert "documents" not in projects[0]
+    assert loaded_revisions == []
+
+
+def test_save_returns_new_revision_without_loading_history(
+    store: StudioStore,
+    loaded_revisions: list[str],
+    principal: Principal,
+) -> None:
+    project = _project_with_history(store, principal)
+    document = project["documents"][0]
+
+    loaded_revisions.clear()
+    saved = store.save_document(
+        principal,
+        project["id"],
+        document["id"],
+        content_markdown="Final",
+        base_revision_id=document["current_revision_id"],
+    )
+
+    assert saved["content_markdown"] == "Final"
+    assert loaded_revisions == [document["current_revision_id"]]
+
+
+def test_revision_history_selects_columns_without_loading_rows(
+    store: StudioStore,
+    loaded_revisions: list[str],
+    principal: Principal,
+) -> None:
+    project = _project_with_history(store, principal)
+    document = project["documents"][0]
+
+    loaded_revisions.clear()
+    history = store.list_revisions(principal, project["id"], document["id"])
+
+    assert [item["revision_number"] for item in history["revisions"]] == [
+        5,
+        4,
+        3,
+        2,
+        1,
+    ]
+    assert all("content_markdown" not in item for item in history["revisions"])
+    assert loaded_revisions == []
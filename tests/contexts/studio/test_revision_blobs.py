@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import text
+
+from alembic import command
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    revision_content_cache,
+)
+from src.contexts.studio.infrastructure.revision_compaction import blob_report
+from src.shared.infrastructure.config import settings as settings_module
+
+DRAFT = "# Chapter\n\n" + "A sentence worth keeping once. " * 40 + "\n"
+REWRITE = "# Chapter\n\n" + "A different take on the scene. " * 40 + "\n"
+
+
+def _draft_then_restore(store: StudioStore) -> tuple[Principal, str, list[str]]:
+    """Save a draft, rewrite it, then restore the draft: three bodies, one repeat."""
+    store.setup_owner("author", "long-test-password")
+    principal = store.owner_principal()
+    project = store.create_project(principal, title="Blobs")
+    document = project["documents"][0]
+    revision_ids = [document["current_revision_id"]]
+    for content in (DRAFT, REWRITE):
+        saved = store.save_document(
+            principal,
+            project["id"],
+            document["id"],
+            content_markdown=content,
+            base_revision_id=revision_ids[-1],
+        )
+        revision_ids.append(saved["current_revision_id"])
+    restored = store.restore_revision(
+        principal,
+        project["id"],
+        document["id"],
+        revision_ids[1],
+        base_revision_id=revision_ids[-1],
+    )
+    revision_ids.append(restored["current_revision_id"])
+    return principal, project["id"], revision_ids
+
+
+def _refcounts(database: StudioDatabase) -> dict[str, int]:
+    with database.read_session() as session:
+        rows = session.execute(text("SELECT sha256, refcount FROM revision_blobs"))
+        return {row[0]: row[1] for row in rows}
+
+
+def test_restored_revision_shares_the_existing_blob(
+    store: StudioStore,
+    database: StudioDatabase,
+) -> None:
+    principal, project_id, revision_ids = _draft_then_restore(store)
+    with database.read_session() as session:
+        inline, shared = session.execute(
+            text(
+                "SELECT SUM(length(content_markdown)), COUNT(DISTINCT blob_sha256) "
+                "FROM document_revisions"
+            )
+        ).one()
+
+    assert inline == 0
+    assert shared == 3
+    assert sorted(_refcounts(database).values()) == [1, 1, 2]
+    revision_content_cache.clear()
+    draft = store.get_revision(
+        principal,
+        project_id,
+        store.get_project(principal, project_id)["documents"][0]["id"],
+        revision_ids[-1],
+    )
+    assert draft["content_markdown"] == DRAFT
+
+
+def test_deleting_a_project_releases_its_blobs(
+    store: StudioStore,
+    database: StudioDatabase,
+) -> None:
+    principal, project_id, _ = _draft_then_restore(store)
+
+    store.delete_project(principal, project_id)
+
+    assert _refcounts(database) == {}
+
+
+def test_blob_report_counts_bytes_saved_by_sharing(
+    store: StudioStore,
+    database: StudioDatabase,
+) -> None:
+    _draft_then_restore(store)
+
+    report = blob_report(database)
+
+    assert report.revisions == 4
+    assert report.blobs == 3
+    assert report.saved_bytes == len(DRAFT.encode())
+    assert report.logical_bytes == report.stored_bytes + report.saved_bytes
+
+
+def test_migration_backfills_inline_bodies_into_blobs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_store: Callable[..., StudioStore],
+) -> None:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'migrated.sqlite3'}")
+    settings_module.reset_settings()
+    config = Config("alembic.ini")
+    try:
+        command.upgrade(config, "head")
+        database = StudioDatabase(settings_module.get_settings().database.url)
+        try:
+            _draft_then_restore(make_store(database))
+            database.dispose()
+
+            command.downgrade(config, "0007_revision_deltas")
+            with database.read_session() as session:
+                inline = list(
+                    session.execute(
+                        text("SELECT content_markdown FROM document_revisions")
+                    ).scalars()
+                )
+            assert (inline.count(DRAFT), inline.count(REWRITE)) == (2, 1)
+            database.dispose()
+
+            command.upgrade(config, "head")
+            with database.read_session() as session:
+                unmoved = session.execute(
+                    text(
+                        "SELECT COUNT(*) FROM document_revisions "
+                        "WHERE blob_sha256 IS NULL OR content_markdown != ''"
+                    )
+                ).scalar_one()
+            assert unmoved == 0
+            assert sorted(_refcounts(database).values()) == [1, 1, 2]
+        finally:
+            database.dispose()
+    finally:
+        settings_module.reset_settings()
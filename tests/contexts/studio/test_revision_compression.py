@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import text
+
+from alembic import command
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository import (
+    RevisionStorage,
+)
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    revision_content_cache,
+)
+from src.contexts.studio.infrastructure.revision_compression import (
+    compress_cold_revisions,
+)
+from src.shared.infrastructure.config import settings as settings_module
+
+PARAGRAPHS = [f"Paragraph {index} " + "words " * 40 for index in range(12)]
+
+
+def _draft(version: int) -> str:
+    paragraphs = list(PARAGRAPHS)
+    paragraphs[version % len(paragraphs)] = f"Edited in version {version}."
+    return "# Chapter\n\n" + "\n\n".join(paragraphs) + "\n"
+
+
+def _write_history(
+    store: StudioStore, saves: int
+) -> tuple[Principal, str, str, dict[str, str]]:
+    """Save ``saves`` drafts and snapshot the project after the first one."""
+    store.setup_owner("author", "long-test-password")
+    principal = store.owner_principal()
+    project = store.create_project(principal, title="Cold")
+    document = project["documents"][0]
+    revision_id = document["current_revision_id"]
+    expected: dict[str, str] = {}
+    for version in range(saves):
+        saved = store.save_document(
+            principal,
+            project["id"],
+            document["id"],
+            content_markdown=_draft(version),
+            base_revision_id=revision_id,
+        )
+        revision_id = saved["current_revision_id"]
+        expected[revision_id] = _draft(version)
+        if version == 0:
+            store.create_snapshot(principal, project["id"], reason="manual")
+    return principal, project["id"], document["id"], expected
+
+
+def _compressed(database: StudioDatabase) -> dict[str, bool]:
+    with database.read_session() as session:
+        rows = session.execute(
+            text(
+                "SELECT r.id, b.content_zlib IS NOT NULL FROM document_revisions r "
+                "JOIN revision_blobs b ON b.sha256 = r.blob_sha256"
+            )
+        )
+        return {row[0]: bool(row[1]) for row in rows}
+
+
+def test_cold_blobs_are_compressed_and_read_back_transparently(
+    store: StudioStore,
+    database: StudioDatabase,
+) -> None:
+    principal, project_id, document_id, expected = _write_history(store, saves=6)
+    snapshotted, *_, current = expected
+
+    report = compress_cold_revisions(database, older_than=timedelta(0))
+
+    compressed = _compressed(database)
+    # Drafts 2-5 are cold: the first is snapshotted, the last is current and
+    # the seed is below the size worth compressing.
+    assert (report.candidates, report.compressed) == (4, 4)
+    assert report.bytes_after * 5 < report.bytes_before
+    assert compressed[snapshotted] is False
+    assert compressed[current] is False
+    assert sum(compressed.values()) == 4
+    revision_content_cache.clear()
+    for revision_id, content in expected.items():
+        revision = store.get_revision(principal, project_id, document_id, revision_id)
+        assert revision["content_markdown"] == content
+    assert compress_cold_revisions(database, older_than=timedelta(0)).candidates == 0
+
+
+def test_recent_blobs_stay_uncompressed(
+    store: StudioStore,
+    database: StudioDatabase,
+) -> None:
+    _write_history(store, saves=4)
+
+    report = compress_cold_revisions(database, older_than=timedelta(days=30))
+
+    assert report.candidates == 0
+    assert not any(_compressed(database).values())
+
+
+def test_delta_chains_rebuild_from_a_compressed_keyframe(
+    make_store: Callable[..., StudioStore],
+    database: StudioDatabase,
+) -> None:
+    storage = RevisionStorage(mode="delta", keyframe_interval=5)
+    store = make_store(database, revision_storage=storage)
+    principal, project_id, document_id, expected = _write_history(store, saves=8)
+
+    compress_cold_revisions(database, older_than=timedelta(0))
+    revision_content_cache.clear()
+
+    for revision_id, content in expected.items():
+        revision = store.get_revision(principal, project_id, document_id, revision_id)
+        assert revision["content_markdown"] == content
+
+
+def test_migration_downgrade_inflates_compressed_blobs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_store: Callable[..., StudioStore],
+) -> None:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'migrated.sqlite3'}")
+    settings_module.reset_settings()
+    config = Config("alembic.ini")
+    try:
+        command.upgrade(config, "head")
+        database = StudioDatabase(settings_module.get_settings().database.url)
+        try:
+            _write_history(make_store(database), saves=4)
+            compress_cold_revisions(database, older_than=timedelta(0))
+            database.dispose()
+
+            command.downgrade(config, "0008_revision_blobs")
+
+            with database.read_session() as session:
+                bodies = set(
+                    session.execute(
+                        text("SELECT content FROM revision_blobs")
+                    ).scalars()
+                )
+            assert {_draft(version) for version in range(4)} <= bodies
+        finally:
+            database.dispose()
+    finally:
+        settings_module.reset_settings()
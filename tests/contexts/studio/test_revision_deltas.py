@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import event, text
+
+from alembic import command
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.domain.utils import _revision_statistics
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository import (
+    RevisionStorage,
+)
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    revision_content_cache,
+)
+from src.contexts.studio.infrastructure.revision_compaction import compact_revisions
+from src.contexts.studio.infrastructure.revision_delta import apply_delta, encode_delta
+from src.shared.infrastructure.config import settings as settings_module
+
+DELTA_STORAGE = RevisionStorage(mode="delta", keyframe_interval=5)
+PARAGRAPHS = [f"Paragraph {index} " + "words " * 40 for index in range(12)]
+
+
+@pytest.fixture
+def store(
+    make_store: Callable[..., StudioStore],
+    database: StudioDatabase,
+) -> StudioStore:
+    return make_store(database, revision_storage=DELTA_STORAGE)
+
+
+def _draft(version: int) -> str:
+    paragraphs = list(PARAGRAPHS)
+    paragraphs[version % len(paragraphs)] = f"Edited in version {version}."
+    return "# Chapter\n\n" + "\n\n".join(paragraphs) + "\n"
+
+
+def _write_history(
+    store: StudioStore, saves: int
+) -> tuple[Principal, dict[str, Any], dict[str, str]]:
+    store.setup_owner("author", "long-test-password")
+    principal = store.owner_principal()
+    project = store.create_project(principal, title="Deltas")
+    document = project["documents"][0]
+    revision_id = document["current_revision_id"]
+    expected: dict[str, str] = {}
+    for version in range(saves):
+        saved = store.save_document(
+            principal,
+            project["id"],
+            document["id"],
+            content_markdown=_draft(version),
+            base_revision_id=revision_id,
+        )
+        revision_id = saved["current_revision_id"]
+        expected[revision_id] = _draft(version)
+    return principal, document, expected
+
+
+def _stored_rows(database: StudioDatabase) -> dict[int, tuple[str, str | None]]:
+    with database.read_session() as session:
+        rows = session.execute(
+            text(
+                "SELECT revision_number, content_markdown, content_delta "
+                "FROM document_revisions ORDER BY revision_number"
+            )
+        )
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+
+@pytest.mark.parametrize(
+    ("base", "content"),
+    [
+        ("", "# Fresh\n\nText"),
+        ("a\nb\nc\n", "a\nB\nc\nd"),
+        ("one\n\ntwo\n\nthree", "zero\n\none\n\nthree\n"),
+        ("same\n", "same\n"),
+        ("drop everything\n", ""),
+    ],
+)
+def test_delta_round_trips(base: str, content: str) -> None:
+    assert apply_delta(base, encode_delta(base, content)) == content
+
+
+def test_delta_storage_keeps_keyframes_and_rebuilds_every_revision(
+    store: StudioStore,
+    database: StudioDatabase,
+) -> None:
+    principal, document, expected = _write_history(store, saves=12)
+
+    rows = _stored_rows(database)
+    keyframes = [number for number, (_, delta) in rows.items() if delta is None]
+    # Revision 2 replaces the seed text outright, so its delta is not smaller.
+    assert keyframes == [1, 2, 6, 11]
+    assert all(rows[number][0] == "" for number in rows if number not in keyframes)
+
+    revision_content_cache.clear()
+    for revision_id, content in expected.items():
+        revision = store.get_revision(
+            principal, document["project_id"], document["id"], revision_id
+        )
+        assert revision["content_markdown"] == content
+        statistics = _revision_statistics(content)
+        assert revision["word_count"] == statistics["word_count"]
+        assert revision["content_sha256"] == statistics["content_sha256"]
+
+
+def test_reconstruction_is_cached_after_one_chain_query(
+    store: StudioStore,
+    database: StudioDatabase,
+) -> None:
+    principal, document, expected = _write_history(store, saves=4)
+    revision_id = list(expected)[-1]
+    chain_queries: list[str] = []
+
+    def _record(*args: Any) -> None:
+        if "revision_chain" in args[2]:
+            chain_queries.append(args[2])
+
+    revision_content_cache.clear()
+    event.listen(database.read_engine, "before_cursor_execute", _record)
+    try:
+        for _ in range(3):
+            store.get_revision(
+                principal, document["project_id"], document["id"], revision_id
+            )
+    finally:
+        event.remove(database.read_engine, "before_cursor_execute", _record)
+
+    assert len(chain_queries) == 1
+
+
+def test_snapshot_content_and_restore_use_rebuilt_bodies(store: StudioStore) -> None:
+    principal, document, expected = _write_history(store, saves=8)
+    first_id, *_, last_id = expected
+    revision_content_cache.clear()
+
+    restored = store.restore_revision(
+        principal,
+        document["project_id"],
+        document["id"],
+        first_id,
+        base_revision_id=last_id,
+    )
+    snapshot = store.create_snapshot(principal, document["project_id"], reason="manual")
+    revision_content_cache.clear()
+    contents = store.repository.snapshot_content(
+        snapshot["id"], owner_id=principal.owner_id, guest_session_id=None
+    )
+
+    assert restored["content_markdown"] == expected[first_id]
+    assert [revision.content_markdown for _, revision in contents] == [
+        expected[first_id]
+    ]
+
+
+def test_compaction_switches_existing_history_between_encodings(
+    make_store: Callable[..., StudioStore],
+    database: StudioDatabase,
+) -> None:
+    store = make_store(database, revision_storage=RevisionStorage())
+    principal, document, expected = _write_history(store, saves=12)
+
+    to_delta = compact_revisions(database, DELTA_STORAGE)
+    revision_content_cache.clear()
+    rebuilt = {
+        revision_id: store.get_revision(
+            principal, document["project_id"], document["id"], revision_id
+        )["content_markdown"]
+        for revision_id in expected
+    }
+    to_full = compact_revisions(database, RevisionStorage(mode="full"))
+
+    assert to_delta.documents == 1
+    assert to_delta.delta_revisions == 9
+    assert to_delta.bytes_after * 3 < to_delta.bytes_before
+    assert rebuilt == expected
+    assert to_full.rewritten == 9
+    assert to_full.bytes_after == to_delta.bytes_before
+    assert all(delta is None for _, delta in _stored_rows(database).values())
+
+
+def test_migration_downgrade_expands_deltas(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_store: Callable[..., StudioStore],
+) -> None:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'migrated.sqlite3'}")
+    settings_module.reset_settings()
+    config = Config("alembic.ini")
+    try:
+        command.upgrade(config, "head")
+        database = StudioDatabase(settings_module.get_settings().database.url)
+        try:
+            store = make_store(database, revision_storage=DELTA_STORAGE)
+            _, _, expected = _write_history(store, saves=6)
+            database.dispose()
+
+            command.downgrade(config, "0006_hot_query_indexes")
+
+            with database.read_session() as session:
+                rows: dict[str, str] = dict(
+                    session.execute(
+                        text("SELECT id, content_markdown FROM document_revisions")
+                    ).all()
+                )
+            assert {key: rows[key] for key in expected} == expected
+        finally:
+            database.dispose()
+    finally:
+        settings_module.reset_settings()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import select, update
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.models import DocumentRevision
+from src.contexts.studio.infrastructure.repository import (
+    RevisionStorage,
+)
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    revision_content_cache,
+)
+from src.contexts.studio.infrastructure.revision_pruning import (
+    RetentionPolicy,
+    prune_revisions,
+)
+
+NOW = datetime(2026, 6, 15, 12, tzinfo=UTC)
+# Revision number -> creation time. 1-3 share a day, 4-5 share an hour,
+# 7-8 fall inside the keep-everything window.
+CREATED_AT = {
+    1: datetime(2026, 6, 5, 9, tzinfo=UTC),
+    2: datetime(2026, 6, 5, 10, tzinfo=UTC),
+    3: datetime(2026, 6, 5, 11, tzinfo=UTC),
+    4: datetime(2026, 6, 12, 10, 5, tzinfo=UTC),
+    5: datetime(2026, 6, 12, 10, 40, tzinfo=UTC),
+    6: datetime(2026, 6, 12, 11, 10, tzinfo=UTC),
+    7: datetime(2026, 6, 15, 2, tzinfo=UTC),
+    8: datetime(2026, 6, 15, 3, tzinfo=UTC),
+}
+PARAGRAPHS = [f"Paragraph {index} " + "words " * 40 for index in range(12)]
+
+
+def _draft(version: int) -> str:
+    paragraphs = list(PARAGRAPHS)
+    paragraphs[version % len(paragraphs)] = f"Edited in version {version}."
+    return "# Chapter\n\n" + "\n\n".join(paragraphs) + "\n"
+
+
+@pytest.fixture
+def store(
+    make_store: Callable[..., StudioStore],
+    database: StudioDatabase,
+) -> StudioStore:
+    return make_store(
+        database,
+        revision_storage=RevisionStorage(mode="delta", keyframe_interval=10),
+    )
+
+
+def _history(
+    store: StudioStore, principal: Principal, database: StudioDatabase
+) -> tuple[dict[str, Any], dict[int, str]]:
+    """Write revisions 1-8, snapshot revision 2 and backdate them all."""
+    project = store.create_project(principal, title="Pruned")
+    document = project["documents"][0]
+    revision_id = document["current_revision_id"]
+    for version in range(7):
+        revision_id = store.save_document(
+            principal,
+            project["id"],
+            document["id"],
+            content_markdown=_draft(version),
+            base_revision_id=revision_id,
+        )["current_revision_id"]
+        if version == 0:
+            store.create_snapshot(principal, project["id"], reason="manual")
+    with database.session() as session:
+        for number, created_at in CREATED_AT.items():
+            session.execute(
+                update(DocumentRevision)
+                .where(DocumentRevision.revision_number == number)
+                .values(created_at=created_at)
+            )
+    ids = {number: row[0] for number, row in _revisions(database).items()}
+    return document, ids
+
+
+def _revisions(
+    database: StudioDatabase,
+) -> dict[int, tuple[str, str | None, str | None]]:
+    with database.read_session() as session:
+        rows = session.execute(
+            select(
+                DocumentRevision.revision_number,
+                DocumentRevision.id,
+                DocumentRevision.parent_revision_id,
+                DocumentRevision.content_delta,
+            ).order_by(DocumentRevision.revision_number)
+        )
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+
+def test_dry_run_reports_without_deleting(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    document, _ids = _history(store, principal, database)
+
+    report = prune_revisions(database, RetentionPolicy(), dry_run=True, now=NOW)
+
+    assert report.pruned_revision_numbers == {document["id"]: [1, 4]}
+    assert (report.pruned, report.relinked, report.materialized) == (2, 2, 1)
+    assert list(_revisions(database)) == list(CREATED_AT)
+
+
+def test_prune_keeps_buckets_relinks_chains_and_materializes_deltas(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    document, ids = _history(store, principal, database)
+    assert _revisions(database)[5][2] is not None
+
+    report = prune_revisions(database, RetentionPolicy(), now=NOW)
+
+    remaining = _revisions(database)
+    # Revision 2 is snapshot-referenced even though revision 3 is newer that day.
+    assert list(remaining) == [2, 3, 5, 6, 7, 8]
+    assert report.pruned == 2
+    assert remaining[2][1] is None
+    assert remaining[5][1] == ids[3]
+    assert remaining[5][2] is None
+    revision_content_cache.clear()
+    for number in remaining:
+        revision = store.get_revision(
+            principal, document["project_id"], document["id"], ids[number]
+        )
+        assert revision["revision_number"] == number
+        assert revision["content_markdown"] == _draft(number - 2)
+    assert prune_revisions(database, RetentionPolicy(), now=NOW).pruned == 0
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import text
+
+from alembic import command
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.domain import utils as domain_utils
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.shared.infrastructure.config import settings as settings_module
+
+CONTENT = "# Chapter\n\nFirst paragraph here.\n\nSecond one."
+
+
+def test_statistics_are_stored_on_write_and_read_without_regex(
+    store: StudioStore,
+    database: StudioDatabase,
+    monkeypatch: pytest.MonkeyPatch,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Stats")
+    document = project["documents"][0]
+    saved = store.save_document(
+        principal,
+        project["id"],
+        document["id"],
+        content_markdown=CONTENT,
+        base_revision_id=document["current_revision_id"],
+    )
+    with database.read_session() as session:
+        row = session.execute(
+            text(
+                "SELECT word_count, char_count, paragraph_count, content_sha256 "
+                "FROM document_revisions WHERE id = :id"
+            ),
+            {"id": saved["current_revision_id"]},
+        ).one()
+    assert tuple(row) == (
+        6,
+        len(CONTENT),
+        3,
+        hashlib.sha256(CONTENT.encode("utf-8")).hexdigest(),
+    )
+
+    def _no_regex(_markdown: str) -> int:
+        raise AssertionError("word counts must come from stored columns")
+
+    monkeypatch.setattr(domain_utils, "_word_count", _no_regex)
+    revisions = store.list_revisions(principal, project["id"], document["id"])[
+        "revisions"
+    ]
+    loaded = store.get_document(principal, project["id"], document["id"])
+
+    assert revisions[0]["word_count"] == 6
+    assert loaded["word_count"] == 6
+
+
+def test_export_reuses_snapshot_when_content_is_unchanged(
+    store: StudioStore, principal: Principal
+) -> None:
+    project = store.create_project(principal, title="Exports")
+    document = project["documents"][0]
+    saved = store.save_document(
+        principal,
+        project["id"],
+        document["id"],
+        content_markdown=CONTENT,
+        base_revision_id=document["current_revision_id"],
+    )
+    first = store.export_project(principal, project["id"], export_format="markdown")
+    resaved = store.save_document(
+        principal,
+        project["id"],
+        document["id"],
+        content_markdown=CONTENT,
+        base_revision_id=saved["current_revision_id"],
+    )
+    second = store.export_project(principal, project["id"], export_format="markdown")
+
+    assert resaved["current_revision_id"] != saved["current_revision_id"]
+    assert second["snapshot_id"] == first["snapshot_id"]
+
+
+def test_migration_backfills_statistics_for_existing_revisions(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'migrated.sqlite3'}")
+    settings_module.reset_settings()
+    config = Config("alembic.ini")
+    try:
+        command.upgrade(config, "head")
+        command.downgrade(config, "0003_add_csrf_token_to_sessions")
+        database = StudioDatabase(settings_module.get_settings().database.url)
+        try:
+            with database.session() as session:
+                session.execute(
+                    text(
+                        "INSERT INTO projects (id, title, description, "
+                        "settings_json, created_at, updated_at) VALUES "
+                        "('p', 'P', '', '{}', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                    )
+                )
+                session.execute(
+                    text(
+                        "INSERT INTO documents (id, project_id, kind, title, "
+                        "position, created_at, updated_at) VALUES ('d', 'p', "
+                        "'chapter', 'D', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                    )
+                )
+                for number in range(1, 6):
+                    session.execute(
+                        text(
+                            "INSERT INTO document_revisions (id, document_id, "
+                            "revision_number, content_markdown, metadata_json, "
+                            "source, created_at) VALUES (:id, 'd', :number, "
+                            ":content, '{}', 'author', CURRENT_TIMESTAMP)"
+                        ),
+                        {
+                            "id": f"r{number}",
+                            "number": number,
+                            "content": " ".join(["word"] * number),
+                        },
+                    )
+            command.upgrade(config, "head")
+            with database.read_session() as session:
+                counts = session.execute(
+                    text(
+                        "SELECT word_count FROM document_revisions "
+                        "WHERE content_sha256 != '' ORDER BY revision_number"
+                    )
+                ).scalars()
+                assert list(counts) == [1, 2, 3, 4, 5]
+        finally:
+            database.dispose()
+    finally:
+        settings_module.reset_settings()
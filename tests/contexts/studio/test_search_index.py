@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from alembic.config import Config
+from sqlalchemy import event, text
+
+from alembic import command
+from src.contexts.studio.application.service_common import _build_fts5_match_query
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.domain.exceptions import InvalidOperation
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository import RevisionStorage
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    revision_content_cache,
+)
+from src.contexts.studio.infrastructure.search_index import excerpt, plain_text
+from src.shared.infrastructure.config import settings as settings_module
+
+DELTA_STORAGE = RevisionStorage(mode="delta", keyframe_interval=10)
+
+
+@pytest.fixture
+def store(
+    make_store: Callable[..., StudioStore],
+    database: StudioDatabase,
+) -> StudioStore:
+    return make_store(database, revision_storage=DELTA_STORAGE)
+
+
+def _indexed_rowids(database: StudioDatabase, term: str) -> list[int]:
+    """Match against the FTS5 table alone, bypassing the entry join."""
+    with database.read_session() as session:
+        return list(
+            session.execute(
+                text(
+                    "SELECT rowid FROM document_search WHERE document_search MATCH :q"
+                ),
+                {"q": f'"{term}"'},
+            ).scalars()
+        )
+
+
+def _save(
+    store: StudioStore,
+    principal: Principal,
+    document: dict[str, object],
+    content: str,
+) -> dict[str, object]:
+    return store.save_document(
+        principal,
+        str(document["project_id"]),
+        str(document["id"]),
+        content_markdown=content,
+        base_revision_id=str(document["current_revision_id"]),
+    )
+
+
+def test_saves_replace_indexed_terms_without_storing_text(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Indexed")
+    document = project["documents"][0]
+    body = "# Chapter\n\n" + "filler words here. " * 30
+    document = _save(store, principal, document, body + "The heron waited.")
+    revision_content_cache.clear()
+    document = _save(store, principal, document, body + "The lantern flickered.")
+
+    assert _indexed_rowids(database, "heron") == []
+    results = store.search(principal, project["id"], "lantern")
+    assert [result["document_id"] for result in results] == [document["id"]]
+    assert results[0]["excerpt"].endswith("The lantern flickered")
+    with database.read_session() as session:
+        tables = set(
+            session.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table'")
+            ).scalars()
+        )
+        indexed = session.execute(
+            text("SELECT revision_id FROM document_search_entries")
+        ).scalar_one()
+    assert "document_search_content" not in tables
+    assert indexed == document["current_revision_id"]
+
+    store.delete_document(principal, project["id"], str(document["id"]))
+    assert _indexed_rowids(database, "lantern") == []
+
+
+def test_project_search_is_scoped_inside_the_fts_query(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Scoped")
+    other = store.create_project(principal, title="Elsewhere")
+    document = _save(
+        store, principal, project["documents"][0], "# One\n\nThe *lantern* swung."
+    )
+    _save(store, principal, other["documents"][0], "Another lantern burned.")
+    statements: list[str] = []
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    revision_content_cache.clear()
+    event.listen(database.read_engine, "before_cursor_execute", record)
+    try:
+        results = store.search(principal, project["id"], "lantern")
+    finally:
+        event.remove(database.read_engine, "before_cursor_execute", record)
+
+    assert [result["document_id"] for result in results] == [document["id"]]
+    assert results[0]["excerpt"] == "One\n\nThe lantern swung"
+    match = next(sql for sql in statements if "MATCH" in sql)
+    assert "document_search.rowid IN" in match
+
+
+def test_excerpt_centres_on_the_first_matching_term() -> None:
+    words = " ".join(f"w{index}" for index in range(40))
+
+    assert excerpt(f"{words} needle tail", '"needle"', tokens=6) == (
+        "… w36 w37 w38 w39 needle tail"
+    )
+    assert excerpt("needle " + words, '"needle"', tokens=3) == "needle w0 w1 … "
+    assert excerpt("", '"needle"') == ""
+
+
+def test_prefix_search_matches_the_token_being_typed(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Typing")
+    document = _save(
+        store, principal, project["documents"][0], "The lantern flickered."
+    )
+
+    assert _build_fts5_match_query("the lant", prefix=True) == '"the" "lant"*'
+    assert _build_fts5_match_query("the lant ", prefix=True) == '"the" "lant"'
+    assert store.search(principal, project["id"], "lant") == []
+    results = store.search(principal, project["id"], "lant", prefix=True)
+    assert [result["document_id"] for result in results] == [document["id"]]
+    assert results[0]["excerpt"] == "The lantern flickered"
+    with database.engine.connect() as connection:
+        sql = connection.execute(
+            text("SELECT sql FROM sqlite_master WHERE name = 'document_search'")
+        ).scalar_one()
+    assert "prefix='2 3'" in sql
+
+
+def test_owner_search_ranks_titles_first_and_pages_across_projects(
+    store: StudioStore,
+    principal: Principal,
+) -> None:
+    first = store.create_project(principal, title="Book One")
+    second = store.create_project(principal, title="Book Two")
+    mention = _save(store, principal, first["documents"][0], "Mara crossed the bridge.")
+    titled = store.create_document(
+        principal,
+        second["id"],
+        kind="character",
+        title="Mara",
+        content_markdown="A ferrywoman.",
+    )
+    also = store.create_document(
+        principal,
+        first["id"],
+        kind="chapter",
+        title="Chapter 2",
+        content_markdown="Mara again, and again Mara.",
+    )
+    _, _, guest_principal = store.create_guest_session()
+    hidden = store.create_project(guest_principal, title="Elsewhere")
+    _save(store, guest_principal, hidden["documents"][0], "Mara too.")
+
+    page = store.search_all(principal, "mara")
+
+    assert page["next_cursor"] is None
+    assert [group["title"] for group in page["projects"]] == ["Book Two", "Book One"]
+    assert [group["results"][0]["document_id"] for group in page["projects"]] == [
+        titled["id"],
+        also["id"],
+    ]
+    assert {result["document_id"] for result in page["projects"][1]["results"]} == {
+        mention["id"],
+        also["id"],
+    }
+    assert page["projects"][1]["results"][1]["excerpt"] == "Mara crossed the bridge"
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        paged = store.search_all(principal, "mara", limit=1, cursor=cursor)
+        seen.extend(
+            result["document_id"]
+            for group in paged["projects"]
+            for result in group["results"]
+        )
+        cursor = paged["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [titled["id"], also["id"], mention["id"]]
+    with pytest.raises(InvalidOperation):
+        store.search_all(principal, "mara", cursor="bm90LWEtY3Vyc29y")
+
+
+def test_plain_text_drops_markdown_syntax_but_keeps_words() -> None:
+    markdown = (
+        "## The *Heron* ##\n"
+        "> - [lantern](https://example.com/lamp) and ![moth](moth.png)\n"
+        "```python\nsnake_case = 1\n```\n"
+        "---\n"
+        "<em>quiet</em> \\*literal\\* __bold__\n"
+        "[ref]: https://example.com\n"
+    )
+
+    assert plain_text(markdown).split() == [
+        "The",
+        "Heron",
+        "lantern",
+        "and",
+        "moth",
+        "snake_case",
+        "=",
+        "1",
+        "quiet",
+        "*literal*",
+        "bold",
+    ]
+
+
+def test_migration_rebuilds_the_index_from_current_revisions(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_store: Callable[..., StudioStore],
+) -> None:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("DB_URL", f"sqlite:///{tmp_path / 'migrated.sqlite3'}")
+    settings_module.reset_settings()
+    config = Config("alembic.ini")
+    try:
+        command.upgrade(config, "head")
+        database = StudioDatabase(settings_module.get_settings().database.url)
+        try:
+            store = make_store(database, revision_storage=DELTA_STORAGE)
+            store.setup_owner("author", "long-test-password")
+            principal = store.owner_principal()
+            project = store.create_project(principal, title="Migrated")
+            _save(store, principal, project["documents"][0], "# One\n\nOtter.\n")
+            database.dispose()
+
+            command.downgrade(config, "0011_project_versions")
+            with database.read_session() as session:
+                legacy = session.execute(
+                    text("SELECT content FROM document_search")
+                ).scalar_one()
+            assert legacy == "# One\n\nOtter.\n"
+            command.upgrade(config, "head")
+
+            results = store.search(principal, project["id"], "otter")
+            assert [result["title"] for result in results] == ["Chapter 1"]
+            assert results[0]["excerpt"] == "One\n\nOtter"
+        finally:
+            database.dispose()
+    finally:
+        settings_module.reset_settings()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+from sqlalchemy import text
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.repository import RevisionStorage
+from src.contexts.studio.infrastructure.search_maintenance import (
+    maintain_search,
+    verify_search,
+)
+from src.contexts.studio.infrastructure.search_reindex import (
+    live_tokenizer,
+    reindex_search,
+    search_index_stale,
+)
+
+DELTA_STORAGE = RevisionStorage(mode="delta", keyframe_interval=10)
+
+
+@pytest.fixture
+def store(
+    make_store: Callable[..., StudioStore],
+    database: StudioDatabase,
+) -> StudioStore:
+    return make_store(database, revision_storage=DELTA_STORAGE)
+
+
+def _save(
+    store: StudioStore,
+    principal: Principal,
+    document: dict[str, object],
+    content: str,
+) -> dict[str, object]:
+    return store.save_document(
+        principal,
+        str(document["project_id"]),
+        str(document["id"]),
+        content_markdown=content,
+        base_revision_id=str(document["current_revision_id"]),
+    )
+
+
+def test_online_reindex_switches_to_trigram_and_keeps_concurrent_saves(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="月光")
+    first = _save(store, principal, project["documents"][0], "城市在月光下沉睡。")
+    second = store.create_document(
+        principal,
+        project["id"],
+        kind="chapter",
+        title="钟声",
+        content_markdown="钟楼敲响了午夜。",
+    )
+    assert store.search(principal, project["id"], "月光下") == []
+
+    def save_between_chunks(copied: int, total: int) -> None:
+        assert total == 2
+        if copied == total:
+            _save(store, principal, first, "**河流**绕过了沉睡的城市。")
+
+    database.search_tokenizer = "trigram"
+    assert search_index_stale(database)
+    report = reindex_search(
+        database, "trigram", chunk_size=1, progress=save_between_chunks
+    )
+
+    assert (report.documents, report.reconciled) == (2, 1)
+    assert not search_index_stale(database)
+    with database.engine.connect() as connection:
+        assert live_tokenizer(connection) == "trigram"
+    assert store.search(principal, project["id"], "月光下") == []
+    results = store.search(principal, project["id"], "绕过了")
+    assert [result["document_id"] for result in results] == [first["id"]]
+    assert results[0]["excerpt"] == "河流绕过了沉睡的城市"
+    results = store.search(principal, project["id"], "敲响")
+    assert results == []
+    results = store.search(principal, project["id"], "敲响了")
+    assert [result["document_id"] for result in results] == [second["id"]]
+
+
+def test_maintenance_repairs_an_index_that_drifted_from_current_revisions(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Restored")
+    lost = _save(store, principal, project["documents"][0], "The heron waited.")
+    renamed = store.create_document(
+        principal,
+        project["id"],
+        kind="chapter",
+        title="Lantern",
+        content_markdown="A moth circled.",
+    )
+    assert verify_search(database).healthy
+    with database.engine.begin() as connection:
+        connection.execute(
+            text("DELETE FROM document_search_entries WHERE document_id = :id"),
+            {"id": lost["id"]},
+        )
+        connection.execute(
+            text("UPDATE documents SET title = 'Candle' WHERE id = :id"),
+            {"id": renamed["id"]},
+        )
+
+    drifted = verify_search(database)
+    assert (drifted.missing, drifted.stale, drifted.orphaned) == (1, 1, 0)
+    assert drifted.integrity == "ok"
+    assert store.search(principal, project["id"], "heron") == []
+
+    progress: list[tuple[int, int]] = []
+    report = maintain_search(
+        database, chunk_size=1, progress=lambda *step: progress.append(step)
+    )
+
+    assert report.reindex is not None
+    assert (report.reindex.documents, report.reindex.repaired) == (2, 2)
+    assert progress[-1] == (2, 2)
+    assert report.after.healthy
+    results = store.search(principal, project["id"], "heron")
+    assert [result["document_id"] for result in results] == [lost["id"]]
+    assert results[0]["excerpt"] == "The heron waited"
+    results = store.search(principal, project["id"], "candle")
+    assert [result["title"] for result in results] == ["Candle"]
+    assert store.search(principal, project["id"], "lantern") == []
+    assert maintain_search(database).reindex is None
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import sqlite3
-from collections.abc import Iterator
 from datetime import timedelta
 from pathlib import Path
 
@@ -26,44 +25,11 @@ from src.contexts.studio.infrastructure.models import (
     SessionRecord,
 )
 from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
-from src.shared.infrastructure.config import settings as settings_module
 
 
-@pytest.fixture
-def database(
-    tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> Iterator[StudioDatabase]:
-    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
-    monkeypatch.setenv("APP_DATA_DIR", str(tmp_path))
-    settings_module.reset_settings()
-    database = StudioDatabase(f"sqlite:///{tmp_path / 'studio.sqlite3'}")
-    database.initialize(create_backup=False)
-    try:
-        yield database
-    finally:
-        database.dispose()
-        settings_module.reset_settings()
-
-
-@pytest.fixture
-def store(tmp_path: Path, database: StudioDatabase) -> StudioStore:
-    return StudioStore(
-        repository=SqlAlchemyStudioRepository(database),
-        data_dir=tmp_path,
-        ai_provider_factory=create_studio_text_generation_provider,
-        session_secret=settings_module.get_settings().security.secret_key,
-        export_writers=DEFAULT_EXPORT_WRITERS,
-    )
-
-
-def _owner(store: StudioStore) -> Principal:
-    store.setup_owner("author", "long-test-password")
-    return store.owner_principal()
-
-
-def test_revisions_are_immutable_and_stale_saves_conflict(store: StudioStore) -> None:
-    principal = _owner(store)
+def test_revisions_are_immutable_and_stale_saves_conflict(
+    store: StudioStore, principal: Principal
+) -> None:
     project = store.create_project(principal, title="Revision Test")
     document = project["documents"][0]
     initial = document["current_revision_id"]
@@ -85,12 +51,19 @@ def test_revisions_are_immutable_and_stale_saves_conflict(store: StudioStore) ->
             base_revision_id=initial,
         )
 
-    revisions = store.list_revisions(principal, project["id"], document["id"])
+    revisions = store.list_revisions(principal, project["id"], document["id"])[
+        "revisions"
+    ]
     assert len(revisions) == 2
     assert [revision["revision_number"] for revision in revisions] == [2, 1]
     assert revisions[0]["parent_revision_id"] == initial
     assert saved["current_revision_id"] == revisions[0]["id"]
-    assert revisions[1]["content_markdown"] == "# Chapter 1\n\n"
+    assert "content_markdown" not in revisions[1]
+    restored = store.get_revision(
+        principal, project["id"], document["id"], revisions[1]["id"]
+    )
+    assert restored["content_markdown"] == "# Chapter 1\n\n"
+    assert restored["content_sha256"] == revisions[1]["content_sha256"]
 
 
 def test_session_secret_verifies_sessions_and_rotation_invalidates_old_tokens(
@@ -125,8 +98,9 @@ def test_session_secret_verifies_sessions_and_rotation_invalidates_old_tokens(
     assert rotated.principal_from_token(token) is None
 
 
-def test_search_snapshot_and_exports_use_exact_revisions(store: StudioStore) -> None:
-    principal = _owner(store)
+def test_search_snapshot_and_exports_use_exact_revisions(
+    store: StudioStore, principal: Principal
+) -> None:
     project = store.create_project(principal, title="Snapshot Test")
     document = project["documents"][0]
     saved = store.save_document(
@@ -155,7 +129,7 @@ def test_search_snapshot_and_exports_use_exact_revisions(store: StudioStore) ->
     ]
     assert len({item["snapshot_id"] for item in exports}) == 1
 
-    snapshots = store.list_snapshots(principal, project["id"])
+    snapshots = store.list_snapshots(principal, project["id"])["snapshots"]
     snapshot_by_id = {snapshot["id"]: snapshot for snapshot in snapshots}
     for item in exports:
         snapshot = snapshot_by_id[item["snapshot_id"]]
@@ -188,8 +162,8 @@ def test_guest_cleanup_cascades_projects(
 async def test_running_jobs_are_interrupted_and_retryable(
     store: StudioStore,
     database: StudioDatabase,
+    principal: Principal,
 ) -> None:
-    principal = _owner(store)
     project = store.create_project(principal, title="Jobs")
     document = project["documents"][0]
     proposal = await store.create_ai_proposal(
@@ -217,8 +191,9 @@ async def test_running_jobs_are_interrupted_and_retryable(
     assert retry["retry_of_job_id"] == proposal["id"]
 
 
-def test_legacy_import_is_idempotent(store: StudioStore, tmp_path: Path) -> None:
-    principal = _owner(store)
+def test_legacy_import_is_idempotent(
+    store: StudioStore, tmp_path: Path, principal: Principal
+) -> None:
     legacy = tmp_path / "legacy"
     chapters = legacy / "manuscript" / "chapters"
     chapters.mkdir(parents=True)
@@ -241,8 +216,8 @@ def test_legacy_import_is_idempotent(store: StudioStore, tmp_path: Path) -> None
 def test_online_backup_is_consistent_with_wal(
     store: StudioStore,
     database: StudioDatabase,
+    principal: Principal,
 ) -> None:
-    principal = _owner(store)
     project = store.create_project(principal, title="Backup Test")
     path = database.path
     assert path is not None
@@ -271,9 +246,9 @@ def test_load_json_returns_empty_for_empty_input_and_raises_for_invalid_json() -
 
 def test_repository_scopes_isolate_projects_between_principals(
     store: StudioStore,
+    principal: Principal,
 ) -> None:
-    owner = _owner(store)
-    project = store.create_project(owner, title="Private")
+    project = store.create_project(principal, title="Private")
     _, _, guest = store.auth.create_guest_session()
 
     with pytest.raises(NotFound):
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from sqlalchemy import event, text
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.database import StudioDatabase
+
+UUID4 = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+)
+
+
+def _member_inserts(database: StudioDatabase) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(database.engine, "before_cursor_execute")
+    def _record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if statement.startswith("INSERT INTO snapshot_documents"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_snapshots_and_reviews_copy_members_in_one_statement(
+    store: StudioStore,
+    database: StudioDatabase,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Frozen")
+    created = store.create_documents(
+        principal,
+        project["id"],
+        [{"kind": "chapter", "title": f"Chapter {n}"} for n in range(2, 201)],
+    )
+    inserts = _member_inserts(database)
+
+    snapshot = store.create_snapshot(principal, project["id"], reason="manual")
+    store.save_document(
+        principal,
+        project["id"],
+        created[0]["id"],
+        content_markdown="# Chapter 2\n\nRevised.",
+        base_revision_id=created[0]["current_revision_id"],
+    )
+    store.review_project(principal, project["id"])
+
+    assert len(inserts) == 2
+    assert all("SELECT" in statement for statement in inserts)
+    assert len(snapshot["documents"]) == 200
+    assert snapshot["documents"][-1]["document_id"] == created[-1]["id"]
+    with database.read_session() as session:
+        result = session.execute(text("SELECT id FROM snapshot_documents"))
+        ids = result.scalars().all()
+    assert len(ids) == 400
+    assert len(set(ids)) == 400
+    assert all(UUID4.match(value) for value in ids)
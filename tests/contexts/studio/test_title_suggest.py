@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from src.contexts.studio.application.services import Principal, StudioStore
+from src.contexts.studio.infrastructure.title_suggest import (
+    TitleSuggestion,
+    TitleTrie,
+    title_suggest_cache,
+)
+
+
+def test_trie_matches_word_starts_and_ranks_title_starts_first() -> None:
+    trie = TitleTrie(
+        TitleSuggestion(document_id=str(index), kind="chapter", title=title)
+        for index, title in enumerate(
+            ["The Red River", "Riverbank", "Harbour  Lights", "Mirror"]
+        )
+    )
+
+    assert [item.title for item in trie.suggest("riv")] == [
+        "Riverbank",
+        "The Red River",
+    ]
+    assert [item.title for item in trie.suggest("RED  ri")] == ["The Red River"]
+    assert [item.title for item in trie.suggest("harbour l")] == ["Harbour  Lights"]
+    assert trie.suggest("irr") == []
+    assert trie.suggest("   ") == []
+    assert len(trie.suggest("r", limit=1)) == 1
+
+
+def test_suggestions_follow_document_create_rename_and_delete(
+    store: StudioStore,
+    principal: Principal,
+) -> None:
+    project = store.create_project(principal, title="Quick open")
+    project_id = project["id"]
+    chapter = project["documents"][0]
+
+    assert store.suggest(principal, project_id, "chap") == [
+        {"document_id": chapter["id"], "kind": "chapter", "title": "Chapter 1"}
+    ]
+    assert title_suggest_cache.get(project_id) is not None
+
+    heron = store.create_document(
+        principal, project_id, kind="chapter", title="The Heron"
+    )
+    assert title_suggest_cache.get(project_id) is None
+    assert [
+        item["document_id"] for item in store.suggest(principal, project_id, "he")
+    ] == [heron["id"]]
+
+    store.save_document(
+        principal,
+        project_id,
+        chapter["id"],
+        content_markdown="Unchanged title.",
+        base_revision_id=chapter["current_revision_id"],
+    )
+    assert title_suggest_cache.get(project_id) is not None
+
+    store.save_document(
+        principal,
+        project_id,
+        heron["id"],
+        content_markdown="",
+        base_revision_id=heron["current_revision_id"],
+        title="The Lantern",
+    )
+    assert store.suggest(principal, project_id, "heron") == []
+    assert [item["title"] for item in store.suggest(principal, project_id, "lan")] == [
+        "The Lantern"
+    ]
+
+    store.delete_document(principal, project_id, heron["id"])
+    assert store.suggest(principal, project_id, "lan") == []
+    assert store.suggest(principal, project_id, "") == []
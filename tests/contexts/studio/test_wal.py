@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.wal import maintain_wal, wal_size
+from src.shared.infrastructure.config.settings_sections import (
+    SQLITE_PROFILES,
+    SqliteProfile,
+)
+
+PRAGMAS = {**SQLITE_PROFILES[SqliteProfile.LAPTOP], "wal_autocheckpoint": 0}
+
+
+@pytest.fixture
+def database(tmp_path: Path, studio_settings: None) -> Iterator[StudioDatabase]:
+    del studio_settings
+    database = StudioDatabase(
+        f"sqlite:///{tmp_path / 'studio.sqlite3'}", pragmas=PRAGMAS
+    )
+    database.initialize(create_backup=False)
+    try:
+        yield database
+    finally:
+        database.dispose()
+
+
+def _write_projects(database: StudioDatabase, count: int) -> None:
+    with database.session() as session:
+        for index in range(count):
+            session.execute(
+                text(
+                    "INSERT INTO projects (id, title, description, settings_json, "
+                    "created_at, updated_at) VALUES (:id, 'P', '', '{}', "
+                    "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ),
+                {"id": f"p{index}"},
+            )
+
+
+def test_profile_pragmas_apply_to_writer_and_readers(database: StudioDatabase) -> None:
+    with database.session() as session:
+        writer_cache = session.execute(text("PRAGMA cache_size")).scalar_one()
+        autocheckpoint = session.execute(text("PRAGMA wal_autocheckpoint")).scalar_one()
+    with database.read_session() as session:
+        reader_cache = session.execute(text("PRAGMA cache_size")).scalar_one()
+        mmap_size = session.execute(text("PRAGMA mmap_size")).scalar_one()
+
+    assert writer_cache == reader_cache == PRAGMAS["cache_size"]
+    assert autocheckpoint == 0
+    assert mmap_size == 0
+
+
+def test_wal_below_threshold_is_left_alone(database: StudioDatabase) -> None:
+    _write_projects(database, 5)
+
+    assert wal_size(database) > 0
+    assert maintain_wal(database, threshold_bytes=1 << 30) == []
+
+
+def test_wal_over_threshold_is_checkpointed_and_truncated(
+    database: StudioDatabase,
+) -> None:
+    _write_projects(database, 200)
+    wal_before = wal_size(database)
+
+    checkpoints = maintain_wal(database, threshold_bytes=1)
+
+    assert wal_before > 0
+    assert [checkpoint.mode for checkpoint in checkpoints] == ["PASSIVE", "TRUNCATE"]
+    assert checkpoints[0].complete
+    assert checkpoints[0].log_frames > 0
+    assert wal_size(database) == 0
+    with database.read_session() as session:
+        count = session.execute(text("SELECT count(*) FROM projects")).scalar_one()
+    assert count == 200
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+
+from src.contexts.studio.application.ports import (
+    PageDto,
+    decode_cursor,
+    encode_cursor,
+)
+
+T = TypeVar("T")
+
+
+def fake_page(
+    items: Sequence[T],
+    key: Callable[[T], tuple[Any, ...]],
+    *,
+    limit: int | None,
+    cursor: str | None,
+) -> PageDto[T]:
+    """Mirror the repository keyset pagination over an in-memory list."""
+    ordered = sorted(items, key=key, reverse=True)
+    if cursor is not None and ordered:
+        sample = key(ordered[0])
+        values = decode_cursor(cursor, len(sample))
+        after = tuple(
+            datetime.fromisoformat(value) if isinstance(kind, datetime) else value
+            for kind, value in zip(sample, values, strict=True)
+        )
+        ordered = [item for item in ordered if key(item) < after]
+    if limit is None or len(ordered) <= limit:
+        return PageDto(items=list(ordered))
+    page = list(ordered[:limit])
+    return PageDto(items=page, next_cursor=encode_cursor(key(page[-1])))
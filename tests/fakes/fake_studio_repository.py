@@ -20,7 +20,11 @@ from src.contexts.studio.application.ports.studio_repository import (
     SnapshotDto,
 )
 from src.contexts.studio.domain.exceptions import InvalidOperation, NotFound
-from src.contexts.studio.domain.utils import new_id
+from src.contexts.studio.domain.utils import (
+    POSITION_GAP,
+    _revision_statistics,
+    new_id,
+)
 from tests.fakes.fake_studio_repository_auth import FakeStudioRepositoryAuthMixin
 from tests.fakes.fake_studio_repository_documents import (
     FakeStudioRepositoryDocumentsMixin,
@@ -29,6 +33,9 @@ from tests.fakes.fake_studio_repository_jobs import (
     FakeStudioRepositoryJobsMixin,
     UsageEvent,
 )
+from tests.fakes.fake_studio_repository_ordering import (
+    FakeStudioRepositoryOrderingMixin,
+)
 from tests.fakes.fake_studio_repository_projects import (
     FakeStudioRepositoryProjectsMixin,
 )
@@ -49,6 +56,7 @@ class FakeStudioRepository(
     FakeStudioRepositoryProjectsMixin,
     FakeStudioRepositorySearchMixin,
     FakeStudioRepositoryDocumentsMixin,
+    FakeStudioRepositoryOrderingMixin,
     FakeStudioRepositoryJobsMixin,
     FakeStudioRepositorySnapshotsMixin,
     FakeStudioRepositoryReviewExportMixin,
@@ -106,7 +114,7 @@ class FakeStudioRepository(
             "chapter",
             "Chapter 1",
             "# Chapter 1\n\n",
-            1,
+            POSITION_GAP,
             "{}",
             "author",
             now,
@@ -137,6 +145,7 @@ class FakeStudioRepository(
             metadata_json=metadata_json,
             source=source,
             created_at=now,
+            **_revision_statistics(content_markdown),
         )
         document = DocumentDto(
             id=document_id,
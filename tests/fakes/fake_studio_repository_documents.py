@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from src.contexts.studio.application.ports.studio_repository import (
     DocumentDto,
+    NewDocumentDto,
+    PageDto,
     ProjectDto,
     RevisionDto,
+    RevisionSummaryDto,
     SnapshotDocumentDto,
 )
 from src.contexts.studio.domain.exceptions import InvalidOperation, NotFound
-from src.contexts.studio.domain.utils import new_id, utcnow
+from src.contexts.studio.domain.utils import (
+    _revision_statistics,
+    new_id,
+    utcnow,
+)
+from tests.fakes.fake_pagination import fake_page
 
 
 class FakeStudioRepositoryDocumentsMixin:
@@ -17,6 +26,10 @@ class FakeStudioRepositoryDocumentsMixin:
     _revisions: dict[str, RevisionDto]
     _snapshot_documents: dict[str, list[SnapshotDocumentDto]]
 
+    if TYPE_CHECKING:
+
+        def next_document_position(self, project_id: str, kind: str) -> int: ...
+
     def _get_visible_project(
         self,
         project_id: str,
@@ -87,6 +100,38 @@ class FakeStudioRepositoryDocumentsMixin:
         self._update_project_timestamp(project_id, now)
         return document
 
+    def create_documents(
+        self,
+        *,
+        project_id: str,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        documents: list[NewDocumentDto],
+        now: datetime,
+    ) -> list[DocumentDto]:
+        self._get_visible_project(project_id, owner_id, guest_session_id)
+        created: list[DocumentDto] = []
+        for item in documents:
+            position = item.position
+            if position is None:
+                position = self.next_document_position(project_id, item.kind)
+            document, revision = self._make_document(
+                project_id,
+                item.kind,
+                item.title,
+                item.content_markdown,
+                position,
+                item.metadata_json,
+                item.source,
+                now,
+            )
+            self._revisions[revision.id] = revision
+            self._documents[document.id] = document
+            self._index_document(document, revision)
+            created.append(document)
+        self._update_project_timestamp(project_id, now)
+        return created
+
     def list_documents(
         self,
         project_id: str,
@@ -125,14 +170,6 @@ class FakeStudioRepositoryDocumentsMixin:
             items[:] = [item for item in items if item.document_id != document_id]
         self._update_project_timestamp(project_id, utcnow())
 
-    def next_document_position(self, project_id: str, kind: str) -> int:
-        positions = [
-            document.position
-            for document in self._documents.values()
-            if document.project_id == project_id and document.kind == kind
-        ]
-        return max(positions, default=0) + 1
-
     def save_document(
         self,
         project_id: str,
@@ -163,6 +200,7 @@ class FakeStudioRepositoryDocumentsMixin:
             metadata_json=metadata_json,
             source=source,
             created_at=now,
+            **_revision_statistics(content_markdown),
         )
         updated_document = DocumentDto(
             id=document.id,
@@ -203,45 +241,29 @@ class FakeStudioRepositoryDocumentsMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[RevisionDto]:
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[RevisionSummaryDto]:
         self._get_visible_project(project_id, owner_id, guest_session_id)
         revisions = [
-            revision
+            RevisionSummaryDto(
+                id=revision.id,
+                document_id=revision.document_id,
+                parent_revision_id=revision.parent_revision_id,
+                revision_number=revision.revision_number,
+                source=revision.source,
+                created_at=revision.created_at,
+                word_count=revision.word_count,
+                char_count=revision.char_count,
+                paragraph_count=revision.paragraph_count,
+                content_sha256=revision.content_sha256,
+            )
             for revision in self._revisions.values()
             if revision.document_id == document_id
         ]
-        revisions.sort(key=lambda revision: revision.revision_number, reverse=True)
-        return revisions
-
-    def reorder_documents(
-        self,
-        project_id: str,
-        *,
-        owner_id: str | None,
-        guest_session_id: str | None,
-        document_ids: list[str],
-        now: datetime,
-    ) -> list[DocumentDto]:
-        self._get_visible_project(project_id, owner_id, guest_session_id)
-        existing = {
-            document.id
-            for document in self._documents.values()
-            if document.project_id == project_id
-        }
-        if set(document_ids) != existing:
-            raise InvalidOperation("Reorder must include every project document once.")
-        for position, doc_id in enumerate(document_ids, start=1):
-            document = self._documents[doc_id]
-            self._documents[doc_id] = DocumentDto(
-                id=document.id,
-                project_id=document.project_id,
-                kind=document.kind,
-                title=document.title,
-                position=position,
-                current_revision_id=document.current_revision_id,
-                created_at=document.created_at,
-                updated_at=now,
-                current_revision=document.current_revision,
-            )
-        self._update_project_timestamp(project_id, now)
-        return [self._documents[doc_id] for doc_id in document_ids]
+        return fake_page(
+            revisions,
+            lambda item: (item.revision_number,),
+            limit=limit,
+            cursor=cursor,
+        )
@@ -5,11 +5,13 @@ from datetime import datetime
 from src.contexts.studio.application.ports.studio_repository import (
     JobDto,
     JobEventDto,
+    PageDto,
     ProjectDto,
 )
 from src.contexts.studio.domain.exceptions import InvalidOperation, NotFound
 from src.contexts.studio.domain.types import JOB_KINDS
 from src.contexts.studio.domain.utils import new_id
+from tests.fakes.fake_pagination import fake_page
 
 UsageEvent = dict[str, str | int | datetime | None]
 
@@ -87,11 +89,17 @@ class FakeStudioRepositoryJobsMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[JobDto]:
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[JobDto]:
         self._get_visible_project(project_id, owner_id, guest_session_id)
         jobs = [job for job in self._jobs.values() if job.project_id == project_id]
-        jobs.sort(key=lambda job: job.created_at, reverse=True)
-        return jobs
+        return fake_page(
+            jobs,
+            lambda item: (item.created_at, item.id),
+            limit=limit,
+            cursor=cursor,
+        )
 
     def update_job(
         self,
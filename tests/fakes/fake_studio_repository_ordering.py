@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime
+
+from src.contexts.studio.application.ports.studio_repository import (
+    DocumentDto,
+    ProjectDto,
+)
+from src.contexts.studio.domain.exceptions import InvalidOperation
+from src.contexts.studio.domain.utils import POSITION_GAP, _position_between
+
+
+class FakeStudioRepositoryOrderingMixin:
+    _documents: dict[str, DocumentDto]
+
+    def _get_visible_project(
+        self,
+        project_id: str,
+        owner_id: str | None,
+        guest_session_id: str | None,
+    ) -> ProjectDto:
+        raise NotImplementedError
+
+    def _get_project_document(self, project_id: str, document_id: str) -> DocumentDto:
+        raise NotImplementedError
+
+    def _update_project_timestamp(self, project_id: str, now: datetime) -> None:
+        raise NotImplementedError
+
+    def next_document_position(self, project_id: str, kind: str) -> int:
+        positions = [
+            document.position
+            for document in self._documents.values()
+            if document.project_id == project_id and document.kind == kind
+        ]
+        return max(positions, default=0) + POSITION_GAP
+
+    def reorder_documents(
+        self,
+        project_id: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        document_ids: list[str],
+        now: datetime,
+    ) -> list[DocumentDto]:
+        self._get_visible_project(project_id, owner_id, guest_session_id)
+        existing = {
+            document.id
+            for document in self._documents.values()
+            if document.project_id == project_id
+        }
+        if set(document_ids) != existing:
+            raise InvalidOperation("Reorder must include every project document once.")
+        for index, doc_id in enumerate(document_ids, start=1):
+            document = self._documents[doc_id]
+            if document.position != index * POSITION_GAP:
+                self._documents[doc_id] = replace(
+                    document, position=index * POSITION_GAP, updated_at=now
+                )
+        self._update_project_timestamp(project_id, now)
+        return [self._documents[doc_id] for doc_id in document_ids]
+
+    def move_document(
+        self,
+        project_id: str,
+        document_id: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        anchor_id: str,
+        before: bool,
+        now: datetime,
+    ) -> DocumentDto:
+        self._get_visible_project(project_id, owner_id, guest_session_id)
+        document = self._get_project_document(project_id, document_id)
+        anchor = self._get_project_document(project_id, anchor_id)
+        if anchor.id == document.id or anchor.kind != document.kind:
+            raise InvalidOperation(
+                "Documents can only move next to another document of their kind."
+            )
+        siblings = sorted(
+            (
+                item
+                for item in self._documents.values()
+                if item.project_id == project_id
+                and item.kind == anchor.kind
+                and item.id != document.id
+            ),
+            key=lambda item: (item.position, item.created_at),
+        )
+        index = [item.id for item in siblings].index(anchor.id) + (0 if before else 1)
+        lower = siblings[index - 1].position if index > 0 else 0
+        upper = siblings[index].position if index < len(siblings) else None
+        position = _position_between(lower, upper)
+        if position is None:
+            siblings.insert(index, document)
+            for slot, item in enumerate(siblings, start=1):
+                self._documents[item.id] = replace(item, position=slot * POSITION_GAP)
+            position = self._documents[document.id].position
+        self._documents[document.id] = replace(
+            document, position=position, updated_at=now
+        )
+        self._update_project_timestamp(project_id, now)
+        return self._documents[document.id]
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 
 from src.contexts.studio.application.ports.studio_repository import (
     DocumentDto,
+    ExportDto,
     ProjectDto,
+    ProjectSummaryDto,
+    RevisionDto,
+    SnapshotDto,
 )
 from src.contexts.studio.domain.exceptions import NotFound
+from src.contexts.studio.domain.types import DOCUMENT_KINDS
 from src.contexts.studio.domain.utils import new_id
 
 
 class FakeStudioRepositoryProjectsMixin:
     _documents: dict[str, DocumentDto]
     _projects: dict[str, ProjectDto]
+    _snapshots: dict[str, SnapshotDto]
+    _exports: dict[str, ExportDto]
 
     def _create_seed_document(self, project_id: str, now: datetime) -> None:
         raise NotImplementedError
@@ -27,6 +35,9 @@ class FakeStudioRepositoryProjectsMixin:
     def _project_documents(self, project_id: str) -> list[DocumentDto]:
         raise NotImplementedError
 
+    def _current_revision(self, document: DocumentDto) -> RevisionDto:
+        raise NotImplementedError
+
     def create_project(
         self,
         *,
@@ -65,6 +76,55 @@ class FakeStudioRepositoryProjectsMixin:
         projects.sort(key=lambda project: project.updated_at, reverse=True)
         return [self._project_without_documents(project) for project in projects]
 
+    def list_project_summaries(
+        self,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+    ) -> list[ProjectSummaryDto]:
+        projects = self._visible_projects(owner_id, guest_session_id)
+        projects.sort(key=lambda project: project.updated_at, reverse=True)
+        return [self._project_summary(project) for project in projects]
+
+    def _project_summary(self, project: ProjectDto) -> ProjectSummaryDto:
+        documents = self._project_documents(project.id)
+        last_edited = max(
+            documents,
+            key=lambda document: document.updated_at,
+            default=None,
+        )
+        snapshots = [
+            item.created_at
+            for item in self._snapshots.values()
+            if item.project_id == project.id
+        ]
+        exports = [
+            item.created_at
+            for item in self._exports.values()
+            if item.project_id == project.id
+        ]
+        return ProjectSummaryDto(
+            id=project.id,
+            title=project.title,
+            description=project.description,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            document_counts={
+                kind: sum(1 for document in documents if document.kind == kind)
+                for kind in DOCUMENT_KINDS
+            },
+            word_count=sum(
+                self._current_revision(document).word_count
+                for document in documents
+                if document.current_revision_id is not None
+            ),
+            last_edited_document_id=last_edited.id if last_edited else None,
+            last_edited_document_title=last_edited.title if last_edited else None,
+            last_edited_at=last_edited.updated_at if last_edited else None,
+            latest_snapshot_at=max(snapshots, default=None),
+            latest_export_at=max(exports, default=None),
+        )
+
     def get_project(
         self,
         project_id: str,
@@ -75,6 +135,15 @@ class FakeStudioRepositoryProjectsMixin:
         self._get_visible_project(project_id, owner_id, guest_session_id)
         return self._project_with_documents(project_id)
 
+    def project_version(
+        self,
+        project_id: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+    ) -> int:
+        return self._get_visible_project(project_id, owner_id, guest_session_id).version
+
     def update_project(
         self,
         project_id: str,
@@ -137,9 +206,8 @@ class FakeStudioRepositoryProjectsMixin:
         guest_session_id: str | None,
     ) -> None:
         project = self._get_visible_project(project_id, owner_id, guest_session_id)
-        self._projects[project_id] = self._replace_project(
-            project, import_hash=import_hash
-        )
+        replaced = self._replace_project(project, import_hash=import_hash)
+        self._projects[project_id] = replace(replaced, version=replaced.version + 1)
 
     def _scope_filter(
         self,
@@ -197,6 +265,7 @@ class FakeStudioRepositoryProjectsMixin:
             import_hash=import_hash if import_hash is not None else project.import_hash,
             created_at=project.created_at,
             updated_at=updated_at if updated_at is not None else project.updated_at,
+            version=project.version + (1 if updated_at is not None else 0),
             documents=None,
         )
 
@@ -211,6 +280,7 @@ class FakeStudioRepositoryProjectsMixin:
             import_hash=project.import_hash,
             created_at=project.created_at,
             updated_at=project.updated_at,
+            version=project.version,
             documents=None,
         )
 
@@ -226,6 +296,7 @@ class FakeStudioRepositoryProjectsMixin:
             import_hash=project.import_hash,
             created_at=project.created_at,
             updated_at=project.updated_at,
+            version=project.version,
             documents=self._project_documents(project_id),
         )
 
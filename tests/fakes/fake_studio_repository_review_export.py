@@ -5,6 +5,7 @@ from datetime import datetime
 from src.contexts.studio.application.ports.studio_repository import (
     DocumentDto,
     ExportDto,
+    PageDto,
     ProjectDto,
     ReviewDto,
     ReviewIssueDto,
@@ -12,7 +13,8 @@ from src.contexts.studio.application.ports.studio_repository import (
     SnapshotDto,
 )
 from src.contexts.studio.domain.exceptions import NotFound
-from src.contexts.studio.domain.utils import _word_count, dump_json, new_id
+from src.contexts.studio.domain.utils import dump_json, new_id
+from tests.fakes.fake_pagination import fake_page
 
 
 class FakeStudioRepositoryReviewExportMixin:
@@ -82,15 +84,21 @@ class FakeStudioRepositoryReviewExportMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[ReviewDto]:
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[ReviewDto]:
         self._get_visible_project(project_id, owner_id, guest_session_id)
         reviews = [
             review
             for review in self._reviews.values()
             if review.project_id == project_id
         ]
-        reviews.sort(key=lambda review: review.created_at, reverse=True)
-        return reviews
+        return fake_page(
+            reviews,
+            lambda item: (item.created_at, item.id),
+            limit=limit,
+            cursor=cursor,
+        )
 
     def _build_review_issues(
         self,
@@ -102,7 +110,7 @@ class FakeStudioRepositoryReviewExportMixin:
             if document.project_id != project_id or document.kind != "chapter":
                 continue
             revision = self._current_revision(document)
-            words = _word_count(revision.content_markdown)
+            words = revision.word_count
             if words < 250:
                 issues.append(
                     ReviewIssueDto(
@@ -160,15 +168,21 @@ class FakeStudioRepositoryReviewExportMixin:
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> list[ExportDto]:
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[ExportDto]:
         self._get_visible_project(project_id, owner_id, guest_session_id)
         exports = [
             export
             for export in self._exports.values()
             if export.project_id == project_id
         ]
-        exports.sort(key=lambda export: export.created_at, reverse=True)
-        return exports
+        return fake_page(
+            exports,
+            lambda item: (item.created_at, item.id),
+            limit=limit,
+            cursor=cursor,
+        )
 
     def get_export(
         self,
@@ -5,9 +5,12 @@ from typing import Any
 
 from src.contexts.studio.application.ports.studio_repository import (
     DocumentDto,
+    PageDto,
     ProjectDto,
     RevisionDto,
+    SearchHitDto,
 )
+from tests.fakes.fake_pagination import fake_page
 
 
 @dataclass
@@ -19,6 +22,8 @@ class FakeSearchIndexEntry:
 
 
 class FakeStudioRepositorySearchMixin:
+    _projects: dict[str, ProjectDto]
+    _documents: dict[str, DocumentDto]
     _search_index: list[FakeSearchIndexEntry]
 
     def _get_visible_project(
@@ -38,13 +43,78 @@ class FakeStudioRepositorySearchMixin:
         guest_session_id: str | None,
     ) -> list[dict[str, Any]]:
         self._get_visible_project(project_id, owner_id, guest_session_id)
-        tokens = [token.strip('"') for token in query.split('" "') if token.strip('"')]
+        tokens = [
+            token.strip('"*') for token in query.split('" "') if token.strip('"*')
+        ]
         return [
             self._match_entry(entry, tokens)
             for entry in self._search_index
             if self._entry_matches(entry, project_id, tokens)
         ]
 
+    def search_all_documents(
+        self,
+        query: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> PageDto[SearchHitDto]:
+        tokens = [
+            token.strip('"*') for token in query.split('" "') if token.strip('"*')
+        ]
+        hits = [
+            SearchHitDto(
+                id=index,
+                score=-2.0
+                if all(t in entry.title.casefold() for t in tokens)
+                else -1.0,
+                project_id=entry.project_id,
+                project_title=self._projects[entry.project_id].title,
+                document_id=entry.document_id,
+                title=entry.title,
+                excerpt=entry.content[:100],
+            )
+            for index, entry in enumerate(self._search_index)
+            if self._entry_matches(entry, entry.project_id, tokens)
+            and self._visible(entry.project_id, owner_id, guest_session_id)
+        ]
+        return fake_page(
+            hits, lambda hit: (-hit.score, -hit.id), limit=limit, cursor=cursor
+        )
+
+    def _visible(
+        self,
+        project_id: str,
+        owner_id: str | None,
+        guest_session_id: str | None,
+    ) -> bool:
+        project = self._projects[project_id]
+        if owner_id:
+            return project.owner_id == owner_id
+        return project.guest_session_id == guest_session_id
+
+    def suggest_titles(
+        self,
+        project_id: str,
+        prefix: str,
+        *,
+        owner_id: str | None,
+        guest_session_id: str | None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        self._get_visible_project(project_id, owner_id, guest_session_id)
+        folded = prefix.casefold()
+        return [
+            {"document_id": document.id, "kind": document.kind, "title": document.title}
+            for document in self._documents.values()
+            if document.project_id == project_id
+            and any(
+                word.startswith(folded) for word in document.title.casefold().split()
+            )
+        ][:limit]
+
     def _index_document(self, document: DocumentDto, revision: RevisionDto) -> None:
         self._delete_search_document_records(document.id)
         self._search_index.append(
@@ -4,6 +4,7 @@ from datetime import datetime
 
 from src.contexts.studio.application.ports.studio_repository import (
     DocumentDto,
+    PageDto,
     ProjectDto,
     RevisionDto,
     SnapshotDocumentDto,
@@ -11,6 +12,7 @@ from src.contexts.studio.application.ports.studio_repository import (
 )
 from src.contexts.studio.domain.exceptions import NotFound
 from src.contexts.studio.domain.utils import new_id
+from tests.fakes.fake_pagination import fake_page
 
 
 class FakeStudioRepositorySnapshotsMixin:
@@ -37,8 +39,13 @@ class FakeStudioRepositorySnapshotsMixin:
         now: datetime,
     ) -> SnapshotDto:
         self._get_visible_project(project_id, owner_id, guest_session_id)
-        snapshot_id = new_id()
         items = self._snapshot_items(project_id)
+        for existing in self._snapshots.values():
+            if existing.project_id == project_id and self._same_content(
+                self._snapshot_documents[existing.id], items
+            ):
+                return existing
+        snapshot_id = new_id()
         snapshot = SnapshotDto(
             id=snapshot_id,
             project_id=project_id,
@@ -50,39 +57,44 @@ class FakeStudioRepositorySnapshotsMixin:
         self._snapshot_documents[snapshot_id] = items
         return snapshot
 
-    def list_snapshots(
+    def _same_content(
         self,
-        project_id: str,
-        *,
-        owner_id: str | None,
-        guest_session_id: str | None,
-    ) -> list[SnapshotDto]:
-        self._get_visible_project(project_id, owner_id, guest_session_id)
-        snapshots = [
-            snapshot
-            for snapshot in self._snapshots.values()
-            if snapshot.project_id == project_id
-        ]
-        snapshots.sort(key=lambda snapshot: snapshot.created_at, reverse=True)
-        return snapshots
+        left: list[SnapshotDocumentDto],
+        right: list[SnapshotDocumentDto],
+    ) -> bool:
+        def members(items: list[SnapshotDocumentDto]) -> set[tuple[str, str, int]]:
+            return {
+                (
+                    item.document_id,
+                    self._revisions[item.revision_id].content_sha256,
+                    item.position,
+                )
+                for item in items
+            }
 
-    def get_latest_export_snapshot(
+        return members(left) == members(right)
+
+    def list_snapshots(
         self,
         project_id: str,
         *,
         owner_id: str | None,
         guest_session_id: str | None,
-    ) -> SnapshotDto | None:
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageDto[SnapshotDto]:
         self._get_visible_project(project_id, owner_id, guest_session_id)
         snapshots = [
             snapshot
             for snapshot in self._snapshots.values()
-            if snapshot.project_id == project_id and snapshot.reason == "export"
+            if snapshot.project_id == project_id
         ]
-        if not snapshots:
-            return None
-        snapshots.sort(key=lambda snapshot: snapshot.created_at, reverse=True)
-        return snapshots[0]
+        return fake_page(
+            snapshots,
+            lambda item: (item.created_at, item.id),
+            limit=limit,
+            cursor=cursor,
+        )
 
     def snapshot_content(
         self,
@@ -97,22 +109,6 @@ class FakeStudioRepositorySnapshotsMixin:
         self._get_visible_project(snapshot.project_id, owner_id, guest_session_id)
         return self._snapshot_content_pairs(snapshot_id)
 
-    def snapshot_revision_map(
-        self,
-        snapshot_id: str,
-        *,
-        owner_id: str | None,
-        guest_session_id: str | None,
-    ) -> dict[str, str]:
-        snapshot = self._snapshots.get(snapshot_id)
-        if snapshot is None:
-            raise NotFound("Snapshot not found.")
-        self._get_visible_project(snapshot.project_id, owner_id, guest_session_id)
-        return {
-            item.document_id: item.revision_id
-            for item in self._snapshot_documents.get(snapshot_id, [])
-        }
-
     def _snapshot_items(self, project_id: str) -> list[SnapshotDocumentDto]:
         documents = [
             document
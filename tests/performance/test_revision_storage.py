@@ -0,0 +1,119 @@
+"""Database size and revision read latency for full versus delta storage.
+
+Run with ``ENABLE_PERFORMANCE_TESTS=1 pytest tests/performance -s`` to print
+the on-disk size after a long autosave history and the cold/warm latency of
+reading revisions back for both storage modes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+
+from src.contexts.studio.application.services import StudioStore
+from src.contexts.studio.infrastructure.ai_provider import (
+    create_studio_text_generation_provider,
+)
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.exporters import DEFAULT_EXPORT_WRITERS
+from src.contexts.studio.infrastructure.repository import (
+    RevisionStorage,
+    SqlAlchemyStudioRepository,
+)
+from src.contexts.studio.infrastructure.repository.revision_content import (
+    revision_content_cache,
+)
+from src.contexts.studio.infrastructure.wal import checkpoint_wal
+from src.shared.infrastructure.config import settings as settings_module
+
+pytestmark = pytest.mark.performance
+
+SAVES = 200
+PARAGRAPHS = 100
+WORDS_PER_PARAGRAPH = 100
+
+
+@pytest.fixture(autouse=True)
+def _testing_settings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[None]:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("APP_DATA_DIR", str(tmp_path))
+    settings_module.reset_settings()
+    yield
+    revision_content_cache.clear()
+    settings_module.reset_settings()
+
+
+def _chapter(version: int) -> str:
+    # A 10k-word chapter where each autosave changes a single word.
+    paragraphs = [
+        " ".join(f"w{paragraph}x{word}" for word in range(WORDS_PER_PARAGRAPH))
+        for paragraph in range(PARAGRAPHS)
+    ]
+    paragraphs[version % PARAGRAPHS] += f" edit{version}"
+    return "\n\n".join(paragraphs)
+
+
+def _measure(path: Path, storage: RevisionStorage) -> tuple[int, float, float]:
+    database = StudioDatabase(f"sqlite:///{path}")
+    database.initialize(create_backup=False)
+    store = StudioStore(
+        repository=SqlAlchemyStudioRepository(database, revision_storage=storage),
+        data_dir=path.parent,
+        ai_provider_factory=create_studio_text_generation_provider,
+        session_secret=settings_module.get_settings().security.secret_key,
+        export_writers=DEFAULT_EXPORT_WRITERS,
+    )
+    store.setup_owner("author", "long-test-password")
+    principal = store.owner_principal()
+    project = store.create_project(principal, title="Benchmark")
+    document = project["documents"][0]
+    revision_ids = [document["current_revision_id"]]
+    try:
+        for version in range(SAVES):
+            saved = store.save_document(
+                principal,
+                project["id"],
+                document["id"],
+                content_markdown=_chapter(version),
+                base_revision_id=revision_ids[-1],
+            )
+            revision_ids.append(saved["current_revision_id"])
+        checkpoint_wal(database, "TRUNCATE")
+        size = path.stat().st_size
+
+        def read_all() -> float:
+            started = perf_counter()
+            for revision_id in revision_ids:
+                store.get_revision(
+                    principal, project["id"], document["id"], revision_id
+                )
+            return (perf_counter() - started) * 1000 / len(revision_ids)
+
+        revision_content_cache.clear()
+        cold = read_all()
+        warm = read_all()
+    finally:
+        database.dispose()
+    return size, cold, warm
+
+
+def test_delta_storage_size_and_read_latency(tmp_path: Path) -> None:
+    full = _measure(tmp_path / "full.sqlite3", RevisionStorage(mode="full"))
+    delta = _measure(
+        tmp_path / "delta.sqlite3",
+        RevisionStorage(mode="delta", keyframe_interval=20),
+    )
+
+    for label, (size, cold, warm) in (("full", full), ("delta", delta)):
+        print(  # noqa: T201
+            f"\n{label}: size={size / 1024 / 1024:.1f}MiB "
+            f"read cold={cold:.2f}ms warm={warm:.2f}ms"
+        )
+    print(f"size ratio={full[0] / delta[0]:.1f}x")  # noqa: T201
+    assert delta[0] < full[0]
@@ -0,0 +1,104 @@
+"""Autosave throughput with and without group commit.
+
+Run with ``ENABLE_PERFORMANCE_TESTS=1 pytest tests/performance -s`` to print
+saves/second for both modes on the local disk.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import pytest
+
+from src.contexts.studio.application.services import StudioStore
+from src.contexts.studio.infrastructure.ai_provider import (
+    create_studio_text_generation_provider,
+)
+from src.contexts.studio.infrastructure.database import StudioDatabase
+from src.contexts.studio.infrastructure.exporters import DEFAULT_EXPORT_WRITERS
+from src.contexts.studio.infrastructure.group_commit import GroupCommitWriter
+from src.contexts.studio.infrastructure.repository import SqlAlchemyStudioRepository
+from src.shared.infrastructure.config import settings as settings_module
+
+pytestmark = pytest.mark.performance
+
+WRITERS = 8
+SAVES_PER_WRITER = 50
+
+
+@pytest.fixture(autouse=True)
+def _testing_settings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[None]:
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+    monkeypatch.setenv("APP_DATA_DIR", str(tmp_path))
+    settings_module.reset_settings()
+    yield
+    settings_module.reset_settings()
+
+
+def _saves_per_second(path: Path, *, window_seconds: float | None) -> float:
+    database = StudioDatabase(f"sqlite:///{path}", pool_size=WRITERS)
+    database.initialize(create_backup=False)
+    writer = (
+        GroupCommitWriter(database, window_seconds=window_seconds)
+        if window_seconds is not None
+        else None
+    )
+    store = StudioStore(
+        repository=SqlAlchemyStudioRepository(database, group_commit=writer),
+        data_dir=path.parent,
+        ai_provider_factory=create_studio_text_generation_provider,
+        session_secret=settings_module.get_settings().security.secret_key,
+        export_writers=DEFAULT_EXPORT_WRITERS,
+    )
+    store.setup_owner("author", "long-test-password")
+    principal = store.owner_principal()
+    project = store.create_project(principal, title="Benchmark")
+    documents = [
+        store.create_document(principal, project["id"], kind="chapter", title=f"C{i}")
+        for i in range(WRITERS)
+    ]
+
+    def autosave(document: dict[str, Any]) -> None:
+        revision_id = document["current_revision_id"]
+        for index in range(SAVES_PER_WRITER):
+            saved = store.save_document(
+                principal,
+                project["id"],
+                document["id"],
+                content_markdown=f"Draft {index}\n\n" + "word " * 400,
+                base_revision_id=revision_id,
+            )
+            revision_id = saved["current_revision_id"]
+
+    try:
+        started = perf_counter()
+        with ThreadPoolExecutor(max_workers=WRITERS) as pool:
+            list(pool.map(autosave, documents))
+        elapsed = perf_counter() - started
+    finally:
+        if writer is not None:
+            writer.close()
+        database.dispose()
+    return WRITERS * SAVES_PER_WRITER / elapsed
+
+
+@pytest.mark.parametrize("window_ms", [0.5, 2.0, 5.0])
+def test_group_commit_save_throughput(tmp_path: Path, window_ms: float) -> None:
+    ungrouped = _saves_per_second(tmp_path / "ungrouped.sqlite3", window_seconds=None)
+    grouped = _saves_per_second(
+        tmp_path / "grouped.sqlite3", window_seconds=window_ms / 1000
+    )
+
+    print(  # noqa: T201
+        f"\nsaves/s ungrouped={ungrouped:.1f} "
+        f"grouped[{window_ms}ms]={grouped:.1f} speedup={grouped / ungrouped:.2f}x"
+    )
+    assert grouped > 0
+    assert ungrouped > 0
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from src.contexts.studio.application.service_common import (
+    InvalidOperation,
     Principal,
     RevisionConflict,
 )
@@ -117,3 +118,58 @@ def test_search_ignores_malicious_operators(
     )
 
     assert results == []
+
+
+def test_create_documents_appends_and_rejects_unknown_kinds(
+    fake_repository: FakeStudioRepository,
+) -> None:
+    principal = _guest("guest-session-1")
+    project = ProjectService(fake_repository).create_project(
+        principal, title="Bulk Test"
+    )
+    service = DocumentService(fake_repository)
+
+    created = service.create_documents(
+        principal,
+        project["id"],
+        [
+            {"kind": "chapter", "title": "Two"},
+            {"kind": "chapter", "title": "Ten", "position": 10},
+        ],
+    )
+
+    assert [document["position"] for document in created] == [2048, 10]
+    with pytest.raises(InvalidOperation):
+        service.create_documents(
+            principal, project["id"], [{"kind": "poem", "title": "Nope"}]
+        )
+
+
+def test_move_document_requires_exactly_one_anchor(
+    fake_repository: FakeStudioRepository,
+) -> None:
+    principal = _guest("guest-session-1")
+    project = ProjectService(fake_repository).create_project(
+        principal, title="Move Test"
+    )
+    service = DocumentService(fake_repository)
+    first = project["documents"][0]
+    second = service.create_document(
+        principal, project["id"], kind="chapter", title="Two"
+    )
+
+    moved = service.move_document(
+        principal, project["id"], second["id"], before_id=first["id"]
+    )
+
+    assert moved["position"] == first["position"] // 2
+    with pytest.raises(InvalidOperation):
+        service.move_document(principal, project["id"], second["id"])
+    with pytest.raises(InvalidOperation):
+        service.move_document(
+            principal,
+            project["id"],
+            second["id"],
+            before_id=first["id"],
+            after_id=first["id"],
+        )
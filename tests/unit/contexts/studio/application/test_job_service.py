@@ -101,7 +101,7 @@ def test_list_jobs_returns_newest_visible_payload(
     jobs = job_service(fake_repository, data_dir=tmp_path).list_jobs(
         guest_principal,
         project,
-    )
+    )["jobs"]
 
     assert [item["id"] for item in jobs] == [second.id, first.id]
     assert jobs[0]["request"] == {"reason": "second"}
@@ -5,6 +5,10 @@ from pathlib import Path
 import pytest
 
 from src.shared.infrastructure.config.settings import LLMSettings, NovelEngineSettings
+from src.shared.infrastructure.config.settings_sections import (
+    SQLITE_PROFILES,
+    SqliteProfile,
+)
 
 
 def _write_local_env(tmp_path: Path, content: str) -> Path:
@@ -252,3 +256,40 @@ def test_resolve_dashscope_credentials_reads_dotenv_local(
 
     assert api_key == "helper-file-dashscope-key"
     assert api_base == "https://helper.example.invalid/api/v1"
+
+
+def test_group_commit_is_opt_in(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    _clear_dashscope_env(monkeypatch)
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+
+    assert NovelEngineSettings().database.group_commit is False
+
+    monkeypatch.setenv("DB_GROUP_COMMIT", "true")
+    monkeypatch.setenv("DB_GROUP_COMMIT_WINDOW_MS", "4")
+    settings = NovelEngineSettings()
+
+    assert settings.database.group_commit is True
+    assert settings.database.group_commit_window_ms == 4
+
+
+def test_sqlite_profile_pragmas_accept_overrides(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    _clear_dashscope_env(monkeypatch)
+    monkeypatch.setenv("APP_ENVIRONMENT", "testing")
+
+    default = NovelEngineSettings().database
+    assert default.sqlite_profile == SqliteProfile.BALANCED
+    assert default.sqlite_pragmas() == SQLITE_PROFILES[SqliteProfile.BALANCED]
+
+    monkeypatch.setenv("DB_SQLITE_PROFILE", "library")
+    monkeypatch.setenv("DB_MMAP_SIZE", "0")
+    pragmas = NovelEngineSettings().database.sqlite_pragmas()
+
+    assert pragmas == {**SQLITE_PROFILES[SqliteProfile.LIBRARY], "mmap_size": 0}